@@ -6,11 +6,24 @@ together.  Routers consume these via ``Depends(get_<use_case>_use_case)``.
 
 Architecture flow:
     get_database  →  get_*_repository  →  get_*_use_case  →  Router endpoint
+
+Public content repositories get ``get_request_database`` instead, which
+routes public reads by ``MONGODB_READ_PREFERENCE`` and keeps writes (and
+editors who just wrote) on the primary.
 """
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from app.api.middlewares.read_your_writes_middleware import reads_from_primary
+
+# ── Services ─────────────────────────────────────────────────────────────
+from app.application.services import (
+    CompositeCVChangeListener,
+    CVResultCache,
+    CVSnapshotService,
+)
+
 # ── Use cases ────────────────────────────────────────────────────────────
 from app.application.use_cases import (
     AddEducationUseCase,
@@ -25,66 +38,93 @@ from app.application.use_cases import (
     EditSkillUseCase,
     GenerateCVPDFUseCase,
     GetCompleteCVUseCase,
+    GetCVFieldsUseCase,
+    GetCVSnapshotUseCase,
+    GetProfileFieldsUseCase,
     GetProfileUseCase,
+    GetSkillStatsUseCase,
+    GroupSkillsUseCase,
+    ListEducationFieldsUseCase,
+    ListExperienceFieldsUseCase,
     ListExperiencesUseCase,
+    ListSkillFieldsUseCase,
     ListSkillsUseCase,
+    ReorderEducationUseCase,
+    ReorderExperiencesUseCase,
+    ReorderSkillsUseCase,
     UpdateProfileUseCase,
 )
 from app.application.use_cases.additional_training import (
     AddAdditionalTrainingUseCase,
     DeleteAdditionalTrainingUseCase,
     EditAdditionalTrainingUseCase,
+    ListAdditionalTrainingFieldsUseCase,
     ListAdditionalTrainingsUseCase,
+    ReorderAdditionalTrainingsUseCase,
 )
 from app.application.use_cases.certification import (
     AddCertificationUseCase,
     DeleteCertificationUseCase,
     EditCertificationUseCase,
+    ListCertificationFieldsUseCase,
     ListCertificationsUseCase,
+    ReorderCertificationsUseCase,
 )
 from app.application.use_cases.contact_information import (
     CreateContactInformationUseCase,
     DeleteContactInformationUseCase,
+    GetContactInformationFieldsUseCase,
     GetContactInformationUseCase,
     UpdateContactInformationUseCase,
 )
 from app.application.use_cases.contact_message import (
     CreateContactMessageUseCase,
     DeleteContactMessageUseCase,
+    GetContactMessageStatsUseCase,
     ListContactMessagesUseCase,
 )
 from app.application.use_cases.language import (
     AddLanguageUseCase,
     DeleteLanguageUseCase,
     EditLanguageUseCase,
+    ListLanguageFieldsUseCase,
     ListLanguagesUseCase,
 )
 from app.application.use_cases.programming_language import (
     AddProgrammingLanguageUseCase,
     DeleteProgrammingLanguageUseCase,
     EditProgrammingLanguageUseCase,
+    ListProgrammingLanguageFieldsUseCase,
     ListProgrammingLanguagesUseCase,
 )
 from app.application.use_cases.project import (
     AddProjectUseCase,
     DeleteProjectUseCase,
     EditProjectUseCase,
+    ListProjectFieldsUseCase,
     ListProjectsUseCase,
+    ReorderProjectsUseCase,
 )
 from app.application.use_cases.social_network import (
     AddSocialNetworkUseCase,
     DeleteSocialNetworkUseCase,
     EditSocialNetworkUseCase,
+    ListSocialNetworkFieldsUseCase,
     ListSocialNetworksUseCase,
+    ReorderSocialNetworksUseCase,
 )
 from app.application.use_cases.tool import (
     AddToolUseCase,
     DeleteToolUseCase,
     EditToolUseCase,
+    GetToolStatsUseCase,
+    GroupToolsUseCase,
+    ListToolFieldsUseCase,
     ListToolsUseCase,
+    ReorderToolsUseCase,
 )
 from app.config.settings import settings
-from app.infrastructure.database.mongo_client import get_database
+from app.infrastructure.database.mongo_client import get_database, get_read_database
 
 # ── Repositories ─────────────────────────────────────────────────────────
 from app.infrastructure.repositories import (
@@ -92,6 +132,10 @@ from app.infrastructure.repositories import (
     CertificationRepository,
     ContactInformationRepository,
     ContactMessageRepository,
+    ContactMessageStatsRepository,
+    ContentVersionRepository,
+    CVRepository,
+    CVSnapshotRepository,
     EducationRepository,
     LanguageRepository,
     ProfileRepository,
@@ -104,59 +148,109 @@ from app.infrastructure.repositories import (
 )
 from app.infrastructure.services.null_email_service import NullEmailService
 from app.infrastructure.services.sendgrid_email_service import SendGridEmailService
+from app.shared.interfaces.cv_change_listener import ICVChangeListener
 from app.shared.interfaces.email_service import IEmailService
 
+# =====================================================================
+# DATABASE PROVIDERS
+# =====================================================================
+
+
+async def get_reads_from_primary(request: Request) -> bool:
+    """Whether this request reads from the primary (its latest data)."""
+    return settings.MONGODB_READ_PREFERENCE == "primary" or reads_from_primary(request)
+
+
+async def get_request_database(
+    primary: bool = Depends(get_reads_from_primary),
+    db: AsyncIOMotorDatabase = Depends(get_database),
+    read_db: AsyncIOMotorDatabase = Depends(get_read_database),
+) -> AsyncIOMotorDatabase:
+    """
+    Database of the public content repositories.
+
+    Public GETs use the configured read preference (secondaries allowed);
+    writes, and every read of a client that just wrote, use the primary.
+    Writes always go to the primary whatever the read preference.
+    """
+    return db if primary else read_db
+
+
 # =====================================================================
 # REPOSITORY PROVIDERS
 # =====================================================================
 
 
-async def get_profile_repository(
+async def get_content_version_repository(
     db: AsyncIOMotorDatabase = Depends(get_database),
+) -> ContentVersionRepository:
+    return ContentVersionRepository(db)
+
+
+async def get_profile_repository(
+    db: AsyncIOMotorDatabase = Depends(get_request_database),
+    versions: ContentVersionRepository = Depends(get_content_version_repository),
 ) -> ProfileRepository:
-    return ProfileRepository(db)
+    return ProfileRepository(db, versions=versions)
 
 
 async def get_skill_repository(
-    db: AsyncIOMotorDatabase = Depends(get_database),
+    db: AsyncIOMotorDatabase = Depends(get_request_database),
+    versions: ContentVersionRepository = Depends(get_content_version_repository),
 ) -> SkillRepository:
-    return SkillRepository(db)
+    return SkillRepository(db, versions=versions, rank_ordering=settings.rank_ordering)
 
 
 async def get_education_repository(
-    db: AsyncIOMotorDatabase = Depends(get_database),
+    db: AsyncIOMotorDatabase = Depends(get_request_database),
+    versions: ContentVersionRepository = Depends(get_content_version_repository),
 ) -> EducationRepository:
-    return EducationRepository(db)
+    return EducationRepository(
+        db, versions=versions, rank_ordering=settings.rank_ordering
+    )
 
 
 async def get_work_experience_repository(
-    db: AsyncIOMotorDatabase = Depends(get_database),
+    db: AsyncIOMotorDatabase = Depends(get_request_database),
+    versions: ContentVersionRepository = Depends(get_content_version_repository),
 ) -> WorkExperienceRepository:
-    return WorkExperienceRepository(db)
+    return WorkExperienceRepository(
+        db, versions=versions, rank_ordering=settings.rank_ordering
+    )
 
 
 async def get_project_repository(
-    db: AsyncIOMotorDatabase = Depends(get_database),
+    db: AsyncIOMotorDatabase = Depends(get_request_database),
+    versions: ContentVersionRepository = Depends(get_content_version_repository),
 ) -> ProjectRepository:
-    return ProjectRepository(db)
+    return ProjectRepository(
+        db, versions=versions, rank_ordering=settings.rank_ordering
+    )
 
 
 async def get_certification_repository(
-    db: AsyncIOMotorDatabase = Depends(get_database),
+    db: AsyncIOMotorDatabase = Depends(get_request_database),
+    versions: ContentVersionRepository = Depends(get_content_version_repository),
 ) -> CertificationRepository:
-    return CertificationRepository(db)
+    return CertificationRepository(
+        db, versions=versions, rank_ordering=settings.rank_ordering
+    )
 
 
 async def get_additional_training_repository(
-    db: AsyncIOMotorDatabase = Depends(get_database),
+    db: AsyncIOMotorDatabase = Depends(get_request_database),
+    versions: ContentVersionRepository = Depends(get_content_version_repository),
 ) -> AdditionalTrainingRepository:
-    return AdditionalTrainingRepository(db)
+    return AdditionalTrainingRepository(
+        db, versions=versions, rank_ordering=settings.rank_ordering
+    )
 
 
 async def get_contact_information_repository(
-    db: AsyncIOMotorDatabase = Depends(get_database),
+    db: AsyncIOMotorDatabase = Depends(get_request_database),
+    versions: ContentVersionRepository = Depends(get_content_version_repository),
 ) -> ContactInformationRepository:
-    return ContactInformationRepository(db)
+    return ContactInformationRepository(db, versions=versions)
 
 
 async def get_contact_message_repository(
@@ -165,28 +259,157 @@ async def get_contact_message_repository(
     return ContactMessageRepository(db)
 
 
-async def get_programming_language_repository(
+async def get_contact_message_stats_repository(
     db: AsyncIOMotorDatabase = Depends(get_database),
+) -> ContactMessageStatsRepository:
+    return ContactMessageStatsRepository(db)
+
+
+async def get_programming_language_repository(
+    db: AsyncIOMotorDatabase = Depends(get_request_database),
+    versions: ContentVersionRepository = Depends(get_content_version_repository),
 ) -> ProgrammingLanguageRepository:
-    return ProgrammingLanguageRepository(db)
+    return ProgrammingLanguageRepository(
+        db, versions=versions, rank_ordering=settings.rank_ordering
+    )
 
 
 async def get_language_repository(
-    db: AsyncIOMotorDatabase = Depends(get_database),
+    db: AsyncIOMotorDatabase = Depends(get_request_database),
+    versions: ContentVersionRepository = Depends(get_content_version_repository),
 ) -> LanguageRepository:
-    return LanguageRepository(db)
+    return LanguageRepository(
+        db, versions=versions, rank_ordering=settings.rank_ordering
+    )
 
 
 async def get_tool_repository(
-    db: AsyncIOMotorDatabase = Depends(get_database),
+    db: AsyncIOMotorDatabase = Depends(get_request_database),
+    versions: ContentVersionRepository = Depends(get_content_version_repository),
 ) -> ToolRepository:
-    return ToolRepository(db)
+    return ToolRepository(db, versions=versions, rank_ordering=settings.rank_ordering)
 
 
 async def get_social_network_repository(
-    db: AsyncIOMotorDatabase = Depends(get_database),
+    db: AsyncIOMotorDatabase = Depends(get_request_database),
+    versions: ContentVersionRepository = Depends(get_content_version_repository),
 ) -> SocialNetworkRepository:
-    return SocialNetworkRepository(db)
+    return SocialNetworkRepository(
+        db, versions=versions, rank_ordering=settings.rank_ordering
+    )
+
+
+async def get_cv_repository(
+    db: AsyncIOMotorDatabase = Depends(get_request_database),
+) -> CVRepository | None:
+    """Aggregated CV read model, only when CV_AGGREGATED_FETCH is enabled."""
+    if not settings.CV_AGGREGATED_FETCH:
+        return None
+    return CVRepository(db, rank_ordering=settings.rank_ordering)
+
+
+# Siempre del primario: un snapshot leído de un secundario con retraso haría
+# que get_or_build lo reconstruyera (o lo sirviera) desfasado
+async def get_cv_snapshot_repository(
+    db: AsyncIOMotorDatabase = Depends(get_database),
+) -> CVSnapshotRepository:
+    return CVSnapshotRepository(db)
+
+
+# =====================================================================
+# CV READ MODEL PROVIDERS
+# =====================================================================
+# Definidos antes que los casos de uso de escritura, que dependen del
+# listener para mantener los snapshots del CV al día.
+
+# Caché en proceso compartida por todas las peticiones del worker
+_cv_cache = CVResultCache(
+    max_entries=settings.CV_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.CV_CACHE_TTL_SECONDS,
+)
+
+
+def get_cv_cache() -> CVResultCache | None:
+    """In-process CV cache, only when CV_CACHE_ENABLED is enabled."""
+    if not settings.CV_CACHE_ENABLED:
+        return None
+    return _cv_cache
+
+
+async def get_get_complete_cv_use_case(
+    request: Request,
+    profile_repo: ProfileRepository = Depends(get_profile_repository),
+    experience_repo: WorkExperienceRepository = Depends(get_work_experience_repository),
+    skill_repo: SkillRepository = Depends(get_skill_repository),
+    education_repo: EducationRepository = Depends(get_education_repository),
+    contact_info_repo: ContactInformationRepository = Depends(
+        get_contact_information_repository
+    ),
+    social_network_repo: SocialNetworkRepository = Depends(
+        get_social_network_repository
+    ),
+    project_repo: ProjectRepository = Depends(get_project_repository),
+    tool_repo: ToolRepository = Depends(get_tool_repository),
+    additional_training_repo: AdditionalTrainingRepository = Depends(
+        get_additional_training_repository
+    ),
+    certification_repo: CertificationRepository = Depends(get_certification_repository),
+    language_repo: LanguageRepository = Depends(get_language_repository),
+    programming_language_repo: ProgrammingLanguageRepository = Depends(
+        get_programming_language_repository
+    ),
+    cv_repo: CVRepository | None = Depends(get_cv_repository),
+    cv_cache: CVResultCache | None = Depends(get_cv_cache),
+) -> GetCompleteCVUseCase:
+    return GetCompleteCVUseCase(
+        profile_repository=profile_repo,
+        experience_repository=experience_repo,
+        skill_repository=skill_repo,
+        education_repository=education_repo,
+        contact_info_repository=contact_info_repo,
+        social_network_repository=social_network_repo,
+        project_repository=project_repo,
+        tool_repository=tool_repo,
+        additional_training_repository=additional_training_repo,
+        certification_repository=certification_repo,
+        language_repository=language_repo,
+        programming_language_repository=programming_language_repo,
+        concurrent=settings.CV_CONCURRENT_FETCH,
+        max_concurrency=settings.CV_MAX_CONCURRENCY,
+        section_timeout=settings.CV_SECTION_TIMEOUT_SECONDS,
+        cv_repository=cv_repo,
+        # Quien acaba de escribir no lee de la caché: podría tener un CV
+        # leído de un secundario antes de que le llegara su cambio
+        cache=None if reads_from_primary(request) else cv_cache,
+    )
+
+
+async def get_cv_snapshot_service(
+    snapshot_repo: CVSnapshotRepository = Depends(get_cv_snapshot_repository),
+    get_cv_uc: GetCompleteCVUseCase = Depends(get_get_complete_cv_use_case),
+    primary: bool = Depends(get_reads_from_primary),
+) -> CVSnapshotService | None:
+    """Snapshot maintenance, only when CV_SNAPSHOTS_ENABLED is enabled."""
+    if not settings.CV_SNAPSHOTS_ENABLED:
+        return None
+    return CVSnapshotService(
+        snapshot_repository=snapshot_repo,
+        cv_use_case=get_cv_uc,
+        store_rebuilds=primary,
+    )
+
+
+async def get_cv_change_listener(
+    cv_cache: CVResultCache | None = Depends(get_cv_cache),
+    snapshot_service: CVSnapshotService | None = Depends(get_cv_snapshot_service),
+) -> ICVChangeListener | None:
+    # La caché se invalida primero: el refresco del snapshot consulta MongoDB
+    listeners = [
+        listener for listener in (cv_cache, snapshot_service) if listener is not None
+    ]
+    if not listeners:
+        return None
+    return CompositeCVChangeListener(listeners)
 
 
 # =====================================================================
@@ -202,14 +425,16 @@ async def get_get_profile_use_case(
 
 async def get_create_profile_use_case(
     repo: ProfileRepository = Depends(get_profile_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> CreateProfileUseCase:
-    return CreateProfileUseCase(profile_repository=repo)
+    return CreateProfileUseCase(profile_repository=repo, cv_listener=cv_listener)
 
 
 async def get_update_profile_use_case(
     repo: ProfileRepository = Depends(get_profile_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> UpdateProfileUseCase:
-    return UpdateProfileUseCase(profile_repository=repo)
+    return UpdateProfileUseCase(profile_repository=repo, cv_listener=cv_listener)
 
 
 # =====================================================================
@@ -219,20 +444,23 @@ async def get_update_profile_use_case(
 
 async def get_add_skill_use_case(
     repo: SkillRepository = Depends(get_skill_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> AddSkillUseCase:
-    return AddSkillUseCase(skill_repository=repo)
+    return AddSkillUseCase(skill_repository=repo, cv_listener=cv_listener)
 
 
 async def get_edit_skill_use_case(
     repo: SkillRepository = Depends(get_skill_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> EditSkillUseCase:
-    return EditSkillUseCase(skill_repository=repo)
+    return EditSkillUseCase(skill_repository=repo, cv_listener=cv_listener)
 
 
 async def get_delete_skill_use_case(
     repo: SkillRepository = Depends(get_skill_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> DeleteSkillUseCase:
-    return DeleteSkillUseCase(skill_repository=repo)
+    return DeleteSkillUseCase(skill_repository=repo, cv_listener=cv_listener)
 
 
 async def get_list_skills_use_case(
@@ -241,6 +469,31 @@ async def get_list_skills_use_case(
     return ListSkillsUseCase(skill_repository=repo)
 
 
+async def get_list_skill_fields_use_case(
+    repo: SkillRepository = Depends(get_skill_repository),
+) -> ListSkillFieldsUseCase:
+    return ListSkillFieldsUseCase(repository=repo)
+
+
+async def get_group_skills_use_case(
+    repo: SkillRepository = Depends(get_skill_repository),
+) -> GroupSkillsUseCase:
+    return GroupSkillsUseCase(skill_repository=repo)
+
+
+async def get_skill_stats_use_case(
+    repo: SkillRepository = Depends(get_skill_repository),
+) -> GetSkillStatsUseCase:
+    return GetSkillStatsUseCase(skill_repository=repo)
+
+
+async def get_reorder_skills_use_case(
+    repo: SkillRepository = Depends(get_skill_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
+) -> ReorderSkillsUseCase:
+    return ReorderSkillsUseCase(repository=repo, cv_listener=cv_listener)
+
+
 # =====================================================================
 # USE CASE PROVIDERS — Education
 # =====================================================================
@@ -248,20 +501,36 @@ async def get_list_skills_use_case(
 
 async def get_add_education_use_case(
     repo: EducationRepository = Depends(get_education_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> AddEducationUseCase:
-    return AddEducationUseCase(education_repository=repo)
+    return AddEducationUseCase(education_repository=repo, cv_listener=cv_listener)
 
 
 async def get_edit_education_use_case(
     repo: EducationRepository = Depends(get_education_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> EditEducationUseCase:
-    return EditEducationUseCase(education_repository=repo)
+    return EditEducationUseCase(education_repository=repo, cv_listener=cv_listener)
 
 
 async def get_delete_education_use_case(
     repo: EducationRepository = Depends(get_education_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> DeleteEducationUseCase:
-    return DeleteEducationUseCase(education_repository=repo)
+    return DeleteEducationUseCase(education_repository=repo, cv_listener=cv_listener)
+
+
+async def get_reorder_education_use_case(
+    repo: EducationRepository = Depends(get_education_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
+) -> ReorderEducationUseCase:
+    return ReorderEducationUseCase(repository=repo, cv_listener=cv_listener)
+
+
+async def get_list_education_fields_use_case(
+    repo: EducationRepository = Depends(get_education_repository),
+) -> ListEducationFieldsUseCase:
+    return ListEducationFieldsUseCase(repository=repo)
 
 
 # =====================================================================
@@ -271,20 +540,23 @@ async def get_delete_education_use_case(
 
 async def get_add_experience_use_case(
     repo: WorkExperienceRepository = Depends(get_work_experience_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> AddExperienceUseCase:
-    return AddExperienceUseCase(experience_repository=repo)
+    return AddExperienceUseCase(experience_repository=repo, cv_listener=cv_listener)
 
 
 async def get_edit_experience_use_case(
     repo: WorkExperienceRepository = Depends(get_work_experience_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> EditExperienceUseCase:
-    return EditExperienceUseCase(experience_repository=repo)
+    return EditExperienceUseCase(experience_repository=repo, cv_listener=cv_listener)
 
 
 async def get_delete_experience_use_case(
     repo: WorkExperienceRepository = Depends(get_work_experience_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> DeleteExperienceUseCase:
-    return DeleteExperienceUseCase(experience_repository=repo)
+    return DeleteExperienceUseCase(experience_repository=repo, cv_listener=cv_listener)
 
 
 async def get_list_experiences_use_case(
@@ -293,6 +565,19 @@ async def get_list_experiences_use_case(
     return ListExperiencesUseCase(experience_repository=repo)
 
 
+async def get_list_experience_fields_use_case(
+    repo: WorkExperienceRepository = Depends(get_work_experience_repository),
+) -> ListExperienceFieldsUseCase:
+    return ListExperienceFieldsUseCase(repository=repo)
+
+
+async def get_reorder_experiences_use_case(
+    repo: WorkExperienceRepository = Depends(get_work_experience_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
+) -> ReorderExperiencesUseCase:
+    return ReorderExperiencesUseCase(repository=repo, cv_listener=cv_listener)
+
+
 # =====================================================================
 # USE CASE PROVIDERS — Language
 # =====================================================================
@@ -322,6 +607,12 @@ async def get_list_languages_use_case(
     return ListLanguagesUseCase(language_repository=repo)
 
 
+async def get_list_language_fields_use_case(
+    repo: LanguageRepository = Depends(get_language_repository),
+) -> ListLanguageFieldsUseCase:
+    return ListLanguageFieldsUseCase(repository=repo)
+
+
 # =====================================================================
 # USE CASE PROVIDERS — Programming Language
 # =====================================================================
@@ -351,6 +642,12 @@ async def get_list_programming_languages_use_case(
     return ListProgrammingLanguagesUseCase(programming_language_repository=repo)
 
 
+async def get_list_programming_language_fields_use_case(
+    repo: ProgrammingLanguageRepository = Depends(get_programming_language_repository),
+) -> ListProgrammingLanguageFieldsUseCase:
+    return ListProgrammingLanguageFieldsUseCase(repository=repo)
+
+
 # =====================================================================
 # USE CASE PROVIDERS — Project
 # =====================================================================
@@ -358,20 +655,23 @@ async def get_list_programming_languages_use_case(
 
 async def get_add_project_use_case(
     repo: ProjectRepository = Depends(get_project_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> AddProjectUseCase:
-    return AddProjectUseCase(project_repository=repo)
+    return AddProjectUseCase(project_repository=repo, cv_listener=cv_listener)
 
 
 async def get_edit_project_use_case(
     repo: ProjectRepository = Depends(get_project_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> EditProjectUseCase:
-    return EditProjectUseCase(project_repository=repo)
+    return EditProjectUseCase(project_repository=repo, cv_listener=cv_listener)
 
 
 async def get_delete_project_use_case(
     repo: ProjectRepository = Depends(get_project_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> DeleteProjectUseCase:
-    return DeleteProjectUseCase(project_repository=repo)
+    return DeleteProjectUseCase(project_repository=repo, cv_listener=cv_listener)
 
 
 async def get_list_projects_use_case(
@@ -380,6 +680,19 @@ async def get_list_projects_use_case(
     return ListProjectsUseCase(project_repository=repo)
 
 
+async def get_list_project_fields_use_case(
+    repo: ProjectRepository = Depends(get_project_repository),
+) -> ListProjectFieldsUseCase:
+    return ListProjectFieldsUseCase(repository=repo)
+
+
+async def get_reorder_projects_use_case(
+    repo: ProjectRepository = Depends(get_project_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
+) -> ReorderProjectsUseCase:
+    return ReorderProjectsUseCase(repository=repo, cv_listener=cv_listener)
+
+
 # =====================================================================
 # USE CASE PROVIDERS — Certification
 # =====================================================================
@@ -387,20 +700,29 @@ async def get_list_projects_use_case(
 
 async def get_add_certification_use_case(
     repo: CertificationRepository = Depends(get_certification_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> AddCertificationUseCase:
-    return AddCertificationUseCase(certification_repository=repo)
+    return AddCertificationUseCase(
+        certification_repository=repo, cv_listener=cv_listener
+    )
 
 
 async def get_edit_certification_use_case(
     repo: CertificationRepository = Depends(get_certification_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> EditCertificationUseCase:
-    return EditCertificationUseCase(certification_repository=repo)
+    return EditCertificationUseCase(
+        certification_repository=repo, cv_listener=cv_listener
+    )
 
 
 async def get_delete_certification_use_case(
     repo: CertificationRepository = Depends(get_certification_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> DeleteCertificationUseCase:
-    return DeleteCertificationUseCase(certification_repository=repo)
+    return DeleteCertificationUseCase(
+        certification_repository=repo, cv_listener=cv_listener
+    )
 
 
 async def get_list_certifications_use_case(
@@ -409,6 +731,19 @@ async def get_list_certifications_use_case(
     return ListCertificationsUseCase(certification_repository=repo)
 
 
+async def get_list_certification_fields_use_case(
+    repo: CertificationRepository = Depends(get_certification_repository),
+) -> ListCertificationFieldsUseCase:
+    return ListCertificationFieldsUseCase(repository=repo)
+
+
+async def get_reorder_certifications_use_case(
+    repo: CertificationRepository = Depends(get_certification_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
+) -> ReorderCertificationsUseCase:
+    return ReorderCertificationsUseCase(repository=repo, cv_listener=cv_listener)
+
+
 # =====================================================================
 # USE CASE PROVIDERS — Additional Training
 # =====================================================================
@@ -416,20 +751,29 @@ async def get_list_certifications_use_case(
 
 async def get_add_additional_training_use_case(
     repo: AdditionalTrainingRepository = Depends(get_additional_training_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> AddAdditionalTrainingUseCase:
-    return AddAdditionalTrainingUseCase(additional_training_repository=repo)
+    return AddAdditionalTrainingUseCase(
+        additional_training_repository=repo, cv_listener=cv_listener
+    )
 
 
 async def get_edit_additional_training_use_case(
     repo: AdditionalTrainingRepository = Depends(get_additional_training_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> EditAdditionalTrainingUseCase:
-    return EditAdditionalTrainingUseCase(additional_training_repository=repo)
+    return EditAdditionalTrainingUseCase(
+        additional_training_repository=repo, cv_listener=cv_listener
+    )
 
 
 async def get_delete_additional_training_use_case(
     repo: AdditionalTrainingRepository = Depends(get_additional_training_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> DeleteAdditionalTrainingUseCase:
-    return DeleteAdditionalTrainingUseCase(additional_training_repository=repo)
+    return DeleteAdditionalTrainingUseCase(
+        additional_training_repository=repo, cv_listener=cv_listener
+    )
 
 
 async def get_list_additional_trainings_use_case(
@@ -438,6 +782,19 @@ async def get_list_additional_trainings_use_case(
     return ListAdditionalTrainingsUseCase(additional_training_repository=repo)
 
 
+async def get_list_additional_training_fields_use_case(
+    repo: AdditionalTrainingRepository = Depends(get_additional_training_repository),
+) -> ListAdditionalTrainingFieldsUseCase:
+    return ListAdditionalTrainingFieldsUseCase(repository=repo)
+
+
+async def get_reorder_additional_trainings_use_case(
+    repo: AdditionalTrainingRepository = Depends(get_additional_training_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
+) -> ReorderAdditionalTrainingsUseCase:
+    return ReorderAdditionalTrainingsUseCase(repository=repo, cv_listener=cv_listener)
+
+
 # =====================================================================
 # USE CASE PROVIDERS — Contact Information
 # =====================================================================
@@ -451,20 +808,29 @@ async def get_get_contact_information_use_case(
 
 async def get_create_contact_information_use_case(
     repo: ContactInformationRepository = Depends(get_contact_information_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> CreateContactInformationUseCase:
-    return CreateContactInformationUseCase(contact_information_repository=repo)
+    return CreateContactInformationUseCase(
+        contact_information_repository=repo, cv_listener=cv_listener
+    )
 
 
 async def get_update_contact_information_use_case(
     repo: ContactInformationRepository = Depends(get_contact_information_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> UpdateContactInformationUseCase:
-    return UpdateContactInformationUseCase(contact_information_repository=repo)
+    return UpdateContactInformationUseCase(
+        contact_information_repository=repo, cv_listener=cv_listener
+    )
 
 
 async def get_delete_contact_information_use_case(
     repo: ContactInformationRepository = Depends(get_contact_information_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> DeleteContactInformationUseCase:
-    return DeleteContactInformationUseCase(contact_information_repository=repo)
+    return DeleteContactInformationUseCase(
+        contact_information_repository=repo, cv_listener=cv_listener
+    )
 
 
 # =====================================================================
@@ -481,10 +847,14 @@ def get_email_service() -> IEmailService:
 async def get_create_contact_message_use_case(
     repo: ContactMessageRepository = Depends(get_contact_message_repository),
     email_service: IEmailService = Depends(get_email_service),
+    stats: ContactMessageStatsRepository = Depends(
+        get_contact_message_stats_repository
+    ),
 ) -> CreateContactMessageUseCase:
     return CreateContactMessageUseCase(
         contact_message_repository=repo,
         email_service=email_service,
+        stats_repository=stats,
     )
 
 
@@ -496,8 +866,21 @@ async def get_list_contact_messages_use_case(
 
 async def get_delete_contact_message_use_case(
     repo: ContactMessageRepository = Depends(get_contact_message_repository),
+    stats: ContactMessageStatsRepository = Depends(
+        get_contact_message_stats_repository
+    ),
 ) -> DeleteContactMessageUseCase:
-    return DeleteContactMessageUseCase(contact_message_repository=repo)
+    return DeleteContactMessageUseCase(
+        contact_message_repository=repo, stats_repository=stats
+    )
+
+
+async def get_contact_message_stats_use_case(
+    stats: ContactMessageStatsRepository = Depends(
+        get_contact_message_stats_repository
+    ),
+) -> GetContactMessageStatsUseCase:
+    return GetContactMessageStatsUseCase(stats_repository=stats)
 
 
 # =====================================================================
@@ -507,20 +890,23 @@ async def get_delete_contact_message_use_case(
 
 async def get_add_tool_use_case(
     repo: ToolRepository = Depends(get_tool_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> AddToolUseCase:
-    return AddToolUseCase(tool_repository=repo)
+    return AddToolUseCase(tool_repository=repo, cv_listener=cv_listener)
 
 
 async def get_edit_tool_use_case(
     repo: ToolRepository = Depends(get_tool_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> EditToolUseCase:
-    return EditToolUseCase(tool_repository=repo)
+    return EditToolUseCase(tool_repository=repo, cv_listener=cv_listener)
 
 
 async def get_delete_tool_use_case(
     repo: ToolRepository = Depends(get_tool_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> DeleteToolUseCase:
-    return DeleteToolUseCase(tool_repository=repo)
+    return DeleteToolUseCase(tool_repository=repo, cv_listener=cv_listener)
 
 
 async def get_list_tools_use_case(
@@ -529,6 +915,31 @@ async def get_list_tools_use_case(
     return ListToolsUseCase(tool_repository=repo)
 
 
+async def get_list_tool_fields_use_case(
+    repo: ToolRepository = Depends(get_tool_repository),
+) -> ListToolFieldsUseCase:
+    return ListToolFieldsUseCase(repository=repo)
+
+
+async def get_group_tools_use_case(
+    repo: ToolRepository = Depends(get_tool_repository),
+) -> GroupToolsUseCase:
+    return GroupToolsUseCase(tool_repository=repo)
+
+
+async def get_tool_stats_use_case(
+    repo: ToolRepository = Depends(get_tool_repository),
+) -> GetToolStatsUseCase:
+    return GetToolStatsUseCase(tool_repository=repo)
+
+
+async def get_reorder_tools_use_case(
+    repo: ToolRepository = Depends(get_tool_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
+) -> ReorderToolsUseCase:
+    return ReorderToolsUseCase(repository=repo, cv_listener=cv_listener)
+
+
 # =====================================================================
 # USE CASE PROVIDERS — Social Network
 # =====================================================================
@@ -536,20 +947,29 @@ async def get_list_tools_use_case(
 
 async def get_add_social_network_use_case(
     repo: SocialNetworkRepository = Depends(get_social_network_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> AddSocialNetworkUseCase:
-    return AddSocialNetworkUseCase(social_network_repository=repo)
+    return AddSocialNetworkUseCase(
+        social_network_repository=repo, cv_listener=cv_listener
+    )
 
 
 async def get_edit_social_network_use_case(
     repo: SocialNetworkRepository = Depends(get_social_network_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> EditSocialNetworkUseCase:
-    return EditSocialNetworkUseCase(social_network_repository=repo)
+    return EditSocialNetworkUseCase(
+        social_network_repository=repo, cv_listener=cv_listener
+    )
 
 
 async def get_delete_social_network_use_case(
     repo: SocialNetworkRepository = Depends(get_social_network_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
 ) -> DeleteSocialNetworkUseCase:
-    return DeleteSocialNetworkUseCase(social_network_repository=repo)
+    return DeleteSocialNetworkUseCase(
+        social_network_repository=repo, cv_listener=cv_listener
+    )
 
 
 async def get_list_social_networks_use_case(
@@ -558,12 +978,33 @@ async def get_list_social_networks_use_case(
     return ListSocialNetworksUseCase(social_network_repository=repo)
 
 
+async def get_list_social_network_fields_use_case(
+    repo: SocialNetworkRepository = Depends(get_social_network_repository),
+) -> ListSocialNetworkFieldsUseCase:
+    return ListSocialNetworkFieldsUseCase(repository=repo)
+
+
+async def get_reorder_social_networks_use_case(
+    repo: SocialNetworkRepository = Depends(get_social_network_repository),
+    cv_listener: ICVChangeListener | None = Depends(get_cv_change_listener),
+) -> ReorderSocialNetworksUseCase:
+    return ReorderSocialNetworksUseCase(repository=repo, cv_listener=cv_listener)
+
+
 # =====================================================================
 # USE CASE PROVIDERS — CV
 # =====================================================================
 
 
-async def get_get_complete_cv_use_case(
+async def get_get_cv_snapshot_use_case(
+    snapshot_service: CVSnapshotService | None = Depends(get_cv_snapshot_service),
+) -> GetCVSnapshotUseCase | None:
+    if snapshot_service is None:
+        return None
+    return GetCVSnapshotUseCase(snapshot_service=snapshot_service)
+
+
+async def get_cv_fields_use_case(
     profile_repo: ProfileRepository = Depends(get_profile_repository),
     experience_repo: WorkExperienceRepository = Depends(get_work_experience_repository),
     skill_repo: SkillRepository = Depends(get_skill_repository),
@@ -580,18 +1021,30 @@ async def get_get_complete_cv_use_case(
         get_additional_training_repository
     ),
     certification_repo: CertificationRepository = Depends(get_certification_repository),
-) -> GetCompleteCVUseCase:
-    return GetCompleteCVUseCase(
-        profile_repository=profile_repo,
-        experience_repository=experience_repo,
-        skill_repository=skill_repo,
-        education_repository=education_repo,
-        contact_info_repository=contact_info_repo,
-        social_network_repository=social_network_repo,
-        project_repository=project_repo,
-        tool_repository=tool_repo,
-        additional_training_repository=additional_training_repo,
-        certification_repository=certification_repo,
+    language_repo: LanguageRepository = Depends(get_language_repository),
+    programming_language_repo: ProgrammingLanguageRepository = Depends(
+        get_programming_language_repository
+    ),
+) -> GetCVFieldsUseCase:
+    return GetCVFieldsUseCase(
+        sections={
+            "profile": GetProfileFieldsUseCase(profile_repo),
+            "contact_info": GetContactInformationFieldsUseCase(contact_info_repo),
+            "social_networks": ListSocialNetworkFieldsUseCase(social_network_repo),
+            "work_experiences": ListExperienceFieldsUseCase(experience_repo),
+            "projects": ListProjectFieldsUseCase(project_repo),
+            "skills": ListSkillFieldsUseCase(skill_repo),
+            "tools": ListToolFieldsUseCase(tool_repo),
+            "education": ListEducationFieldsUseCase(education_repo),
+            "additional_training": ListAdditionalTrainingFieldsUseCase(
+                additional_training_repo
+            ),
+            "certifications": ListCertificationFieldsUseCase(certification_repo),
+            "languages": ListLanguageFieldsUseCase(language_repo),
+            "programming_languages": ListProgrammingLanguageFieldsUseCase(
+                programming_language_repo
+            ),
+        }
     )
 
 
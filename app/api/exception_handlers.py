@@ -9,8 +9,8 @@ import logging
 
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 
+from app.api.responses import FastJSONResponse
 from app.domain.exceptions.domain_errors import DomainError
 from app.shared.shared_exceptions import (
     ApplicationException,
@@ -30,7 +30,7 @@ def _error_response(
     error: str,
     message: str,
     code: str | None = None,
-) -> JSONResponse:
+) -> FastJSONResponse:
     """Build a standardized error response."""
     body: dict[str, object] = {
         "success": False,
@@ -39,7 +39,7 @@ def _error_response(
     }
     if code is not None:
         body["code"] = code
-    return JSONResponse(status_code=status_code, content=body)
+    return FastJSONResponse(status_code=status_code, content=body)
 
 
 # ==================== APPLICATION EXCEPTION HANDLERS ====================
@@ -47,7 +47,7 @@ def _error_response(
 
 async def not_found_exception_handler(
     _request: Request, exc: NotFoundException
-) -> JSONResponse:
+) -> FastJSONResponse:
     """NotFoundException → 404"""
     return _error_response(
         status_code=status.HTTP_404_NOT_FOUND,
@@ -59,7 +59,7 @@ async def not_found_exception_handler(
 
 async def validation_exception_handler(
     _request: Request, exc: ValidationException
-) -> JSONResponse:
+) -> FastJSONResponse:
     """ValidationException → 422"""
     return _error_response(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -71,7 +71,7 @@ async def validation_exception_handler(
 
 async def duplicate_exception_handler(
     _request: Request, exc: DuplicateException
-) -> JSONResponse:
+) -> FastJSONResponse:
     """DuplicateException → 409"""
     return _error_response(
         status_code=status.HTTP_409_CONFLICT,
@@ -83,7 +83,7 @@ async def duplicate_exception_handler(
 
 async def unauthorized_exception_handler(
     _request: Request, exc: UnauthorizedException
-) -> JSONResponse:
+) -> FastJSONResponse:
     """UnauthorizedException → 401"""
     return _error_response(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -95,7 +95,7 @@ async def unauthorized_exception_handler(
 
 async def forbidden_exception_handler(
     _request: Request, exc: ForbiddenException
-) -> JSONResponse:
+) -> FastJSONResponse:
     """ForbiddenException → 403"""
     return _error_response(
         status_code=status.HTTP_403_FORBIDDEN,
@@ -107,7 +107,7 @@ async def forbidden_exception_handler(
 
 async def business_rule_exception_handler(
     _request: Request, exc: BusinessRuleViolationException
-) -> JSONResponse:
+) -> FastJSONResponse:
     """BusinessRuleViolationException → 400"""
     return _error_response(
         status_code=status.HTTP_400_BAD_REQUEST,
@@ -119,7 +119,7 @@ async def business_rule_exception_handler(
 
 async def application_exception_handler(
     _request: Request, exc: ApplicationException
-) -> JSONResponse:
+) -> FastJSONResponse:
     """Catch-all for any ApplicationException not handled above → 500"""
     logger.error("Unhandled application exception: %s", exc.message)
     return _error_response(
@@ -133,7 +133,7 @@ async def application_exception_handler(
 # ==================== DOMAIN EXCEPTION HANDLER ====================
 
 
-async def domain_error_handler(_request: Request, exc: DomainError) -> JSONResponse:
+async def domain_error_handler(_request: Request, exc: DomainError) -> FastJSONResponse:
     """DomainError (any) → 400"""
     return _error_response(
         status_code=status.HTTP_400_BAD_REQUEST,
@@ -148,7 +148,7 @@ async def domain_error_handler(_request: Request, exc: DomainError) -> JSONRespo
 
 async def request_validation_handler(
     _request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> FastJSONResponse:
     """Pydantic RequestValidationError → 422 with clean message."""
     errors = []
     for err in exc.errors():
@@ -166,7 +166,9 @@ async def request_validation_handler(
 # ==================== GENERIC FALLBACK ====================
 
 
-async def generic_exception_handler(_request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(
+    _request: Request, exc: Exception
+) -> FastJSONResponse:
     """Catch-all for unexpected exceptions → 500. Logs full traceback."""
     logger.exception("Unhandled exception: %s", exc)
     return _error_response(
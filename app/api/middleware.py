@@ -9,7 +9,12 @@ import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.middlewares import LoggingMiddleware, ProcessTimeMiddleware
+from app.api.middlewares import (
+    ConditionalGetMiddleware,
+    LoggingMiddleware,
+    ProcessTimeMiddleware,
+    ReadYourWritesMiddleware,
+)
 from app.config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -22,11 +27,23 @@ def setup_middleware(app: FastAPI) -> None:
     registration (last registered runs first).  We register them so that
     the execution order is:
 
-    1. ProcessTimeMiddleware  (outermost - measures total time)
-    2. LoggingMiddleware      (logs after response is ready)
-    3. CORSMiddleware         (innermost - handles preflight)
+    1. ProcessTimeMiddleware     (outermost - measures total time)
+    2. LoggingMiddleware         (logs after response is ready)
+    3. CORSMiddleware            (handles preflight, also decorates 304s)
+    4. ConditionalGetMiddleware  (ETag / 304 Not Modified)
+    5. ReadYourWritesMiddleware  (innermost - pins writers to the primary)
     """
-    # --- CORS (innermost - registered first) ---
+    # --- Read-your-writes (innermost - registered first) ---
+    # Only needed when public reads may be served by secondaries
+    read_your_writes = settings.MONGODB_READ_PREFERENCE != "primary"
+    if read_your_writes:
+        app.add_middleware(ReadYourWritesMiddleware)
+
+    # --- Conditional GET ---
+    if settings.HTTP_CONDITIONAL_GET_ENABLED:
+        app.add_middleware(ConditionalGetMiddleware)
+
+    # --- CORS ---
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.cors_origins_list,
@@ -41,5 +58,10 @@ def setup_middleware(app: FastAPI) -> None:
     # --- Process time (outermost - registered last) ---
     app.add_middleware(ProcessTimeMiddleware)
 
-    logger.info("Middlewares configured: CORS, Logging, ProcessTime")
+    logger.info(
+        "Middlewares configured: ReadYourWrites=%s, ConditionalGet=%s, CORS, "
+        "Logging, ProcessTime",
+        read_your_writes,
+        settings.HTTP_CONDITIONAL_GET_ENABLED,
+    )
     logger.info("CORS origins: %s", settings.cors_origins_list)
@@ -1,7 +1,11 @@
+from app.api.middlewares.conditional_get_middleware import ConditionalGetMiddleware
 from app.api.middlewares.logging_middleware import LoggingMiddleware
 from app.api.middlewares.process_time_middleware import ProcessTimeMiddleware
+from app.api.middlewares.read_your_writes_middleware import ReadYourWritesMiddleware
 
 __all__ = [
+    "ConditionalGetMiddleware",
     "LoggingMiddleware",
     "ProcessTimeMiddleware",
+    "ReadYourWritesMiddleware",
 ]
@@ -0,0 +1,180 @@
+"""
+Conditional GET middleware.
+
+Emits strong ``ETag`` and ``Last-Modified`` headers on public read endpoints
+and answers ``304 Not Modified`` when the client's ``If-None-Match`` matches,
+without running the endpoint. Validators come from per-collection content
+versions bumped by the repositories on every write, so the check is one
+primary-key lookup regardless of response size and never hashes the body.
+
+Versions are read with the same read preference as the content they
+describe: from the primary for clients that just wrote (see
+``ReadYourWritesMiddleware``), otherwise as ``MONGODB_READ_PREFERENCE`` says.
+"""
+
+from collections.abc import Callable
+from datetime import UTC, date, datetime, time
+from email.utils import format_datetime
+import logging
+
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+from app.api.middlewares.read_your_writes_middleware import reads_from_primary
+from app.config.settings import settings
+from app.infrastructure.database.mongo_client import MongoDBClient
+from app.infrastructure.repositories import (
+    AdditionalTrainingRepository,
+    CertificationRepository,
+    ContactInformationRepository,
+    ContentVersionRepository,
+    CVRepository,
+    EducationRepository,
+    LanguageRepository,
+    ProfileRepository,
+    ProgrammingLanguageRepository,
+    ProjectRepository,
+    SkillRepository,
+    SocialNetworkRepository,
+    ToolRepository,
+    WorkExperienceRepository,
+)
+from app.shared.interfaces.content_version import (
+    ContentVersion,
+    IContentVersionRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# Colecciones de las que depende cada grupo de endpoints públicos de lectura
+SCOPES_BY_PATH: dict[str, tuple[str, ...]] = {
+    "/cv": (
+        ProfileRepository.collection_name,
+        *(collection for collection, _, _ in CVRepository.SECTIONS.values()),
+    ),
+    "/profile": (ProfileRepository.collection_name,),
+    "/contact-information": (ContactInformationRepository.collection_name,),
+    "/social-networks": (SocialNetworkRepository.collection_name,),
+    "/work-experiences": (WorkExperienceRepository.collection_name,),
+    "/projects": (ProjectRepository.collection_name,),
+    "/skills": (SkillRepository.collection_name,),
+    "/tools": (ToolRepository.collection_name,),
+    "/programming-languages": (ProgrammingLanguageRepository.collection_name,),
+    "/languages": (LanguageRepository.collection_name,),
+    "/education": (EducationRepository.collection_name,),
+    "/additional-training": (AdditionalTrainingRepository.collection_name,),
+    "/certifications": (CertificationRepository.collection_name,),
+}
+
+# Sin validadores: no dependen solo del contenido almacenado
+EXCLUDED_PATHS = {"/cv/download"}
+
+# Colecciones cuya respuesta depende de la fecha (p. ej. is_expired); su
+# ETag incluye el día para no confirmar una respuesta de ayer
+DATE_SENSITIVE_SCOPES = {CertificationRepository.collection_name}
+
+
+def _default_version_store(request: Request) -> IContentVersionRepository | None:
+    # Quien acaba de escribir lee del primario: su ETag también
+    db = MongoDBClient.db if reads_from_primary(request) else MongoDBClient.read_db
+    if db is None:
+        return None
+    return ContentVersionRepository(db)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison, as RFC 9110 requires for If-None-Match."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+class ConditionalGetMiddleware(BaseHTTPMiddleware):
+    """Adds ETag/Last-Modified to public GETs and short-circuits 304s."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        version_store_factory: Callable[
+            [Request], IContentVersionRepository | None
+        ] = _default_version_store,
+        prefix: str = settings.API_V1_PREFIX,
+    ) -> None:
+        super().__init__(app)
+        self._version_store_factory = version_store_factory
+        self._prefix = prefix
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        if request.method not in ("GET", "HEAD"):
+            return await call_next(request)
+
+        scopes = self._scopes_for(request.url.path)
+        store = self._version_store_factory(request) if scopes else None
+        if store is None:
+            return await call_next(request)
+
+        # Leer la versión ANTES que el contenido: si hay una escritura en
+        # medio, el cliente recibe datos nuevos con un ETag viejo (como
+        # mucho una revalidación de más), nunca un 304 falso
+        try:
+            versions = await store.get_versions(scopes)
+        except Exception:
+            logger.warning("Content versions unavailable", exc_info=True)
+            return await call_next(request)
+
+        today = datetime.now(UTC).date()
+        etag = self._etag(scopes, versions, today)
+        last_modified = self._last_modified(scopes, versions, today)
+        headers = {"ETag": etag}
+        if last_modified is not None:
+            headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+
+        response = await call_next(request)
+        if response.status_code == 200:
+            response.headers.update(headers)
+        return response
+
+    def _scopes_for(self, path: str) -> tuple[str, ...]:
+        if not path.startswith(self._prefix):
+            return ()
+        path = path[len(self._prefix) :]
+        if path in EXCLUDED_PATHS:
+            return ()
+        for base, scopes in SCOPES_BY_PATH.items():
+            if path == base or path.startswith(base + "/"):
+                return scopes
+        return ()
+
+    @staticmethod
+    def _etag(
+        scopes: tuple[str, ...], versions: dict[str, ContentVersion], today: date
+    ) -> str:
+        # Las versiones solo crecen: su suma cambia con cualquier escritura
+        total = sum(versions[scope].version for scope in scopes)
+        etag = f"{settings.VERSION}-{total}"
+        if DATE_SENSITIVE_SCOPES.intersection(scopes):
+            etag = f"{etag}-{today:%Y%m%d}"
+        return f'"{etag}"'
+
+    @staticmethod
+    def _last_modified(
+        scopes: tuple[str, ...], versions: dict[str, ContentVersion], today: date
+    ) -> datetime | None:
+        # updated_at se guarda en UTC sin zona horaria
+        stamps = []
+        for scope in scopes:
+            updated_at = versions[scope].updated_at
+            if updated_at is not None:
+                stamps.append(updated_at.replace(tzinfo=UTC))
+        if DATE_SENSITIVE_SCOPES.intersection(scopes):
+            stamps.append(datetime.combine(today, time.min, tzinfo=UTC))
+        return max(stamps) if stamps else None
@@ -0,0 +1,54 @@
+"""
+Read-your-writes middleware.
+
+Public reads may be served by replica set secondaries
+(``MONGODB_READ_PREFERENCE``), which lag behind the primary.  After a
+successful write, this middleware sets a short-lived cookie on the response;
+while the client sends it back, its reads go to the primary, so an editor
+always sees their own change.  Everybody else keeps reading from secondaries.
+"""
+
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+from app.config.settings import settings
+
+PRIMARY_READS_COOKIE = "primary_reads"
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def reads_from_primary(request: Request) -> bool:
+    """Whether this request must read from the primary."""
+    return request.method not in SAFE_METHODS or PRIMARY_READS_COOKIE in request.cookies
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """Pins a client's reads to the primary for a while after it writes."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        pin_seconds: int = settings.MONGODB_PRIMARY_PIN_SECONDS,
+        path: str = settings.API_V1_PREFIX,
+    ) -> None:
+        super().__init__(app)
+        self._pin_seconds = pin_seconds
+        self._path = path
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        response = await call_next(request)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                PRIMARY_READS_COOKIE,
+                "1",
+                max_age=self._pin_seconds,
+                path=self._path,
+                httponly=True,
+                samesite="lax",
+            )
+        return response
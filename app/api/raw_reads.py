@@ -0,0 +1,63 @@
+"""
+Raw public reads (``PUBLIC_RAW_READS``).
+
+Public lists whose items are plain stored fields can skip the entity, the DTO
+and the ``response_model`` validation: the repository streams read views
+straight from raw BSON (``stream_views``) and each view is encoded the way
+the validated response would be, with the fields in the schema order. The
+response bytes are the same as on the regular path.
+
+Endpoints with computed fields (``is_current``, ``is_expired``...) still need
+the entity and keep the regular path.
+"""
+
+from collections.abc import AsyncIterator, Mapping, Sequence
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.api.responses import dumps
+
+# Bytes gathered before each write to the client
+CHUNK_BYTES = 64 * 1024
+
+
+def response_fields(schema: type[BaseModel]) -> tuple[str, ...]:
+    """Fields of a response schema, in the order it serializes them."""
+    return tuple(schema.model_fields)
+
+
+def encode_item(view: Mapping[str, Any], fields: Sequence[str]) -> bytes:
+    """One item as ``FastJSONResponse`` renders it, with ``fields`` in order."""
+    return dumps({name: view[name] for name in fields})
+
+
+async def raw_list_response(
+    views: AsyncIterator[Mapping[str, Any]], fields: Sequence[str]
+) -> StreamingResponse:
+    """
+    Stream ``views`` as a JSON array of ``fields``.
+
+    The first item is read before answering, so a failing query (or an
+    invalid request) still reaches the exception handlers instead of
+    cutting a 200 response short.
+    """
+    first = await anext(views, None)
+
+    async def body() -> AsyncIterator[bytes]:
+        if first is None:
+            yield b"[]"
+            return
+        chunk = bytearray(b"[")
+        chunk += encode_item(first, fields)
+        async for view in views:
+            chunk += b","
+            chunk += encode_item(view, fields)
+            if len(chunk) >= CHUNK_BYTES:
+                yield bytes(chunk)
+                chunk.clear()
+        chunk += b"]"
+        yield bytes(chunk)
+
+    return StreamingResponse(body(), media_type="application/json")
@@ -0,0 +1,43 @@
+"""
+JSON responses.
+
+``FastJSONResponse`` is the application's default response class (see
+``app.main``) and the one used by the exception handlers. It renders with
+orjson instead of the stdlib ``json`` module: datetimes, dates, UUIDs, enums
+and dataclasses (DTOs and value objects such as ``SkillLevel``) are encoded
+natively, with the same output ``jsonable_encoder`` + ``json.dumps`` give.
+"""
+
+from collections.abc import Mapping
+from typing import Any
+
+from fastapi.responses import JSONResponse
+import orjson
+from pydantic import BaseModel
+
+# Non-str dict keys (ints, enums...) become strings, as with jsonable_encoder
+DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _encode_value(value: Any) -> Any:
+    # Schemas returned without a response_model (e.g. from views_response)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    # Embedded documents of a RawBSONDocument
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, set | frozenset):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Compact UTF-8 JSON of ``content``, as ``FastJSONResponse`` renders it."""
+    return orjson.dumps(content, default=_encode_value, option=DUMPS_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Generic, TypeVar
 
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, Field
 
 # Generic type para responses
 T = TypeVar("T")
@@ -36,3 +36,15 @@ class TimestampMixin(BaseModel):
 
     created_at: datetime | None = None
     updated_at: datetime | None = None
+
+
+class ReorderItem(BaseModel):
+    """Nueva posición de un elemento en un reordenamiento"""
+
+    id: str = Field(..., min_length=1)
+    order_index: int = Field(
+        ...,
+        ge=0,
+        validation_alias=AliasChoices("order_index", "orderIndex"),
+        description="Nueva posición (debe ser única dentro del perfil)",
+    )
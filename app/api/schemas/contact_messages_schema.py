@@ -75,3 +75,15 @@ class ContactMessageResponse(ContactMessageBase, TimestampMixin):
     replied_at: datetime | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ContactMessagePage(BaseModel):
+    """
+    Página de mensajes de contacto (paginación por cursor).
+
+    Para pedir la siguiente página se envía ``next_cursor`` como ``cursor``;
+    es ``None`` en la última página.
+    """
+
+    messages: list[ContactMessageResponse]
+    next_cursor: str | None = None
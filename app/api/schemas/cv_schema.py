@@ -4,7 +4,9 @@ from app.api.schemas.additional_training_schema import AdditionalTrainingRespons
 from app.api.schemas.certification_schema import CertificationResponse
 from app.api.schemas.contact_info_schema import ContactInformationResponse
 from app.api.schemas.education_schema import EducationResponse
+from app.api.schemas.language_schema import LanguageResponse
 from app.api.schemas.profile_schema import ProfileResponse
+from app.api.schemas.programming_language_schema import ProgrammingLanguageResponse
 from app.api.schemas.projects_schema import ProjectResponse
 from app.api.schemas.skill_schema import SkillResponse
 from app.api.schemas.social_networks_schema import SocialNetworkResponse
@@ -36,4 +38,11 @@ class CVCompleteResponse(BaseModel):
     additional_training: list[AdditionalTrainingResponse] = []
     certifications: list[CertificationResponse] = []
 
+    # Idiomas y lenguajes (opcionales: solo con ?include=)
+    languages: list[LanguageResponse] | None = None
+    programming_languages: list[ProgrammingLanguageResponse] | None = None
+
+    # Secciones opcionales que no se pudieron cargar a tiempo (CV parcial)
+    missing_sections: list[str] = []
+
     model_config = ConfigDict(from_attributes=True)
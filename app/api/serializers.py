@@ -0,0 +1,166 @@
+"""
+Precompiled response serializers.
+
+Routes declare a ``response_model`` schema and return DTO dataclasses, which
+FastAPI validates against the schema (every item of a list) before dumping
+them. The response schemas mostly copy DTO fields as they are, so each
+schema is compiled once into a converter that reads its fields from the DTO
+in the schema order, and the route answers with the result directly. Fields
+whose dump may differ from the stored value (``EmailStr``...) and schemas
+with aliases or computed fields still go through pydantic.
+
+In development and test (``settings.DEBUG``) every response is also
+validated against the schema, as FastAPI does, and must produce the same
+JSON: a schema the converter cannot reproduce fails there instead of
+changing production responses.
+"""
+
+from collections.abc import Callable, Mapping
+from datetime import date, datetime
+from functools import cache
+from types import NoneType, UnionType
+from typing import Any, Literal, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+from app.api.responses import FastJSONResponse, dumps
+from app.config.settings import settings
+
+Converter = Callable[[Any], Any]
+
+# Types the JSON dump leaves as they are (datetimes are encoded by dumps)
+_PLAIN_TYPES = (str, int, bool, datetime, date, NoneType)
+
+_MISSING = object()
+
+
+def _read(source: Any, name: str) -> Any:
+    # DTOs, or dicts (the CV snapshot)
+    if isinstance(source, Mapping):
+        return source.get(name, _MISSING)
+    return getattr(source, name, _MISSING)
+
+
+def _through_pydantic(annotation: Any) -> Converter:
+    adapter = TypeAdapter(annotation)
+
+    def convert(value: Any) -> Any:
+        return adapter.dump_python(
+            adapter.validate_python(value, from_attributes=True),
+            mode="json",
+            by_alias=True,
+        )
+
+    return convert
+
+
+def _compile(annotation: Any) -> Converter | None:
+    """Converter of a value of ``annotation``; None if it is copied as is."""
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if annotation in _PLAIN_TYPES or origin is Literal:
+        return None
+    if origin is Union or origin is UnionType:
+        options = [arg for arg in args if arg is not NoneType]
+        if len(options) == 1:
+            convert = _compile(options[0])
+            if convert is None:
+                return None
+            return lambda value: None if value is None else convert(value)
+        if all(_compile(arg) is None for arg in options):
+            return None
+    elif origin is list:
+        item_converter = _compile(args[0])
+        if item_converter is None:
+            return None
+        return lambda value: [item_converter(item) for item in value]
+    elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _compile_model(annotation)
+    return _through_pydantic(annotation)
+
+
+@cache
+def _compile_model(schema: type[BaseModel]) -> Converter:
+    if schema.model_computed_fields or any(
+        info.alias or info.serialization_alias or info.validation_alias
+        for info in schema.model_fields.values()
+    ):
+        return _through_pydantic(schema)
+
+    plan = [
+        (
+            name,
+            (
+                _MISSING
+                if info.is_required()
+                else info.get_default(call_default_factory=True)
+            ),
+            _compile(info.annotation),
+        )
+        for name, info in schema.model_fields.items()
+        if not info.exclude
+    ]
+
+    def convert(source: Any) -> dict[str, Any]:
+        item = {}
+        for name, default, convert_value in plan:
+            value = _read(source, name)
+            if value is _MISSING:
+                if default is _MISSING:
+                    raise TypeError(f"{schema.__name__} missing field: {name}")
+                value = default
+            item[name] = value if convert_value is None else convert_value(value)
+        return item
+
+    return convert
+
+
+class ResponseSerializer:
+    """
+    DTO → JSON converter of one response type (a schema or ``list[schema]``).
+
+    Attributes:
+        response_type: The route's ``response_model``
+    """
+
+    def __init__(self, response_type: Any, *, validate: bool):
+        self.response_type = response_type
+        self._convert = _compile(response_type) or (lambda value: value)
+        self._adapter = TypeAdapter(response_type) if validate else None
+
+    def content(self, dto: Any) -> Any:
+        """
+        ``dto`` as the response_model would dump it (datetimes left to dumps).
+
+        Raises:
+            ValidationError: If validating and ``dto`` doesn't match the schema
+            RuntimeError: If validating and the schema dumps something else
+        """
+        content = self._convert(dto)
+        if self._adapter is not None:
+            expected = self._adapter.dump_python(
+                self._adapter.validate_python(dto, from_attributes=True),
+                mode="json",
+                by_alias=True,
+            )
+            if dumps(content) != dumps(expected):
+                raise RuntimeError(
+                    f"Precompiled serializer of {self.response_type} "
+                    "differs from the schema"
+                )
+        return content
+
+    def response(self, dto: Any, status_code: int = 200) -> FastJSONResponse:
+        """JSON response with ``dto``, without validating it again."""
+        return FastJSONResponse(self.content(dto), status_code=status_code)
+
+
+@cache
+def serializer_for(response_type: Any) -> ResponseSerializer:
+    """
+    Serializer of ``response_type``, compiled on first use.
+
+    Routers get theirs at import time, so every schema is compiled once at
+    startup. They validate only in development and test.
+    """
+    return ResponseSerializer(response_type, validate=settings.DEBUG)
@@ -0,0 +1,50 @@
+"""
+Sparse fieldsets (``?fields=``).
+
+With ``fields`` a list endpoint only returns those fields (plus ``id``), and
+the repositories only load them from MongoDB. Partial items don't match the
+full ``response_model``, so they are returned as plain JSON.
+"""
+
+from typing import Any
+
+from app.api.responses import FastJSONResponse
+from app.shared.shared_exceptions import ValidationException
+
+FIELDS_DESCRIPTION = (
+    "Campos a devolver separados por comas, p. ej. `name,level` "
+    "(el `id` se incluye siempre). Sin `fields` se devuelven todos"
+)
+
+CV_FIELDS_DESCRIPTION = (
+    "Secciones y campos a devolver como `sección.campo` separados por comas, "
+    "p. ej. `skills.name,work_experiences.role`. Una sección sin campo se "
+    "devuelve completa; las secciones no nombradas se omiten"
+)
+
+
+def parse_fields(fields: str) -> tuple[str, ...]:
+    """Field names of a comma separated list, ignoring blanks."""
+    return tuple(name for name in (n.strip() for n in fields.split(",")) if name)
+
+
+def parse_cv_fields(fields: str) -> dict[str, tuple[str, ...]]:
+    """
+    Group ``section.field`` names by section.
+
+    A bare ``section`` maps to an empty tuple (every field of the section).
+    """
+    by_section: dict[str, list[str]] = {}
+    for name in parse_fields(fields):
+        section, _, field = name.partition(".")
+        if not section or "." in field:
+            raise ValidationException([f"Expected section.field: {name}"])
+        by_section.setdefault(section, [])
+        if field:
+            by_section[section].append(field)
+    return {section: tuple(names) for section, names in by_section.items()}
+
+
+def views_response(views: Any) -> FastJSONResponse:
+    """JSON response for partial items, bypassing the full response_model."""
+    return FastJSONResponse(content=views)
@@ -1,31 +1,42 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 from app.api.dependencies import (
     get_add_additional_training_use_case,
     get_additional_training_repository,
     get_delete_additional_training_use_case,
     get_edit_additional_training_use_case,
+    get_list_additional_training_fields_use_case,
     get_list_additional_trainings_use_case,
+    get_reorder_additional_trainings_use_case,
 )
+from app.api.raw_reads import raw_list_response, response_fields
 from app.api.schemas.additional_training_schema import (
     AdditionalTrainingCreate,
     AdditionalTrainingResponse,
     AdditionalTrainingUpdate,
 )
-from app.api.schemas.common_schema import MessageResponse
+from app.api.schemas.common_schema import MessageResponse, ReorderItem
+from app.api.serializers import serializer_for
+from app.api.sparse_fields import FIELDS_DESCRIPTION, parse_fields, views_response
 from app.application.dto import (
     AddAdditionalTrainingRequest,
     AdditionalTrainingResponse as AdditionalTrainingDTO,
     DeleteAdditionalTrainingRequest,
     EditAdditionalTrainingRequest,
     ListAdditionalTrainingsRequest,
+    ListFieldsRequest,
+    ReorderItem as ReorderItemDTO,
+    ReorderRequest,
 )
 from app.application.use_cases.additional_training import (
     AddAdditionalTrainingUseCase,
     DeleteAdditionalTrainingUseCase,
     EditAdditionalTrainingUseCase,
+    ListAdditionalTrainingFieldsUseCase,
     ListAdditionalTrainingsUseCase,
+    ReorderAdditionalTrainingsUseCase,
 )
+from app.config.settings import settings
 from app.infrastructure.repositories import AdditionalTrainingRepository
 from app.shared.shared_exceptions import NotFoundException
 
@@ -33,6 +44,15 @@ router = APIRouter(prefix="/additional-training", tags=["Additional Training"])
 
 PROFILE_ID = "default_profile"
 
+# Campos (y orden) de cada elemento en las lecturas directas del BSON
+ADDITIONAL_TRAINING_FIELDS = response_fields(AdditionalTrainingResponse)
+
+
+# Serializadores precompilados: en producción las respuestas no se vuelven a
+# validar contra el response_model (en development y test sí)
+ADDITIONAL_TRAINING_LIST_SERIALIZER = serializer_for(list[AdditionalTrainingResponse])
+ADDITIONAL_TRAINING_SERIALIZER = serializer_for(AdditionalTrainingResponse)
+
 
 @router.get(
     "",
@@ -41,14 +61,39 @@ PROFILE_ID = "default_profile"
     description="Obtiene toda la formación complementaria ordenada por orderIndex",
 )
 async def get_additional_trainings(
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     use_case: ListAdditionalTrainingsUseCase = Depends(
         get_list_additional_trainings_use_case
     ),
+    fields_use_case: ListAdditionalTrainingFieldsUseCase = Depends(
+        get_list_additional_training_fields_use_case
+    ),
 ):
-    result = await use_case.execute(
-        ListAdditionalTrainingsRequest(profile_id=PROFILE_ID)
-    )
-    return result.trainings
+    request = ListAdditionalTrainingsRequest(profile_id=PROFILE_ID)
+    # Con fields solo se leen de MongoDB (y se devuelven) esos campos, en el
+    # mismo orden que la lista completa
+    if fields:
+        views = await fields_use_case.execute(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=parse_fields(fields),
+                ascending=request.ascending,
+            )
+        )
+        return views_response(views)
+    # Sin fields: con PUBLIC_RAW_READS se sirven directamente del BSON, con
+    # el orden de la lista completa
+    if settings.PUBLIC_RAW_READS:
+        stream = fields_use_case.stream(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=ADDITIONAL_TRAINING_FIELDS,
+                ascending=request.ascending,
+            )
+        )
+        return await raw_list_response(stream, ADDITIONAL_TRAINING_FIELDS)
+    result = await use_case.execute(request)
+    return ADDITIONAL_TRAINING_LIST_SERIALIZER.response(result.trainings)
 
 
 @router.get(
@@ -64,7 +109,9 @@ async def get_additional_training(
     entity = await repo.get_by_id(training_id)
     if not entity:
         raise NotFoundException("AdditionalTraining", training_id)
-    return AdditionalTrainingDTO.from_entity(entity)
+    return ADDITIONAL_TRAINING_SERIALIZER.response(
+        AdditionalTrainingDTO.from_entity(entity)
+    )
 
 
 @router.post(
@@ -147,6 +194,15 @@ async def delete_additional_training(
     summary="Reordenar formación adicional",
     description="Actualiza el orderIndex de múltiples formaciones de una vez",
 )
-async def reorder_additional_trainings(_training_orders: list[dict]):
-    # TODO: Implement with ReorderAdditionalTrainingsUseCase
-    return []
+async def reorder_additional_trainings(
+    items: list[ReorderItem],
+    use_case: ReorderAdditionalTrainingsUseCase = Depends(
+        get_reorder_additional_trainings_use_case
+    ),
+):
+    return await use_case.execute(
+        ReorderRequest(
+            profile_id=PROFILE_ID,
+            items=[ReorderItemDTO(id=i.id, order_index=i.order_index) for i in items],
+        )
+    )
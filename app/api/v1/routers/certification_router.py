@@ -1,34 +1,44 @@
-from datetime import date, timedelta
+from datetime import date, datetime, time, timedelta
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 from app.api.dependencies import (
     get_add_certification_use_case,
     get_certification_repository,
     get_delete_certification_use_case,
     get_edit_certification_use_case,
+    get_list_certification_fields_use_case,
     get_list_certifications_use_case,
+    get_reorder_certifications_use_case,
 )
 from app.api.schemas.certification_schema import (
     CertificationCreate,
     CertificationResponse,
     CertificationUpdate,
 )
-from app.api.schemas.common_schema import MessageResponse
+from app.api.schemas.common_schema import MessageResponse, ReorderItem
+from app.api.serializers import serializer_for
+from app.api.sparse_fields import FIELDS_DESCRIPTION, parse_fields, views_response
 from app.application.dto import (
     AddCertificationRequest,
     CertificationResponse as CertificationDTO,
     DeleteCertificationRequest,
     EditCertificationRequest,
     ListCertificationsRequest,
+    ListFieldsRequest,
+    ReorderItem as ReorderItemDTO,
+    ReorderRequest,
 )
 from app.application.use_cases.certification import (
     AddCertificationUseCase,
     DeleteCertificationUseCase,
     EditCertificationUseCase,
+    ListCertificationFieldsUseCase,
     ListCertificationsUseCase,
+    ReorderCertificationsUseCase,
 )
 from app.infrastructure.repositories import CertificationRepository
+from app.shared.interfaces import Not, Range
 from app.shared.shared_exceptions import NotFoundException
 
 router = APIRouter(prefix="/certifications", tags=["Certifications"])
@@ -36,6 +46,12 @@ router = APIRouter(prefix="/certifications", tags=["Certifications"])
 PROFILE_ID = "default_profile"
 
 
+# Serializadores precompilados: en producción las respuestas no se vuelven a
+# validar contra el response_model (en development y test sí)
+CERTIFICATION_LIST_SERIALIZER = serializer_for(list[CertificationResponse])
+CERTIFICATION_SERIALIZER = serializer_for(CertificationResponse)
+
+
 @router.get(
     "",
     response_model=list[CertificationResponse],
@@ -44,16 +60,36 @@ PROFILE_ID = "default_profile"
 )
 async def get_certifications(
     active_only: bool = False,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     use_case: ListCertificationsUseCase = Depends(get_list_certifications_use_case),
+    fields_use_case: ListCertificationFieldsUseCase = Depends(
+        get_list_certification_fields_use_case
+    ),
 ):
-    result = await use_case.execute(ListCertificationsRequest(profile_id=PROFILE_ID))
+    request = ListCertificationsRequest(profile_id=PROFILE_ID)
+    # Con fields solo se leen de MongoDB (y se devuelven) esos campos, en el
+    # mismo orden que la lista completa
+    if fields:
+        # Activas: sin caducidad o caducan después de hoy
+        tomorrow = datetime.combine(date.today() + timedelta(days=1), time())
+        active = {"expiry_date": Not(Range(lt=tomorrow))}
+        views = await fields_use_case.execute(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=parse_fields(fields),
+                filters=active if active_only else {},
+                ascending=request.ascending,
+            )
+        )
+        return views_response(views)
+    result = await use_case.execute(request)
     certs = result.certifications
     if active_only:
         today = date.today()
         certs = [
             c for c in certs if c.expiry_date is None or c.expiry_date.date() > today
         ]
-    return certs
+    return CERTIFICATION_LIST_SERIALIZER.response(certs)
 
 
 @router.get(
@@ -69,7 +105,7 @@ async def get_certification(
     entity = await repo.get_by_id(certification_id)
     if not entity:
         raise NotFoundException("Certification", certification_id)
-    return CertificationDTO.from_entity(entity)
+    return CERTIFICATION_SERIALIZER.response(CertificationDTO.from_entity(entity))
 
 
 @router.post(
@@ -148,9 +184,18 @@ async def delete_certification(
     summary="Reordenar certificaciones",
     description="Actualiza el orderIndex de múltiples certificaciones de una vez",
 )
-async def reorder_certifications(_certification_orders: list[dict]):
-    # TODO: Implement with ReorderCertificationsUseCase
-    return []
+async def reorder_certifications(
+    items: list[ReorderItem],
+    use_case: ReorderCertificationsUseCase = Depends(
+        get_reorder_certifications_use_case
+    ),
+):
+    return await use_case.execute(
+        ReorderRequest(
+            profile_id=PROFILE_ID,
+            items=[ReorderItemDTO(id=i.id, order_index=i.order_index) for i in items],
+        )
+    )
 
 
 @router.get(
@@ -163,9 +208,10 @@ async def get_certifications_by_issuer(
     issuer: str,
     use_case: ListCertificationsUseCase = Depends(get_list_certifications_use_case),
 ):
-    result = await use_case.execute(ListCertificationsRequest(profile_id=PROFILE_ID))
-    issuer_lower = issuer.lower()
-    return [c for c in result.certifications if issuer_lower in c.issuer.lower()]
+    result = await use_case.execute(
+        ListCertificationsRequest(profile_id=PROFILE_ID, issuer=issuer)
+    )
+    return CERTIFICATION_LIST_SERIALIZER.response(result.certifications)
 
 
 @router.get(
@@ -177,8 +223,10 @@ async def get_certifications_by_issuer(
 async def get_expired_certifications(
     use_case: ListCertificationsUseCase = Depends(get_list_certifications_use_case),
 ):
-    result = await use_case.execute(ListCertificationsRequest(profile_id=PROFILE_ID))
-    return [c for c in result.certifications if c.is_expired]
+    result = await use_case.execute(
+        ListCertificationsRequest(profile_id=PROFILE_ID, expired_only=True)
+    )
+    return CERTIFICATION_LIST_SERIALIZER.response(result.certifications)
 
 
 @router.get(
@@ -191,13 +239,7 @@ async def get_expiring_soon_certifications(
     days: int = 90,
     use_case: ListCertificationsUseCase = Depends(get_list_certifications_use_case),
 ):
-    result = await use_case.execute(ListCertificationsRequest(profile_id=PROFILE_ID))
-    today = date.today()
-    threshold = today + timedelta(days=days)
-    return [
-        c
-        for c in result.certifications
-        if c.expiry_date is not None
-        and not c.is_expired
-        and c.expiry_date.date() <= threshold
-    ]
+    result = await use_case.execute(
+        ListCertificationsRequest(profile_id=PROFILE_ID, expiring_within_days=days)
+    )
+    return CERTIFICATION_LIST_SERIALIZER.response(result.certifications)
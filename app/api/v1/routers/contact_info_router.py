@@ -12,6 +12,7 @@ from app.api.schemas.contact_info_schema import (
     ContactInformationResponse,
     ContactInformationUpdate,
 )
+from app.api.serializers import serializer_for
 from app.application.dto import (
     CreateContactInformationRequest,
     DeleteContactInformationRequest,
@@ -30,6 +31,11 @@ router = APIRouter(prefix="/contact-information", tags=["Contact Information"])
 PROFILE_ID = "default_profile"
 
 
+# Serializadores precompilados: en producción las respuestas no se vuelven a
+# validar contra el response_model (en development y test sí)
+CONTACT_INFORMATION_SERIALIZER = serializer_for(ContactInformationResponse)
+
+
 @router.get(
     "",
     response_model=ContactInformationResponse,
@@ -42,7 +48,7 @@ async def get_contact_information(
     ),
 ):
     result = await use_case.execute(GetContactInformationRequest(profile_id=PROFILE_ID))
-    return result
+    return CONTACT_INFORMATION_SERIALIZER.response(result)
 
 
 @router.post(
@@ -1,9 +1,8 @@
-from datetime import date, timedelta
-
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 from app.api.dependencies import (
     get_contact_message_repository,
+    get_contact_message_stats_use_case,
     get_create_contact_message_use_case,
     get_delete_contact_message_use_case,
     get_list_contact_messages_use_case,
@@ -11,17 +10,22 @@ from app.api.dependencies import (
 from app.api.schemas.common_schema import MessageResponse
 from app.api.schemas.contact_messages_schema import (
     ContactMessageCreate,
+    ContactMessagePage,
     ContactMessageResponse,
 )
+from app.api.serializers import serializer_for
 from app.application.dto import (
     ContactMessageResponse as ContactMessageDTO,
     CreateContactMessageRequest,
     DeleteContactMessageRequest,
+    GetContactMessageStatsRequest,
     ListContactMessagesRequest,
 )
+from app.application.dto.contact_message_dto import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.application.use_cases.contact_message import (
     CreateContactMessageUseCase,
     DeleteContactMessageUseCase,
+    GetContactMessageStatsUseCase,
     ListContactMessagesUseCase,
 )
 from app.infrastructure.repositories import ContactMessageRepository
@@ -30,6 +34,13 @@ from app.shared.shared_exceptions import NotFoundException
 router = APIRouter(prefix="/contact-messages", tags=["Contact Messages"])
 
 
+# Serializadores precompilados: en producción las respuestas no se vuelven a
+# validar contra el response_model (en development y test sí)
+CONTACT_MESSAGE_LIST_SERIALIZER = serializer_for(list[ContactMessageResponse])
+CONTACT_MESSAGE_PAGE_SERIALIZER = serializer_for(ContactMessagePage)
+CONTACT_MESSAGE_SERIALIZER = serializer_for(ContactMessageResponse)
+
+
 @router.get(
     "/stats/summary",
     response_model=dict,
@@ -37,55 +48,20 @@ router = APIRouter(prefix="/contact-messages", tags=["Contact Messages"])
     description="Obtiene estadísticas sobre los mensajes recibidos",
 )
 async def get_contact_messages_stats(
-    use_case: ListContactMessagesUseCase = Depends(get_list_contact_messages_use_case),
+    use_case: GetContactMessageStatsUseCase = Depends(
+        get_contact_message_stats_use_case
+    ),
 ):
-    result = await use_case.execute(ListContactMessagesRequest(ascending=False))
-    messages = result.messages
-
-    today = date.today()
-    dated_messages = [m for m in messages if m.created_at is not None]
-
-    stats: dict = {
+    # Se leen los contadores diarios, no los mensajes
+    result = await use_case.execute(GetContactMessageStatsRequest())
+    return {
         "total": result.total,
-        "today": len(
-            [
-                m
-                for m in dated_messages
-                if m.created_at is not None and m.created_at.date() == today
-            ]
-        ),
-        "this_week": len(
-            [
-                m
-                for m in dated_messages
-                if m.created_at is not None
-                and m.created_at.date() >= today - timedelta(days=7)
-            ]
-        ),
-        "this_month": len(
-            [
-                m
-                for m in dated_messages
-                if m.created_at is not None
-                and m.created_at.date() >= today - timedelta(days=30)
-            ]
-        ),
-        "by_day": {},
+        "today": result.today,
+        "this_week": result.this_week,
+        "this_month": result.this_month,
+        "by_day": result.by_day,
     }
 
-    for i in range(7):
-        day = today - timedelta(days=i)
-        count = len(
-            [
-                m
-                for m in dated_messages
-                if m.created_at is not None and m.created_at.date() == day
-            ]
-        )
-        stats["by_day"][str(day)] = count
-
-    return stats
-
 
 @router.get(
     "/recent/{limit}",
@@ -100,21 +76,33 @@ async def get_recent_contact_messages(
     if limit > 50:
         limit = 50
 
-    result = await use_case.execute(ListContactMessagesRequest(ascending=False))
-    return result.messages[:limit]
+    result = await use_case.execute(
+        ListContactMessagesRequest(ascending=False, limit=max(limit, 1))
+    )
+    return CONTACT_MESSAGE_LIST_SERIALIZER.response(result.messages)
 
 
 @router.get(
     "",
-    response_model=list[ContactMessageResponse],
+    response_model=ContactMessagePage,
     summary="Listar mensajes de contacto (ADMIN)",
-    description="Obtiene todos los mensajes de contacto recibidos",
+    description=(
+        "Obtiene los mensajes de contacto, del más reciente al más antiguo, "
+        "paginados por cursor: `next_cursor` se envía como `cursor` para "
+        "pedir la página siguiente"
+    ),
 )
 async def get_contact_messages(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
     use_case: ListContactMessagesUseCase = Depends(get_list_contact_messages_use_case),
 ):
-    result = await use_case.execute(ListContactMessagesRequest(ascending=False))
-    return result.messages
+    result = await use_case.execute(
+        ListContactMessagesRequest(ascending=False, limit=limit, cursor=cursor)
+    )
+    return CONTACT_MESSAGE_PAGE_SERIALIZER.response(
+        {"messages": result.messages, "next_cursor": result.next_cursor}
+    )
 
 
 @router.get(
@@ -130,7 +118,7 @@ async def get_contact_message(
     entity = await repo.get_by_id(message_id)
     if not entity:
         raise NotFoundException("ContactMessage", message_id)
-    return ContactMessageDTO.from_entity(entity)
+    return CONTACT_MESSAGE_SERIALIZER.response(ContactMessageDTO.from_entity(entity))
 
 
 @router.post(
@@ -1,16 +1,46 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import FileResponse
 
 from app.api.dependencies import (
+    get_cv_fields_use_case,
     get_generate_cv_pdf_use_case,
     get_get_complete_cv_use_case,
+    get_get_cv_snapshot_use_case,
 )
 from app.api.schemas.cv_schema import CVCompleteResponse
-from app.application.dto import GenerateCVPDFRequest, GetCompleteCVRequest
-from app.application.use_cases import GenerateCVPDFUseCase, GetCompleteCVUseCase
+from app.api.serializers import serializer_for
+from app.api.sparse_fields import (
+    CV_FIELDS_DESCRIPTION,
+    parse_cv_fields,
+    parse_fields,
+    views_response,
+)
+from app.application.dto import (
+    GenerateCVPDFRequest,
+    GetCompleteCVRequest,
+    GetCVFieldsRequest,
+)
+from app.application.use_cases import (
+    GenerateCVPDFUseCase,
+    GetCompleteCVUseCase,
+    GetCVFieldsUseCase,
+    GetCVSnapshotUseCase,
+)
 
 router = APIRouter(prefix="/cv", tags=["CV"])
 
+INCLUDE_DESCRIPTION = (
+    "Secciones a devolver separadas por comas, p. ej. `projects,languages` "
+    "(el perfil se incluye siempre). `languages` y `programming_languages` "
+    "solo se devuelven si se piden"
+)
+EXCLUDE_DESCRIPTION = "Secciones a omitir separadas por comas, p. ej. `tools`"
+
+
+# Serializadores precompilados: en producción las respuestas no se vuelven a
+# validar contra el response_model (en development y test sí)
+CV_SERIALIZER = serializer_for(CVCompleteResponse)
+
 
 @router.get(
     "",
@@ -19,10 +49,35 @@ router = APIRouter(prefix="/cv", tags=["CV"])
     description="Obtiene TODA la información del CV para mostrar en el portfolio",
 )
 async def get_complete_cv(
+    fields: str | None = Query(None, description=CV_FIELDS_DESCRIPTION),
+    include: str | None = Query(None, description=INCLUDE_DESCRIPTION),
+    exclude: str | None = Query(None, description=EXCLUDE_DESCRIPTION),
     use_case: GetCompleteCVUseCase = Depends(get_get_complete_cv_use_case),
+    snapshot_use_case: GetCVSnapshotUseCase | None = Depends(
+        get_get_cv_snapshot_use_case
+    ),
+    fields_use_case: GetCVFieldsUseCase = Depends(get_cv_fields_use_case),
 ):
-    result = await use_case.execute(GetCompleteCVRequest())
-    return result
+    # Con fields cada sección pedida lee de MongoDB solo esos campos
+    if fields:
+        views = await fields_use_case.execute(
+            GetCVFieldsRequest(fields=parse_cv_fields(fields))
+        )
+        return views_response(views)
+    request = GetCompleteCVRequest(
+        include=parse_fields(include or ""), exclude=parse_fields(exclude or "")
+    )
+    # Con include/exclude solo se consultan (y se devuelven) esas secciones;
+    # el snapshot y la caché guardan únicamente el CV por defecto
+    if request.include or request.exclude:
+        sections = {*GetCompleteCVUseCase.select_sections(request), "missing_sections"}
+        content = CV_SERIALIZER.content(await use_case.execute(request))
+        return views_response({key: content[key] for key in content if key in sections})
+    # Con CV_SNAPSHOTS_ENABLED se sirve el snapshot materializado (una lectura)
+    if snapshot_use_case is not None:
+        return CV_SERIALIZER.response(await snapshot_use_case.execute(request))
+    result = await use_case.execute(request)
+    return CV_SERIALIZER.response(result)
 
 
 @router.get(
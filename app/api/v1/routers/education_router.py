@@ -1,27 +1,36 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 from app.api.dependencies import (
     get_add_education_use_case,
     get_delete_education_use_case,
     get_edit_education_use_case,
     get_education_repository,
+    get_list_education_fields_use_case,
+    get_reorder_education_use_case,
 )
-from app.api.schemas.common_schema import MessageResponse
+from app.api.schemas.common_schema import MessageResponse, ReorderItem
 from app.api.schemas.education_schema import (
     EducationCreate,
     EducationResponse,
     EducationUpdate,
 )
+from app.api.serializers import serializer_for
+from app.api.sparse_fields import FIELDS_DESCRIPTION, parse_fields, views_response
 from app.application.dto import (
     AddEducationRequest,
     DeleteEducationRequest,
     EditEducationRequest,
     EducationResponse as EducationDTO,
+    ListFieldsRequest,
+    ReorderItem as ReorderItemDTO,
+    ReorderRequest,
 )
 from app.application.use_cases import (
     AddEducationUseCase,
     DeleteEducationUseCase,
     EditEducationUseCase,
+    ListEducationFieldsUseCase,
+    ReorderEducationUseCase,
 )
 from app.infrastructure.repositories import EducationRepository
 from app.shared.shared_exceptions import NotFoundException
@@ -31,6 +40,12 @@ router = APIRouter(prefix="/education", tags=["Education"])
 PROFILE_ID = "default_profile"
 
 
+# Serializadores precompilados: en producción las respuestas no se vuelven a
+# validar contra el response_model (en development y test sí)
+EDUCATION_LIST_SERIALIZER = serializer_for(list[EducationResponse])
+EDUCATION_SERIALIZER = serializer_for(EducationResponse)
+
+
 @router.get(
     "",
     response_model=list[EducationResponse],
@@ -38,11 +53,26 @@ PROFILE_ID = "default_profile"
     description="Obtiene toda la formación académica ordenada por orderIndex",
 )
 async def get_education(
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     repo: EducationRepository = Depends(get_education_repository),
+    fields_use_case: ListEducationFieldsUseCase = Depends(
+        get_list_education_fields_use_case
+    ),
 ):
+    # Con fields solo se leen de MongoDB (y se devuelven) esos campos
+    if fields:
+        views = await fields_use_case.execute(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=parse_fields(fields),
+            )
+        )
+        return views_response(views)
     entities = await repo.find_by(profile_id=PROFILE_ID)
     entities.sort(key=lambda e: e.order_index)
-    return [EducationDTO.from_entity(e) for e in entities]
+    return EDUCATION_LIST_SERIALIZER.response(
+        [EducationDTO.from_entity(e) for e in entities]
+    )
 
 
 @router.get(
@@ -58,7 +88,7 @@ async def get_education_by_id(
     entity = await repo.get_by_id(education_id)
     if not entity:
         raise NotFoundException("Education", education_id)
-    return EducationDTO.from_entity(entity)
+    return EDUCATION_SERIALIZER.response(EducationDTO.from_entity(entity))
 
 
 @router.post(
@@ -135,6 +165,13 @@ async def delete_education(
     summary="Reordenar formación académica",
     description="Actualiza el orderIndex de múltiples formaciones de una vez",
 )
-async def reorder_education(_education_orders: list[dict]):
-    # TODO: Implement with ReorderEducationUseCase
-    return []
+async def reorder_education(
+    items: list[ReorderItem],
+    use_case: ReorderEducationUseCase = Depends(get_reorder_education_use_case),
+):
+    return await use_case.execute(
+        ReorderRequest(
+            profile_id=PROFILE_ID,
+            items=[ReorderItemDTO(id=i.id, order_index=i.order_index) for i in items],
+        )
+    )
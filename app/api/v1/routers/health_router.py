@@ -1,7 +1,10 @@
 from datetime import datetime
+from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from app.api.dependencies import get_cv_cache
+from app.application.services import CVResultCache
 from app.config.settings import settings
 from app.infrastructure.database.mongo_client import MongoDBClient
 
@@ -33,3 +36,35 @@ async def health_check_db():
         "database": "connected" if db_ok else "disconnected",
         "timestamp": datetime.utcnow().isoformat(),
     }
+
+
+@router.get("/health/cache")
+async def health_check_cache(
+    cv_cache: CVResultCache | None = Depends(get_cv_cache),
+):
+    """Contadores de la caché del CV (aciertos, fallos, expulsiones)"""
+    cv_stats: dict[str, Any] = {"enabled": False}
+    if cv_cache is not None:
+        cv_stats = {"enabled": True, **cv_cache.stats()}
+
+    return {
+        "status": "ok",
+        "cv": cv_stats,
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+
+@router.get("/health/pool")
+async def health_check_pool():
+    """Pool de conexiones a MongoDB: en uso, libres, en espera y latencia de checkout"""
+    metrics = MongoDBClient.pool_metrics
+    return {
+        "status": "ok" if metrics is not None else "disconnected",
+        "limits": {
+            "max_pool_size": settings.MONGODB_MAX_POOL_SIZE,
+            "min_pool_size": settings.MONGODB_MIN_POOL_SIZE,
+            "wait_queue_timeout_ms": settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+        },
+        "servers": metrics.stats() if metrics is not None else {},
+        "timestamp": datetime.utcnow().isoformat(),
+    }
@@ -1,31 +1,38 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 from app.api.dependencies import (
     get_add_language_use_case,
     get_delete_language_use_case,
     get_edit_language_use_case,
     get_language_repository,
+    get_list_language_fields_use_case,
     get_list_languages_use_case,
 )
+from app.api.raw_reads import raw_list_response, response_fields
 from app.api.schemas.common_schema import MessageResponse
 from app.api.schemas.language_schema import (
     LanguageCreate,
     LanguageResponse,
     LanguageUpdate,
 )
+from app.api.serializers import serializer_for
+from app.api.sparse_fields import FIELDS_DESCRIPTION, parse_fields, views_response
 from app.application.dto import (
     AddLanguageRequest,
     DeleteLanguageRequest,
     EditLanguageRequest,
     LanguageResponse as LanguageDTO,
+    ListFieldsRequest,
     ListLanguagesRequest,
 )
 from app.application.use_cases.language import (
     AddLanguageUseCase,
     DeleteLanguageUseCase,
     EditLanguageUseCase,
+    ListLanguageFieldsUseCase,
     ListLanguagesUseCase,
 )
+from app.config.settings import settings
 from app.infrastructure.repositories import LanguageRepository
 from app.shared.shared_exceptions import NotFoundException
 
@@ -33,6 +40,15 @@ router = APIRouter(prefix="/languages", tags=["Languages"])
 
 PROFILE_ID = "default_profile"
 
+# Campos (y orden) de cada elemento en las lecturas directas del BSON
+LANGUAGE_FIELDS = response_fields(LanguageResponse)
+
+
+# Serializadores precompilados: en producción las respuestas no se vuelven a
+# validar contra el response_model (en development y test sí)
+LANGUAGE_LIST_SERIALIZER = serializer_for(list[LanguageResponse])
+LANGUAGE_SERIALIZER = serializer_for(LanguageResponse)
+
 
 @router.get(
     "",
@@ -41,15 +57,39 @@ PROFILE_ID = "default_profile"
 )
 async def list_languages(
     proficiency: str | None = None,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     use_case: ListLanguagesUseCase = Depends(get_list_languages_use_case),
+    fields_use_case: ListLanguageFieldsUseCase = Depends(
+        get_list_language_fields_use_case
+    ),
 ):
-    result = await use_case.execute(ListLanguagesRequest(profile_id=PROFILE_ID))
-    languages = result.languages
-    if proficiency:
-        languages = [
-            lang for lang in languages if lang.proficiency == proficiency.lower()
-        ]
-    return languages
+    request = ListLanguagesRequest(profile_id=PROFILE_ID, proficiency=proficiency)
+    # Con fields solo se leen de MongoDB (y se devuelven) esos campos, en el
+    # mismo orden que la lista completa
+    if fields:
+        views = await fields_use_case.execute(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=parse_fields(fields),
+                filters={"proficiency": proficiency},
+                ascending=request.ascending,
+            )
+        )
+        return views_response(views)
+    # Sin fields: con PUBLIC_RAW_READS se sirven directamente del BSON, con
+    # el orden de la lista completa
+    if settings.PUBLIC_RAW_READS:
+        stream = fields_use_case.stream(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=LANGUAGE_FIELDS,
+                filters={"proficiency": proficiency.lower() if proficiency else None},
+                ascending=request.ascending,
+            )
+        )
+        return await raw_list_response(stream, LANGUAGE_FIELDS)
+    result = await use_case.execute(request)
+    return LANGUAGE_LIST_SERIALIZER.response(result.languages)
 
 
 @router.get(
@@ -64,7 +104,7 @@ async def get_language(
     entity = await repo.get_by_id(language_id)
     if not entity:
         raise NotFoundException("Language", language_id)
-    return LanguageDTO.from_entity(entity)
+    return LANGUAGE_SERIALIZER.response(LanguageDTO.from_entity(entity))
 
 
 @router.post(
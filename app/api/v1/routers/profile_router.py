@@ -7,6 +7,7 @@ from app.api.dependencies import (
 )
 from app.api.schemas.common_schema import MessageResponse
 from app.api.schemas.profile_schema import ProfileCreate, ProfileResponse, ProfileUpdate
+from app.api.serializers import serializer_for
 from app.application.dto import (
     CreateProfileRequest,
     GetProfileRequest,
@@ -21,6 +22,11 @@ from app.application.use_cases import (
 router = APIRouter(prefix="/profile", tags=["Profile"])
 
 
+# Serializadores precompilados: en producción las respuestas no se vuelven a
+# validar contra el response_model (en development y test sí)
+PROFILE_SERIALIZER = serializer_for(ProfileResponse)
+
+
 @router.get(
     "",
     response_model=ProfileResponse,
@@ -31,7 +37,7 @@ async def get_profile(
     use_case: GetProfileUseCase = Depends(get_get_profile_use_case),
 ):
     result = await use_case.execute(GetProfileRequest())
-    return result
+    return PROFILE_SERIALIZER.response(result)
 
 
 @router.put(
@@ -1,22 +1,27 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 from app.api.dependencies import (
     get_add_programming_language_use_case,
     get_delete_programming_language_use_case,
     get_edit_programming_language_use_case,
+    get_list_programming_language_fields_use_case,
     get_list_programming_languages_use_case,
     get_programming_language_repository,
 )
+from app.api.raw_reads import raw_list_response, response_fields
 from app.api.schemas.common_schema import MessageResponse
 from app.api.schemas.programming_language_schema import (
     ProgrammingLanguageCreate,
     ProgrammingLanguageResponse,
     ProgrammingLanguageUpdate,
 )
+from app.api.serializers import serializer_for
+from app.api.sparse_fields import FIELDS_DESCRIPTION, parse_fields, views_response
 from app.application.dto import (
     AddProgrammingLanguageRequest,
     DeleteProgrammingLanguageRequest,
     EditProgrammingLanguageRequest,
+    ListFieldsRequest,
     ListProgrammingLanguagesRequest,
     ProgrammingLanguageResponse as ProgrammingLanguageDTO,
 )
@@ -24,8 +29,10 @@ from app.application.use_cases.programming_language import (
     AddProgrammingLanguageUseCase,
     DeleteProgrammingLanguageUseCase,
     EditProgrammingLanguageUseCase,
+    ListProgrammingLanguageFieldsUseCase,
     ListProgrammingLanguagesUseCase,
 )
+from app.config.settings import settings
 from app.infrastructure.repositories import ProgrammingLanguageRepository
 from app.shared.shared_exceptions import NotFoundException
 
@@ -33,6 +40,15 @@ router = APIRouter(prefix="/programming-languages", tags=["Programming Languages
 
 PROFILE_ID = "default_profile"
 
+# Campos (y orden) de cada elemento en las lecturas directas del BSON
+PROGRAMMING_LANGUAGE_FIELDS = response_fields(ProgrammingLanguageResponse)
+
+
+# Serializadores precompilados: en producción las respuestas no se vuelven a
+# validar contra el response_model (en development y test sí)
+PROGRAMMING_LANGUAGE_LIST_SERIALIZER = serializer_for(list[ProgrammingLanguageResponse])
+PROGRAMMING_LANGUAGE_SERIALIZER = serializer_for(ProgrammingLanguageResponse)
+
 
 @router.get(
     "",
@@ -41,17 +57,41 @@ PROFILE_ID = "default_profile"
 )
 async def list_programming_languages(
     level: str | None = None,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     use_case: ListProgrammingLanguagesUseCase = Depends(
         get_list_programming_languages_use_case
     ),
+    fields_use_case: ListProgrammingLanguageFieldsUseCase = Depends(
+        get_list_programming_language_fields_use_case
+    ),
 ):
-    result = await use_case.execute(
-        ListProgrammingLanguagesRequest(profile_id=PROFILE_ID)
-    )
-    languages = result.programming_languages
-    if level:
-        languages = [pl for pl in languages if pl.level == level.lower()]
-    return languages
+    request = ListProgrammingLanguagesRequest(profile_id=PROFILE_ID, level=level)
+    # Con fields solo se leen de MongoDB (y se devuelven) esos campos, en el
+    # mismo orden que la lista completa
+    if fields:
+        views = await fields_use_case.execute(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=parse_fields(fields),
+                filters={"level": level},
+                ascending=request.ascending,
+            )
+        )
+        return views_response(views)
+    # Sin fields: con PUBLIC_RAW_READS se sirven directamente del BSON, con
+    # el orden de la lista completa
+    if settings.PUBLIC_RAW_READS:
+        stream = fields_use_case.stream(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=PROGRAMMING_LANGUAGE_FIELDS,
+                filters={"level": level.lower() if level else None},
+                ascending=request.ascending,
+            )
+        )
+        return await raw_list_response(stream, PROGRAMMING_LANGUAGE_FIELDS)
+    result = await use_case.execute(request)
+    return PROGRAMMING_LANGUAGE_LIST_SERIALIZER.response(result.programming_languages)
 
 
 @router.get(
@@ -66,7 +106,9 @@ async def get_programming_language(
     entity = await repo.get_by_id(programming_language_id)
     if not entity:
         raise NotFoundException("ProgrammingLanguage", programming_language_id)
-    return ProgrammingLanguageDTO.from_entity(entity)
+    return PROGRAMMING_LANGUAGE_SERIALIZER.response(
+        ProgrammingLanguageDTO.from_entity(entity)
+    )
 
 
 @router.post(
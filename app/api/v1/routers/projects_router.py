@@ -1,30 +1,39 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 from app.api.dependencies import (
     get_add_project_use_case,
     get_delete_project_use_case,
     get_edit_project_use_case,
+    get_list_project_fields_use_case,
     get_list_projects_use_case,
     get_project_repository,
+    get_reorder_projects_use_case,
 )
-from app.api.schemas.common_schema import MessageResponse
+from app.api.schemas.common_schema import MessageResponse, ReorderItem
 from app.api.schemas.projects_schema import (
     ProjectCreate,
     ProjectResponse,
     ProjectUpdate,
 )
+from app.api.serializers import serializer_for
+from app.api.sparse_fields import FIELDS_DESCRIPTION, parse_fields, views_response
 from app.application.dto import (
     AddProjectRequest,
     DeleteProjectRequest,
     EditProjectRequest,
+    ListFieldsRequest,
     ListProjectsRequest,
     ProjectResponse as ProjectDTO,
+    ReorderItem as ReorderItemDTO,
+    ReorderRequest,
 )
 from app.application.use_cases.project import (
     AddProjectUseCase,
     DeleteProjectUseCase,
     EditProjectUseCase,
+    ListProjectFieldsUseCase,
     ListProjectsUseCase,
+    ReorderProjectsUseCase,
 )
 from app.infrastructure.repositories import ProjectRepository
 from app.shared.shared_exceptions import NotFoundException
@@ -34,6 +43,12 @@ router = APIRouter(prefix="/projects", tags=["Projects"])
 PROFILE_ID = "default_profile"
 
 
+# Serializadores precompilados: en producción las respuestas no se vuelven a
+# validar contra el response_model (en development y test sí)
+PROJECT_LIST_SERIALIZER = serializer_for(list[ProjectResponse])
+PROJECT_SERIALIZER = serializer_for(ProjectResponse)
+
+
 @router.get(
     "",
     response_model=list[ProjectResponse],
@@ -41,10 +56,26 @@ PROFILE_ID = "default_profile"
     description="Obtiene todos los proyectos del perfil ordenados por orderIndex",
 )
 async def get_projects(
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     use_case: ListProjectsUseCase = Depends(get_list_projects_use_case),
+    fields_use_case: ListProjectFieldsUseCase = Depends(
+        get_list_project_fields_use_case
+    ),
 ):
-    result = await use_case.execute(ListProjectsRequest(profile_id=PROFILE_ID))
-    return result.projects
+    request = ListProjectsRequest(profile_id=PROFILE_ID)
+    # Con fields solo se leen de MongoDB (y se devuelven) esos campos, en el
+    # mismo orden que la lista completa
+    if fields:
+        views = await fields_use_case.execute(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=parse_fields(fields),
+                ascending=request.ascending,
+            )
+        )
+        return views_response(views)
+    result = await use_case.execute(request)
+    return PROJECT_LIST_SERIALIZER.response(result.projects)
 
 
 @router.get(
@@ -60,7 +91,7 @@ async def get_project(
     entity = await repo.get_by_id(project_id)
     if not entity:
         raise NotFoundException("Project", project_id)
-    return ProjectDTO.from_entity(entity)
+    return PROJECT_SERIALIZER.response(ProjectDTO.from_entity(entity))
 
 
 @router.post(
@@ -138,6 +169,13 @@ async def delete_project(
     summary="Reordenar proyectos",
     description="Actualiza el orderIndex de múltiples proyectos de una vez",
 )
-async def reorder_projects(_project_orders: list[dict]):
-    # TODO: Implement with ReorderProjectsUseCase
-    return []
+async def reorder_projects(
+    items: list[ReorderItem],
+    use_case: ReorderProjectsUseCase = Depends(get_reorder_projects_use_case),
+):
+    return await use_case.execute(
+        ReorderRequest(
+            profile_id=PROFILE_ID,
+            items=[ReorderItemDTO(id=i.id, order_index=i.order_index) for i in items],
+        )
+    )
@@ -1,34 +1,49 @@
-from typing import Any
-
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 from app.api.dependencies import (
     get_add_skill_use_case,
     get_delete_skill_use_case,
     get_edit_skill_use_case,
+    get_group_skills_use_case,
+    get_list_skill_fields_use_case,
     get_list_skills_use_case,
+    get_reorder_skills_use_case,
     get_skill_repository,
+    get_skill_stats_use_case,
 )
-from app.api.schemas.common_schema import MessageResponse
+from app.api.raw_reads import raw_list_response, response_fields
+from app.api.schemas.common_schema import MessageResponse, ReorderItem
 from app.api.schemas.skill_schema import (
     SkillCreate,
     SkillLevel,
     SkillResponse,
     SkillUpdate,
 )
+from app.api.serializers import serializer_for
+from app.api.sparse_fields import FIELDS_DESCRIPTION, parse_fields, views_response
 from app.application.dto import (
     AddSkillRequest,
     DeleteSkillRequest,
     EditSkillRequest,
+    GetSkillStatsRequest,
+    GroupSkillsRequest,
+    ListFieldsRequest,
     ListSkillsRequest,
+    ReorderItem as ReorderItemDTO,
+    ReorderRequest,
     SkillResponse as SkillDTO,
 )
 from app.application.use_cases import (
     AddSkillUseCase,
     DeleteSkillUseCase,
     EditSkillUseCase,
+    GetSkillStatsUseCase,
+    GroupSkillsUseCase,
+    ListSkillFieldsUseCase,
     ListSkillsUseCase,
+    ReorderSkillsUseCase,
 )
+from app.config.settings import settings
 from app.infrastructure.repositories import SkillRepository
 from app.shared.shared_exceptions import NotFoundException
 
@@ -36,6 +51,15 @@ router = APIRouter(prefix="/skills", tags=["Skills"])
 
 PROFILE_ID = "default_profile"
 
+# Campos (y orden) de cada elemento en las lecturas directas del BSON
+SKILL_FIELDS = response_fields(SkillResponse)
+
+
+# Serializadores precompilados: en producción las respuestas no se vuelven a
+# validar contra el response_model (en development y test sí)
+SKILL_LIST_SERIALIZER = serializer_for(list[SkillResponse])
+SKILL_SERIALIZER = serializer_for(SkillResponse)
+
 
 @router.get(
     "",
@@ -46,15 +70,37 @@ PROFILE_ID = "default_profile"
 async def get_skills(
     category: str | None = None,
     level: SkillLevel | None = None,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     use_case: ListSkillsUseCase = Depends(get_list_skills_use_case),
+    fields_use_case: ListSkillFieldsUseCase = Depends(get_list_skill_fields_use_case),
 ):
-    result = await use_case.execute(
-        ListSkillsRequest(profile_id=PROFILE_ID, category=category)
-    )
-    skills = result.skills
-    if level:
-        skills = [s for s in skills if s.level == level]
-    return skills
+    request = ListSkillsRequest(profile_id=PROFILE_ID, category=category, level=level)
+    # Con fields solo se leen de MongoDB (y se devuelven) esos campos, en el
+    # mismo orden que la lista completa
+    if fields:
+        views = await fields_use_case.execute(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=parse_fields(fields),
+                filters={"category": category, "level": level},
+                ascending=request.ascending,
+            )
+        )
+        return views_response(views)
+    # Sin fields: con PUBLIC_RAW_READS se sirven directamente del BSON, con
+    # el orden de la lista completa
+    if settings.PUBLIC_RAW_READS:
+        stream = fields_use_case.stream(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=SKILL_FIELDS,
+                filters={"category": category, "level": level},
+                ascending=request.ascending,
+            )
+        )
+        return await raw_list_response(stream, SKILL_FIELDS)
+    result = await use_case.execute(request)
+    return SKILL_LIST_SERIALIZER.response(result.skills)
 
 
 @router.get(
@@ -70,7 +116,7 @@ async def get_skill(
     skill = await repo.get_by_id(skill_id)
     if not skill:
         raise NotFoundException("Skill", skill_id)
-    return SkillDTO.from_entity(skill)
+    return SKILL_SERIALIZER.response(SkillDTO.from_entity(skill))
 
 
 @router.post(
@@ -140,9 +186,16 @@ async def delete_skill(
     summary="Reordenar habilidades técnicas",
     description="Actualiza el orderIndex de múltiples habilidades de una vez",
 )
-async def reorder_skills(_skill_orders: list[dict]):
-    # TODO: Implement with ReorderSkillsUseCase
-    return []
+async def reorder_skills(
+    items: list[ReorderItem],
+    use_case: ReorderSkillsUseCase = Depends(get_reorder_skills_use_case),
+):
+    return await use_case.execute(
+        ReorderRequest(
+            profile_id=PROFILE_ID,
+            items=[ReorderItemDTO(id=i.id, order_index=i.order_index) for i in items],
+        )
+    )
 
 
 @router.get(
@@ -152,13 +205,13 @@ async def reorder_skills(_skill_orders: list[dict]):
     description="Obtiene habilidades agrupadas por categoría",
 )
 async def get_skills_grouped_by_category(
-    use_case: ListSkillsUseCase = Depends(get_list_skills_use_case),
+    use_case: GroupSkillsUseCase = Depends(get_group_skills_use_case),
 ):
-    result = await use_case.execute(ListSkillsRequest(profile_id=PROFILE_ID))
-    grouped: dict[str, list] = {}
-    for skill in result.skills:
-        grouped.setdefault(skill.category, []).append(skill)
-    return grouped
+    # La agrupación se resuelve en MongoDB
+    result = await use_case.execute(
+        GroupSkillsRequest(profile_id=PROFILE_ID, field="category")
+    )
+    return result.groups
 
 
 @router.get(
@@ -168,14 +221,12 @@ async def get_skills_grouped_by_category(
     description="Obtiene habilidades agrupadas por nivel de dominio",
 )
 async def get_skills_grouped_by_level(
-    use_case: ListSkillsUseCase = Depends(get_list_skills_use_case),
+    use_case: GroupSkillsUseCase = Depends(get_group_skills_use_case),
 ):
-    result = await use_case.execute(ListSkillsRequest(profile_id=PROFILE_ID))
-    grouped: dict[str, list] = {}
-    for skill in result.skills:
-        level = skill.level if skill.level is not None else "none"
-        grouped.setdefault(level, []).append(skill)
-    return grouped
+    result = await use_case.execute(
+        GroupSkillsRequest(profile_id=PROFILE_ID, field="level")
+    )
+    return result.groups
 
 
 @router.get(
@@ -185,18 +236,12 @@ async def get_skills_grouped_by_level(
     description="Obtiene estadísticas sobre las habilidades del perfil",
 )
 async def get_skills_stats(
-    use_case: ListSkillsUseCase = Depends(get_list_skills_use_case),
+    use_case: GetSkillStatsUseCase = Depends(get_skill_stats_use_case),
 ):
-    result = await use_case.execute(ListSkillsRequest(profile_id=PROFILE_ID))
-    stats: dict[str, Any] = {
+    # Solo se leen los recuentos, no las habilidades
+    result = await use_case.execute(GetSkillStatsRequest(profile_id=PROFILE_ID))
+    return {
         "total": result.total,
-        "by_level": {},
-        "by_category": {},
+        "by_level": result.by_level,
+        "by_category": result.by_category,
     }
-    for skill in result.skills:
-        level = skill.level if skill.level is not None else "none"
-        stats["by_level"][level] = stats["by_level"].get(level, 0) + 1
-        stats["by_category"][skill.category] = (
-            stats["by_category"].get(skill.category, 0) + 1
-        )
-    return stats
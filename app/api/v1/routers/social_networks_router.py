@@ -1,31 +1,42 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 from app.api.dependencies import (
     get_add_social_network_use_case,
     get_delete_social_network_use_case,
     get_edit_social_network_use_case,
+    get_list_social_network_fields_use_case,
     get_list_social_networks_use_case,
+    get_reorder_social_networks_use_case,
     get_social_network_repository,
 )
-from app.api.schemas.common_schema import MessageResponse
+from app.api.raw_reads import raw_list_response, response_fields
+from app.api.schemas.common_schema import MessageResponse, ReorderItem
 from app.api.schemas.social_networks_schema import (
     SocialNetworkCreate,
     SocialNetworkResponse,
     SocialNetworkUpdate,
 )
+from app.api.serializers import serializer_for
+from app.api.sparse_fields import FIELDS_DESCRIPTION, parse_fields, views_response
 from app.application.dto import (
     AddSocialNetworkRequest,
     DeleteSocialNetworkRequest,
     EditSocialNetworkRequest,
+    ListFieldsRequest,
     ListSocialNetworksRequest,
+    ReorderItem as ReorderItemDTO,
+    ReorderRequest,
     SocialNetworkResponse as SocialNetworkDTO,
 )
 from app.application.use_cases.social_network import (
     AddSocialNetworkUseCase,
     DeleteSocialNetworkUseCase,
     EditSocialNetworkUseCase,
+    ListSocialNetworkFieldsUseCase,
     ListSocialNetworksUseCase,
+    ReorderSocialNetworksUseCase,
 )
+from app.config.settings import settings
 from app.infrastructure.repositories import SocialNetworkRepository
 from app.shared.shared_exceptions import NotFoundException
 
@@ -33,6 +44,15 @@ router = APIRouter(prefix="/social-networks", tags=["Social Networks"])
 
 PROFILE_ID = "default_profile"
 
+# Campos (y orden) de cada elemento en las lecturas directas del BSON
+SOCIAL_NETWORK_FIELDS = response_fields(SocialNetworkResponse)
+
+
+# Serializadores precompilados: en producción las respuestas no se vuelven a
+# validar contra el response_model (en development y test sí)
+SOCIAL_NETWORK_LIST_SERIALIZER = serializer_for(list[SocialNetworkResponse])
+SOCIAL_NETWORK_SERIALIZER = serializer_for(SocialNetworkResponse)
+
 
 @router.get(
     "",
@@ -41,10 +61,37 @@ PROFILE_ID = "default_profile"
     description="Obtiene todas las redes sociales ordenadas por orderIndex",
 )
 async def get_social_networks(
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     use_case: ListSocialNetworksUseCase = Depends(get_list_social_networks_use_case),
+    fields_use_case: ListSocialNetworkFieldsUseCase = Depends(
+        get_list_social_network_fields_use_case
+    ),
 ):
-    result = await use_case.execute(ListSocialNetworksRequest(profile_id=PROFILE_ID))
-    return result.social_networks
+    request = ListSocialNetworksRequest(profile_id=PROFILE_ID)
+    # Con fields solo se leen de MongoDB (y se devuelven) esos campos, en el
+    # mismo orden que la lista completa
+    if fields:
+        views = await fields_use_case.execute(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=parse_fields(fields),
+                ascending=request.ascending,
+            )
+        )
+        return views_response(views)
+    # Sin fields: con PUBLIC_RAW_READS se sirven directamente del BSON, con
+    # el orden de la lista completa
+    if settings.PUBLIC_RAW_READS:
+        stream = fields_use_case.stream(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=SOCIAL_NETWORK_FIELDS,
+                ascending=request.ascending,
+            )
+        )
+        return await raw_list_response(stream, SOCIAL_NETWORK_FIELDS)
+    result = await use_case.execute(request)
+    return SOCIAL_NETWORK_LIST_SERIALIZER.response(result.social_networks)
 
 
 @router.get(
@@ -57,8 +104,10 @@ async def get_social_networks_by_platform(
     platform: str,
     use_case: ListSocialNetworksUseCase = Depends(get_list_social_networks_use_case),
 ):
-    result = await use_case.execute(ListSocialNetworksRequest(profile_id=PROFILE_ID))
-    return [s for s in result.social_networks if s.platform == platform]
+    result = await use_case.execute(
+        ListSocialNetworksRequest(profile_id=PROFILE_ID, platform=platform)
+    )
+    return SOCIAL_NETWORK_LIST_SERIALIZER.response(result.social_networks)
 
 
 @router.get(
@@ -92,7 +141,7 @@ async def get_social_network(
     entity = await repo.get_by_id(social_id)
     if not entity:
         raise NotFoundException("SocialNetwork", social_id)
-    return SocialNetworkDTO.from_entity(entity)
+    return SOCIAL_NETWORK_SERIALIZER.response(SocialNetworkDTO.from_entity(entity))
 
 
 @router.post(
@@ -162,6 +211,15 @@ async def delete_social_network(
     summary="Reordenar redes sociales",
     description="Actualiza el orderIndex de múltiples redes sociales de una vez",
 )
-async def reorder_social_networks(_social_orders: list[dict]):
-    # TODO: Implementar con ReorderSocialNetworksUseCase
-    return []
+async def reorder_social_networks(
+    items: list[ReorderItem],
+    use_case: ReorderSocialNetworksUseCase = Depends(
+        get_reorder_social_networks_use_case
+    ),
+):
+    return await use_case.execute(
+        ReorderRequest(
+            profile_id=PROFILE_ID,
+            items=[ReorderItemDTO(id=i.id, order_index=i.order_index) for i in items],
+        )
+    )
@@ -1,29 +1,44 @@
-from typing import Any
-
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 from app.api.dependencies import (
     get_add_tool_use_case,
     get_delete_tool_use_case,
     get_edit_tool_use_case,
+    get_group_tools_use_case,
+    get_list_tool_fields_use_case,
     get_list_tools_use_case,
+    get_reorder_tools_use_case,
     get_tool_repository,
+    get_tool_stats_use_case,
 )
-from app.api.schemas.common_schema import MessageResponse
+from app.api.raw_reads import raw_list_response, response_fields
+from app.api.schemas.common_schema import MessageResponse, ReorderItem
 from app.api.schemas.tools_schema import ToolCreate, ToolResponse, ToolUpdate
+from app.api.serializers import serializer_for
+from app.api.sparse_fields import FIELDS_DESCRIPTION, parse_fields, views_response
 from app.application.dto import (
     AddToolRequest,
     DeleteToolRequest,
     EditToolRequest,
+    GetToolStatsRequest,
+    GroupToolsRequest,
+    ListFieldsRequest,
     ListToolsRequest,
+    ReorderItem as ReorderItemDTO,
+    ReorderRequest,
     ToolResponse as ToolDTO,
 )
 from app.application.use_cases.tool import (
     AddToolUseCase,
     DeleteToolUseCase,
     EditToolUseCase,
+    GetToolStatsUseCase,
+    GroupToolsUseCase,
+    ListToolFieldsUseCase,
     ListToolsUseCase,
+    ReorderToolsUseCase,
 )
+from app.config.settings import settings
 from app.infrastructure.repositories import ToolRepository
 from app.shared.shared_exceptions import NotFoundException
 
@@ -31,6 +46,15 @@ router = APIRouter(prefix="/tools", tags=["Tools"])
 
 PROFILE_ID = "default_profile"
 
+# Campos (y orden) de cada elemento en las lecturas directas del BSON
+TOOL_FIELDS = response_fields(ToolResponse)
+
+
+# Serializadores precompilados: en producción las respuestas no se vuelven a
+# validar contra el response_model (en development y test sí)
+TOOL_LIST_SERIALIZER = serializer_for(list[ToolResponse])
+TOOL_SERIALIZER = serializer_for(ToolResponse)
+
 
 @router.get(
     "",
@@ -40,12 +64,37 @@ PROFILE_ID = "default_profile"
 )
 async def get_tools(
     category: str | None = None,
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     use_case: ListToolsUseCase = Depends(get_list_tools_use_case),
+    fields_use_case: ListToolFieldsUseCase = Depends(get_list_tool_fields_use_case),
 ):
-    result = await use_case.execute(
-        ListToolsRequest(profile_id=PROFILE_ID, category=category)
-    )
-    return result.tools
+    request = ListToolsRequest(profile_id=PROFILE_ID, category=category)
+    # Con fields solo se leen de MongoDB (y se devuelven) esos campos, en el
+    # mismo orden que la lista completa
+    if fields:
+        views = await fields_use_case.execute(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=parse_fields(fields),
+                filters={"category": category},
+                ascending=request.ascending,
+            )
+        )
+        return views_response(views)
+    # Sin fields: con PUBLIC_RAW_READS se sirven directamente del BSON, con
+    # el orden de la lista completa
+    if settings.PUBLIC_RAW_READS:
+        stream = fields_use_case.stream(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=TOOL_FIELDS,
+                filters={"category": category},
+                ascending=request.ascending,
+            )
+        )
+        return await raw_list_response(stream, TOOL_FIELDS)
+    result = await use_case.execute(request)
+    return TOOL_LIST_SERIALIZER.response(result.tools)
 
 
 @router.get(
@@ -55,15 +104,11 @@ async def get_tools(
     description="Obtiene herramientas agrupadas por categoría",
 )
 async def get_tools_grouped_by_category(
-    use_case: ListToolsUseCase = Depends(get_list_tools_use_case),
+    use_case: GroupToolsUseCase = Depends(get_group_tools_use_case),
 ):
-    result = await use_case.execute(ListToolsRequest(profile_id=PROFILE_ID))
-    grouped: dict[str, list] = {}
-    for tool in result.tools:
-        if tool.category not in grouped:
-            grouped[tool.category] = []
-        grouped[tool.category].append(tool)
-    return grouped
+    # La agrupación se resuelve en MongoDB
+    result = await use_case.execute(GroupToolsRequest(profile_id=PROFILE_ID))
+    return result.groups
 
 
 @router.get(
@@ -73,18 +118,11 @@ async def get_tools_grouped_by_category(
     description="Obtiene estadísticas sobre las herramientas del perfil",
 )
 async def get_tools_stats(
-    use_case: ListToolsUseCase = Depends(get_list_tools_use_case),
+    use_case: GetToolStatsUseCase = Depends(get_tool_stats_use_case),
 ):
-    result = await use_case.execute(ListToolsRequest(profile_id=PROFILE_ID))
-    stats: dict[str, Any] = {
-        "total": len(result.tools),
-        "by_category": {},
-    }
-    for tool in result.tools:
-        stats["by_category"][tool.category] = (
-            stats["by_category"].get(tool.category, 0) + 1
-        )
-    return stats
+    # Solo se leen los recuentos, no las herramientas
+    result = await use_case.execute(GetToolStatsRequest(profile_id=PROFILE_ID))
+    return {"total": result.total, "by_category": result.by_category}
 
 
 @router.get(
@@ -100,7 +138,7 @@ async def get_tool(
     entity = await repo.get_by_id(tool_id)
     if not entity:
         raise NotFoundException("Tool", tool_id)
-    return ToolDTO.from_entity(entity)
+    return TOOL_SERIALIZER.response(ToolDTO.from_entity(entity))
 
 
 @router.post(
@@ -170,6 +208,13 @@ async def delete_tool(
     summary="Reordenar herramientas",
     description="Actualiza el orderIndex de múltiples herramientas de una vez",
 )
-async def reorder_tools(_tool_orders: list[dict]):
-    # TODO: Implementar con ReorderToolsUseCase
-    return []
+async def reorder_tools(
+    items: list[ReorderItem],
+    use_case: ReorderToolsUseCase = Depends(get_reorder_tools_use_case),
+):
+    return await use_case.execute(
+        ReorderRequest(
+            profile_id=PROFILE_ID,
+            items=[ReorderItemDTO(id=i.id, order_index=i.order_index) for i in items],
+        )
+    )
@@ -1,30 +1,39 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 from app.api.dependencies import (
     get_add_experience_use_case,
     get_delete_experience_use_case,
     get_edit_experience_use_case,
+    get_list_experience_fields_use_case,
     get_list_experiences_use_case,
+    get_reorder_experiences_use_case,
     get_work_experience_repository,
 )
-from app.api.schemas.common_schema import MessageResponse
+from app.api.schemas.common_schema import MessageResponse, ReorderItem
 from app.api.schemas.work_experience_schema import (
     WorkExperienceCreate,
     WorkExperienceResponse,
     WorkExperienceUpdate,
 )
+from app.api.serializers import serializer_for
+from app.api.sparse_fields import FIELDS_DESCRIPTION, parse_fields, views_response
 from app.application.dto import (
     AddExperienceRequest,
     DeleteExperienceRequest,
     EditExperienceRequest,
     ListExperiencesRequest,
+    ListFieldsRequest,
+    ReorderItem as ReorderItemDTO,
+    ReorderRequest,
     WorkExperienceResponse as WorkExperienceDTO,
 )
 from app.application.use_cases import (
     AddExperienceUseCase,
     DeleteExperienceUseCase,
     EditExperienceUseCase,
+    ListExperienceFieldsUseCase,
     ListExperiencesUseCase,
+    ReorderExperiencesUseCase,
 )
 from app.infrastructure.repositories import WorkExperienceRepository
 from app.shared.shared_exceptions import NotFoundException
@@ -34,6 +43,12 @@ router = APIRouter(prefix="/work-experiences", tags=["Work Experience"])
 PROFILE_ID = "default_profile"
 
 
+# Serializadores precompilados: en producción las respuestas no se vuelven a
+# validar contra el response_model (en development y test sí)
+WORK_EXPERIENCE_LIST_SERIALIZER = serializer_for(list[WorkExperienceResponse])
+WORK_EXPERIENCE_SERIALIZER = serializer_for(WorkExperienceResponse)
+
+
 @router.get(
     "",
     response_model=list[WorkExperienceResponse],
@@ -41,10 +56,26 @@ PROFILE_ID = "default_profile"
     description="Obtiene todas las experiencias laborales ordenadas por orderIndex",
 )
 async def get_work_experiences(
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     use_case: ListExperiencesUseCase = Depends(get_list_experiences_use_case),
+    fields_use_case: ListExperienceFieldsUseCase = Depends(
+        get_list_experience_fields_use_case
+    ),
 ):
-    result = await use_case.execute(ListExperiencesRequest(profile_id=PROFILE_ID))
-    return result.experiences
+    request = ListExperiencesRequest(profile_id=PROFILE_ID)
+    # Con fields solo se leen de MongoDB (y se devuelven) esos campos, en el
+    # mismo orden que la lista completa
+    if fields:
+        views = await fields_use_case.execute(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=parse_fields(fields),
+                ascending=request.ascending,
+            )
+        )
+        return views_response(views)
+    result = await use_case.execute(request)
+    return WORK_EXPERIENCE_LIST_SERIALIZER.response(result.experiences)
 
 
 @router.get(
@@ -60,7 +91,7 @@ async def get_work_experience(
     entity = await repo.get_by_id(experience_id)
     if not entity:
         raise NotFoundException("WorkExperience", experience_id)
-    return WorkExperienceDTO.from_entity(entity)
+    return WORK_EXPERIENCE_SERIALIZER.response(WorkExperienceDTO.from_entity(entity))
 
 
 @router.post(
@@ -137,9 +168,16 @@ async def delete_work_experience(
     summary="Reordenar experiencias laborales",
     description="Actualiza el orderIndex de múltiples experiencias de una vez",
 )
-async def reorder_work_experiences(_experience_orders: list[dict]):
-    # TODO: Implement with ReorderWorkExperiencesUseCase
-    return []
+async def reorder_work_experiences(
+    items: list[ReorderItem],
+    use_case: ReorderExperiencesUseCase = Depends(get_reorder_experiences_use_case),
+):
+    return await use_case.execute(
+        ReorderRequest(
+            profile_id=PROFILE_ID,
+            items=[ReorderItemDTO(id=i.id, order_index=i.order_index) for i in items],
+        )
+    )
 
 
 @router.get(
@@ -151,8 +189,10 @@ async def reorder_work_experiences(_experience_orders: list[dict]):
 async def get_current_work_experiences(
     use_case: ListExperiencesUseCase = Depends(get_list_experiences_use_case),
 ):
-    result = await use_case.execute(ListExperiencesRequest(profile_id=PROFILE_ID))
-    return [exp for exp in result.experiences if exp.is_current]
+    result = await use_case.execute(
+        ListExperiencesRequest(profile_id=PROFILE_ID, current_only=True)
+    )
+    return WORK_EXPERIENCE_LIST_SERIALIZER.response(result.experiences)
 
 
 @router.get(
@@ -165,6 +205,7 @@ async def get_experiences_by_company(
     company: str,
     use_case: ListExperiencesUseCase = Depends(get_list_experiences_use_case),
 ):
-    result = await use_case.execute(ListExperiencesRequest(profile_id=PROFILE_ID))
-    company_lower = company.lower()
-    return [exp for exp in result.experiences if company_lower in exp.company.lower()]
+    result = await use_case.execute(
+        ListExperiencesRequest(profile_id=PROFILE_ID, company=company)
+    )
+    return WORK_EXPERIENCE_LIST_SERIALIZER.response(result.experiences)
@@ -14,7 +14,15 @@ from .additional_training_dto import (
     EditAdditionalTrainingRequest,
     ListAdditionalTrainingsRequest,
 )
-from .base_dto import DateRangeDTO, ErrorResponse, PaginationRequest, SuccessResponse
+from .base_dto import (
+    DateRangeDTO,
+    ErrorResponse,
+    ListFieldsRequest,
+    PaginationRequest,
+    ReorderItem,
+    ReorderRequest,
+    SuccessResponse,
+)
 from .certification_dto import (
     AddCertificationRequest,
     CertificationListResponse,
@@ -31,10 +39,13 @@ from .contact_information_dto import (
     UpdateContactInformationRequest,
 )
 from .contact_message_dto import (
+    ContactMessageCursor,
     ContactMessageListResponse,
     ContactMessageResponse,
+    ContactMessageStatsResponse,
     CreateContactMessageRequest,
     DeleteContactMessageRequest,
+    GetContactMessageStatsRequest,
     ListContactMessagesRequest,
 )
 from .cv_dto import (
@@ -42,6 +53,7 @@ from .cv_dto import (
     GenerateCVPDFRequest,
     GenerateCVPDFResponse,
     GetCompleteCVRequest,
+    GetCVFieldsRequest,
 )
 from .education_dto import (
     AddEducationRequest,
@@ -85,9 +97,13 @@ from .skill_dto import (
     AddSkillRequest,
     DeleteSkillRequest,
     EditSkillRequest,
+    GetSkillStatsRequest,
+    GroupSkillsRequest,
     ListSkillsRequest,
+    SkillGroupsResponse,
     SkillListResponse,
     SkillResponse,
+    SkillStatsResponse,
 )
 from .social_network_dto import (
     AddSocialNetworkRequest,
@@ -101,9 +117,13 @@ from .tool_dto import (
     AddToolRequest,
     DeleteToolRequest,
     EditToolRequest,
+    GetToolStatsRequest,
+    GroupToolsRequest,
     ListToolsRequest,
+    ToolGroupsResponse,
     ToolListResponse,
     ToolResponse,
+    ToolStatsResponse,
 )
 from .work_experience_dto import (
     AddExperienceRequest,
@@ -120,6 +140,9 @@ __all__ = [
     "ErrorResponse",
     "PaginationRequest",
     "DateRangeDTO",
+    "ReorderItem",
+    "ReorderRequest",
+    "ListFieldsRequest",
     # Profile
     "CreateProfileRequest",
     "UpdateProfileRequest",
@@ -139,6 +162,10 @@ __all__ = [
     "ListSkillsRequest",
     "SkillResponse",
     "SkillListResponse",
+    "GroupSkillsRequest",
+    "SkillGroupsResponse",
+    "GetSkillStatsRequest",
+    "SkillStatsResponse",
     # Education
     "AddEducationRequest",
     "EditEducationRequest",
@@ -198,6 +225,9 @@ __all__ = [
     "DeleteContactMessageRequest",
     "ContactMessageResponse",
     "ContactMessageListResponse",
+    "ContactMessageCursor",
+    "GetContactMessageStatsRequest",
+    "ContactMessageStatsResponse",
     # Tool
     "AddToolRequest",
     "EditToolRequest",
@@ -205,6 +235,10 @@ __all__ = [
     "ListToolsRequest",
     "ToolResponse",
     "ToolListResponse",
+    "GroupToolsRequest",
+    "ToolGroupsResponse",
+    "GetToolStatsRequest",
+    "ToolStatsResponse",
     # SocialNetwork
     "AddSocialNetworkRequest",
     "EditSocialNetworkRequest",
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class AddAdditionalTrainingRequest:
     """Request to add additional training."""
 
@@ -22,7 +22,7 @@ class AddAdditionalTrainingRequest:
     description: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EditAdditionalTrainingRequest:
     """Request to edit additional training."""
 
@@ -35,14 +35,14 @@ class EditAdditionalTrainingRequest:
     description: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteAdditionalTrainingRequest:
     """Request to delete additional training."""
 
     training_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ListAdditionalTrainingsRequest:
     """Request to list additional trainings."""
 
@@ -50,7 +50,7 @@ class ListAdditionalTrainingsRequest:
     ascending: bool = True  # Default: by order_index ASC
 
 
-@dataclass
+@dataclass(slots=True)
 class AdditionalTrainingResponse:
     """Response containing additional training data."""
 
@@ -84,7 +84,7 @@ class AdditionalTrainingResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AdditionalTrainingListResponse:
     """Response containing list of additional trainings."""
 
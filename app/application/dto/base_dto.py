@@ -7,9 +7,10 @@ These are simple data containers without business logic.
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class SuccessResponse:
     """Generic success response."""
 
@@ -17,7 +18,7 @@ class SuccessResponse:
     message: str = "Operation completed successfully"
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorResponse:
     """Generic error response."""
 
@@ -26,7 +27,7 @@ class ErrorResponse:
     errors: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginationRequest:
     """Pagination parameters for list queries."""
 
@@ -44,9 +45,35 @@ class PaginationRequest:
             self.limit = 1000
 
 
-@dataclass
+@dataclass(slots=True)
 class DateRangeDTO:
     """DTO for date ranges."""
 
     start_date: datetime
     end_date: datetime | None = None
+
+
+@dataclass(slots=True)
+class ReorderItem:
+    """New position of one item of an ordered list."""
+
+    id: str
+    order_index: int
+
+
+@dataclass(slots=True)
+class ReorderRequest:
+    """Request to apply a new ordering to the items of a profile."""
+
+    profile_id: str
+    items: list[ReorderItem]
+
+
+@dataclass(slots=True)
+class ListFieldsRequest:
+    """Request to list the items of a profile with only some fields."""
+
+    profile_id: str
+    fields: tuple[str, ...]
+    filters: dict[str, Any] = field(default_factory=dict)  # None = not filtered
+    ascending: bool = True  # By order_index
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class AddCertificationRequest:
     """Request to add a certification."""
 
@@ -22,7 +22,7 @@ class AddCertificationRequest:
     credential_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EditCertificationRequest:
     """Request to edit a certification."""
 
@@ -35,22 +35,25 @@ class EditCertificationRequest:
     credential_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteCertificationRequest:
     """Request to delete a certification."""
 
     certification_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ListCertificationsRequest:
     """Request to list certifications."""
 
     profile_id: str
     ascending: bool = True  # Default: by order_index ASC
+    issuer: str | None = None  # Filter by issuer (case-insensitive substring)
+    expired_only: bool = False  # Only certifications already expired
+    expiring_within_days: int | None = None  # Not expired, expiring in N days
 
 
-@dataclass
+@dataclass(slots=True)
 class CertificationResponse:
     """Response containing certification data."""
 
@@ -86,7 +89,7 @@ class CertificationResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CertificationListResponse:
     """Response containing list of certifications."""
 
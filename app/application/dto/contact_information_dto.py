@@ -8,14 +8,14 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class GetContactInformationRequest:
     """Request to get contact information."""
 
     profile_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateContactInformationRequest:
     """Request to create contact information."""
 
@@ -27,7 +27,7 @@ class CreateContactInformationRequest:
     website: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateContactInformationRequest:
     """Request to update contact information."""
 
@@ -39,14 +39,14 @@ class UpdateContactInformationRequest:
     website: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteContactInformationRequest:
     """Request to delete contact information."""
 
     profile_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactInformationResponse:
     """Response containing contact information data."""
 
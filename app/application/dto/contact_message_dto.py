@@ -4,11 +4,17 @@ ContactMessage DTOs.
 Data Transfer Objects for ContactMessage use cases.
 """
 
+import base64
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
+import json
 
+# Page size bounds for keyset pagination
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
 
-@dataclass
+
+@dataclass(slots=True)
 class CreateContactMessageRequest:
     """Request to create a contact message."""
 
@@ -17,21 +23,62 @@ class CreateContactMessageRequest:
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ListContactMessagesRequest:
-    """Request to list contact messages."""
+    """Request to list one page of contact messages."""
 
     ascending: bool = False  # Default: newest first
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: str | None = None  # next_cursor of the previous page
+
+
+@dataclass(frozen=True, slots=True)
+class ContactMessageCursor:
+    """
+    Position after which the next page starts.
+
+    Encoded as an opaque URL-safe token so clients cannot depend on its
+    contents.
+    """
+
+    created_at: datetime
+    id: str
+
+    def encode(self) -> str:
+        payload = json.dumps([self.created_at.isoformat(), self.id])
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "ContactMessageCursor":
+        """Parse a token produced by encode(); raises ValueError if malformed."""
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            created_at, message_id = json.loads(base64.urlsafe_b64decode(padded))
+            if not isinstance(message_id, str):
+                raise TypeError(message_id)
+            return cls(created_at=datetime.fromisoformat(created_at), id=message_id)
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid pagination cursor") from e
+
+    def as_key(self) -> tuple[datetime, str]:
+        return self.created_at, self.id
+
+
+@dataclass(slots=True)
+class GetContactMessageStatsRequest:
+    """Request for contact message statistics."""
+
+    today: date | None = None  # Defaults to the current UTC date
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteContactMessageRequest:
     """Request to delete a contact message."""
 
     message_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactMessageResponse:
     """Response containing contact message data."""
 
@@ -59,17 +106,32 @@ class ContactMessageResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactMessageListResponse:
-    """Response containing list of contact messages."""
+    """Response containing one page of contact messages."""
 
     messages: list[ContactMessageResponse]
     total: int
+    next_cursor: str | None = None  # None on the last page
 
     @classmethod
-    def from_entities(cls, entities) -> "ContactMessageListResponse":
+    def from_entities(
+        cls, entities, next_cursor: str | None = None
+    ) -> "ContactMessageListResponse":
         """Create DTO from list of domain entities."""
         return cls(
             messages=[ContactMessageResponse.from_entity(e) for e in entities],
             total=len(entities),
+            next_cursor=next_cursor,
         )
+
+
+@dataclass(slots=True)
+class ContactMessageStatsResponse:
+    """Message counts over the usual time windows."""
+
+    total: int
+    today: int
+    this_week: int  # Last 7 days plus today
+    this_month: int  # Last 30 days plus today
+    by_day: dict[str, int]  # ISO date -> count, today and the 6 previous days
@@ -5,27 +5,61 @@ Data Transfer Objects for CV-related use cases.
 """
 
 from dataclasses import dataclass, field
+from typing import Any
 
 from .additional_training_dto import AdditionalTrainingResponse
 from .certification_dto import CertificationResponse
 from .contact_information_dto import ContactInformationResponse
 from .education_dto import EducationResponse
+from .language_dto import LanguageResponse
 from .profile_dto import ProfileResponse
+from .programming_language_dto import ProgrammingLanguageResponse
 from .project_dto import ProjectResponse
 from .skill_dto import SkillResponse
 from .social_network_dto import SocialNetworkResponse
 from .tool_dto import ToolResponse
 from .work_experience_dto import WorkExperienceResponse
 
-
-@dataclass
+# Response DTO of each CV section, keyed by CompleteCVResponse field name
+CV_SECTION_RESPONSES: dict[str, Any] = {
+    "profile": ProfileResponse,
+    "contact_info": ContactInformationResponse,
+    "social_networks": SocialNetworkResponse,
+    "work_experiences": WorkExperienceResponse,
+    "projects": ProjectResponse,
+    "skills": SkillResponse,
+    "tools": ToolResponse,
+    "education": EducationResponse,
+    "additional_training": AdditionalTrainingResponse,
+    "certifications": CertificationResponse,
+    "languages": LanguageResponse,
+    "programming_languages": ProgrammingLanguageResponse,
+}
+
+# Sections only returned when explicitly requested (GetCompleteCVRequest.include)
+OPTIONAL_CV_SECTIONS = frozenset({"languages", "programming_languages"})
+
+
+@dataclass(slots=True)
 class GetCompleteCVRequest:
-    """Request to get complete CV (no parameters needed)."""
+    """Request to get the complete CV, or only some of its sections."""
+
+    # Sections to return (keys of CV_SECTION_RESPONSES); empty = every
+    # section except OPTIONAL_CV_SECTIONS
+    include: tuple[str, ...] = ()
+    # Sections to leave out of the selection
+    exclude: tuple[str, ...] = ()
+
 
-    pass
+@dataclass(slots=True)
+class GetCVFieldsRequest:
+    """Request to get some CV sections with only some fields."""
 
+    # Field names by section (keys of CV_SECTION_RESPONSES)
+    fields: dict[str, tuple[str, ...]]
 
-@dataclass
+
+@dataclass(slots=True)
 class CompleteCVResponse:
     """Response containing complete CV data."""
 
@@ -39,29 +73,36 @@ class CompleteCVResponse:
     tools: list[ToolResponse] = field(default_factory=list)
     additional_training: list[AdditionalTrainingResponse] = field(default_factory=list)
     certifications: list[CertificationResponse] = field(default_factory=list)
+    # Opt-in sections: None unless requested
+    languages: list[LanguageResponse] | None = None
+    programming_languages: list[ProgrammingLanguageResponse] | None = None
+    # Optional sections that could not be loaded in time (partial result)
+    missing_sections: list[str] = field(default_factory=list)
 
     @classmethod
     def create(
         cls,
         profile,
-        work_experiences,
-        skills,
-        education,
+        work_experiences=None,
+        skills=None,
+        education=None,
         contact_info=None,
         social_networks=None,
         projects=None,
         tools=None,
         additional_training=None,
         certifications=None,
+        languages=None,
+        programming_languages=None,
     ) -> "CompleteCVResponse":
         """Create complete CV response from entities."""
         return cls(
             profile=ProfileResponse.from_entity(profile),
             work_experiences=[
-                WorkExperienceResponse.from_entity(e) for e in work_experiences
+                WorkExperienceResponse.from_entity(e) for e in (work_experiences or [])
             ],
-            skills=[SkillResponse.from_entity(s) for s in skills],
-            education=[EducationResponse.from_entity(e) for e in education],
+            skills=[SkillResponse.from_entity(s) for s in (skills or [])],
+            education=[EducationResponse.from_entity(e) for e in (education or [])],
             contact_info=(
                 ContactInformationResponse.from_entity(contact_info)
                 if contact_info
@@ -79,10 +120,31 @@ class CompleteCVResponse:
             certifications=[
                 CertificationResponse.from_entity(c) for c in (certifications or [])
             ],
+            languages=(
+                [LanguageResponse.from_entity(lang) for lang in languages]
+                if languages is not None
+                else None
+            ),
+            programming_languages=(
+                [
+                    ProgrammingLanguageResponse.from_entity(pl)
+                    for pl in programming_languages
+                ]
+                if programming_languages is not None
+                else None
+            ),
         )
 
+    @staticmethod
+    def section_from_entities(section: str, value: Any) -> Any:
+        """Convert a single section (entity, entity list or None) to DTOs."""
+        response = CV_SECTION_RESPONSES[section]
+        if isinstance(value, list):
+            return [response.from_entity(item) for item in value]
+        return response.from_entity(value) if value else None
+
 
-@dataclass
+@dataclass(slots=True)
 class GenerateCVPDFRequest:
     """Request to generate CV PDF."""
 
@@ -90,7 +152,7 @@ class GenerateCVPDFRequest:
     include_photo: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerateCVPDFResponse:
     """Response containing PDF generation result."""
 
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class AddEducationRequest:
     """Request to add education."""
 
@@ -22,7 +22,7 @@ class AddEducationRequest:
     end_date: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EditEducationRequest:
     """Request to edit education."""
 
@@ -35,14 +35,14 @@ class EditEducationRequest:
     end_date: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteEducationRequest:
     """Request to delete education."""
 
     education_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ListEducationRequest:
     """Request to list education entries."""
 
@@ -50,7 +50,7 @@ class ListEducationRequest:
     ascending: bool = False  # Default: newest first
 
 
-@dataclass
+@dataclass(slots=True)
 class EducationResponse:
     """Response containing education data."""
 
@@ -86,7 +86,7 @@ class EducationResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EducationListResponse:
     """Response containing list of education entries."""
 
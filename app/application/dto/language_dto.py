@@ -7,7 +7,7 @@ Data Transfer Objects for Language use cases.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class AddLanguageRequest:
     """Request to add a language."""
 
@@ -17,7 +17,7 @@ class AddLanguageRequest:
     proficiency: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EditLanguageRequest:
     """Request to edit a language."""
 
@@ -26,22 +26,23 @@ class EditLanguageRequest:
     proficiency: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteLanguageRequest:
     """Request to delete a language."""
 
     language_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ListLanguagesRequest:
     """Request to list languages."""
 
     profile_id: str
     ascending: bool = True
+    proficiency: str | None = None  # Filter by CEFR level
 
 
-@dataclass
+@dataclass(slots=True)
 class LanguageResponse:
     """Response containing language data."""
 
@@ -67,7 +68,7 @@ class LanguageResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LanguageListResponse:
     """Response containing list of languages."""
 
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateProfileRequest:
     """Request to create a profile."""
 
@@ -19,7 +19,7 @@ class CreateProfileRequest:
     avatar_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateProfileRequest:
     """Request to update profile information."""
 
@@ -30,14 +30,14 @@ class UpdateProfileRequest:
     avatar_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GetProfileRequest:
     """Request to get the profile (no parameters needed)."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileResponse:
     """Response containing profile data."""
 
@@ -7,7 +7,7 @@ Data Transfer Objects for ProgrammingLanguage use cases.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class AddProgrammingLanguageRequest:
     """Request to add a programming language."""
 
@@ -17,7 +17,7 @@ class AddProgrammingLanguageRequest:
     level: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EditProgrammingLanguageRequest:
     """Request to edit a programming language."""
 
@@ -26,22 +26,23 @@ class EditProgrammingLanguageRequest:
     level: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteProgrammingLanguageRequest:
     """Request to delete a programming language."""
 
     programming_language_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ListProgrammingLanguagesRequest:
     """Request to list programming languages."""
 
     profile_id: str
     ascending: bool = True
+    level: str | None = None  # Filter by level
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgrammingLanguageResponse:
     """Response containing programming language data."""
 
@@ -67,7 +68,7 @@ class ProgrammingLanguageResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgrammingLanguageListResponse:
     """Response containing list of programming languages."""
 
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class AddProjectRequest:
     """Request to add a project."""
 
@@ -23,7 +23,7 @@ class AddProjectRequest:
     technologies: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EditProjectRequest:
     """Request to edit a project."""
 
@@ -37,14 +37,14 @@ class EditProjectRequest:
     technologies: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteProjectRequest:
     """Request to delete a project."""
 
     project_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ListProjectsRequest:
     """Request to list projects."""
 
@@ -52,7 +52,7 @@ class ListProjectsRequest:
     ascending: bool = True  # Default: by order_index ASC
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectResponse:
     """Response containing project data."""
 
@@ -90,7 +90,7 @@ class ProjectResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectListResponse:
     """Response containing list of projects."""
 
@@ -7,7 +7,7 @@ Data Transfer Objects for Skill use cases.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class AddSkillRequest:
     """Request to add a skill."""
 
@@ -18,7 +18,7 @@ class AddSkillRequest:
     level: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EditSkillRequest:
     """Request to edit a skill."""
 
@@ -28,23 +28,24 @@ class EditSkillRequest:
     level: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteSkillRequest:
     """Request to delete a skill."""
 
     skill_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ListSkillsRequest:
     """Request to list skills."""
 
     profile_id: str
     category: str | None = None  # Filter by category
+    level: str | None = None  # Filter by level
     ascending: bool = False  # Default: newest first
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillResponse:
     """Response containing skill data."""
 
@@ -72,7 +73,7 @@ class SkillResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillListResponse:
     """Response containing list of skills."""
 
@@ -86,3 +87,62 @@ class SkillListResponse:
             skills=[SkillResponse.from_entity(s) for s in entities],
             total=len(entities),
         )
+
+
+# Key used for skills without a level in groups and stats
+NO_LEVEL = "none"
+
+
+def _level_key(value: str | None) -> str:
+    return value if value is not None else NO_LEVEL
+
+
+@dataclass(slots=True)
+class GroupSkillsRequest:
+    """Request to group skills by category or level."""
+
+    profile_id: str
+    field: str = "category"  # "category" or "level"
+
+
+@dataclass(slots=True)
+class SkillGroupsResponse:
+    """Response containing skills grouped by a field value."""
+
+    groups: dict[str, list[SkillResponse]]
+
+    @classmethod
+    def from_groups(cls, groups) -> "SkillGroupsResponse":
+        """Create DTO from domain entities grouped by field value."""
+        return cls(
+            groups={
+                _level_key(value): [SkillResponse.from_entity(s) for s in skills]
+                for value, skills in groups.items()
+            }
+        )
+
+
+@dataclass(slots=True)
+class GetSkillStatsRequest:
+    """Request to get skill statistics."""
+
+    profile_id: str
+
+
+@dataclass(slots=True)
+class SkillStatsResponse:
+    """Response containing skill counts."""
+
+    total: int
+    by_level: dict[str, int]
+    by_category: dict[str, int]
+
+    @classmethod
+    def from_counts(cls, counts) -> "SkillStatsResponse":
+        """Create DTO from counts by field value."""
+        by_level = {_level_key(v): n for v, n in counts["level"].items()}
+        return cls(
+            total=sum(by_level.values()),
+            by_level=by_level,
+            by_category=dict(counts["category"]),
+        )
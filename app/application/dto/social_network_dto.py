@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class AddSocialNetworkRequest:
     """Request to add a social network."""
 
@@ -19,7 +19,7 @@ class AddSocialNetworkRequest:
     username: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EditSocialNetworkRequest:
     """Request to edit a social network."""
 
@@ -29,22 +29,23 @@ class EditSocialNetworkRequest:
     username: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteSocialNetworkRequest:
     """Request to delete a social network."""
 
     social_network_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ListSocialNetworksRequest:
     """Request to list social networks."""
 
     profile_id: str
     ascending: bool = True  # Default: by order_index ASC
+    platform: str | None = None  # Filter by platform
 
 
-@dataclass
+@dataclass(slots=True)
 class SocialNetworkResponse:
     """Response containing social network data."""
 
@@ -72,7 +73,7 @@ class SocialNetworkResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SocialNetworkListResponse:
     """Response containing list of social networks."""
 
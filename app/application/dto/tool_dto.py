@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class AddToolRequest:
     """Request to add a tool."""
 
@@ -19,7 +19,7 @@ class AddToolRequest:
     icon_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EditToolRequest:
     """Request to edit a tool."""
 
@@ -29,14 +29,14 @@ class EditToolRequest:
     icon_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteToolRequest:
     """Request to delete a tool."""
 
     tool_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ListToolsRequest:
     """Request to list tools."""
 
@@ -45,7 +45,7 @@ class ListToolsRequest:
     ascending: bool = True  # Default: by order_index ASC
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResponse:
     """Response containing tool data."""
 
@@ -73,7 +73,7 @@ class ToolResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolListResponse:
     """Response containing list of tools."""
 
@@ -87,3 +87,48 @@ class ToolListResponse:
             tools=[ToolResponse.from_entity(e) for e in entities],
             total=len(entities),
         )
+
+
+@dataclass(slots=True)
+class GroupToolsRequest:
+    """Request to group tools by category."""
+
+    profile_id: str
+
+
+@dataclass(slots=True)
+class ToolGroupsResponse:
+    """Response containing tools grouped by category."""
+
+    groups: dict[str, list[ToolResponse]]
+
+    @classmethod
+    def from_groups(cls, groups) -> "ToolGroupsResponse":
+        """Create DTO from domain entities grouped by category."""
+        return cls(
+            groups={
+                category: [ToolResponse.from_entity(t) for t in tools]
+                for category, tools in groups.items()
+            }
+        )
+
+
+@dataclass(slots=True)
+class GetToolStatsRequest:
+    """Request to get tool statistics."""
+
+    profile_id: str
+
+
+@dataclass(slots=True)
+class ToolStatsResponse:
+    """Response containing tool counts."""
+
+    total: int
+    by_category: dict[str, int]
+
+    @classmethod
+    def from_counts(cls, counts) -> "ToolStatsResponse":
+        """Create DTO from counts by field value."""
+        by_category = dict(counts["category"])
+        return cls(total=sum(by_category.values()), by_category=by_category)
@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class AddExperienceRequest:
     """Request to add a work experience."""
 
@@ -22,7 +22,7 @@ class AddExperienceRequest:
     responsibilities: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class EditExperienceRequest:
     """Request to edit a work experience."""
 
@@ -35,22 +35,24 @@ class EditExperienceRequest:
     responsibilities: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteExperienceRequest:
     """Request to delete a work experience."""
 
     experience_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ListExperiencesRequest:
     """Request to list work experiences."""
 
     profile_id: str
     ascending: bool = False  # Default: newest first
+    company: str | None = None  # Filter by company (case-insensitive substring)
+    current_only: bool = False  # Only positions without end date
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkExperienceResponse:
     """Response containing work experience data."""
 
@@ -86,7 +88,7 @@ class WorkExperienceResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkExperienceListResponse:
     """Response containing list of work experiences."""
 
@@ -0,0 +1,15 @@
+"""
+Application Services Module.
+
+Contains services that maintain derived read models on behalf of use cases.
+"""
+
+from .composite_cv_change_listener import CompositeCVChangeListener
+from .cv_cache import CVResultCache
+from .cv_snapshot_service import CVSnapshotService
+
+__all__ = [
+    "CompositeCVChangeListener",
+    "CVResultCache",
+    "CVSnapshotService",
+]
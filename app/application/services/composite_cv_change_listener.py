@@ -0,0 +1,26 @@
+"""
+Composite CV Change Listener.
+
+Fans a CV section change out to several listeners.
+"""
+
+from collections.abc import Sequence
+
+from app.shared.interfaces import ICVChangeListener
+
+
+class CompositeCVChangeListener(ICVChangeListener):
+    """Notifies every wrapped listener, in order."""
+
+    def __init__(self, listeners: Sequence[ICVChangeListener]):
+        """
+        Initialize the composite.
+
+        Args:
+            listeners: Listeners to notify, in order
+        """
+        self.listeners = list(listeners)
+
+    async def section_changed(self, section: str) -> None:
+        for listener in self.listeners:
+            await listener.section_changed(section)
@@ -0,0 +1,132 @@
+"""
+CV Result Cache.
+
+In-process cache of the assembled complete CV, so that repeated reads skip
+the database entirely until a write invalidates them.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable
+import time
+from typing import Any
+
+from app.shared.interfaces import ICVChangeListener
+
+
+class CVResultCache(ICVChangeListener):
+    """
+    TTL + LRU cache of complete CV responses, keyed by profile ID.
+
+    Business Rules:
+    - Entries expire ``ttl_seconds`` after being stored
+    - At most ``max_entries`` are kept; the least recently used is evicted
+    - Any CV section change drops every entry: entries are whole CVs, and
+      every section that notifies changes is part of them
+    - A result computed while a write happened is not stored (see
+      ``generation``), so a slow read cannot resurrect stale data
+
+    The cache lives in the process: with several workers, each keeps its own
+    copy and only the one that handled a write is invalidated immediately;
+    the others converge within ``ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 16,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached CVs
+            ttl_seconds: Seconds an entry stays valid
+            clock: Monotonic time source (injectable for tests)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation; pass it back to ``put``."""
+        return self._generation
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for ``key``, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any, generation: int | None = None) -> bool:
+        """
+        Store ``value`` under ``key``.
+
+        Args:
+            key: Cache key (profile ID)
+            value: Value to cache
+            generation: ``generation`` read before computing ``value``; if an
+                invalidation happened since, the value is discarded
+
+        Returns:
+            True if the value was stored
+        """
+        if generation is not None and generation != self._generation:
+            return False
+
+        self._entries[key] = (self._clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return True
+
+    def invalidate(self) -> None:
+        """Drop every entry."""
+        self._generation += 1
+        self._entries.clear()
+        self.invalidations += 1
+
+    async def section_changed(self, _section: str) -> None:
+        """Drop every entry, whichever section changed."""
+        self.invalidate()
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for sizing the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
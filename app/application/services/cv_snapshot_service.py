@@ -0,0 +1,150 @@
+"""
+CV Snapshot Service.
+
+Maintains the materialized CV read model (one pre-assembled document per
+profile) so that ``GET /cv`` costs a single lookup.
+"""
+
+from dataclasses import asdict
+from datetime import datetime
+import logging
+import time
+from typing import Any
+
+from app.application.dto import CompleteCVResponse, GetCompleteCVRequest
+from app.application.use_cases.cv.get_complete_cv import GetCompleteCVUseCase
+from app.shared.interfaces import ICVChangeListener, ICVSnapshotRepository
+
+logger = logging.getLogger(__name__)
+
+# Every CV section is stored under this profile_id by convention
+_PROFILE_ID = "default_profile"
+
+
+class CVSnapshotService(ICVChangeListener):
+    """
+    Builds and incrementally refreshes CV snapshots.
+
+    Business Rules:
+    - A snapshot is only stored when every section loaded (never partial)
+    - Without ``store_rebuilds`` a rebuilt snapshot is served but not stored:
+      sections read from a lagging replica must not overwrite a newer one
+    - The snapshot holds the default CV (no opt-in sections)
+    - A section change rewrites only that section of the stored snapshot
+    - Section writes, full rebuilds included, are versioned by the time
+      their load started, so a slow write never overwrites a newer section
+      that finished first
+    - ``is_expired`` depends on the current date and is recomputed on read
+    - If a refresh fails the snapshot is dropped, so the next read rebuilds
+      it instead of serving stale data
+    - Refresh failures never fail the write that triggered them
+
+    Dependencies:
+    - ICVSnapshotRepository: Snapshot storage
+    - GetCompleteCVUseCase: Loads the sections from their source collections
+    """
+
+    def __init__(
+        self,
+        snapshot_repository: ICVSnapshotRepository,
+        cv_use_case: GetCompleteCVUseCase,
+        store_rebuilds: bool = True,
+    ):
+        """
+        Initialize service with dependencies.
+
+        Args:
+            snapshot_repository: Snapshot storage
+            cv_use_case: Use case that assembles the CV from its sections
+            store_rebuilds: Whether rebuilt snapshots are stored, i.e. whether
+                the use case reads up-to-date sections
+        """
+        self.snapshot_repo = snapshot_repository
+        self.cv_use_case = cv_use_case
+        self.store_rebuilds = store_rebuilds
+
+    async def get_or_build(self) -> dict[str, Any]:
+        """
+        Return the stored snapshot, building it on a miss.
+
+        Raises:
+            NotFoundException: If profile doesn't exist
+        """
+        snapshot = await self.snapshot_repo.get(_PROFILE_ID)
+        if snapshot is None:
+            return await self.rebuild()
+        self._refresh_expiry(snapshot)
+        return snapshot
+
+    async def rebuild(self) -> dict[str, Any]:
+        """
+        Assemble the complete CV from the source collections and store it.
+
+        Returns:
+            The serialized CV
+
+        Raises:
+            NotFoundException: If profile doesn't exist
+        """
+        version = self._next_version()
+        response = await self.cv_use_case.execute(GetCompleteCVRequest())
+        snapshot = asdict(response)
+        if response.missing_sections or not self.store_rebuilds:
+            # Serve the partial (or possibly stale) CV, but do not persist it
+            return snapshot
+        await self.snapshot_repo.save(_PROFILE_ID, snapshot, version=version)
+        return snapshot
+
+    async def section_changed(self, section: str) -> None:
+        """Refresh ``section`` in the stored snapshot after a write."""
+        if section not in GetCompleteCVUseCase.DEFAULT_SECTIONS:
+            # Not part of the default CV: nothing to refresh
+            return
+
+        version = self._next_version()
+        try:
+            value = await self.cv_use_case.load_section(section)
+        except Exception:
+            logger.exception("Could not reload CV section %s", section)
+            await self._invalidate()
+            return
+
+        if section == "profile" and value is None:
+            await self._invalidate()
+            return
+
+        serialized = self._serialize(
+            CompleteCVResponse.section_from_entities(section, value)
+        )
+        try:
+            await self.snapshot_repo.save_section(
+                _PROFILE_ID, section, serialized, version=version
+            )
+        except Exception:
+            logger.exception("Could not refresh CV snapshot section %s", section)
+            await self._invalidate()
+
+    async def _invalidate(self) -> None:
+        try:
+            await self.snapshot_repo.delete(_PROFILE_ID)
+        except Exception:
+            logger.exception("Could not invalidate CV snapshot")
+
+    @staticmethod
+    def _next_version() -> int:
+        # Taken before loading: a later load sees at least the same writes
+        return time.time_ns()
+
+    @staticmethod
+    def _refresh_expiry(snapshot: dict[str, Any]) -> None:
+        # Same rule as Certification.is_expired, evaluated at read time
+        now = datetime.utcnow()
+        for certification in snapshot.get("certifications") or []:
+            expiry_date = certification.get("expiry_date")
+            certification["is_expired"] = expiry_date is not None and now > expiry_date
+
+    @staticmethod
+    def _serialize(value: Any) -> Any:
+        if isinstance(value, list):
+            return [asdict(item) for item in value]
+        return asdict(value) if value is not None else None
@@ -8,64 +8,109 @@ from .additional_training import (
     AddAdditionalTrainingUseCase,
     DeleteAdditionalTrainingUseCase,
     EditAdditionalTrainingUseCase,
+    ListAdditionalTrainingFieldsUseCase,
     ListAdditionalTrainingsUseCase,
+    ReorderAdditionalTrainingsUseCase,
 )
 from .certification import (
     AddCertificationUseCase,
     DeleteCertificationUseCase,
     EditCertificationUseCase,
+    ListCertificationFieldsUseCase,
     ListCertificationsUseCase,
+    ReorderCertificationsUseCase,
 )
 from .contact_information import (
     CreateContactInformationUseCase,
     DeleteContactInformationUseCase,
+    GetContactInformationFieldsUseCase,
     GetContactInformationUseCase,
     UpdateContactInformationUseCase,
 )
 from .contact_message import (
     CreateContactMessageUseCase,
     DeleteContactMessageUseCase,
+    GetContactMessageStatsUseCase,
     ListContactMessagesUseCase,
 )
-from .cv import GenerateCVPDFUseCase, GetCompleteCVUseCase
-from .education import AddEducationUseCase, DeleteEducationUseCase, EditEducationUseCase
+from .cv import (
+    GenerateCVPDFUseCase,
+    GetCompleteCVUseCase,
+    GetCVFieldsUseCase,
+    GetCVSnapshotUseCase,
+)
+from .education import (
+    AddEducationUseCase,
+    DeleteEducationUseCase,
+    EditEducationUseCase,
+    ListEducationFieldsUseCase,
+    ReorderEducationUseCase,
+)
+from .fields import ListFieldsUseCase
 from .language import (
     AddLanguageUseCase,
     DeleteLanguageUseCase,
     EditLanguageUseCase,
+    ListLanguageFieldsUseCase,
     ListLanguagesUseCase,
 )
-from .profile import CreateProfileUseCase, GetProfileUseCase, UpdateProfileUseCase
+from .ordering import ReorderItemsUseCase
+from .profile import (
+    CreateProfileUseCase,
+    GetProfileFieldsUseCase,
+    GetProfileUseCase,
+    UpdateProfileUseCase,
+)
 from .programming_language import (
     AddProgrammingLanguageUseCase,
     DeleteProgrammingLanguageUseCase,
     EditProgrammingLanguageUseCase,
+    ListProgrammingLanguageFieldsUseCase,
     ListProgrammingLanguagesUseCase,
 )
 from .project import (
     AddProjectUseCase,
     DeleteProjectUseCase,
     EditProjectUseCase,
+    ListProjectFieldsUseCase,
     ListProjectsUseCase,
+    ReorderProjectsUseCase,
 )
 from .skill import (
     AddSkillUseCase,
     DeleteSkillUseCase,
     EditSkillUseCase,
+    GetSkillStatsUseCase,
+    GroupSkillsUseCase,
+    ListSkillFieldsUseCase,
     ListSkillsUseCase,
+    ReorderSkillsUseCase,
 )
 from .social_network import (
     AddSocialNetworkUseCase,
     DeleteSocialNetworkUseCase,
     EditSocialNetworkUseCase,
+    ListSocialNetworkFieldsUseCase,
     ListSocialNetworksUseCase,
+    ReorderSocialNetworksUseCase,
+)
+from .tool import (
+    AddToolUseCase,
+    DeleteToolUseCase,
+    EditToolUseCase,
+    GetToolStatsUseCase,
+    GroupToolsUseCase,
+    ListToolFieldsUseCase,
+    ListToolsUseCase,
+    ReorderToolsUseCase,
 )
-from .tool import AddToolUseCase, DeleteToolUseCase, EditToolUseCase, ListToolsUseCase
 from .work_experience import (
     AddExperienceUseCase,
     DeleteExperienceUseCase,
     EditExperienceUseCase,
+    ListExperienceFieldsUseCase,
     ListExperiencesUseCase,
+    ReorderExperiencesUseCase,
 )
 
 __all__ = [
@@ -73,65 +118,96 @@ __all__ = [
     "GetProfileUseCase",
     "CreateProfileUseCase",
     "UpdateProfileUseCase",
+    "GetProfileFieldsUseCase",
     # Experience
     "AddExperienceUseCase",
     "EditExperienceUseCase",
     "DeleteExperienceUseCase",
     "ListExperiencesUseCase",
+    "ReorderExperiencesUseCase",
+    "ListExperienceFieldsUseCase",
     # Skill
     "AddSkillUseCase",
     "EditSkillUseCase",
     "DeleteSkillUseCase",
     "ListSkillsUseCase",
+    "ReorderSkillsUseCase",
+    "GroupSkillsUseCase",
+    "GetSkillStatsUseCase",
+    "ListSkillFieldsUseCase",
     # Education
     "AddEducationUseCase",
     "EditEducationUseCase",
     "DeleteEducationUseCase",
+    "ReorderEducationUseCase",
+    "ListEducationFieldsUseCase",
     # Language
     "AddLanguageUseCase",
     "EditLanguageUseCase",
     "DeleteLanguageUseCase",
     "ListLanguagesUseCase",
+    "ListLanguageFieldsUseCase",
     # Programming Language
     "AddProgrammingLanguageUseCase",
     "EditProgrammingLanguageUseCase",
     "DeleteProgrammingLanguageUseCase",
     "ListProgrammingLanguagesUseCase",
+    "ListProgrammingLanguageFieldsUseCase",
+    # Ordering
+    "ReorderItemsUseCase",
+    # Sparse fields
+    "ListFieldsUseCase",
     # CV
     "GetCompleteCVUseCase",
+    "GetCVSnapshotUseCase",
     "GenerateCVPDFUseCase",
+    "GetCVFieldsUseCase",
     # Project
     "AddProjectUseCase",
     "EditProjectUseCase",
     "DeleteProjectUseCase",
     "ListProjectsUseCase",
+    "ReorderProjectsUseCase",
+    "ListProjectFieldsUseCase",
     # Certification
     "AddCertificationUseCase",
     "EditCertificationUseCase",
     "DeleteCertificationUseCase",
     "ListCertificationsUseCase",
+    "ReorderCertificationsUseCase",
+    "ListCertificationFieldsUseCase",
     # AdditionalTraining
     "AddAdditionalTrainingUseCase",
     "EditAdditionalTrainingUseCase",
     "DeleteAdditionalTrainingUseCase",
     "ListAdditionalTrainingsUseCase",
+    "ReorderAdditionalTrainingsUseCase",
+    "ListAdditionalTrainingFieldsUseCase",
     # ContactInformation
     "GetContactInformationUseCase",
     "CreateContactInformationUseCase",
     "UpdateContactInformationUseCase",
     "DeleteContactInformationUseCase",
+    "GetContactInformationFieldsUseCase",
     # ContactMessage
     "CreateContactMessageUseCase",
     "ListContactMessagesUseCase",
     "DeleteContactMessageUseCase",
+    "GetContactMessageStatsUseCase",
     # Tool
     "AddToolUseCase",
     "EditToolUseCase",
     "DeleteToolUseCase",
     "ListToolsUseCase",
+    "ReorderToolsUseCase",
+    "GroupToolsUseCase",
+    "GetToolStatsUseCase",
+    "ListToolFieldsUseCase",
     # SocialNetwork
     "AddSocialNetworkUseCase",
     "EditSocialNetworkUseCase",
     "DeleteSocialNetworkUseCase",
     "ListSocialNetworksUseCase",
+    "ReorderSocialNetworksUseCase",
+    "ListSocialNetworkFieldsUseCase",
 ]
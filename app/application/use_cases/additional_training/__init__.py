@@ -7,11 +7,15 @@ Contains all use cases related to additional training management.
 from .add_additional_training import AddAdditionalTrainingUseCase
 from .delete_additional_training import DeleteAdditionalTrainingUseCase
 from .edit_additional_training import EditAdditionalTrainingUseCase
+from .list_additional_training_fields import ListAdditionalTrainingFieldsUseCase
 from .list_additional_trainings import ListAdditionalTrainingsUseCase
+from .reorder_additional_trainings import ReorderAdditionalTrainingsUseCase
 
 __all__ = [
     "AddAdditionalTrainingUseCase",
     "EditAdditionalTrainingUseCase",
     "DeleteAdditionalTrainingUseCase",
     "ListAdditionalTrainingsUseCase",
+    "ReorderAdditionalTrainingsUseCase",
+    "ListAdditionalTrainingFieldsUseCase",
 ]
@@ -8,8 +8,7 @@ from typing import TYPE_CHECKING
 
 from app.application.dto import AddAdditionalTrainingRequest, AdditionalTrainingResponse
 from app.domain.entities import AdditionalTraining
-from app.shared.interfaces import ICommandUseCase, IOrderedRepository
-from app.shared.shared_exceptions import BusinessRuleViolationException
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IOrderedRepository
 
 if TYPE_CHECKING:
     from app.domain.entities import AdditionalTraining as AdditionalTrainingType
@@ -27,19 +26,23 @@ class AddAdditionalTrainingUseCase(
 
     Dependencies:
     - IOrderedRepository[AdditionalTraining]: For additional training data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
     def __init__(
         self,
         additional_training_repository: IOrderedRepository["AdditionalTrainingType"],
+        cv_listener: ICVChangeListener | None = None,
     ):
         """
         Initialize use case with dependencies.
 
         Args:
             additional_training_repository: Additional training repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.training_repo = additional_training_repository
+        self.cv_listener = cv_listener
 
     async def execute(
         self, request: AddAdditionalTrainingRequest
@@ -57,16 +60,6 @@ class AddAdditionalTrainingUseCase(
             BusinessRuleViolationException: If orderIndex already exists
             DomainError: If validation fails
         """
-        # Check orderIndex uniqueness
-        existing = await self.training_repo.get_by_order_index(
-            request.profile_id, request.order_index
-        )
-        if existing:
-            raise BusinessRuleViolationException(
-                "orderIndex must be unique per profile",
-                {"orderIndex": request.order_index},
-            )
-
         # Create domain entity (validates automatically)
         training = AdditionalTraining.create(
             profile_id=request.profile_id,
@@ -79,8 +72,12 @@ class AddAdditionalTrainingUseCase(
             description=request.description,
         )
 
-        # Persist the training
+        # Persist the training (the repository rejects a duplicate orderIndex)
         created_training = await self.training_repo.add(training)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("additional_training")
+
         # Convert to DTO and return
         return AdditionalTrainingResponse.from_entity(created_training)
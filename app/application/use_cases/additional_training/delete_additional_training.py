@@ -7,7 +7,7 @@ Deletes an existing additional training entry.
 from typing import TYPE_CHECKING
 
 from app.application.dto import DeleteAdditionalTrainingRequest, SuccessResponse
-from app.shared.interfaces import ICommandUseCase, IOrderedRepository
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IOrderedRepository
 from app.shared.shared_exceptions import NotFoundException
 
 if TYPE_CHECKING:
@@ -26,19 +26,23 @@ class DeleteAdditionalTrainingUseCase(
 
     Dependencies:
     - IOrderedRepository[AdditionalTraining]: For additional training data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
     def __init__(
         self,
         additional_training_repository: IOrderedRepository["AdditionalTrainingType"],
+        cv_listener: ICVChangeListener | None = None,
     ):
         """
         Initialize use case with dependencies.
 
         Args:
             additional_training_repository: Additional training repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.training_repo = additional_training_repository
+        self.cv_listener = cv_listener
 
     async def execute(
         self, request: DeleteAdditionalTrainingRequest
@@ -61,4 +65,8 @@ class DeleteAdditionalTrainingUseCase(
         if not deleted:
             raise NotFoundException("AdditionalTraining", request.training_id)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("additional_training")
+
         return SuccessResponse(message="Additional training deleted successfully")
@@ -10,9 +10,12 @@ from app.application.dto import (
     AdditionalTrainingResponse,
     EditAdditionalTrainingRequest,
 )
-from app.shared.interfaces import ICommandUseCase, IOrderedRepository
+from app.domain.entities import AdditionalTraining
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IOrderedRepository
 from app.shared.shared_exceptions import NotFoundException
 
+from ..editing import provided_changes
+
 if TYPE_CHECKING:
     from app.domain.entities import AdditionalTraining as AdditionalTrainingType
 
@@ -25,24 +28,29 @@ class EditAdditionalTrainingUseCase(
 
     Business Rules:
     - Training must exist
-    - Only provided fields are updated
+    - Only provided fields are updated, in one round trip without loading
+      the training first
     - Validations are performed by the entity
 
     Dependencies:
     - IOrderedRepository[AdditionalTraining]: For additional training data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
     def __init__(
         self,
         additional_training_repository: IOrderedRepository["AdditionalTrainingType"],
+        cv_listener: ICVChangeListener | None = None,
     ):
         """
         Initialize use case with dependencies.
 
         Args:
             additional_training_repository: Additional training repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.training_repo = additional_training_repository
+        self.cv_listener = cv_listener
 
     async def execute(
         self, request: EditAdditionalTrainingRequest
@@ -60,24 +68,29 @@ class EditAdditionalTrainingUseCase(
             NotFoundException: If training doesn't exist
             DomainError: If validation fails
         """
-        # Get existing training
-        training = await self.training_repo.get_by_id(request.training_id)
-
-        if not training:
-            raise NotFoundException("AdditionalTraining", request.training_id)
+        # Validate the changed fields (entity rules)
+        changes = AdditionalTraining.validate_changes(
+            provided_changes(
+                title=request.title,
+                provider=request.provider,
+                completion_date=request.completion_date,
+                duration=request.duration,
+                certificate_url=request.certificate_url,
+                description=request.description,
+            )
+        )
 
-        # Update info (entity validates)
-        training.update_info(
-            title=request.title,
-            provider=request.provider,
-            completion_date=request.completion_date,
-            duration=request.duration,
-            certificate_url=request.certificate_url,
-            description=request.description,
+        # Write only those fields
+        updated_training = await self.training_repo.update_fields(
+            request.training_id, changes
         )
 
-        # Persist changes
-        updated_training = await self.training_repo.update(training)
+        if not updated_training:
+            raise NotFoundException("AdditionalTraining", request.training_id)
+
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("additional_training")
 
         # Convert to DTO and return
         return AdditionalTrainingResponse.from_entity(updated_training)
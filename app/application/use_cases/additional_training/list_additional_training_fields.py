@@ -0,0 +1,20 @@
+"""
+List Additional Training Fields Use Case.
+
+Lists additional trainings with only the requested fields.
+"""
+
+from app.application.dto import AdditionalTrainingResponse
+
+from ..fields import ListFieldsUseCase
+
+
+class ListAdditionalTrainingFieldsUseCase(ListFieldsUseCase):
+    """
+    Use case for listing additional trainings with a sparse fieldset.
+
+    See ListFieldsUseCase for the business rules.
+    """
+
+    resource_type = "AdditionalTraining"
+    response_class = AdditionalTrainingResponse
@@ -0,0 +1,21 @@
+"""
+Reorder Additional Trainings Use Case.
+
+Applies a new ordering to the additional trainings of the profile.
+"""
+
+from app.application.dto import AdditionalTrainingResponse
+
+from ..ordering import ReorderItemsUseCase
+
+
+class ReorderAdditionalTrainingsUseCase(ReorderItemsUseCase):
+    """
+    Use case for reordering additional trainings.
+
+    See ReorderItemsUseCase for the business rules.
+    """
+
+    resource_type = "AdditionalTraining"
+    section = "additional_training"
+    response_class = AdditionalTrainingResponse
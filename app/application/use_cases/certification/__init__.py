@@ -7,11 +7,15 @@ Contains all use cases related to certification management.
 from .add_certification import AddCertificationUseCase
 from .delete_certification import DeleteCertificationUseCase
 from .edit_certification import EditCertificationUseCase
+from .list_certification_fields import ListCertificationFieldsUseCase
 from .list_certifications import ListCertificationsUseCase
+from .reorder_certifications import ReorderCertificationsUseCase
 
 __all__ = [
     "AddCertificationUseCase",
     "EditCertificationUseCase",
     "DeleteCertificationUseCase",
     "ListCertificationsUseCase",
+    "ReorderCertificationsUseCase",
+    "ListCertificationFieldsUseCase",
 ]
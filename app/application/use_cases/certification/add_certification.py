@@ -8,8 +8,7 @@ from typing import TYPE_CHECKING
 
 from app.application.dto import AddCertificationRequest, CertificationResponse
 from app.domain.entities import Certification
-from app.shared.interfaces import ICommandUseCase, IOrderedRepository
-from app.shared.shared_exceptions import BusinessRuleViolationException
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IOrderedRepository
 
 if TYPE_CHECKING:
     from app.domain.entities import Certification as CertificationType
@@ -28,18 +27,23 @@ class AddCertificationUseCase(
 
     Dependencies:
     - IOrderedRepository[Certification]: For certification data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
     def __init__(
-        self, certification_repository: IOrderedRepository["CertificationType"]
+        self,
+        certification_repository: IOrderedRepository["CertificationType"],
+        cv_listener: ICVChangeListener | None = None,
     ):
         """
         Initialize use case with dependencies.
 
         Args:
             certification_repository: Certification repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.certification_repo = certification_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: AddCertificationRequest) -> CertificationResponse:
         """
@@ -55,16 +59,6 @@ class AddCertificationUseCase(
             BusinessRuleViolationException: If orderIndex already exists
             DomainError: If validation fails
         """
-        # Check orderIndex uniqueness
-        existing = await self.certification_repo.get_by_order_index(
-            request.profile_id, request.order_index
-        )
-        if existing:
-            raise BusinessRuleViolationException(
-                "orderIndex must be unique per profile",
-                {"orderIndex": request.order_index},
-            )
-
         # Create domain entity (validates automatically)
         certification = Certification.create(
             profile_id=request.profile_id,
@@ -77,8 +71,12 @@ class AddCertificationUseCase(
             credential_url=request.credential_url,
         )
 
-        # Persist the certification
+        # Persist the certification (the repository rejects a duplicate orderIndex)
         created_certification = await self.certification_repo.add(certification)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("certifications")
+
         # Convert to DTO and return
         return CertificationResponse.from_entity(created_certification)
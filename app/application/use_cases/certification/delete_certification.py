@@ -7,7 +7,7 @@ Deletes an existing certification.
 from typing import TYPE_CHECKING
 
 from app.application.dto import DeleteCertificationRequest, SuccessResponse
-from app.shared.interfaces import ICommandUseCase, IOrderedRepository
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IOrderedRepository
 from app.shared.shared_exceptions import NotFoundException
 
 if TYPE_CHECKING:
@@ -26,18 +26,23 @@ class DeleteCertificationUseCase(
 
     Dependencies:
     - IOrderedRepository[Certification]: For certification data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
     def __init__(
-        self, certification_repository: IOrderedRepository["CertificationType"]
+        self,
+        certification_repository: IOrderedRepository["CertificationType"],
+        cv_listener: ICVChangeListener | None = None,
     ):
         """
         Initialize use case with dependencies.
 
         Args:
             certification_repository: Certification repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.certification_repo = certification_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: DeleteCertificationRequest) -> SuccessResponse:
         """
@@ -58,4 +63,8 @@ class DeleteCertificationUseCase(
         if not deleted:
             raise NotFoundException("Certification", request.certification_id)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("certifications")
+
         return SuccessResponse(message="Certification deleted successfully")
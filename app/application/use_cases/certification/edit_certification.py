@@ -7,9 +7,12 @@ Updates an existing certification.
 from typing import TYPE_CHECKING
 
 from app.application.dto import CertificationResponse, EditCertificationRequest
-from app.shared.interfaces import ICommandUseCase, IOrderedRepository
+from app.domain.entities import Certification
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IOrderedRepository
 from app.shared.shared_exceptions import NotFoundException
 
+from ..editing import provided_changes
+
 if TYPE_CHECKING:
     from app.domain.entities import Certification as CertificationType
 
@@ -22,23 +25,29 @@ class EditCertificationUseCase(
 
     Business Rules:
     - Certification must exist
-    - Only provided fields are updated
+    - Only provided fields are updated; without a date change, in one round
+      trip without loading the certification first
     - Validations are performed by the entity
 
     Dependencies:
     - IOrderedRepository[Certification]: For certification data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
     def __init__(
-        self, certification_repository: IOrderedRepository["CertificationType"]
+        self,
+        certification_repository: IOrderedRepository["CertificationType"],
+        cv_listener: ICVChangeListener | None = None,
     ):
         """
         Initialize use case with dependencies.
 
         Args:
             certification_repository: Certification repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.certification_repo = certification_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: EditCertificationRequest) -> CertificationResponse:
         """
@@ -54,13 +63,46 @@ class EditCertificationUseCase(
             NotFoundException: If certification doesn't exist
             DomainError: If validation fails
         """
+        changes = provided_changes(
+            title=request.title,
+            issuer=request.issuer,
+            issue_date=request.issue_date,
+            expiry_date=request.expiry_date,
+            credential_id=request.credential_id,
+            credential_url=request.credential_url,
+        )
+
+        if Certification.can_update_partially(changes):
+            # No date change: validate the changed fields (entity rules) and
+            # write only those, without loading the certification first
+            updated_certification = await self.certification_repo.update_fields(
+                request.certification_id, Certification.validate_changes(changes)
+            )
+        else:
+            # Dates are validated together with the stored ones
+            updated_certification = await self._update_loaded(request)
+
+        if not updated_certification:
+            raise NotFoundException("Certification", request.certification_id)
+
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("certifications")
+
+        # Convert to DTO and return
+        return CertificationResponse.from_entity(updated_certification)
+
+    async def _update_loaded(
+        self, request: EditCertificationRequest
+    ) -> "CertificationType | None":
+        """Apply the request to the stored certification (None if it doesn't exist)."""
         # Get existing certification
         certification = await self.certification_repo.get_by_id(
             request.certification_id
         )
 
         if not certification:
-            raise NotFoundException("Certification", request.certification_id)
+            return None
 
         # Update info (entity validates)
         certification.update_info(
@@ -72,8 +114,4 @@ class EditCertificationUseCase(
             credential_url=request.credential_url,
         )
 
-        # Persist changes
-        updated_certification = await self.certification_repo.update(certification)
-
-        # Convert to DTO and return
-        return CertificationResponse.from_entity(updated_certification)
+        return await self.certification_repo.update(certification)
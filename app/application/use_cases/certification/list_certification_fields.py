@@ -0,0 +1,21 @@
+"""
+List Certification Fields Use Case.
+
+Lists certifications with only the requested fields.
+"""
+
+from app.application.dto import CertificationResponse
+
+from ..fields import ListFieldsUseCase
+
+
+class ListCertificationFieldsUseCase(ListFieldsUseCase):
+    """
+    Use case for listing certifications with a sparse fieldset.
+
+    See ListFieldsUseCase for the business rules.
+    """
+
+    resource_type = "Certification"
+    response_class = CertificationResponse
+    computed_fields = frozenset({"is_expired"})
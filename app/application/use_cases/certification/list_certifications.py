@@ -4,10 +4,12 @@ List Certifications Use Case.
 Retrieves all certifications for a profile.
 """
 
-from typing import TYPE_CHECKING
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING, Any
 
 from app.application.dto import CertificationListResponse, ListCertificationsRequest
-from app.shared.interfaces import IOrderedRepository, IQueryUseCase
+from app.shared.interfaces import Contains, IOrderedRepository, IQueryUseCase, Range
+from app.shared.shared_exceptions import ValidationException
 
 if TYPE_CHECKING:
     from app.domain.entities import Certification as CertificationType
@@ -21,6 +23,9 @@ class ListCertificationsUseCase(
 
     Business Rules:
     - Returns all certifications for the profile
+    - Optional filters, evaluated by the repository: issuer (case-insensitive
+      substring), expired only, or not expired but expiring within N days
+      (counting whole local days, today included)
     - Ordered by orderIndex (configurable direction)
 
     Dependencies:
@@ -50,9 +55,9 @@ class ListCertificationsUseCase(
         Returns:
             CertificationListResponse with list of certifications and metadata
         """
-        # Get certifications
+        # Get certifications (only the ones matching the filters)
         certifications = await self.certification_repo.find_by(
-            profile_id=request.profile_id
+            profile_id=request.profile_id, **self._conditions(request)
         )
 
         # Sort by order_index
@@ -60,3 +65,25 @@ class ListCertificationsUseCase(
 
         # Convert to DTO and return
         return CertificationListResponse.from_entities(certifications)
+
+    @staticmethod
+    def _conditions(request: ListCertificationsRequest) -> dict[str, Any]:
+        """Translate the request filters into repository conditions."""
+        if request.expired_only and request.expiring_within_days is not None:
+            raise ValidationException(
+                ["expired_only and expiring_within_days are mutually exclusive"]
+            )
+
+        conditions: dict[str, Any] = {}
+        if request.issuer:
+            conditions["issuer"] = Contains(request.issuer)
+
+        now = datetime.utcnow()
+        if request.expired_only:
+            conditions["expiry_date"] = Range(lt=now)
+        elif request.expiring_within_days is not None:
+            last_day = date.today() + timedelta(days=request.expiring_within_days)
+            conditions["expiry_date"] = Range(
+                gte=now, lt=datetime.combine(last_day + timedelta(days=1), time.min)
+            )
+        return conditions
@@ -0,0 +1,21 @@
+"""
+Reorder Certifications Use Case.
+
+Applies a new ordering to the certifications of the profile.
+"""
+
+from app.application.dto import CertificationResponse
+
+from ..ordering import ReorderItemsUseCase
+
+
+class ReorderCertificationsUseCase(ReorderItemsUseCase):
+    """
+    Use case for reordering certifications.
+
+    See ReorderItemsUseCase for the business rules.
+    """
+
+    resource_type = "Certification"
+    section = "certifications"
+    response_class = CertificationResponse
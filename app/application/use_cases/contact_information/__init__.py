@@ -7,6 +7,7 @@ Contains all use cases related to contact information management.
 from .create_contact_information import CreateContactInformationUseCase
 from .delete_contact_information import DeleteContactInformationUseCase
 from .get_contact_information import GetContactInformationUseCase
+from .get_contact_information_fields import GetContactInformationFieldsUseCase
 from .update_contact_information import UpdateContactInformationUseCase
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "CreateContactInformationUseCase",
     "UpdateContactInformationUseCase",
     "DeleteContactInformationUseCase",
+    "GetContactInformationFieldsUseCase",
 ]
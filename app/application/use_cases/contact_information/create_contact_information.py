@@ -11,7 +11,7 @@ from app.application.dto import (
     CreateContactInformationRequest,
 )
 from app.domain.entities import ContactInformation
-from app.shared.interfaces import ICommandUseCase, IRepository
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IRepository
 from app.shared.shared_exceptions import DuplicateException
 
 if TYPE_CHECKING:
@@ -30,19 +30,23 @@ class CreateContactInformationUseCase(
 
     Dependencies:
     - IRepository[ContactInformation]: For contact information data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
     def __init__(
         self,
         contact_information_repository: IRepository["ContactInformationType"],
+        cv_listener: ICVChangeListener | None = None,
     ):
         """
         Initialize use case with dependencies.
 
         Args:
             contact_information_repository: Contact information repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.contact_info_repo = contact_information_repository
+        self.cv_listener = cv_listener
 
     async def execute(
         self, request: CreateContactInformationRequest
@@ -80,5 +84,9 @@ class CreateContactInformationUseCase(
         # Persist the contact information
         created_info = await self.contact_info_repo.add(contact_info)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("contact_info")
+
         # Convert to DTO and return
         return ContactInformationResponse.from_entity(created_info)
@@ -7,7 +7,7 @@ Deletes contact information for a profile.
 from typing import TYPE_CHECKING
 
 from app.application.dto import DeleteContactInformationRequest, SuccessResponse
-from app.shared.interfaces import ICommandUseCase, IRepository
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IRepository
 from app.shared.shared_exceptions import NotFoundException
 
 if TYPE_CHECKING:
@@ -26,19 +26,23 @@ class DeleteContactInformationUseCase(
 
     Dependencies:
     - IRepository[ContactInformation]: For contact information data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
     def __init__(
         self,
         contact_information_repository: IRepository["ContactInformationType"],
+        cv_listener: ICVChangeListener | None = None,
     ):
         """
         Initialize use case with dependencies.
 
         Args:
             contact_information_repository: Contact information repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.contact_info_repo = contact_information_repository
+        self.cv_listener = cv_listener
 
     async def execute(
         self, request: DeleteContactInformationRequest
@@ -64,4 +68,8 @@ class DeleteContactInformationUseCase(
         # Delete
         await self.contact_info_repo.delete(results[0].id)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("contact_info")
+
         return SuccessResponse(message="Contact information deleted successfully")
@@ -0,0 +1,21 @@
+"""
+Get Contact Information Fields Use Case.
+
+Gets the contact information with only the requested fields.
+"""
+
+from app.application.dto import ContactInformationResponse
+
+from ..fields import ListFieldsUseCase
+
+
+class GetContactInformationFieldsUseCase(ListFieldsUseCase):
+    """
+    Use case for getting the contact information with a sparse fieldset.
+
+    See ListFieldsUseCase for the business rules.
+    """
+
+    resource_type = "ContactInformation"
+    response_class = ContactInformationResponse
+    ordered = False
@@ -4,7 +4,11 @@ from app.application.dto import ContactMessageResponse, CreateContactMessageRequ
 from app.config.settings import settings
 from app.domain.entities import ContactMessage
 from app.infrastructure.services.null_email_service import NullEmailService
-from app.shared.interfaces import ICommandUseCase, IContactMessageRepository
+from app.shared.interfaces import (
+    ICommandUseCase,
+    IContactMessageRepository,
+    IContactMessageStatsRepository,
+)
 from app.shared.interfaces.email_service import EmailMessage, IEmailService
 
 logger = logging.getLogger(__name__)
@@ -17,11 +21,13 @@ class CreateContactMessageUseCase(
         self,
         contact_message_repository: IContactMessageRepository,
         email_service: IEmailService | None = None,
+        stats_repository: IContactMessageStatsRepository | None = None,
     ):
         self.message_repo = contact_message_repository
         self.email_service = (
             email_service if email_service is not None else NullEmailService()
         )
+        self.stats_repo = stats_repository
 
     async def execute(
         self, request: CreateContactMessageRequest
@@ -34,10 +40,20 @@ class CreateContactMessageUseCase(
 
         created_message = await self.message_repo.add(message)
 
+        await self._count(created_message)
         await self._send_notification(created_message)
 
         return ContactMessageResponse.from_entity(created_message)
 
+    async def _count(self, message: ContactMessage) -> None:
+        if self.stats_repo is None:
+            return
+        try:
+            await self.stats_repo.increment(message.created_at.date())
+        except Exception as exc:
+            # The message is already stored; a backfill fixes the counters
+            logger.warning("Contact message counter update failed: %s", exc)
+
     async def _send_notification(self, message: ContactMessage) -> None:
         try:
             body_text = (
@@ -4,10 +4,18 @@ Delete ContactMessage Use Case.
 Deletes an existing contact message.
 """
 
+import logging
+
 from app.application.dto import DeleteContactMessageRequest, SuccessResponse
-from app.shared.interfaces import ICommandUseCase, IContactMessageRepository
+from app.shared.interfaces import (
+    ICommandUseCase,
+    IContactMessageRepository,
+    IContactMessageStatsRepository,
+)
 from app.shared.shared_exceptions import NotFoundException
 
+logger = logging.getLogger(__name__)
+
 
 class DeleteContactMessageUseCase(
     ICommandUseCase[DeleteContactMessageRequest, SuccessResponse]
@@ -18,19 +26,27 @@ class DeleteContactMessageUseCase(
     Business Rules:
     - Message must exist
     - Deletion is permanent
+    - The daily counter of the message's creation day is decremented
 
     Dependencies:
     - IContactMessageRepository: For contact message data access
+    - IContactMessageStatsRepository: Daily message counters (optional)
     """
 
-    def __init__(self, contact_message_repository: IContactMessageRepository):
+    def __init__(
+        self,
+        contact_message_repository: IContactMessageRepository,
+        stats_repository: IContactMessageStatsRepository | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             contact_message_repository: Contact message repository interface
+            stats_repository: Contact message counters repository interface
         """
         self.message_repo = contact_message_repository
+        self.stats_repo = stats_repository
 
     async def execute(self, request: DeleteContactMessageRequest) -> SuccessResponse:
         """
@@ -45,10 +61,22 @@ class DeleteContactMessageUseCase(
         Raises:
             NotFoundException: If message doesn't exist
         """
+        # The creation date tells which daily counter to decrement
+        message = None
+        if self.stats_repo is not None:
+            message = await self.message_repo.get_by_id(request.message_id)
+
         # Attempt to delete
         deleted = await self.message_repo.delete(request.message_id)
 
         if not deleted:
             raise NotFoundException("ContactMessage", request.message_id)
 
+        if message is not None and self.stats_repo is not None:
+            try:
+                await self.stats_repo.increment(message.created_at.date(), -1)
+            except Exception as exc:
+                # The message is already gone; a backfill fixes the counters
+                logger.warning("Contact message counter update failed: %s", exc)
+
         return SuccessResponse(message="Contact message deleted successfully")
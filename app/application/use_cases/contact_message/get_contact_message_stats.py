@@ -0,0 +1,77 @@
+"""
+Get ContactMessage Stats Use Case.
+
+Summarizes how many contact messages arrived over recent time windows.
+"""
+
+from datetime import datetime, timedelta
+
+from app.application.dto import (
+    ContactMessageStatsResponse,
+    GetContactMessageStatsRequest,
+)
+from app.shared.interfaces import IContactMessageStatsRepository, IQueryUseCase
+
+# Widest window reported (this_month)
+MONTH_DAYS = 30
+WEEK_DAYS = 7
+
+
+class GetContactMessageStatsUseCase(
+    IQueryUseCase[GetContactMessageStatsRequest, ContactMessageStatsResponse]
+):
+    """
+    Use case for contact message statistics.
+
+    Business Rules:
+    - Days are UTC days, matching created_at
+    - this_week/this_month include today and the previous 7/30 days
+    - by_day always lists the last 7 days, including days without messages
+
+    Dependencies:
+    - IContactMessageStatsRepository: Daily counters, so the cost depends on
+      the number of days, not on the number of messages
+    """
+
+    def __init__(self, stats_repository: IContactMessageStatsRepository):
+        """
+        Initialize use case with dependencies.
+
+        Args:
+            stats_repository: Contact message counters repository interface
+        """
+        self.stats_repo = stats_repository
+
+    async def execute(
+        self, request: GetContactMessageStatsRequest
+    ) -> ContactMessageStatsResponse:
+        """
+        Execute the use case.
+
+        Args:
+            request: Stats request (optionally pinned to a given day)
+
+        Returns:
+            ContactMessageStatsResponse with counts per time window
+        """
+        today = request.today or datetime.utcnow().date()
+
+        # At most MONTH_DAYS + 1 buckets
+        counts = await self.stats_repo.get_daily_counts(
+            today - timedelta(days=MONTH_DAYS)
+        )
+        total = await self.stats_repo.get_total()
+
+        def since(days: int) -> int:
+            start = today - timedelta(days=days)
+            return sum(c for day, c in counts.items() if start <= day <= today)
+
+        last_week = [today - timedelta(days=i) for i in range(WEEK_DAYS)]
+
+        return ContactMessageStatsResponse(
+            total=total,
+            today=counts.get(today, 0),
+            this_week=since(WEEK_DAYS),
+            this_month=since(MONTH_DAYS),
+            by_day={str(day): counts.get(day, 0) for day in last_week},
+        )
@@ -1,22 +1,29 @@
 """
 List ContactMessages Use Case.
 
-Retrieves all contact messages.
+Retrieves contact messages one page at a time.
 """
 
-from app.application.dto import ContactMessageListResponse, ListContactMessagesRequest
+from app.application.dto import (
+    ContactMessageCursor,
+    ContactMessageListResponse,
+    ListContactMessagesRequest,
+)
+from app.application.dto.contact_message_dto import MAX_PAGE_SIZE
 from app.shared.interfaces import IContactMessageRepository, IQueryUseCase
+from app.shared.shared_exceptions import ValidationException
 
 
 class ListContactMessagesUseCase(
     IQueryUseCase[ListContactMessagesRequest, ContactMessageListResponse]
 ):
     """
-    Use case for listing all contact messages.
+    Use case for listing contact messages with cursor pagination.
 
     Business Rules:
-    - Returns all contact messages
-    - Default ordering: newest first (by created_at desc)
+    - Default ordering: newest first (by created_at desc, then id)
+    - Page size must be between 1 and MAX_PAGE_SIZE
+    - next_cursor is only returned when more messages follow the page
 
     Dependencies:
     - IContactMessageRepository: For contact message data access
@@ -41,13 +48,31 @@ class ListContactMessagesUseCase(
             request: List contact messages request
 
         Returns:
-            ContactMessageListResponse with list of messages and metadata
+            ContactMessageListResponse with one page of messages
+
+        Raises:
+            ValidationException: If the limit is out of range or the cursor
+                is malformed
         """
-        # Get all messages
-        messages = await self.message_repo.list_all()
+        if not 1 <= request.limit <= MAX_PAGE_SIZE:
+            raise ValidationException([f"limit must be between 1 and {MAX_PAGE_SIZE}"])
+
+        after = None
+        if request.cursor is not None:
+            try:
+                after = ContactMessageCursor.decode(request.cursor).as_key()
+            except ValueError as e:
+                raise ValidationException([str(e)]) from e
+
+        # One extra message tells whether another page follows
+        messages = await self.message_repo.list_page(
+            limit=request.limit + 1, after=after, ascending=request.ascending
+        )
+        page = messages[: request.limit]
 
-        # Sort by created_at
-        messages.sort(key=lambda m: m.created_at, reverse=not request.ascending)
+        next_cursor = None
+        if len(messages) > request.limit:
+            last = page[-1]
+            next_cursor = ContactMessageCursor(last.created_at, last.id).encode()
 
-        # Convert to DTO and return
-        return ContactMessageListResponse.from_entities(messages)
+        return ContactMessageListResponse.from_entities(page, next_cursor)
@@ -6,8 +6,12 @@ Contains use cases for retrieving and generating the complete CV.
 
 from .generate_cv_pdf import GenerateCVPDFUseCase
 from .get_complete_cv import GetCompleteCVUseCase
+from .get_cv_fields import GetCVFieldsUseCase
+from .get_cv_snapshot import GetCVSnapshotUseCase
 
 __all__ = [
     "GetCompleteCVUseCase",
+    "GetCVSnapshotUseCase",
+    "GetCVFieldsUseCase",
     "GenerateCVPDFUseCase",
 ]
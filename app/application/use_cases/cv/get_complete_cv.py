@@ -4,10 +4,16 @@ Get Complete CV Use Case.
 Aggregates all CV data from multiple sources.
 """
 
-from typing import TYPE_CHECKING
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from functools import partial
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from app.application.dto import CompleteCVResponse, GetCompleteCVRequest
+from app.application.dto.cv_dto import CV_SECTION_RESPONSES, OPTIONAL_CV_SECTIONS
 from app.shared.interfaces import (
+    ICVRepository,
     IOrderedRepository,
     IProfileRepository,
     IQueryUseCase,
@@ -15,20 +21,28 @@ from app.shared.interfaces import (
     ISocialNetworkRepository,
     IUniqueNameRepository,
 )
-from app.shared.shared_exceptions import NotFoundException
+from app.shared.shared_exceptions import NotFoundException, ValidationException
 
 if TYPE_CHECKING:
+    from app.application.services import CVResultCache
     from app.domain.entities import (
         AdditionalTraining as AdditionalTrainingType,
         Certification as CertificationType,
         ContactInformation as ContactInformationType,
         Education as EducationType,
+        Language as LanguageType,
+        ProgrammingLanguage as ProgrammingLanguageType,
         Project as ProjectType,
         Skill as SkillType,
         Tool as ToolType,
         WorkExperience as WorkExperienceType,
     )
 
+# All related entities are stored with this fixed profile_id by convention.
+# The profile entity itself has a UUID id, but every router in the system
+# uses "default_profile" as the profile_id for all related documents.
+_PROFILE_ID = "default_profile"
+
 
 class GetCompleteCVUseCase(IQueryUseCase[GetCompleteCVRequest, CompleteCVResponse]):
     """
@@ -45,12 +59,30 @@ class GetCompleteCVUseCase(IQueryUseCase[GetCompleteCVRequest, CompleteCVRespons
     - Education
     - Additional Training
     - Certifications
+    - Languages and Programming Languages (opt-in)
 
     Business Rules:
     - Profile must exist
+    - Only the selected sections are queried: ``include`` picks them
+      (default: every section but the opt-in ones), ``exclude`` drops some;
+      the profile is always loaded
     - All lists are ordered appropriately
     - Empty lists are returned if no data exists
     - Contact information is optional (None if not set)
+    - Optional sections that exceed ``section_timeout`` are returned empty
+      and listed in ``missing_sections``; a profile timeout is an error
+
+    Fetch Modes:
+    - Sequential (default): one repository call after another
+    - Concurrent: all sections are fetched at once, bounded by
+      ``max_concurrency`` simultaneous repository calls
+    - Aggregated: when a ``cv_repository`` is given, the whole CV is read in
+      a single round trip and ``section_timeout`` bounds that one call
+
+    Caching:
+    - When a ``cache`` is given, complete results are served from it until
+      they expire or a write invalidates them; partial results and custom
+      section selections are not cached
 
     Dependencies:
     - IProfileRepository: For profile data
@@ -63,8 +95,21 @@ class GetCompleteCVUseCase(IQueryUseCase[GetCompleteCVRequest, CompleteCVRespons
     - IOrderedRepository[Education]: For education
     - IOrderedRepository[AdditionalTraining]: For additional training
     - IOrderedRepository[Certification]: For certifications
+    - IOrderedRepository[Language] (optional): For languages
+    - IOrderedRepository[ProgrammingLanguage] (optional): For programming
+      languages
+    - ICVRepository (optional): For the single-round-trip aggregated read
+    - CVResultCache (optional): In-process cache of assembled CVs
     """
 
+    # Sections whose failure must fail the whole request
+    REQUIRED_SECTIONS = frozenset({"profile"})
+
+    # Sections returned when the request does not pick any, in CV order
+    DEFAULT_SECTIONS: ClassVar[tuple[str, ...]] = tuple(
+        name for name in CV_SECTION_RESPONSES if name not in OPTIONAL_CV_SECTIONS
+    )
+
     def __init__(
         self,
         profile_repository: IProfileRepository,
@@ -77,7 +122,37 @@ class GetCompleteCVUseCase(IQueryUseCase[GetCompleteCVRequest, CompleteCVRespons
         tool_repository: IUniqueNameRepository["ToolType"],
         additional_training_repository: IOrderedRepository["AdditionalTrainingType"],
         certification_repository: IOrderedRepository["CertificationType"],
+        language_repository: IOrderedRepository["LanguageType"] | None = None,
+        programming_language_repository: (
+            IOrderedRepository["ProgrammingLanguageType"] | None
+        ) = None,
+        concurrent: bool = False,
+        max_concurrency: int | None = None,
+        section_timeout: float | None = None,
+        cv_repository: ICVRepository | None = None,
+        cache: "CVResultCache | None" = None,
     ):
+        """
+        Initialize use case with dependencies.
+
+        Args:
+            language_repository: Languages, needed for the ``languages``
+                section
+            programming_language_repository: Programming languages, needed
+                for the ``programming_languages`` section
+            concurrent: Fetch all sections concurrently instead of one by one
+            max_concurrency: Maximum simultaneous repository calls in
+                concurrent mode (None = unbounded)
+            section_timeout: Seconds allowed per section (None = no timeout)
+            cv_repository: Aggregated CV repository; when set, it replaces the
+                per-section repository calls
+            cache: Cache of assembled CVs, checked before any repository call
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if section_timeout is not None and section_timeout <= 0:
+            raise ValueError("section_timeout must be positive")
+
         self.profile_repo = profile_repository
         self.experience_repo = experience_repository
         self.skill_repo = skill_repository
@@ -88,82 +163,250 @@ class GetCompleteCVUseCase(IQueryUseCase[GetCompleteCVRequest, CompleteCVRespons
         self.tool_repo = tool_repository
         self.additional_training_repo = additional_training_repository
         self.certification_repo = certification_repository
+        self.language_repo = language_repository
+        self.programming_language_repo = programming_language_repository
+        self.concurrent = concurrent
+        self.max_concurrency = max_concurrency
+        self.section_timeout = section_timeout
+        self.cv_repo = cv_repository
+        self.cache = cache
 
-    async def execute(self, _request: GetCompleteCVRequest) -> CompleteCVResponse:
+    @classmethod
+    def select_sections(cls, request: GetCompleteCVRequest) -> tuple[str, ...]:
+        """
+        Sections to load for ``request``, in CV order.
+
+        Raises:
+            ValidationException: If a section is unknown or the profile is
+                excluded
+        """
+        unknown = sorted(
+            {*request.include, *request.exclude}.difference(CV_SECTION_RESPONSES)
+        )
+        if unknown:
+            raise ValidationException(
+                [f"Unknown CV section: {section}" for section in unknown]
+            )
+        if "profile" in request.exclude:
+            raise ValidationException(["The profile section cannot be excluded"])
+
+        selected = {"profile", *(request.include or cls.DEFAULT_SECTIONS)}
+        selected.difference_update(request.exclude)
+        return tuple(name for name in CV_SECTION_RESPONSES if name in selected)
+
+    async def execute(self, request: GetCompleteCVRequest) -> CompleteCVResponse:
         """
         Execute the use case.
 
         Args:
-            _request: Get complete CV request (empty)
+            request: Sections to include or exclude (empty = default CV)
 
         Returns:
-            CompleteCVResponse with all CV data
+            CompleteCVResponse with the selected sections; the others keep
+            their empty value
 
         Raises:
             NotFoundException: If profile doesn't exist
+            ValidationException: If a section is unknown or unavailable (its
+                repository is not configured), or the profile is excluded
+            TimeoutError: If the profile section (or the aggregated read)
+                exceeds ``section_timeout``
         """
-        # Get profile (required)
-        profile = await self.profile_repo.get_profile()
+        sections = self.select_sections(request)
+        # Only the default CV is cached: writes to the opt-in sections do
+        # not invalidate the cache
+        if self.cache is None or sections != self.DEFAULT_SECTIONS:
+            return await self._build(sections)
+
+        cached: CompleteCVResponse | None = self.cache.get(_PROFILE_ID)
+        if cached is not None:
+            return cached
+
+        # Read before building: a write during the build voids the result
+        generation = self.cache.generation
+        response = await self._build(sections)
+        if not response.missing_sections:
+            self.cache.put(_PROFILE_ID, response, generation)
+        return response
+
+    async def _build(self, selected: tuple[str, ...]) -> CompleteCVResponse:
+        """Assemble the selected sections, using the configured fetch mode."""
+        if self.cv_repo is not None:
+            return await self._execute_aggregated(self.cv_repo, selected)
+
+        available = self._section_loaders()
+        unavailable = [name for name in selected if name not in available]
+        if unavailable:
+            raise ValidationException(
+                [f"CV section not available: {name}" for name in unavailable]
+            )
+        loaders = {name: available[name] for name in selected}
+
+        if self.concurrent:
+            sections, missing = await self._fetch_concurrently(loaders)
+        else:
+            sections, missing = await self._fetch_sequentially(loaders)
+
+        profile = sections.pop("profile")
         if not profile:
             raise NotFoundException("Profile", "single")
 
-        # All related entities are stored with this fixed profile_id by convention.
-        # The profile entity itself has a UUID id, but every router in the system
-        # uses "default_profile" as the profile_id for all related documents.
-        _PROFILE_ID = "default_profile"
+        response = CompleteCVResponse.create(profile=profile, **sections)
+        response.missing_sections = missing
+        return response
+
+    async def _execute_aggregated(
+        self, cv_repo: ICVRepository, selected: tuple[str, ...]
+    ) -> CompleteCVResponse:
+        """Build the CV from the single-round-trip aggregated read."""
+        async with asyncio.timeout(self.section_timeout):
+            sections = await cv_repo.get_cv_sections(_PROFILE_ID, selected)
+        if not sections:
+            raise NotFoundException("Profile", "single")
+        return CompleteCVResponse.create(**sections)
+
+    async def load_section(self, section: str) -> Any:
+        """
+        Load a single CV section as domain entities.
+
+        Used by read models that refresh one section at a time. Sections are
+        ordered exactly as in the complete CV.
+
+        Raises:
+            KeyError: If ``section`` is not a CV section
+        """
+        return await self._section_loaders()[section]()
+
+    def _section_loaders(self) -> dict[str, Callable[[], Awaitable[Any]]]:
+        """Map each available CV section to the coroutine function that loads it."""
+        loaders: dict[str, Callable[[], Awaitable[Any]]] = {
+            "profile": self.profile_repo.get_profile,
+            "contact_info": self._load_contact_info,
+            "social_networks": self._load_social_networks,
+            "work_experiences": self._load_work_experiences,
+            "projects": self._load_projects,
+            "skills": self._load_skills,
+            "tools": self._load_tools,
+            "education": self._load_education,
+            "additional_training": self._load_additional_training,
+            "certifications": self._load_certifications,
+        }
+        # Opt-in sections, ordered like their list endpoints (ascending)
+        if self.language_repo is not None:
+            loaders["languages"] = partial(
+                self.language_repo.get_all_ordered, profile_id=_PROFILE_ID
+            )
+        if self.programming_language_repo is not None:
+            loaders["programming_languages"] = partial(
+                self.programming_language_repo.get_all_ordered, profile_id=_PROFILE_ID
+            )
+        return loaders
+
+    async def _fetch_sequentially(
+        self, loaders: dict[str, Callable[[], Awaitable[Any]]]
+    ) -> tuple[dict[str, Any], list[str]]:
+        """Load sections one after another, stopping early if there is no profile."""
+        sections: dict[str, Any] = {}
+        missing: list[str] = []
+        for name, loader in loaders.items():
+            sections[name] = await self._load_section(name, loader, missing)
+            if name == "profile" and not sections[name]:
+                break
+        return sections, missing
 
-        # Get contact information (optional — None if not set)
-        contact_info_results = await self.contact_info_repo.find_by(
-            profile_id=_PROFILE_ID
+    async def _fetch_concurrently(
+        self, loaders: dict[str, Callable[[], Awaitable[Any]]]
+    ) -> tuple[dict[str, Any], list[str]]:
+        """Load all sections at once, bounded by ``max_concurrency``."""
+        limiter: AbstractAsyncContextManager[Any] = (
+            asyncio.Semaphore(self.max_concurrency)
+            if self.max_concurrency is not None
+            else nullcontext()
         )
-        contact_info = contact_info_results[0] if contact_info_results else None
+        missing: list[str] = []
 
-        # Get social networks (ordered by order_index)
+        async def run(name: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+            async with limiter:
+                return await self._load_section(name, loader, missing)
+
+        # TaskGroup cancels the remaining sections as soon as one fails;
+        # surface the original error rather than the ExceptionGroup wrapper
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = {
+                    name: group.create_task(run(name, loader))
+                    for name, loader in loaders.items()
+                }
+        except BaseExceptionGroup as group_error:
+            raise group_error.exceptions[0] from None
+
+        # Keep the marker order stable regardless of completion order
+        missing.sort(key=list(loaders).index)
+        return {name: task.result() for name, task in tasks.items()}, missing
+
+    async def _load_section(
+        self,
+        name: str,
+        loader: Callable[[], Awaitable[Any]],
+        missing: list[str],
+    ) -> Any:
+        """
+        Load a single section, applying ``section_timeout``.
+
+        Optional sections that time out are recorded in ``missing`` and
+        replaced by their empty value; required sections re-raise.
+        """
+        try:
+            async with asyncio.timeout(self.section_timeout):
+                return await loader()
+        except TimeoutError:
+            if name in self.REQUIRED_SECTIONS:
+                raise
+            missing.append(name)
+            return None if name == "contact_info" else []
+
+    async def _load_contact_info(self) -> "ContactInformationType | None":
+        # Contact information is optional — None if not set
+        results = await self.contact_info_repo.find_by(profile_id=_PROFILE_ID)
+        return results[0] if results else None
+
+    async def _load_social_networks(self) -> list:
         social_networks = await self.social_network_repo.find_by(profile_id=_PROFILE_ID)
         social_networks.sort(key=lambda sn: sn.order_index)
+        return social_networks
 
-        # Get experiences (ordered by order_index, newest first)
-        experiences = await self.experience_repo.get_all_ordered(
+    async def _load_work_experiences(self) -> list:
+        # Ordered by order_index, newest first
+        return await self.experience_repo.get_all_ordered(
             profile_id=_PROFILE_ID, ascending=False
         )
 
-        # Get projects (ordered by order_index, newest first)
-        projects = await self.project_repo.get_all_ordered(
+    async def _load_projects(self) -> list:
+        return await self.project_repo.get_all_ordered(
             profile_id=_PROFILE_ID, ascending=False
         )
 
-        # Get skills (find all by profile_id, sorted by order_index)
+    async def _load_skills(self) -> list:
         skills = await self.skill_repo.find_by(profile_id=_PROFILE_ID)
         skills.sort(key=lambda s: s.order_index)
+        return skills
 
-        # Get tools (find all by profile_id, sorted by order_index)
+    async def _load_tools(self) -> list:
         tools = await self.tool_repo.find_by(profile_id=_PROFILE_ID)
         tools.sort(key=lambda t: t.order_index)
+        return tools
 
-        # Get education (ordered by order_index, newest first)
-        education = await self.education_repo.get_all_ordered(
+    async def _load_education(self) -> list:
+        return await self.education_repo.get_all_ordered(
             profile_id=_PROFILE_ID, ascending=False
         )
 
-        # Get additional training (ordered by order_index, newest first)
-        additional_training = await self.additional_training_repo.get_all_ordered(
+    async def _load_additional_training(self) -> list:
+        return await self.additional_training_repo.get_all_ordered(
             profile_id=_PROFILE_ID, ascending=False
         )
 
-        # Get certifications (ordered by order_index, newest first)
-        certifications = await self.certification_repo.get_all_ordered(
+    async def _load_certifications(self) -> list:
+        return await self.certification_repo.get_all_ordered(
             profile_id=_PROFILE_ID, ascending=False
         )
-
-        return CompleteCVResponse.create(
-            profile=profile,
-            contact_info=contact_info,
-            social_networks=social_networks,
-            work_experiences=experiences,
-            projects=projects,
-            skills=skills,
-            tools=tools,
-            education=education,
-            additional_training=additional_training,
-            certifications=certifications,
-        )
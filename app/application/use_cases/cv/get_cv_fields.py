@@ -0,0 +1,97 @@
+"""
+Get CV Fields Use Case.
+
+Gets some CV sections with only the requested fields.
+"""
+
+import asyncio
+from collections.abc import Mapping
+from typing import Any
+
+from app.application.dto import GetCVFieldsRequest, ListFieldsRequest
+from app.shared.interfaces import IQueryUseCase
+from app.shared.shared_exceptions import ValidationException
+
+from ..fields import ListFieldsUseCase
+
+# Same convention as GetCompleteCVUseCase
+_PROFILE_ID = "default_profile"
+
+# Sections with one item (or none) instead of a list
+SINGLE_SECTIONS = frozenset({"profile", "contact_info"})
+
+
+class GetCVFieldsUseCase(IQueryUseCase[GetCVFieldsRequest, dict[str, Any]]):
+    """
+    Use case for retrieving a sparse CV.
+
+    Business Rules:
+    - Only the requested sections are returned, each with only the requested
+      fields (plus ``id``), in the same order as the complete CV
+    - A section requested without fields gets every stored field
+    - profile and contact_info are a single view (or None), the other
+      sections a list of views
+    - Unknown sections or fields are rejected before querying
+
+    Dependencies:
+    - ListFieldsUseCase per section: Loads only the requested fields
+    """
+
+    def __init__(self, sections: Mapping[str, ListFieldsUseCase]):
+        """
+        Initialize use case with dependencies.
+
+        Args:
+            sections: Sparse fieldset use case of each CV section, keyed by
+                section name (same keys as CV_SECTION_RESPONSES)
+        """
+        self.sections = sections
+
+    async def execute(self, request: GetCVFieldsRequest) -> dict[str, Any]:
+        """
+        Execute the use case.
+
+        Args:
+            request: Requested fields by section
+
+        Returns:
+            Mapping of section name to its views
+
+        Raises:
+            ValidationException: If no sections are given, or a section or
+                field is unknown
+        """
+        if not request.fields:
+            raise ValidationException(["At least one section is required"])
+        unknown = sorted(set(request.fields) - set(self.sections))
+        if unknown:
+            raise ValidationException(
+                [f"Unknown CV section: {section}" for section in unknown]
+            )
+        fields_by_section = {
+            section: fields or self.sections[section].selectable_fields()
+            for section, fields in request.fields.items()
+        }
+        for section, fields in fields_by_section.items():
+            self.sections[section].validate_fields(fields)
+
+        # Sections are independent: query them at the same time
+        names = [name for name in self.sections if name in fields_by_section]
+        results = await asyncio.gather(
+            *(
+                self.sections[name].execute(
+                    ListFieldsRequest(
+                        profile_id=_PROFILE_ID, fields=fields_by_section[name]
+                    )
+                )
+                for name in names
+            )
+        )
+
+        cv: dict[str, Any] = {}
+        for name, views in zip(names, results, strict=True):
+            if name in SINGLE_SECTIONS:
+                cv[name] = views[0] if views else None
+            else:
+                cv[name] = views
+        return cv
@@ -0,0 +1,51 @@
+"""
+Get CV Snapshot Use Case.
+
+Serves the complete CV from its materialized snapshot.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from app.application.dto import GetCompleteCVRequest
+from app.shared.interfaces import IQueryUseCase
+
+if TYPE_CHECKING:
+    from app.application.services import CVSnapshotService
+
+
+class GetCVSnapshotUseCase(IQueryUseCase[GetCompleteCVRequest, dict[str, Any]]):
+    """
+    Use case for retrieving the complete CV from the ``cv_snapshots`` read model.
+
+    Business Rules:
+    - Profile must exist
+    - A missing snapshot is rebuilt from the source collections and stored
+    - The result has the same shape as CompleteCVResponse, already serialized
+
+    Dependencies:
+    - CVSnapshotService: Snapshot lookup and rebuild
+    """
+
+    def __init__(self, snapshot_service: "CVSnapshotService"):
+        """
+        Initialize use case with dependencies.
+
+        Args:
+            snapshot_service: Service maintaining the CV snapshot
+        """
+        self.snapshot_service = snapshot_service
+
+    async def execute(self, _request: GetCompleteCVRequest) -> dict[str, Any]:
+        """
+        Execute the use case.
+
+        Args:
+            _request: Get complete CV request (empty)
+
+        Returns:
+            The serialized complete CV
+
+        Raises:
+            NotFoundException: If profile doesn't exist
+        """
+        return await self.snapshot_service.get_or_build()
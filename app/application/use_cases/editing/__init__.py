@@ -0,0 +1,11 @@
+"""
+Editing Use Cases Module.
+
+Contains the helpers shared by the Edit use cases.
+"""
+
+from .provided_changes import provided_changes
+
+__all__ = [
+    "provided_changes",
+]
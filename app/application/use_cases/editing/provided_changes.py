@@ -0,0 +1,20 @@
+"""
+Provided changes of an edit request.
+
+Edit requests leave the fields that do not change as None.
+"""
+
+from typing import Any
+
+
+def provided_changes(**fields: Any) -> dict[str, Any]:
+    """
+    Keep the fields an edit request actually gives.
+
+    Args:
+        **fields: Request value of each editable field
+
+    Returns:
+        Mapping of field name to new value, without the None ones
+    """
+    return {name: value for name, value in fields.items() if value is not None}
@@ -7,9 +7,13 @@ Contains all use cases related to education management.
 from .add_education import AddEducationUseCase
 from .delete_education import DeleteEducationUseCase
 from .edit_education import EditEducationUseCase
+from .list_education_fields import ListEducationFieldsUseCase
+from .reorder_education import ReorderEducationUseCase
 
 __all__ = [
     "AddEducationUseCase",
     "EditEducationUseCase",
     "DeleteEducationUseCase",
+    "ReorderEducationUseCase",
+    "ListEducationFieldsUseCase",
 ]
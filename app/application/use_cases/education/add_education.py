@@ -8,8 +8,7 @@ from typing import TYPE_CHECKING
 
 from app.application.dto import AddEducationRequest, EducationResponse
 from app.domain.entities import Education
-from app.shared.interfaces import ICommandUseCase, IOrderedRepository
-from app.shared.shared_exceptions import BusinessRuleViolationException
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IOrderedRepository
 
 if TYPE_CHECKING:
     from app.domain.entities import Education as EducationType
@@ -26,16 +25,23 @@ class AddEducationUseCase(ICommandUseCase[AddEducationRequest, EducationResponse
 
     Dependencies:
     - IOrderedRepository[Education]: For education data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, education_repository: IOrderedRepository["EducationType"]):
+    def __init__(
+        self,
+        education_repository: IOrderedRepository["EducationType"],
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             education_repository: Education repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.education_repo = education_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: AddEducationRequest) -> EducationResponse:
         """
@@ -51,16 +57,6 @@ class AddEducationUseCase(ICommandUseCase[AddEducationRequest, EducationResponse
             BusinessRuleViolationException: If orderIndex already exists
             DomainError: If validation fails
         """
-        # Check orderIndex uniqueness
-        existing = await self.education_repo.get_by_order_index(
-            request.profile_id, request.order_index
-        )
-        if existing:
-            raise BusinessRuleViolationException(
-                "orderIndex must be unique per profile",
-                {"orderIndex": request.order_index},
-            )
-
         # Create domain entity (validates automatically)
         education = Education.create(
             profile_id=request.profile_id,
@@ -73,8 +69,12 @@ class AddEducationUseCase(ICommandUseCase[AddEducationRequest, EducationResponse
             end_date=request.end_date,
         )
 
-        # Persist the education
+        # Persist the education (the repository rejects a duplicate orderIndex)
         created_education = await self.education_repo.add(education)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("education")
+
         # Convert to DTO and return
         return EducationResponse.from_entity(created_education)
@@ -7,7 +7,7 @@ Deletes an existing education entry.
 from typing import TYPE_CHECKING
 
 from app.application.dto import DeleteEducationRequest, SuccessResponse
-from app.shared.interfaces import ICommandUseCase, IOrderedRepository
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IOrderedRepository
 from app.shared.shared_exceptions import NotFoundException
 
 if TYPE_CHECKING:
@@ -24,16 +24,23 @@ class DeleteEducationUseCase(ICommandUseCase[DeleteEducationRequest, SuccessResp
 
     Dependencies:
     - IOrderedRepository[Education]: For education data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, education_repository: IOrderedRepository["EducationType"]):
+    def __init__(
+        self,
+        education_repository: IOrderedRepository["EducationType"],
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             education_repository: Education repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.education_repo = education_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: DeleteEducationRequest) -> SuccessResponse:
         """
@@ -54,4 +61,8 @@ class DeleteEducationUseCase(ICommandUseCase[DeleteEducationRequest, SuccessResp
         if not deleted:
             raise NotFoundException("Education", request.education_id)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("education")
+
         return SuccessResponse(message="Education deleted successfully")
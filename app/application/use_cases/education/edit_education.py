@@ -7,9 +7,12 @@ Updates an existing education entry.
 from typing import TYPE_CHECKING
 
 from app.application.dto import EditEducationRequest, EducationResponse
-from app.shared.interfaces import ICommandUseCase, IOrderedRepository
+from app.domain.entities import Education
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IOrderedRepository
 from app.shared.shared_exceptions import NotFoundException
 
+from ..editing import provided_changes
+
 if TYPE_CHECKING:
     from app.domain.entities import Education as EducationType
 
@@ -20,21 +23,29 @@ class EditEducationUseCase(ICommandUseCase[EditEducationRequest, EducationRespon
 
     Business Rules:
     - Education must exist
-    - Only provided fields are updated
+    - Only provided fields are updated; without a date change, in one round
+      trip without loading the education first
     - Validations are performed by the entity
 
     Dependencies:
     - IOrderedRepository[Education]: For education data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, education_repository: IOrderedRepository["EducationType"]):
+    def __init__(
+        self,
+        education_repository: IOrderedRepository["EducationType"],
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             education_repository: Education repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.education_repo = education_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: EditEducationRequest) -> EducationResponse:
         """
@@ -50,11 +61,44 @@ class EditEducationUseCase(ICommandUseCase[EditEducationRequest, EducationRespon
             NotFoundException: If education doesn't exist
             DomainError: If validation fails
         """
+        changes = provided_changes(
+            institution=request.institution,
+            degree=request.degree,
+            field=request.field,
+            description=request.description,
+            start_date=request.start_date,
+            end_date=request.end_date,
+        )
+
+        if Education.can_update_partially(changes):
+            # No date change: validate the changed fields (entity rules) and
+            # write only those, without loading the education first
+            updated_education = await self.education_repo.update_fields(
+                request.education_id, Education.validate_changes(changes)
+            )
+        else:
+            # Dates are validated together with the stored ones
+            updated_education = await self._update_loaded(request)
+
+        if not updated_education:
+            raise NotFoundException("Education", request.education_id)
+
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("education")
+
+        # Convert to DTO and return
+        return EducationResponse.from_entity(updated_education)
+
+    async def _update_loaded(
+        self, request: EditEducationRequest
+    ) -> "EducationType | None":
+        """Apply the request to the stored education (None if it doesn't exist)."""
         # Get existing education
         education = await self.education_repo.get_by_id(request.education_id)
 
         if not education:
-            raise NotFoundException("Education", request.education_id)
+            return None
 
         # Update info (entity validates)
         education.update_info(
@@ -66,8 +110,4 @@ class EditEducationUseCase(ICommandUseCase[EditEducationRequest, EducationRespon
             end_date=request.end_date,
         )
 
-        # Persist changes
-        updated_education = await self.education_repo.update(education)
-
-        # Convert to DTO and return
-        return EducationResponse.from_entity(updated_education)
+        return await self.education_repo.update(education)
@@ -0,0 +1,21 @@
+"""
+List Education Fields Use Case.
+
+Lists education entries with only the requested fields.
+"""
+
+from app.application.dto import EducationResponse
+
+from ..fields import ListFieldsUseCase
+
+
+class ListEducationFieldsUseCase(ListFieldsUseCase):
+    """
+    Use case for listing education entries with a sparse fieldset.
+
+    See ListFieldsUseCase for the business rules.
+    """
+
+    resource_type = "Education"
+    response_class = EducationResponse
+    computed_fields = frozenset({"is_ongoing"})
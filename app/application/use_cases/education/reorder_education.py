@@ -0,0 +1,21 @@
+"""
+Reorder Education Use Case.
+
+Applies a new ordering to the education entries of the profile.
+"""
+
+from app.application.dto import EducationResponse
+
+from ..ordering import ReorderItemsUseCase
+
+
+class ReorderEducationUseCase(ReorderItemsUseCase):
+    """
+    Use case for reordering education entries.
+
+    See ReorderItemsUseCase for the business rules.
+    """
+
+    resource_type = "Education"
+    section = "education"
+    response_class = EducationResponse
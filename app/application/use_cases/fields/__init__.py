@@ -0,0 +1,11 @@
+"""
+Sparse Fields Use Cases Module.
+
+Contains the shared use case for listing sections with only some fields.
+"""
+
+from .list_fields import ListFieldsUseCase
+
+__all__ = [
+    "ListFieldsUseCase",
+]
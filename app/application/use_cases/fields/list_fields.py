@@ -0,0 +1,131 @@
+"""
+List Fields Use Case.
+
+Lists the items of a section with only the requested fields.
+"""
+
+from collections.abc import AsyncIterator
+from dataclasses import fields as dataclass_fields
+from typing import Any, ClassVar
+
+from app.application.dto import ListFieldsRequest
+from app.shared.interfaces import FilterSpec, IQueryUseCase, IRepository
+from app.shared.shared_exceptions import ValidationException
+
+
+class ListFieldsUseCase(IQueryUseCase[ListFieldsRequest, list[dict[str, Any]]]):
+    """
+    Base use case for listing a section with a sparse fieldset.
+
+    Subclasses only name the resource and the response DTO whose fields can
+    be requested.
+
+    Business Rules:
+    - At least one field must be given
+    - Only stored fields of the response DTO can be requested: computed ones
+      (e.g. is_expired) need the full entity
+    - ``id`` is always included
+    - Same filters and order (orderIndex) as the full list
+
+    Dependencies:
+    - IRepository: Loads only the requested fields (find_views, stream_views)
+    """
+
+    resource_type: ClassVar[str]
+    response_class: ClassVar[Any]
+    computed_fields: ClassVar[frozenset[str]] = frozenset()
+    # Sections with a single item have no order_index
+    ordered: ClassVar[bool] = True
+    # The profile itself is not stored under a profile_id
+    profile_scoped: ClassVar[bool] = True
+
+    def __init__(self, repository: IRepository[Any]):
+        """
+        Initialize use case with dependencies.
+
+        Args:
+            repository: Repository of the section
+        """
+        self.repository = repository
+
+    @classmethod
+    def selectable_fields(cls) -> tuple[str, ...]:
+        """Fields that can be requested, in response DTO order."""
+        return tuple(
+            f.name
+            for f in dataclass_fields(cls.response_class)
+            if f.name not in cls.computed_fields
+        )
+
+    def validate_fields(self, fields: tuple[str, ...]) -> None:
+        """
+        Check a sparse fieldset before querying.
+
+        Raises:
+            ValidationException: If no fields are given or one is unknown
+        """
+        if not fields:
+            raise ValidationException(["At least one field is required"])
+        selectable = self.selectable_fields()
+        unknown = sorted(set(fields).difference(selectable))
+        if unknown:
+            raise ValidationException(
+                [
+                    f"Unknown {self.resource_type} field: {name} "
+                    f"(available: {', '.join(selectable)})"
+                    for name in unknown
+                ]
+            )
+
+    async def execute(self, request: ListFieldsRequest) -> list[dict[str, Any]]:
+        """
+        Execute the use case.
+
+        Args:
+            request: Profile ID, requested fields and optional filters
+
+        Returns:
+            One dict per item with ``id`` and the requested fields
+
+        Raises:
+            ValidationException: If no fields are given or one is unknown
+        """
+        self.validate_fields(request.fields)
+        return await self.repository.find_views(
+            self._unique_fields(request), self._spec(request)
+        )
+
+    async def stream(self, request: ListFieldsRequest) -> AsyncIterator[dict[str, Any]]:
+        """
+        Same items as ``execute``, yielded as the repository reads them.
+
+        Args:
+            request: Profile ID, requested fields and optional filters
+
+        Returns:
+            Async iterator yielding one dict per item
+
+        Raises:
+            ValidationException: If no fields are given or one is unknown
+                (on the first iteration)
+        """
+        self.validate_fields(request.fields)
+        views = self.repository.stream_views(
+            self._unique_fields(request), self._spec(request)
+        )
+        async for view in views:
+            yield view
+
+    @staticmethod
+    def _unique_fields(request: ListFieldsRequest) -> tuple[str, ...]:
+        # Repeated fields would only repeat the projection
+        return tuple(dict.fromkeys(request.fields))
+
+    def _spec(self, request: ListFieldsRequest) -> FilterSpec:
+        where = {name: v for name, v in request.filters.items() if v is not None}
+        if self.profile_scoped:
+            where["profile_id"] = request.profile_id
+        sort: tuple[tuple[str, int], ...] = ()
+        if self.ordered:
+            sort = (("order_index", 1 if request.ascending else -1),)
+        return FilterSpec(where=where, sort=sort)
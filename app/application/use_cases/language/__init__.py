@@ -7,6 +7,7 @@ Contains all use cases related to language management.
 from .add_language import AddLanguageUseCase
 from .delete_language import DeleteLanguageUseCase
 from .edit_language import EditLanguageUseCase
+from .list_language_fields import ListLanguageFieldsUseCase
 from .list_languages import ListLanguagesUseCase
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "EditLanguageUseCase",
     "DeleteLanguageUseCase",
     "ListLanguagesUseCase",
+    "ListLanguageFieldsUseCase",
 ]
@@ -7,9 +7,12 @@ Updates an existing language.
 from typing import TYPE_CHECKING
 
 from app.application.dto.language_dto import EditLanguageRequest, LanguageResponse
+from app.domain.entities import Language
 from app.shared.interfaces import ICommandUseCase, IOrderedRepository
 from app.shared.shared_exceptions import NotFoundException
 
+from ..editing import provided_changes
+
 if TYPE_CHECKING:
     from app.domain.entities import Language as LanguageType
 
@@ -21,16 +24,13 @@ class EditLanguageUseCase(ICommandUseCase[EditLanguageRequest, LanguageResponse]
         self.repo = language_repository
 
     async def execute(self, request: EditLanguageRequest) -> LanguageResponse:
-        language = await self.repo.get_by_id(request.language_id)
-
-        if not language:
-            raise NotFoundException("Language", request.language_id)
-
-        language.update_info(
-            name=request.name,
-            proficiency=request.proficiency,
+        changes = Language.validate_changes(
+            provided_changes(name=request.name, proficiency=request.proficiency)
         )
 
-        updated = await self.repo.update(language)
+        updated = await self.repo.update_fields(request.language_id, changes)
+
+        if not updated:
+            raise NotFoundException("Language", request.language_id)
 
         return LanguageResponse.from_entity(updated)
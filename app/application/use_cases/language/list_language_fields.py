@@ -0,0 +1,20 @@
+"""
+List Language Fields Use Case.
+
+Lists languages with only the requested fields.
+"""
+
+from app.application.dto import LanguageResponse
+
+from ..fields import ListFieldsUseCase
+
+
+class ListLanguageFieldsUseCase(ListFieldsUseCase):
+    """
+    Use case for listing languages with a sparse fieldset.
+
+    See ListFieldsUseCase for the business rules.
+    """
+
+    resource_type = "Language"
+    response_class = LanguageResponse
@@ -7,7 +7,7 @@ Retrieves all languages for a profile.
 from typing import TYPE_CHECKING
 
 from app.application.dto.language_dto import LanguageListResponse, ListLanguagesRequest
-from app.shared.interfaces import IOrderedRepository, IQueryUseCase
+from app.shared.interfaces import FilterSpec, IOrderedRepository, IQueryUseCase
 
 if TYPE_CHECKING:
     from app.domain.entities import Language as LanguageType
@@ -20,9 +20,17 @@ class ListLanguagesUseCase(IQueryUseCase[ListLanguagesRequest, LanguageListRespo
         self.repo = language_repository
 
     async def execute(self, request: ListLanguagesRequest) -> LanguageListResponse:
-        languages = await self.repo.get_all_ordered(
-            profile_id=request.profile_id,
-            ascending=request.ascending,
-        )
+        if request.proficiency:
+            # Only the matching languages leave the database
+            languages = await self.repo.find_by(
+                FilterSpec(sort=(("order_index", 1 if request.ascending else -1),)),
+                profile_id=request.profile_id,
+                proficiency=request.proficiency.lower(),
+            )
+        else:
+            languages = await self.repo.get_all_ordered(
+                profile_id=request.profile_id,
+                ascending=request.ascending,
+            )
 
         return LanguageListResponse.from_entities(languages)
@@ -0,0 +1,11 @@
+"""
+Ordering Use Cases Module.
+
+Contains the shared use case for reordering ordered sections.
+"""
+
+from .reorder_items import ReorderItemsUseCase
+
+__all__ = [
+    "ReorderItemsUseCase",
+]
@@ -0,0 +1,111 @@
+"""
+Reorder Items Use Case.
+
+Applies a new ordering to an ordered section of the profile.
+"""
+
+from collections import Counter
+from typing import Any, ClassVar
+
+from app.application.dto import ReorderRequest
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IOrderedRepository
+from app.shared.shared_exceptions import (
+    BusinessRuleViolationException,
+    NotFoundException,
+    ValidationException,
+)
+
+
+class ReorderItemsUseCase(ICommandUseCase[ReorderRequest, list[Any]]):
+    """
+    Base use case for reordering the items of an ordered section.
+
+    Subclasses only name the resource, the CV section it feeds and the
+    response DTO built from each entity.
+
+    Business Rules:
+    - At least one item must be given, and each item only once
+    - Every item must exist in the profile
+    - orderIndex must be non-negative and unique per profile, also against
+      the items left out of the request (they keep their position)
+    - The new ordering is written at once, never item by item
+
+    Dependencies:
+    - IOrderedRepository: For data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
+    """
+
+    resource_type: ClassVar[str]
+    section: ClassVar[str]
+    response_class: ClassVar[Any]
+
+    def __init__(
+        self,
+        repository: IOrderedRepository[Any],
+        cv_listener: ICVChangeListener | None = None,
+    ):
+        """
+        Initialize use case with dependencies.
+
+        Args:
+            repository: Ordered repository of the section
+            cv_listener: Notified after a successful write (optional)
+        """
+        self.repository = repository
+        self.cv_listener = cv_listener
+
+    async def execute(self, request: ReorderRequest) -> list[Any]:
+        """
+        Execute the use case.
+
+        Args:
+            request: Reorder request with the new orderIndex of each item
+
+        Returns:
+            Every item of the section as response DTOs, in the new order
+
+        Raises:
+            ValidationException: If no items are given or an item is repeated
+            NotFoundException: If an item doesn't exist in the profile
+            BusinessRuleViolationException: If the resulting orderIndex
+                values are not unique
+            InvalidOrderIndexError: If an orderIndex is negative
+        """
+        ids = [item.id for item in request.items]
+        if not ids:
+            raise ValidationException(["At least one item is required"])
+        repeated = sorted(item_id for item_id, n in Counter(ids).items() if n > 1)
+        if repeated:
+            raise ValidationException(
+                [f"Item listed more than once: {item_id}" for item_id in repeated]
+            )
+
+        # One read validates the request and builds the response afterwards
+        entities = await self.repository.get_all_ordered(request.profile_id)
+        by_id = {entity.id: entity for entity in entities}
+        for item_id in ids:
+            if item_id not in by_id:
+                raise NotFoundException(self.resource_type, item_id)
+
+        # Apply in memory first: the entity validates each index
+        for item in request.items:
+            by_id[item.id].update_order(item.order_index)
+        taken = Counter(entity.order_index for entity in entities)
+        clashes = sorted(index for index, n in taken.items() if n > 1)
+        if clashes:
+            raise BusinessRuleViolationException(
+                "orderIndex must be unique per profile", {"orderIndex": clashes}
+            )
+
+        # Persist the whole ordering in a single write
+        await self.repository.bulk_reorder(
+            request.profile_id,
+            {item.id: item.order_index for item in request.items},
+        )
+
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed(self.section)
+
+        entities.sort(key=lambda entity: entity.order_index)
+        return [self.response_class.from_entity(entity) for entity in entities]
@@ -6,10 +6,12 @@ Contains all use cases related to profile management.
 
 from .create_profile import CreateProfileUseCase
 from .get_profile import GetProfileUseCase
+from .get_profile_fields import GetProfileFieldsUseCase
 from .update_profile import UpdateProfileUseCase
 
 __all__ = [
     "GetProfileUseCase",
     "CreateProfileUseCase",
     "UpdateProfileUseCase",
+    "GetProfileFieldsUseCase",
 ]
@@ -6,7 +6,7 @@ Creates the single profile in the system.
 
 from app.application.dto import CreateProfileRequest, ProfileResponse
 from app.domain.entities import Profile
-from app.shared.interfaces import ICommandUseCase, IProfileRepository
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IProfileRepository
 from app.shared.shared_exceptions import DuplicateException
 
 
@@ -21,16 +21,23 @@ class CreateProfileUseCase(ICommandUseCase[CreateProfileRequest, ProfileResponse
 
     Dependencies:
     - IProfileRepository: For profile data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, profile_repository: IProfileRepository):
+    def __init__(
+        self,
+        profile_repository: IProfileRepository,
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             profile_repository: Profile repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.profile_repo = profile_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: CreateProfileRequest) -> ProfileResponse:
         """
@@ -66,5 +73,9 @@ class CreateProfileUseCase(ICommandUseCase[CreateProfileRequest, ProfileResponse
         # Persist the profile
         created_profile = await self.profile_repo.add(profile)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("profile")
+
         # Convert to DTO and return
         return ProfileResponse.from_entity(created_profile)
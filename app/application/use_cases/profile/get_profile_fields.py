@@ -0,0 +1,22 @@
+"""
+Get Profile Fields Use Case.
+
+Gets the profile with only the requested fields.
+"""
+
+from app.application.dto import ProfileResponse
+
+from ..fields import ListFieldsUseCase
+
+
+class GetProfileFieldsUseCase(ListFieldsUseCase):
+    """
+    Use case for getting the profile with a sparse fieldset.
+
+    See ListFieldsUseCase for the business rules.
+    """
+
+    resource_type = "Profile"
+    response_class = ProfileResponse
+    ordered = False
+    profile_scoped = False
@@ -5,7 +5,7 @@ Updates the existing profile with new data.
 """
 
 from app.application.dto import ProfileResponse, UpdateProfileRequest
-from app.shared.interfaces import ICommandUseCase, IProfileRepository
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IProfileRepository
 from app.shared.shared_exceptions import NotFoundException
 
 
@@ -20,16 +20,23 @@ class UpdateProfileUseCase(ICommandUseCase[UpdateProfileRequest, ProfileResponse
 
     Dependencies:
     - IProfileRepository: For profile data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, profile_repository: IProfileRepository):
+    def __init__(
+        self,
+        profile_repository: IProfileRepository,
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             profile_repository: Profile repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.profile_repo = profile_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: UpdateProfileRequest) -> ProfileResponse:
         """
@@ -66,5 +73,9 @@ class UpdateProfileUseCase(ICommandUseCase[UpdateProfileRequest, ProfileResponse
         # Persist changes
         updated_profile = await self.profile_repo.update(profile)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("profile")
+
         # Convert to DTO and return
         return ProfileResponse.from_entity(updated_profile)
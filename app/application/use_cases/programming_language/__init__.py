@@ -7,6 +7,7 @@ Contains all use cases related to programming language management.
 from .add_programming_language import AddProgrammingLanguageUseCase
 from .delete_programming_language import DeleteProgrammingLanguageUseCase
 from .edit_programming_language import EditProgrammingLanguageUseCase
+from .list_programming_language_fields import ListProgrammingLanguageFieldsUseCase
 from .list_programming_languages import ListProgrammingLanguagesUseCase
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "EditProgrammingLanguageUseCase",
     "DeleteProgrammingLanguageUseCase",
     "ListProgrammingLanguagesUseCase",
+    "ListProgrammingLanguageFieldsUseCase",
 ]
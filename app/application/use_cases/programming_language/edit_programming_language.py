@@ -10,9 +10,12 @@ from app.application.dto.programming_language_dto import (
     EditProgrammingLanguageRequest,
     ProgrammingLanguageResponse,
 )
+from app.domain.entities import ProgrammingLanguage
 from app.shared.interfaces import ICommandUseCase, IOrderedRepository
 from app.shared.shared_exceptions import NotFoundException
 
+from ..editing import provided_changes
+
 if TYPE_CHECKING:
     from app.domain.entities import ProgrammingLanguage as ProgrammingLanguageType
 
@@ -31,20 +34,17 @@ class EditProgrammingLanguageUseCase(
     async def execute(
         self, request: EditProgrammingLanguageRequest
     ) -> ProgrammingLanguageResponse:
-        programming_language = await self.repo.get_by_id(
-            request.programming_language_id
+        changes = ProgrammingLanguage.validate_changes(
+            provided_changes(name=request.name, level=request.level)
+        )
+
+        updated = await self.repo.update_fields(
+            request.programming_language_id, changes
         )
 
-        if not programming_language:
+        if not updated:
             raise NotFoundException(
                 "ProgrammingLanguage", request.programming_language_id
             )
 
-        programming_language.update_info(
-            name=request.name,
-            level=request.level,
-        )
-
-        updated = await self.repo.update(programming_language)
-
         return ProgrammingLanguageResponse.from_entity(updated)
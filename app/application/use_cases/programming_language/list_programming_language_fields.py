@@ -0,0 +1,20 @@
+"""
+List Programming Language Fields Use Case.
+
+Lists programming languages with only the requested fields.
+"""
+
+from app.application.dto import ProgrammingLanguageResponse
+
+from ..fields import ListFieldsUseCase
+
+
+class ListProgrammingLanguageFieldsUseCase(ListFieldsUseCase):
+    """
+    Use case for listing programming languages with a sparse fieldset.
+
+    See ListFieldsUseCase for the business rules.
+    """
+
+    resource_type = "ProgrammingLanguage"
+    response_class = ProgrammingLanguageResponse
@@ -10,7 +10,7 @@ from app.application.dto.programming_language_dto import (
     ListProgrammingLanguagesRequest,
     ProgrammingLanguageListResponse,
 )
-from app.shared.interfaces import IOrderedRepository, IQueryUseCase
+from app.shared.interfaces import FilterSpec, IOrderedRepository, IQueryUseCase
 
 if TYPE_CHECKING:
     from app.domain.entities import ProgrammingLanguage as ProgrammingLanguageType
@@ -30,9 +30,17 @@ class ListProgrammingLanguagesUseCase(
     async def execute(
         self, request: ListProgrammingLanguagesRequest
     ) -> ProgrammingLanguageListResponse:
-        programming_languages = await self.repo.get_all_ordered(
-            profile_id=request.profile_id,
-            ascending=request.ascending,
-        )
+        if request.level:
+            # Only the matching languages leave the database
+            programming_languages = await self.repo.find_by(
+                FilterSpec(sort=(("order_index", 1 if request.ascending else -1),)),
+                profile_id=request.profile_id,
+                level=request.level.lower(),
+            )
+        else:
+            programming_languages = await self.repo.get_all_ordered(
+                profile_id=request.profile_id,
+                ascending=request.ascending,
+            )
 
         return ProgrammingLanguageListResponse.from_entities(programming_languages)
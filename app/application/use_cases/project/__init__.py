@@ -7,11 +7,15 @@ Contains all use cases related to project management.
 from .add_project import AddProjectUseCase
 from .delete_project import DeleteProjectUseCase
 from .edit_project import EditProjectUseCase
+from .list_project_fields import ListProjectFieldsUseCase
 from .list_projects import ListProjectsUseCase
+from .reorder_projects import ReorderProjectsUseCase
 
 __all__ = [
     "AddProjectUseCase",
     "EditProjectUseCase",
     "DeleteProjectUseCase",
     "ListProjectsUseCase",
+    "ReorderProjectsUseCase",
+    "ListProjectFieldsUseCase",
 ]
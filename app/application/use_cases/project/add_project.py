@@ -8,8 +8,7 @@ from typing import TYPE_CHECKING
 
 from app.application.dto import AddProjectRequest, ProjectResponse
 from app.domain.entities import Project
-from app.shared.interfaces import ICommandUseCase, IOrderedRepository
-from app.shared.shared_exceptions import BusinessRuleViolationException
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IOrderedRepository
 
 if TYPE_CHECKING:
     from app.domain.entities import Project as ProjectType
@@ -26,16 +25,23 @@ class AddProjectUseCase(ICommandUseCase[AddProjectRequest, ProjectResponse]):
 
     Dependencies:
     - IOrderedRepository[Project]: For project data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, project_repository: IOrderedRepository["ProjectType"]):
+    def __init__(
+        self,
+        project_repository: IOrderedRepository["ProjectType"],
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             project_repository: Project repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.project_repo = project_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: AddProjectRequest) -> ProjectResponse:
         """
@@ -51,16 +57,6 @@ class AddProjectUseCase(ICommandUseCase[AddProjectRequest, ProjectResponse]):
             BusinessRuleViolationException: If orderIndex already exists
             DomainError: If validation fails
         """
-        # Check orderIndex uniqueness
-        existing = await self.project_repo.get_by_order_index(
-            request.profile_id, request.order_index
-        )
-        if existing:
-            raise BusinessRuleViolationException(
-                "orderIndex must be unique per profile",
-                {"orderIndex": request.order_index},
-            )
-
         # Create domain entity (validates automatically)
         project = Project.create(
             profile_id=request.profile_id,
@@ -74,8 +70,12 @@ class AddProjectUseCase(ICommandUseCase[AddProjectRequest, ProjectResponse]):
             technologies=request.technologies,
         )
 
-        # Persist the project
+        # Persist the project (the repository rejects a duplicate orderIndex)
         created_project = await self.project_repo.add(project)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("projects")
+
         # Convert to DTO and return
         return ProjectResponse.from_entity(created_project)
@@ -7,7 +7,7 @@ Deletes an existing project.
 from typing import TYPE_CHECKING
 
 from app.application.dto import DeleteProjectRequest, SuccessResponse
-from app.shared.interfaces import ICommandUseCase, IOrderedRepository
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IOrderedRepository
 from app.shared.shared_exceptions import NotFoundException
 
 if TYPE_CHECKING:
@@ -24,16 +24,23 @@ class DeleteProjectUseCase(ICommandUseCase[DeleteProjectRequest, SuccessResponse
 
     Dependencies:
     - IOrderedRepository[Project]: For project data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, project_repository: IOrderedRepository["ProjectType"]):
+    def __init__(
+        self,
+        project_repository: IOrderedRepository["ProjectType"],
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             project_repository: Project repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.project_repo = project_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: DeleteProjectRequest) -> SuccessResponse:
         """
@@ -54,4 +61,8 @@ class DeleteProjectUseCase(ICommandUseCase[DeleteProjectRequest, SuccessResponse
         if not deleted:
             raise NotFoundException("Project", request.project_id)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("projects")
+
         return SuccessResponse(message="Project deleted successfully")
@@ -7,9 +7,12 @@ Updates an existing project.
 from typing import TYPE_CHECKING
 
 from app.application.dto import EditProjectRequest, ProjectResponse
-from app.shared.interfaces import ICommandUseCase, IOrderedRepository
+from app.domain.entities import Project
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IOrderedRepository
 from app.shared.shared_exceptions import NotFoundException
 
+from ..editing import provided_changes
+
 if TYPE_CHECKING:
     from app.domain.entities import Project as ProjectType
 
@@ -20,21 +23,29 @@ class EditProjectUseCase(ICommandUseCase[EditProjectRequest, ProjectResponse]):
 
     Business Rules:
     - Project must exist
-    - Only provided fields are updated
+    - Only provided fields are updated; when dates, description and URLs
+      do not change, in one round trip without loading the project first
     - Validations are performed by the entity
 
     Dependencies:
     - IOrderedRepository[Project]: For project data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, project_repository: IOrderedRepository["ProjectType"]):
+    def __init__(
+        self,
+        project_repository: IOrderedRepository["ProjectType"],
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             project_repository: Project repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.project_repo = project_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: EditProjectRequest) -> ProjectResponse:
         """
@@ -50,11 +61,44 @@ class EditProjectUseCase(ICommandUseCase[EditProjectRequest, ProjectResponse]):
             NotFoundException: If project doesn't exist
             DomainError: If validation fails
         """
+        changes = provided_changes(
+            title=request.title,
+            description=request.description,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            live_url=request.live_url,
+            repo_url=request.repo_url,
+            technologies=request.technologies,
+        )
+
+        if Project.can_update_partially(changes):
+            # No date, description or URL change: validate the changed
+            # fields (entity rules) and write only those, without loading
+            # the project first
+            updated_project = await self.project_repo.update_fields(
+                request.project_id, Project.validate_changes(changes)
+            )
+        else:
+            # Dates, description and URLs are validated with the stored ones
+            updated_project = await self._update_loaded(request)
+
+        if not updated_project:
+            raise NotFoundException("Project", request.project_id)
+
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("projects")
+
+        # Convert to DTO and return
+        return ProjectResponse.from_entity(updated_project)
+
+    async def _update_loaded(self, request: EditProjectRequest) -> "ProjectType | None":
+        """Apply the request to the stored project (None if it doesn't exist)."""
         # Get existing project
         project = await self.project_repo.get_by_id(request.project_id)
 
         if not project:
-            raise NotFoundException("Project", request.project_id)
+            return None
 
         # Update basic info (entity validates)
         project.update_info(
@@ -75,8 +119,4 @@ class EditProjectUseCase(ICommandUseCase[EditProjectRequest, ProjectResponse]):
         if request.technologies is not None:
             project.update_technologies(request.technologies)
 
-        # Persist changes
-        updated_project = await self.project_repo.update(project)
-
-        # Convert to DTO and return
-        return ProjectResponse.from_entity(updated_project)
+        return await self.project_repo.update(project)
@@ -0,0 +1,21 @@
+"""
+List Project Fields Use Case.
+
+Lists projects with only the requested fields.
+"""
+
+from app.application.dto import ProjectResponse
+
+from ..fields import ListFieldsUseCase
+
+
+class ListProjectFieldsUseCase(ListFieldsUseCase):
+    """
+    Use case for listing projects with a sparse fieldset.
+
+    See ListFieldsUseCase for the business rules.
+    """
+
+    resource_type = "Project"
+    response_class = ProjectResponse
+    computed_fields = frozenset({"is_ongoing"})
@@ -0,0 +1,21 @@
+"""
+Reorder Projects Use Case.
+
+Applies a new ordering to the projects of the profile.
+"""
+
+from app.application.dto import ProjectResponse
+
+from ..ordering import ReorderItemsUseCase
+
+
+class ReorderProjectsUseCase(ReorderItemsUseCase):
+    """
+    Use case for reordering projects.
+
+    See ReorderItemsUseCase for the business rules.
+    """
+
+    resource_type = "Project"
+    section = "projects"
+    response_class = ProjectResponse
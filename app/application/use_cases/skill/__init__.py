@@ -7,11 +7,19 @@ Contains all use cases related to skill management.
 from .add_skill import AddSkillUseCase
 from .delete_skill import DeleteSkillUseCase
 from .edit_skill import EditSkillUseCase
+from .get_skill_stats import GetSkillStatsUseCase
+from .group_skills import GroupSkillsUseCase
+from .list_skill_fields import ListSkillFieldsUseCase
 from .list_skills import ListSkillsUseCase
+from .reorder_skills import ReorderSkillsUseCase
 
 __all__ = [
     "AddSkillUseCase",
     "EditSkillUseCase",
     "DeleteSkillUseCase",
     "ListSkillsUseCase",
+    "ReorderSkillsUseCase",
+    "GroupSkillsUseCase",
+    "GetSkillStatsUseCase",
+    "ListSkillFieldsUseCase",
 ]
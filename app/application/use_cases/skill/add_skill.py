@@ -8,8 +8,11 @@ from typing import TYPE_CHECKING
 
 from app.application.dto import AddSkillRequest, SkillResponse
 from app.domain.entities import Skill
-from app.shared.interfaces import ICommandUseCase, IUniqueNameRepository
-from app.shared.shared_exceptions import DuplicateException
+from app.shared.interfaces import (
+    ICommandUseCase,
+    ICVChangeListener,
+    IUniqueNameRepository,
+)
 
 if TYPE_CHECKING:
     from app.domain.entities import Skill as SkillType
@@ -27,16 +30,23 @@ class AddSkillUseCase(ICommandUseCase[AddSkillRequest, SkillResponse]):
 
     Dependencies:
     - IUniqueNameRepository[Skill]: For skill data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, skill_repository: IUniqueNameRepository["SkillType"]):
+    def __init__(
+        self,
+        skill_repository: IUniqueNameRepository["SkillType"],
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             skill_repository: Skill repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.skill_repo = skill_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: AddSkillRequest) -> SkillResponse:
         """
@@ -52,10 +62,6 @@ class AddSkillUseCase(ICommandUseCase[AddSkillRequest, SkillResponse]):
             DuplicateException: If skill name already exists
             DomainError: If validation fails
         """
-        # Check name uniqueness
-        if await self.skill_repo.exists_by_name(request.profile_id, request.name):
-            raise DuplicateException("Skill", "name", request.name)
-
         # Create domain entity (validates automatically)
         skill = Skill.create(
             profile_id=request.profile_id,
@@ -65,8 +71,12 @@ class AddSkillUseCase(ICommandUseCase[AddSkillRequest, SkillResponse]):
             level=request.level,
         )
 
-        # Persist the skill
+        # Persist the skill (the repository rejects a duplicate name)
         created_skill = await self.skill_repo.add(skill)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("skills")
+
         # Convert to DTO and return
         return SkillResponse.from_entity(created_skill)
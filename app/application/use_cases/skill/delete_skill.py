@@ -7,7 +7,11 @@ Deletes an existing skill.
 from typing import TYPE_CHECKING
 
 from app.application.dto import DeleteSkillRequest, SuccessResponse
-from app.shared.interfaces import ICommandUseCase, IUniqueNameRepository
+from app.shared.interfaces import (
+    ICommandUseCase,
+    ICVChangeListener,
+    IUniqueNameRepository,
+)
 from app.shared.shared_exceptions import NotFoundException
 
 if TYPE_CHECKING:
@@ -24,16 +28,23 @@ class DeleteSkillUseCase(ICommandUseCase[DeleteSkillRequest, SuccessResponse]):
 
     Dependencies:
     - IUniqueNameRepository[Skill]: For skill data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, skill_repository: IUniqueNameRepository["SkillType"]):
+    def __init__(
+        self,
+        skill_repository: IUniqueNameRepository["SkillType"],
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             skill_repository: Skill repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.skill_repo = skill_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: DeleteSkillRequest) -> SuccessResponse:
         """
@@ -54,4 +65,8 @@ class DeleteSkillUseCase(ICommandUseCase[DeleteSkillRequest, SuccessResponse]):
         if not deleted:
             raise NotFoundException("Skill", request.skill_id)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("skills")
+
         return SuccessResponse(message="Skill deleted successfully")
@@ -7,8 +7,15 @@ Updates an existing skill.
 from typing import TYPE_CHECKING
 
 from app.application.dto import EditSkillRequest, SkillResponse
-from app.shared.interfaces import ICommandUseCase, IUniqueNameRepository
-from app.shared.shared_exceptions import DuplicateException, NotFoundException
+from app.domain.entities import Skill
+from app.shared.interfaces import (
+    ICommandUseCase,
+    ICVChangeListener,
+    IUniqueNameRepository,
+)
+from app.shared.shared_exceptions import NotFoundException
+
+from ..editing import provided_changes
 
 if TYPE_CHECKING:
     from app.domain.entities import Skill as SkillType
@@ -21,21 +28,29 @@ class EditSkillUseCase(ICommandUseCase[EditSkillRequest, SkillResponse]):
     Business Rules:
     - Skill must exist
     - Name must be unique if changed
-    - Only provided fields are updated
+    - Only provided fields are updated, in one round trip without loading
+      the skill first
     - Validations are performed by the entity
 
     Dependencies:
     - IUniqueNameRepository[Skill]: For skill data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, skill_repository: IUniqueNameRepository["SkillType"]):
+    def __init__(
+        self,
+        skill_repository: IUniqueNameRepository["SkillType"],
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             skill_repository: Skill repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.skill_repo = skill_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: EditSkillRequest) -> SkillResponse:
         """
@@ -52,29 +67,22 @@ class EditSkillUseCase(ICommandUseCase[EditSkillRequest, SkillResponse]):
             DuplicateException: If new name already exists
             DomainError: If validation fails
         """
-        # Get existing skill
-        skill = await self.skill_repo.get_by_id(request.skill_id)
+        # Validate the changed fields (entity rules)
+        changes = Skill.validate_changes(
+            provided_changes(
+                name=request.name, category=request.category, level=request.level
+            )
+        )
 
-        if not skill:
-            raise NotFoundException("Skill", request.skill_id)
+        # Write only those fields (the repository rejects a duplicate name)
+        updated_skill = await self.skill_repo.update_fields(request.skill_id, changes)
 
-        # Check name uniqueness if changing name
-        if (
-            request.name
-            and request.name != skill.name
-            and await self.skill_repo.exists_by_name(skill.profile_id, request.name)
-        ):
-            raise DuplicateException("Skill", "name", request.name)
-
-        # Update info (entity validates)
-        skill.update_info(
-            name=request.name,
-            category=request.category,
-            level=request.level,
-        )
+        if not updated_skill:
+            raise NotFoundException("Skill", request.skill_id)
 
-        # Persist changes
-        updated_skill = await self.skill_repo.update(skill)
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("skills")
 
         # Convert to DTO and return
         return SkillResponse.from_entity(updated_skill)
@@ -0,0 +1,50 @@
+"""
+Get Skill Stats Use Case.
+
+Counts the skills of a profile by level and category.
+"""
+
+from typing import TYPE_CHECKING
+
+from app.application.dto import GetSkillStatsRequest, SkillStatsResponse
+from app.shared.interfaces import IGroupableRepository, IQueryUseCase
+
+if TYPE_CHECKING:
+    from app.domain.entities import Skill as SkillType
+
+
+class GetSkillStatsUseCase(IQueryUseCase[GetSkillStatsRequest, SkillStatsResponse]):
+    """
+    Use case for skill statistics.
+
+    Business Rules:
+    - Skills without a level are counted under "none"
+    - by_level and by_category both add up to total
+
+    Dependencies:
+    - IGroupableRepository[Skill]: Counts in the database, no skill is loaded
+    """
+
+    def __init__(self, skill_repository: IGroupableRepository["SkillType"]):
+        """
+        Initialize use case with dependencies.
+
+        Args:
+            skill_repository: Skill repository interface
+        """
+        self.skill_repo = skill_repository
+
+    async def execute(self, request: GetSkillStatsRequest) -> SkillStatsResponse:
+        """
+        Execute the use case.
+
+        Args:
+            request: Stats request with profile ID
+
+        Returns:
+            SkillStatsResponse with counts by level and category
+        """
+        counts = await self.skill_repo.count_by(
+            request.profile_id, ("level", "category")
+        )
+        return SkillStatsResponse.from_counts(counts)
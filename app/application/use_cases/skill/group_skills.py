@@ -0,0 +1,61 @@
+"""
+Group Skills Use Case.
+
+Retrieves the skills of a profile grouped by category or level.
+"""
+
+from typing import TYPE_CHECKING
+
+from app.application.dto import GroupSkillsRequest, SkillGroupsResponse
+from app.shared.interfaces import IGroupableRepository, IQueryUseCase
+from app.shared.shared_exceptions import ValidationException
+
+if TYPE_CHECKING:
+    from app.domain.entities import Skill as SkillType
+
+# Fields skills can be grouped by
+GROUP_FIELDS = ("category", "level")
+
+
+class GroupSkillsUseCase(IQueryUseCase[GroupSkillsRequest, SkillGroupsResponse]):
+    """
+    Use case for grouping skills.
+
+    Business Rules:
+    - Skills can be grouped by category or level
+    - Skills without a level are grouped under "none"
+    - Each group is ordered by orderIndex
+
+    Dependencies:
+    - IGroupableRepository[Skill]: Groups in the database
+    """
+
+    def __init__(self, skill_repository: IGroupableRepository["SkillType"]):
+        """
+        Initialize use case with dependencies.
+
+        Args:
+            skill_repository: Skill repository interface
+        """
+        self.skill_repo = skill_repository
+
+    async def execute(self, request: GroupSkillsRequest) -> SkillGroupsResponse:
+        """
+        Execute the use case.
+
+        Args:
+            request: Group skills request with profile ID and field
+
+        Returns:
+            SkillGroupsResponse with skills by field value
+
+        Raises:
+            ValidationException: If the field is not groupable
+        """
+        if request.field not in GROUP_FIELDS:
+            raise ValidationException(
+                [f"field must be one of: {', '.join(GROUP_FIELDS)}"]
+            )
+
+        groups = await self.skill_repo.group_by(request.profile_id, request.field)
+        return SkillGroupsResponse.from_groups(groups)
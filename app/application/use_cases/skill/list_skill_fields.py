@@ -0,0 +1,20 @@
+"""
+List Skill Fields Use Case.
+
+Lists skills with only the requested fields.
+"""
+
+from app.application.dto import SkillResponse
+
+from ..fields import ListFieldsUseCase
+
+
+class ListSkillFieldsUseCase(ListFieldsUseCase):
+    """
+    Use case for listing skills with a sparse fieldset.
+
+    See ListFieldsUseCase for the business rules.
+    """
+
+    resource_type = "Skill"
+    response_class = SkillResponse
@@ -19,7 +19,7 @@ class ListSkillsUseCase(IQueryUseCase[ListSkillsRequest, SkillListResponse]):
 
     Business Rules:
     - Returns all skills for the profile
-    - Optional filter by category
+    - Optional filters by category and level (evaluated by the repository)
     - Ordered by orderIndex (configurable direction)
 
     Dependencies:
@@ -45,13 +45,13 @@ class ListSkillsUseCase(IQueryUseCase[ListSkillsRequest, SkillListResponse]):
         Returns:
             SkillListResponse with list of skills and metadata
         """
-        # Get skills (filtered by category if provided)
+        # Get skills (filtered by category/level if provided)
+        filters = {"profile_id": request.profile_id}
         if request.category:
-            skills = await self.skill_repo.find_by(
-                profile_id=request.profile_id, category=request.category
-            )
-        else:
-            skills = await self.skill_repo.find_by(profile_id=request.profile_id)
+            filters["category"] = request.category
+        if request.level:
+            filters["level"] = request.level
+        skills = await self.skill_repo.find_by(**filters)
 
         # Sort by order_index
         skills.sort(key=lambda s: s.order_index, reverse=not request.ascending)
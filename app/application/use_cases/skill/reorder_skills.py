@@ -0,0 +1,21 @@
+"""
+Reorder Skills Use Case.
+
+Applies a new ordering to the skills of the profile.
+"""
+
+from app.application.dto import SkillResponse
+
+from ..ordering import ReorderItemsUseCase
+
+
+class ReorderSkillsUseCase(ReorderItemsUseCase):
+    """
+    Use case for reordering skills.
+
+    See ReorderItemsUseCase for the business rules.
+    """
+
+    resource_type = "Skill"
+    section = "skills"
+    response_class = SkillResponse
@@ -7,11 +7,15 @@ Contains all use cases related to social network management.
 from .add_social_network import AddSocialNetworkUseCase
 from .delete_social_network import DeleteSocialNetworkUseCase
 from .edit_social_network import EditSocialNetworkUseCase
+from .list_social_network_fields import ListSocialNetworkFieldsUseCase
 from .list_social_networks import ListSocialNetworksUseCase
+from .reorder_social_networks import ReorderSocialNetworksUseCase
 
 __all__ = [
     "AddSocialNetworkUseCase",
     "EditSocialNetworkUseCase",
     "DeleteSocialNetworkUseCase",
     "ListSocialNetworksUseCase",
+    "ReorderSocialNetworksUseCase",
+    "ListSocialNetworkFieldsUseCase",
 ]
@@ -8,8 +8,11 @@ from typing import TYPE_CHECKING
 
 from app.application.dto import AddSocialNetworkRequest, SocialNetworkResponse
 from app.domain.entities import SocialNetwork
-from app.shared.interfaces import ICommandUseCase, ISocialNetworkRepository
-from app.shared.shared_exceptions import DuplicateException
+from app.shared.interfaces import (
+    ICommandUseCase,
+    ICVChangeListener,
+    ISocialNetworkRepository,
+)
 
 if TYPE_CHECKING:
     pass
@@ -27,16 +30,23 @@ class AddSocialNetworkUseCase(
 
     Dependencies:
     - ISocialNetworkRepository: For social network data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, social_network_repository: ISocialNetworkRepository):
+    def __init__(
+        self,
+        social_network_repository: ISocialNetworkRepository,
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             social_network_repository: Social network repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.social_network_repo = social_network_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: AddSocialNetworkRequest) -> SocialNetworkResponse:
         """
@@ -52,12 +62,6 @@ class AddSocialNetworkUseCase(
             DuplicateException: If platform already exists for profile
             DomainError: If validation fails
         """
-        # Check platform uniqueness
-        if await self.social_network_repo.exists_by_platform(
-            request.profile_id, request.platform
-        ):
-            raise DuplicateException("SocialNetwork", "platform", request.platform)
-
         # Create domain entity (validates automatically)
         social_network = SocialNetwork.create(
             profile_id=request.profile_id,
@@ -67,8 +71,12 @@ class AddSocialNetworkUseCase(
             username=request.username,
         )
 
-        # Persist the social network
+        # Persist the social network (the repository rejects a duplicate platform)
         created = await self.social_network_repo.add(social_network)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("social_networks")
+
         # Convert to DTO and return
         return SocialNetworkResponse.from_entity(created)
@@ -5,7 +5,11 @@ Deletes an existing social network.
 """
 
 from app.application.dto import DeleteSocialNetworkRequest, SuccessResponse
-from app.shared.interfaces import ICommandUseCase, ISocialNetworkRepository
+from app.shared.interfaces import (
+    ICommandUseCase,
+    ICVChangeListener,
+    ISocialNetworkRepository,
+)
 from app.shared.shared_exceptions import NotFoundException
 
 
@@ -21,16 +25,23 @@ class DeleteSocialNetworkUseCase(
 
     Dependencies:
     - ISocialNetworkRepository: For social network data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, social_network_repository: ISocialNetworkRepository):
+    def __init__(
+        self,
+        social_network_repository: ISocialNetworkRepository,
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             social_network_repository: Social network repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.social_network_repo = social_network_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: DeleteSocialNetworkRequest) -> SuccessResponse:
         """
@@ -51,4 +62,8 @@ class DeleteSocialNetworkUseCase(
         if not deleted:
             raise NotFoundException("SocialNetwork", request.social_network_id)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("social_networks")
+
         return SuccessResponse(message="Social network deleted successfully")
@@ -7,8 +7,15 @@ Updates an existing social network.
 from typing import TYPE_CHECKING
 
 from app.application.dto import EditSocialNetworkRequest, SocialNetworkResponse
-from app.shared.interfaces import ICommandUseCase, ISocialNetworkRepository
-from app.shared.shared_exceptions import DuplicateException, NotFoundException
+from app.domain.entities import SocialNetwork
+from app.shared.interfaces import (
+    ICommandUseCase,
+    ICVChangeListener,
+    ISocialNetworkRepository,
+)
+from app.shared.shared_exceptions import NotFoundException
+
+from ..editing import provided_changes
 
 if TYPE_CHECKING:
     pass
@@ -23,20 +30,28 @@ class EditSocialNetworkUseCase(
     Business Rules:
     - Social network must exist
     - Platform must be unique if changed
-    - Only provided fields are updated
+    - Only provided fields are updated, in one round trip without loading
+      the social network first
 
     Dependencies:
     - ISocialNetworkRepository: For social network data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, social_network_repository: ISocialNetworkRepository):
+    def __init__(
+        self,
+        social_network_repository: ISocialNetworkRepository,
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             social_network_repository: Social network repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.social_network_repo = social_network_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: EditSocialNetworkRequest) -> SocialNetworkResponse:
         """
@@ -53,33 +68,24 @@ class EditSocialNetworkUseCase(
             DuplicateException: If new platform already exists
             DomainError: If validation fails
         """
-        # Get existing social network
-        social_network = await self.social_network_repo.get_by_id(
-            request.social_network_id
+        # Validate the changed fields (entity rules)
+        changes = SocialNetwork.validate_changes(
+            provided_changes(
+                platform=request.platform, url=request.url, username=request.username
+            )
         )
 
-        if not social_network:
-            raise NotFoundException("SocialNetwork", request.social_network_id)
-
-        # Check platform uniqueness if changing platform
-        if (
-            request.platform
-            and request.platform != social_network.platform
-            and await self.social_network_repo.exists_by_platform(
-                social_network.profile_id, request.platform
-            )
-        ):
-            raise DuplicateException("SocialNetwork", "platform", request.platform)
-
-        # Update info (entity validates)
-        social_network.update_info(
-            platform=request.platform,
-            url=request.url,
-            username=request.username,
+        # Write only those fields (the repository rejects a duplicate platform)
+        updated = await self.social_network_repo.update_fields(
+            request.social_network_id, changes
         )
 
-        # Persist changes
-        updated = await self.social_network_repo.update(social_network)
+        if not updated:
+            raise NotFoundException("SocialNetwork", request.social_network_id)
+
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("social_networks")
 
         # Convert to DTO and return
         return SocialNetworkResponse.from_entity(updated)
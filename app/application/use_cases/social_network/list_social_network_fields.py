@@ -0,0 +1,20 @@
+"""
+List Social Network Fields Use Case.
+
+Lists social networks with only the requested fields.
+"""
+
+from app.application.dto import SocialNetworkResponse
+
+from ..fields import ListFieldsUseCase
+
+
+class ListSocialNetworkFieldsUseCase(ListFieldsUseCase):
+    """
+    Use case for listing social networks with a sparse fieldset.
+
+    See ListFieldsUseCase for the business rules.
+    """
+
+    resource_type = "SocialNetwork"
+    response_class = SocialNetworkResponse
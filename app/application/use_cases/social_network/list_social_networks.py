@@ -16,6 +16,7 @@ class ListSocialNetworksUseCase(
 
     Business Rules:
     - Returns all social networks for the profile
+    - Optional filter by platform (evaluated by the repository)
     - Ordered by orderIndex (configurable direction)
 
     Dependencies:
@@ -43,10 +44,11 @@ class ListSocialNetworksUseCase(
         Returns:
             SocialNetworkListResponse with list of social networks and metadata
         """
-        # Get social networks
-        social_networks = await self.social_network_repo.find_by(
-            profile_id=request.profile_id
-        )
+        # Get social networks (filtered by platform if provided)
+        filters = {"profile_id": request.profile_id}
+        if request.platform:
+            filters["platform"] = request.platform
+        social_networks = await self.social_network_repo.find_by(**filters)
 
         # Sort by order_index
         social_networks.sort(
@@ -0,0 +1,21 @@
+"""
+Reorder Social Networks Use Case.
+
+Applies a new ordering to the social networks of the profile.
+"""
+
+from app.application.dto import SocialNetworkResponse
+
+from ..ordering import ReorderItemsUseCase
+
+
+class ReorderSocialNetworksUseCase(ReorderItemsUseCase):
+    """
+    Use case for reordering social networks.
+
+    See ReorderItemsUseCase for the business rules.
+    """
+
+    resource_type = "SocialNetwork"
+    section = "social_networks"
+    response_class = SocialNetworkResponse
@@ -7,11 +7,19 @@ Contains all use cases related to tool management.
 from .add_tool import AddToolUseCase
 from .delete_tool import DeleteToolUseCase
 from .edit_tool import EditToolUseCase
+from .get_tool_stats import GetToolStatsUseCase
+from .group_tools import GroupToolsUseCase
+from .list_tool_fields import ListToolFieldsUseCase
 from .list_tools import ListToolsUseCase
+from .reorder_tools import ReorderToolsUseCase
 
 __all__ = [
     "AddToolUseCase",
     "EditToolUseCase",
     "DeleteToolUseCase",
     "ListToolsUseCase",
+    "ReorderToolsUseCase",
+    "GroupToolsUseCase",
+    "GetToolStatsUseCase",
+    "ListToolFieldsUseCase",
 ]
@@ -8,8 +8,11 @@ from typing import TYPE_CHECKING
 
 from app.application.dto import AddToolRequest, ToolResponse
 from app.domain.entities import Tool
-from app.shared.interfaces import ICommandUseCase, IUniqueNameRepository
-from app.shared.shared_exceptions import DuplicateException
+from app.shared.interfaces import (
+    ICommandUseCase,
+    ICVChangeListener,
+    IUniqueNameRepository,
+)
 
 if TYPE_CHECKING:
     from app.domain.entities import Tool as ToolType
@@ -25,16 +28,23 @@ class AddToolUseCase(ICommandUseCase[AddToolRequest, ToolResponse]):
 
     Dependencies:
     - IUniqueNameRepository[Tool]: For tool data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, tool_repository: IUniqueNameRepository["ToolType"]):
+    def __init__(
+        self,
+        tool_repository: IUniqueNameRepository["ToolType"],
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             tool_repository: Tool repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.tool_repo = tool_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: AddToolRequest) -> ToolResponse:
         """
@@ -50,10 +60,6 @@ class AddToolUseCase(ICommandUseCase[AddToolRequest, ToolResponse]):
             DuplicateException: If tool name already exists
             DomainError: If validation fails
         """
-        # Check name uniqueness
-        if await self.tool_repo.exists_by_name(request.profile_id, request.name):
-            raise DuplicateException("Tool", "name", request.name)
-
         # Create domain entity (validates automatically)
         tool = Tool.create(
             profile_id=request.profile_id,
@@ -63,8 +69,12 @@ class AddToolUseCase(ICommandUseCase[AddToolRequest, ToolResponse]):
             icon_url=request.icon_url,
         )
 
-        # Persist the tool
+        # Persist the tool (the repository rejects a duplicate name)
         created_tool = await self.tool_repo.add(tool)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("tools")
+
         # Convert to DTO and return
         return ToolResponse.from_entity(created_tool)
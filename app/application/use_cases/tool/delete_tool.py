@@ -7,7 +7,11 @@ Deletes an existing tool.
 from typing import TYPE_CHECKING
 
 from app.application.dto import DeleteToolRequest, SuccessResponse
-from app.shared.interfaces import ICommandUseCase, IUniqueNameRepository
+from app.shared.interfaces import (
+    ICommandUseCase,
+    ICVChangeListener,
+    IUniqueNameRepository,
+)
 from app.shared.shared_exceptions import NotFoundException
 
 if TYPE_CHECKING:
@@ -24,16 +28,23 @@ class DeleteToolUseCase(ICommandUseCase[DeleteToolRequest, SuccessResponse]):
 
     Dependencies:
     - IUniqueNameRepository[Tool]: For tool data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, tool_repository: IUniqueNameRepository["ToolType"]):
+    def __init__(
+        self,
+        tool_repository: IUniqueNameRepository["ToolType"],
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             tool_repository: Tool repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.tool_repo = tool_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: DeleteToolRequest) -> SuccessResponse:
         """
@@ -54,4 +65,8 @@ class DeleteToolUseCase(ICommandUseCase[DeleteToolRequest, SuccessResponse]):
         if not deleted:
             raise NotFoundException("Tool", request.tool_id)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("tools")
+
         return SuccessResponse(message="Tool deleted successfully")
@@ -7,8 +7,15 @@ Updates an existing tool.
 from typing import TYPE_CHECKING
 
 from app.application.dto import EditToolRequest, ToolResponse
-from app.shared.interfaces import ICommandUseCase, IUniqueNameRepository
-from app.shared.shared_exceptions import DuplicateException, NotFoundException
+from app.domain.entities import Tool
+from app.shared.interfaces import (
+    ICommandUseCase,
+    ICVChangeListener,
+    IUniqueNameRepository,
+)
+from app.shared.shared_exceptions import NotFoundException
+
+from ..editing import provided_changes
 
 if TYPE_CHECKING:
     from app.domain.entities import Tool as ToolType
@@ -21,20 +28,28 @@ class EditToolUseCase(ICommandUseCase[EditToolRequest, ToolResponse]):
     Business Rules:
     - Tool must exist
     - Name must be unique if changed
-    - Only provided fields are updated
+    - Only provided fields are updated, in one round trip without loading
+      the tool first
 
     Dependencies:
     - IUniqueNameRepository[Tool]: For tool data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, tool_repository: IUniqueNameRepository["ToolType"]):
+    def __init__(
+        self,
+        tool_repository: IUniqueNameRepository["ToolType"],
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             tool_repository: Tool repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.tool_repo = tool_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: EditToolRequest) -> ToolResponse:
         """
@@ -51,29 +66,22 @@ class EditToolUseCase(ICommandUseCase[EditToolRequest, ToolResponse]):
             DuplicateException: If new name already exists
             DomainError: If validation fails
         """
-        # Get existing tool
-        tool = await self.tool_repo.get_by_id(request.tool_id)
+        # Validate the changed fields (entity rules)
+        changes = Tool.validate_changes(
+            provided_changes(
+                name=request.name, category=request.category, icon_url=request.icon_url
+            )
+        )
 
-        if not tool:
-            raise NotFoundException("Tool", request.tool_id)
+        # Write only those fields (the repository rejects a duplicate name)
+        updated_tool = await self.tool_repo.update_fields(request.tool_id, changes)
 
-        # Check name uniqueness if changing name
-        if (
-            request.name
-            and request.name != tool.name
-            and await self.tool_repo.exists_by_name(tool.profile_id, request.name)
-        ):
-            raise DuplicateException("Tool", "name", request.name)
-
-        # Update info (entity validates)
-        tool.update_info(
-            name=request.name,
-            category=request.category,
-            icon_url=request.icon_url,
-        )
+        if not updated_tool:
+            raise NotFoundException("Tool", request.tool_id)
 
-        # Persist changes
-        updated_tool = await self.tool_repo.update(tool)
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("tools")
 
         # Convert to DTO and return
         return ToolResponse.from_entity(updated_tool)
@@ -0,0 +1,47 @@
+"""
+Get Tool Stats Use Case.
+
+Counts the tools of a profile by category.
+"""
+
+from typing import TYPE_CHECKING
+
+from app.application.dto import GetToolStatsRequest, ToolStatsResponse
+from app.shared.interfaces import IGroupableRepository, IQueryUseCase
+
+if TYPE_CHECKING:
+    from app.domain.entities import Tool as ToolType
+
+
+class GetToolStatsUseCase(IQueryUseCase[GetToolStatsRequest, ToolStatsResponse]):
+    """
+    Use case for tool statistics.
+
+    Business Rules:
+    - by_category adds up to total
+
+    Dependencies:
+    - IGroupableRepository[Tool]: Counts in the database, no tool is loaded
+    """
+
+    def __init__(self, tool_repository: IGroupableRepository["ToolType"]):
+        """
+        Initialize use case with dependencies.
+
+        Args:
+            tool_repository: Tool repository interface
+        """
+        self.tool_repo = tool_repository
+
+    async def execute(self, request: GetToolStatsRequest) -> ToolStatsResponse:
+        """
+        Execute the use case.
+
+        Args:
+            request: Stats request with profile ID
+
+        Returns:
+            ToolStatsResponse with counts by category
+        """
+        counts = await self.tool_repo.count_by(request.profile_id, ("category",))
+        return ToolStatsResponse.from_counts(counts)
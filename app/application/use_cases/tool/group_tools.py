@@ -0,0 +1,47 @@
+"""
+Group Tools Use Case.
+
+Retrieves the tools of a profile grouped by category.
+"""
+
+from typing import TYPE_CHECKING
+
+from app.application.dto import GroupToolsRequest, ToolGroupsResponse
+from app.shared.interfaces import IGroupableRepository, IQueryUseCase
+
+if TYPE_CHECKING:
+    from app.domain.entities import Tool as ToolType
+
+
+class GroupToolsUseCase(IQueryUseCase[GroupToolsRequest, ToolGroupsResponse]):
+    """
+    Use case for grouping tools by category.
+
+    Business Rules:
+    - Each group is ordered by orderIndex
+
+    Dependencies:
+    - IGroupableRepository[Tool]: Groups in the database
+    """
+
+    def __init__(self, tool_repository: IGroupableRepository["ToolType"]):
+        """
+        Initialize use case with dependencies.
+
+        Args:
+            tool_repository: Tool repository interface
+        """
+        self.tool_repo = tool_repository
+
+    async def execute(self, request: GroupToolsRequest) -> ToolGroupsResponse:
+        """
+        Execute the use case.
+
+        Args:
+            request: Group tools request with profile ID
+
+        Returns:
+            ToolGroupsResponse with tools by category
+        """
+        groups = await self.tool_repo.group_by(request.profile_id, "category")
+        return ToolGroupsResponse.from_groups(groups)
@@ -0,0 +1,20 @@
+"""
+List Tool Fields Use Case.
+
+Lists tools with only the requested fields.
+"""
+
+from app.application.dto import ToolResponse
+
+from ..fields import ListFieldsUseCase
+
+
+class ListToolFieldsUseCase(ListFieldsUseCase):
+    """
+    Use case for listing tools with a sparse fieldset.
+
+    See ListFieldsUseCase for the business rules.
+    """
+
+    resource_type = "Tool"
+    response_class = ToolResponse
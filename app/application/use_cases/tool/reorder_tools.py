@@ -0,0 +1,21 @@
+"""
+Reorder Tools Use Case.
+
+Applies a new ordering to the tools of the profile.
+"""
+
+from app.application.dto import ToolResponse
+
+from ..ordering import ReorderItemsUseCase
+
+
+class ReorderToolsUseCase(ReorderItemsUseCase):
+    """
+    Use case for reordering tools.
+
+    See ReorderItemsUseCase for the business rules.
+    """
+
+    resource_type = "Tool"
+    section = "tools"
+    response_class = ToolResponse
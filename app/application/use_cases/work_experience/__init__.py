@@ -7,11 +7,15 @@ Contains all use cases related to work experience management.
 from .add_experience import AddExperienceUseCase
 from .delete_experience import DeleteExperienceUseCase
 from .edit_experience import EditExperienceUseCase
+from .list_experience_fields import ListExperienceFieldsUseCase
 from .list_experiences import ListExperiencesUseCase
+from .reorder_experiences import ReorderExperiencesUseCase
 
 __all__ = [
     "AddExperienceUseCase",
     "EditExperienceUseCase",
     "DeleteExperienceUseCase",
     "ListExperiencesUseCase",
+    "ReorderExperiencesUseCase",
+    "ListExperienceFieldsUseCase",
 ]
@@ -8,8 +8,7 @@ from typing import TYPE_CHECKING
 
 from app.application.dto import AddExperienceRequest, WorkExperienceResponse
 from app.domain.entities import WorkExperience
-from app.shared.interfaces import ICommandUseCase, IOrderedRepository
-from app.shared.shared_exceptions import BusinessRuleViolationException
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IOrderedRepository
 
 if TYPE_CHECKING:
     from app.domain.entities import WorkExperience as WorkExperienceType
@@ -28,16 +27,23 @@ class AddExperienceUseCase(
 
     Dependencies:
     - IOrderedRepository[WorkExperience]: For experience data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, experience_repository: IOrderedRepository["WorkExperienceType"]):
+    def __init__(
+        self,
+        experience_repository: IOrderedRepository["WorkExperienceType"],
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             experience_repository: Work experience repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.experience_repo = experience_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: AddExperienceRequest) -> WorkExperienceResponse:
         """
@@ -53,16 +59,6 @@ class AddExperienceUseCase(
             BusinessRuleViolationException: If orderIndex already exists
             DomainError: If validation fails
         """
-        # Check if orderIndex is already used
-        existing = await self.experience_repo.get_by_order_index(
-            request.profile_id, request.order_index
-        )
-        if existing:
-            raise BusinessRuleViolationException(
-                "orderIndex must be unique per profile",
-                {"orderIndex": request.order_index},
-            )
-
         # Create domain entity (validates automatically)
         experience = WorkExperience.create(
             profile_id=request.profile_id,
@@ -75,8 +71,12 @@ class AddExperienceUseCase(
             responsibilities=request.responsibilities,
         )
 
-        # Persist the experience
+        # Persist the experience (the repository rejects a duplicate orderIndex)
         created_experience = await self.experience_repo.add(experience)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("work_experiences")
+
         # Convert to DTO and return
         return WorkExperienceResponse.from_entity(created_experience)
@@ -7,7 +7,7 @@ Deletes an existing work experience.
 from typing import TYPE_CHECKING
 
 from app.application.dto import DeleteExperienceRequest, SuccessResponse
-from app.shared.interfaces import ICommandUseCase, IOrderedRepository
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IOrderedRepository
 from app.shared.shared_exceptions import NotFoundException
 
 if TYPE_CHECKING:
@@ -26,16 +26,23 @@ class DeleteExperienceUseCase(
 
     Dependencies:
     - IOrderedRepository[WorkExperience]: For experience data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, experience_repository: IOrderedRepository["WorkExperienceType"]):
+    def __init__(
+        self,
+        experience_repository: IOrderedRepository["WorkExperienceType"],
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             experience_repository: Work experience repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.experience_repo = experience_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: DeleteExperienceRequest) -> SuccessResponse:
         """
@@ -56,4 +63,8 @@ class DeleteExperienceUseCase(
         if not deleted:
             raise NotFoundException("WorkExperience", request.experience_id)
 
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("work_experiences")
+
         return SuccessResponse(message="Work experience deleted successfully")
@@ -7,9 +7,12 @@ Updates an existing work experience.
 from typing import TYPE_CHECKING
 
 from app.application.dto import EditExperienceRequest, WorkExperienceResponse
-from app.shared.interfaces import ICommandUseCase, IOrderedRepository
+from app.domain.entities import WorkExperience
+from app.shared.interfaces import ICommandUseCase, ICVChangeListener, IOrderedRepository
 from app.shared.shared_exceptions import NotFoundException
 
+from ..editing import provided_changes
+
 if TYPE_CHECKING:
     from app.domain.entities import WorkExperience as WorkExperienceType
 
@@ -22,21 +25,29 @@ class EditExperienceUseCase(
 
     Business Rules:
     - Experience must exist
-    - Only provided fields are updated
+    - Only provided fields are updated; without a date change, in one round
+      trip without loading the experience first
     - Validations are performed by the entity
 
     Dependencies:
     - IOrderedRepository[WorkExperience]: For experience data access
+    - ICVChangeListener (optional): Keeps CV read models in sync
     """
 
-    def __init__(self, experience_repository: IOrderedRepository["WorkExperienceType"]):
+    def __init__(
+        self,
+        experience_repository: IOrderedRepository["WorkExperienceType"],
+        cv_listener: ICVChangeListener | None = None,
+    ):
         """
         Initialize use case with dependencies.
 
         Args:
             experience_repository: Work experience repository interface
+            cv_listener: Notified after a successful write (optional)
         """
         self.experience_repo = experience_repository
+        self.cv_listener = cv_listener
 
     async def execute(self, request: EditExperienceRequest) -> WorkExperienceResponse:
         """
@@ -52,11 +63,44 @@ class EditExperienceUseCase(
             NotFoundException: If experience doesn't exist
             DomainError: If validation fails
         """
+        changes = provided_changes(
+            role=request.role,
+            company=request.company,
+            description=request.description,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            responsibilities=request.responsibilities,
+        )
+
+        if WorkExperience.can_update_partially(changes):
+            # No date change: validate the changed fields (entity rules) and
+            # write only those, without loading the experience first
+            updated_experience = await self.experience_repo.update_fields(
+                request.experience_id, WorkExperience.validate_changes(changes)
+            )
+        else:
+            # Dates are validated together with the stored ones
+            updated_experience = await self._update_loaded(request)
+
+        if not updated_experience:
+            raise NotFoundException("WorkExperience", request.experience_id)
+
+        # Keep CV read models in sync
+        if self.cv_listener is not None:
+            await self.cv_listener.section_changed("work_experiences")
+
+        # Convert to DTO and return
+        return WorkExperienceResponse.from_entity(updated_experience)
+
+    async def _update_loaded(
+        self, request: EditExperienceRequest
+    ) -> "WorkExperienceType | None":
+        """Apply the request to the stored experience (None if it doesn't exist)."""
         # Get existing experience
         experience = await self.experience_repo.get_by_id(request.experience_id)
 
         if not experience:
-            raise NotFoundException("WorkExperience", request.experience_id)
+            return None
 
         # Update info (entity validates)
         experience.update_info(
@@ -71,8 +115,4 @@ class EditExperienceUseCase(
         if request.responsibilities is not None:
             experience.update_responsibilities(request.responsibilities)
 
-        # Persist changes
-        updated_experience = await self.experience_repo.update(experience)
-
-        # Convert to DTO and return
-        return WorkExperienceResponse.from_entity(updated_experience)
+        return await self.experience_repo.update(experience)
@@ -0,0 +1,21 @@
+"""
+List Experience Fields Use Case.
+
+Lists work experiences with only the requested fields.
+"""
+
+from app.application.dto import WorkExperienceResponse
+
+from ..fields import ListFieldsUseCase
+
+
+class ListExperienceFieldsUseCase(ListFieldsUseCase):
+    """
+    Use case for listing work experiences with a sparse fieldset.
+
+    See ListFieldsUseCase for the business rules.
+    """
+
+    resource_type = "WorkExperience"
+    response_class = WorkExperienceResponse
+    computed_fields = frozenset({"is_current"})
@@ -4,10 +4,15 @@ List Experiences Use Case.
 Retrieves all work experiences for a profile, ordered by orderIndex.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from app.application.dto import ListExperiencesRequest, WorkExperienceListResponse
-from app.shared.interfaces import IOrderedRepository, IQueryUseCase
+from app.shared.interfaces import (
+    Contains,
+    FilterSpec,
+    IOrderedRepository,
+    IQueryUseCase,
+)
 
 if TYPE_CHECKING:
     from app.domain.entities import WorkExperience as WorkExperienceType
@@ -21,6 +26,8 @@ class ListExperiencesUseCase(
 
     Business Rules:
     - Returns all experiences for the profile
+    - Optional filters: company (case-insensitive substring) and current
+      positions only (no end date), evaluated by the repository
     - Ordered by orderIndex (configurable direction)
 
     Dependencies:
@@ -48,10 +55,24 @@ class ListExperiencesUseCase(
         Returns:
             WorkExperienceListResponse with list of experiences
         """
-        # Get all experiences ordered by orderIndex
-        experiences = await self.experience_repo.get_all_ordered(
-            profile_id=request.profile_id, ascending=request.ascending
-        )
+        conditions: dict[str, Any] = {}
+        if request.company:
+            conditions["company"] = Contains(request.company)
+        if request.current_only:
+            # Matches documents without end_date too
+            conditions["end_date"] = None
+
+        if conditions:
+            experiences = await self.experience_repo.find_by(
+                FilterSpec(sort=(("order_index", 1 if request.ascending else -1),)),
+                profile_id=request.profile_id,
+                **conditions,
+            )
+        else:
+            # Get all experiences ordered by orderIndex
+            experiences = await self.experience_repo.get_all_ordered(
+                profile_id=request.profile_id, ascending=request.ascending
+            )
 
         # Convert to DTO and return
         return WorkExperienceListResponse.from_entities(experiences)
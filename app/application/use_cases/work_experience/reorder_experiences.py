@@ -0,0 +1,21 @@
+"""
+Reorder Experiences Use Case.
+
+Applies a new ordering to the work experiences of the profile.
+"""
+
+from app.application.dto import WorkExperienceResponse
+
+from ..ordering import ReorderItemsUseCase
+
+
+class ReorderExperiencesUseCase(ReorderItemsUseCase):
+    """
+    Use case for reordering work experiences.
+
+    See ReorderItemsUseCase for the business rules.
+    """
+
+    resource_type = "WorkExperience"
+    section = "work_experiences"
+    response_class = WorkExperienceResponse
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -27,6 +28,127 @@ class Settings(BaseSettings):
     # MongoDB
     MONGODB_URL: str = Field(default="mongodb://localhost:27017")
     MONGODB_DB_NAME: str = Field(default="portfolio_db", alias="DATABASE_NAME")
+    MONGODB_BACKEND: Literal["motor", "pymongo"] = Field(
+        default="motor",
+        description="motor: Motor (thread pool); pymongo: PyMongo's native "
+        "AsyncMongoClient, no thread offload",
+    )
+    MONGODB_MAX_POOL_SIZE: int = Field(
+        default=100, ge=1, description="Max connections per server (per worker)"
+    )
+    MONGODB_MIN_POOL_SIZE: int = Field(
+        default=0, ge=0, description="Connections kept open, pre-warmed at startup"
+    )
+    MONGODB_MAX_IDLE_TIME_MS: int | None = Field(
+        default=None, gt=0, description="Close connections idle for longer than this"
+    )
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int | None = Field(
+        default=None,
+        gt=0,
+        description="Max wait for a free connection when the pool is exhausted",
+    )
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = Field(
+        default=30000, gt=0, description="Max wait for a suitable server"
+    )
+    MONGODB_COMPRESSORS: str = Field(
+        default="",
+        description="Wire compressors in preference order, e.g. zstd,snappy,zlib "
+        "(zstd and snappy need their optional packages)",
+    )
+    MONGODB_APP_NAME: str = Field(
+        default="azfe-portfolio-api", description="appname shown in server logs"
+    )
+    MONGODB_READ_PREFERENCE: Literal[
+        "primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest"
+    ] = Field(
+        default="primary",
+        description="Read preference of public GET endpoints; writes, and reads "
+        "while writing, always use the primary",
+    )
+    MONGODB_MAX_STALENESS_SECONDS: int | None = Field(
+        default=None,
+        ge=90,
+        description="Skip secondaries lagging more than this (not for primary)",
+    )
+    MONGODB_PRIMARY_PIN_SECONDS: int = Field(
+        default=120,
+        ge=0,
+        description="After a write, that client's reads use the primary for this "
+        "long (read-your-writes); at least MONGODB_MAX_STALENESS_SECONDS",
+    )
+    MONGODB_ENSURE_INDEXES: bool = Field(
+        default=True,
+        description="Create the missing declared indexes at startup "
+        "(when false they are only verified); a missing unique index fails startup",
+    )
+    MONGODB_INDEXES_DRY_RUN: bool = Field(
+        default=False, description="Only report index differences, never create"
+    )
+
+    # Ordering
+    ORDERING_MODE: Literal["index", "rank"] = Field(
+        default="index",
+        description="index: shift order_index on moves; rank: fractional rank keys "
+        "that rewrite only the moved item (MongoDB 5.0+)",
+    )
+
+    @property
+    def rank_ordering(self) -> bool:
+        return self.ORDERING_MODE == "rank"
+
+    # CV aggregation
+    CV_AGGREGATED_FETCH: bool = Field(
+        default=False,
+        description="Assemble the CV with one $unionWith aggregation (MongoDB 4.4+)",
+    )
+    CV_CONCURRENT_FETCH: bool = Field(
+        default=True, description="Fetch CV sections concurrently"
+    )
+    CV_MAX_CONCURRENCY: int = Field(
+        default=10, ge=1, description="Max simultaneous queries per CV request"
+    )
+    CV_SECTION_TIMEOUT_SECONDS: float | None = Field(
+        default=None,
+        gt=0,
+        description="Per-section timeout; optional sections that exceed it are omitted",
+    )
+    CV_SNAPSHOTS_ENABLED: bool = Field(
+        default=False,
+        description="Serve /cv from the cv_snapshots materialized read model",
+    )
+    CV_CACHE_ENABLED: bool = Field(
+        default=False,
+        description="Cache the assembled CV in process (one cache per worker)",
+    )
+    CV_CACHE_TTL_SECONDS: float = Field(
+        default=60.0,
+        gt=0,
+        description="Max staleness for workers that did not handle the write",
+    )
+    CV_CACHE_MAX_ENTRIES: int = Field(
+        default=16, ge=1, description="Cached CVs kept before LRU eviction"
+    )
+
+    # HTTP caching
+    HTTP_CONDITIONAL_GET_ENABLED: bool = Field(
+        default=True,
+        description="ETag/Last-Modified on public reads and 304 on If-None-Match",
+    )
+
+    # Domain hydration
+    MAPPER_VALIDATE_ON_READ: bool = Field(
+        default=False,
+        description="Re-run entity validation on every document read (debug)",
+    )
+
+    # Public reads
+    PUBLIC_RAW_READS: bool = Field(
+        default=False,
+        description=(
+            "Serve public lists of plain stored fields from raw BSON, "
+            "without entities, DTOs or response_model validation"
+        ),
+    )
 
     # CORS
     CORS_ORIGINS: str = "http://localhost:4321,http://localhost:3000"
@@ -77,8 +199,22 @@ class Settings(BaseSettings):
                     "SENDGRID_API_KEY must not be empty when EMAIL_ENABLED=true"
                 )
             if not self.SMTP_FROM:
+                raise ValueError("SMTP_FROM must not be empty when EMAIL_ENABLED=true")
+        return self
+
+    @model_validator(mode="after")
+    def validate_read_preference_settings(self) -> "Settings":
+        staleness = self.MONGODB_MAX_STALENESS_SECONDS
+        if staleness is not None:
+            if self.MONGODB_READ_PREFERENCE == "primary":
+                raise ValueError(
+                    "MONGODB_MAX_STALENESS_SECONDS requires a non-primary "
+                    "MONGODB_READ_PREFERENCE"
+                )
+            if staleness > self.MONGODB_PRIMARY_PIN_SECONDS:
                 raise ValueError(
-                    "SMTP_FROM must not be empty when EMAIL_ENABLED=true"
+                    "MONGODB_PRIMARY_PIN_SECONDS must be at least "
+                    "MONGODB_MAX_STALENESS_SECONDS"
                 )
         return self
 
@@ -11,12 +11,14 @@ from .contact_information import ContactInformation
 from .contact_message import ContactMessage
 from .education import Education
 from .language import Language
+from .partial_update import PartialUpdateMixin
 from .profile import Profile
 from .programming_language import ProgrammingLanguage
 from .project import Project
 from .skill import Skill
 from .social_network import SocialNetwork
 from .tool import Tool
+from .trusted import build_trusted
 from .work_experience import WorkExperience
 
 __all__ = [
@@ -33,4 +35,6 @@ __all__ = [
     "Tool",
     "ProgrammingLanguage",
     "Language",
+    "PartialUpdateMixin",
+    "build_trusted",
 ]
@@ -16,6 +16,7 @@ Business Rules Applied:
 from dataclasses import dataclass, field
 from datetime import datetime
 import re
+from typing import ClassVar
 import uuid
 
 from ..exceptions import (
@@ -26,10 +27,11 @@ from ..exceptions import (
     InvalidTitleError,
     InvalidURLError,
 )
+from .partial_update import PartialUpdateMixin
 
 
-@dataclass
-class AdditionalTraining:
+@dataclass(slots=True)
+class AdditionalTraining(PartialUpdateMixin):
     """
     AdditionalTraining entity representing courses, workshops, or other training.
 
@@ -49,11 +51,11 @@ class AdditionalTraining:
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
     # Constants
-    MAX_TITLE_LENGTH = 100
-    MAX_PROVIDER_LENGTH = 100
-    MAX_DURATION_LENGTH = 50
-    MAX_DESCRIPTION_LENGTH = 500
-    URL_PATTERN = re.compile(
+    MAX_TITLE_LENGTH: ClassVar[int] = 100
+    MAX_PROVIDER_LENGTH: ClassVar[int] = 100
+    MAX_DURATION_LENGTH: ClassVar[int] = 50
+    MAX_DESCRIPTION_LENGTH: ClassVar[int] = 500
+    URL_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
         r"^https?://"
         r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"
         r"localhost|"
@@ -63,6 +65,16 @@ class AdditionalTraining:
         re.IGNORECASE,
     )
 
+    # Fields an edit can change without loading the entity
+    FIELD_VALIDATORS: ClassVar[dict[str, str | None]] = {
+        "title": "_validate_title",
+        "provider": "_validate_provider",
+        "completion_date": None,
+        "duration": "_validate_duration",
+        "certificate_url": "_validate_certificate_url",
+        "description": "_validate_description",
+    }
+
     def __post_init__(self):
         """Validate entity invariants after initialization."""
         self._validate_profile_id()
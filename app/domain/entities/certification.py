@@ -16,6 +16,7 @@ Business Rules Applied:
 from dataclasses import dataclass, field
 from datetime import datetime
 import re
+from typing import ClassVar
 import uuid
 
 from ..exceptions import (
@@ -27,10 +28,11 @@ from ..exceptions import (
     InvalidTitleError,
     InvalidURLError,
 )
+from .partial_update import PartialUpdateMixin
 
 
-@dataclass
-class Certification:
+@dataclass(slots=True)
+class Certification(PartialUpdateMixin):
     """
     Certification entity representing a professional certification.
 
@@ -50,10 +52,10 @@ class Certification:
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
     # Constants
-    MAX_TITLE_LENGTH = 100
-    MAX_ISSUER_LENGTH = 100
-    MAX_CREDENTIAL_ID_LENGTH = 100
-    URL_PATTERN = re.compile(
+    MAX_TITLE_LENGTH: ClassVar[int] = 100
+    MAX_ISSUER_LENGTH: ClassVar[int] = 100
+    MAX_CREDENTIAL_ID_LENGTH: ClassVar[int] = 100
+    URL_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
         r"^https?://"
         r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"
         r"localhost|"
@@ -63,6 +65,15 @@ class Certification:
         re.IGNORECASE,
     )
 
+    # Fields an edit can change without loading the entity
+    # Dates are validated together: changing them needs the stored entity
+    FIELD_VALIDATORS: ClassVar[dict[str, str | None]] = {
+        "title": "_validate_title",
+        "issuer": "_validate_issuer",
+        "credential_id": "_validate_credential_id",
+        "credential_url": "_validate_credential_url",
+    }
+
     def __post_init__(self):
         """Validate entity invariants after initialization."""
         self._validate_profile_id()
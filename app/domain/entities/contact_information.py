@@ -15,6 +15,7 @@ Business Rules Applied:
 from dataclasses import dataclass, field
 from datetime import datetime
 import re
+from typing import ClassVar
 import uuid
 
 from ..exceptions import (
@@ -25,7 +26,7 @@ from ..exceptions import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactInformation:
     """
     ContactInformation entity representing official contact details.
@@ -45,11 +46,13 @@ class ContactInformation:
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
     # Validation patterns
-    EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-    PHONE_PATTERN = re.compile(
+    EMAIL_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+    )
+    PHONE_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
         r"^\+?[1-9]\d{1,14}$"  # E.164 format (international phone numbers)
     )
-    URL_PATTERN = re.compile(
+    URL_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
         r"^https?://"
         r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"
         r"localhost|"
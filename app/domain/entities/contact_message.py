@@ -15,6 +15,7 @@ Business Rules Applied:
 from dataclasses import dataclass, field
 from datetime import datetime
 import re
+from typing import ClassVar
 import uuid
 
 from ..exceptions import (
@@ -28,7 +29,7 @@ from ..exceptions import (
 VALID_MESSAGE_STATUSES = {"pending", "read", "replied"}
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactMessage:
     """
     ContactMessage entity representing an inquiry from a visitor.
@@ -46,10 +47,12 @@ class ContactMessage:
     replied_at: datetime | None = None
 
     # Constants
-    MAX_NAME_LENGTH = 100
-    MIN_MESSAGE_LENGTH = 10
-    MAX_MESSAGE_LENGTH = 2000
-    EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+    MAX_NAME_LENGTH: ClassVar[int] = 100
+    MIN_MESSAGE_LENGTH: ClassVar[int] = 10
+    MAX_MESSAGE_LENGTH: ClassVar[int] = 2000
+    EMAIL_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+    )
 
     def __post_init__(self):
         """Validate entity invariants after initialization."""
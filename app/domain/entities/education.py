@@ -15,6 +15,7 @@ Business Rules Applied:
 
 from dataclasses import dataclass, field as dataclass_field
 from datetime import datetime
+from typing import ClassVar
 import uuid
 
 from ..exceptions import (
@@ -24,10 +25,11 @@ from ..exceptions import (
     InvalidLengthError,
     InvalidOrderIndexError,
 )
+from .partial_update import PartialUpdateMixin
 
 
-@dataclass
-class Education:
+@dataclass(slots=True)
+class Education(PartialUpdateMixin):
     """
     Education entity representing formal academic education.
 
@@ -47,10 +49,19 @@ class Education:
     updated_at: datetime = dataclass_field(default_factory=datetime.utcnow)
 
     # Constants
-    MAX_INSTITUTION_LENGTH = 100
-    MAX_DEGREE_LENGTH = 100
-    MAX_FIELD_LENGTH = 100
-    MAX_DESCRIPTION_LENGTH = 1000
+    MAX_INSTITUTION_LENGTH: ClassVar[int] = 100
+    MAX_DEGREE_LENGTH: ClassVar[int] = 100
+    MAX_FIELD_LENGTH: ClassVar[int] = 100
+    MAX_DESCRIPTION_LENGTH: ClassVar[int] = 1000
+
+    # Fields an edit can change without loading the entity
+    # Dates are validated together: changing them needs the stored entity
+    FIELD_VALIDATORS: ClassVar[dict[str, str | None]] = {
+        "institution": "_validate_institution",
+        "degree": "_validate_degree",
+        "field": "_validate_field",
+        "description": "_validate_description",
+    }
 
     def __post_init__(self):
         """Validate entity invariants after initialization."""
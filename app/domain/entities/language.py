@@ -11,6 +11,7 @@ Business Rules Applied:
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import ClassVar
 import uuid
 
 from ..exceptions import (
@@ -20,13 +21,14 @@ from ..exceptions import (
     InvalidNameError,
     InvalidOrderIndexError,
 )
+from .partial_update import PartialUpdateMixin
 
 # Valid CEFR proficiency levels
 VALID_PROFICIENCIES = {"a1", "a2", "b1", "b2", "c1", "c2"}
 
 
-@dataclass
-class Language:
+@dataclass(slots=True)
+class Language(PartialUpdateMixin):
     """
     Language entity representing a spoken/written language proficiency.
 
@@ -42,7 +44,13 @@ class Language:
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
     # Constants
-    MAX_NAME_LENGTH = 50
+    MAX_NAME_LENGTH: ClassVar[int] = 50
+
+    # Fields an edit can change without loading the entity
+    FIELD_VALIDATORS: ClassVar[dict[str, str | None]] = {
+        "name": "_validate_name",
+        "proficiency": "_validate_proficiency",
+    }
 
     def __post_init__(self):
         """Validate entity invariants after initialization."""
@@ -0,0 +1,63 @@
+"""
+Partial update support for entities.
+
+An edit usually changes a few fields whose rules only look at the field
+itself (a name's length, a level among the allowed values). Those changes
+can be validated without the stored entity and written with a single
+partial update. Rules that relate several fields (a date range) need the
+stored values, so changes touching them go through the loaded entity.
+"""
+
+from collections.abc import Mapping
+from typing import Any, ClassVar
+
+
+class PartialUpdateMixin:
+    """
+    Validates a set of field changes without loading the entity.
+
+    Entities list in ``FIELD_VALIDATORS`` the fields that can be changed on
+    their own, with the name of the validator that checks each one (None if
+    the field has no rule).
+    """
+
+    # Entities are slotted dataclasses: the mixin must not add a __dict__
+    __slots__ = ()
+
+    FIELD_VALIDATORS: ClassVar[Mapping[str, str | None]] = {}
+
+    @classmethod
+    def can_update_partially(cls, changes: Mapping[str, Any]) -> bool:
+        """Whether ``changes`` can be validated without the stored entity."""
+        return set(changes) <= set(cls.FIELD_VALIDATORS)
+
+    @classmethod
+    def validate_changes(cls, changes: Mapping[str, Any]) -> dict[str, Any]:
+        """
+        Validate and normalize field changes.
+
+        Args:
+            changes: New value of each changed field
+
+        Returns:
+            The changes as the entity would store them (e.g. a level in
+            lowercase)
+
+        Raises:
+            DomainError: If a change breaks a rule
+            ValueError: If a changed field needs the stored entity (see
+                can_update_partially)
+        """
+        if not cls.can_update_partially(changes):
+            fields = sorted(set(changes) - set(cls.FIELD_VALIDATORS))
+            raise ValueError(f"{cls.__name__} fields need the stored entity: {fields}")
+
+        # Entity with only the changed fields: enough for their validators
+        probe = object.__new__(cls)
+        for name, value in changes.items():
+            object.__setattr__(probe, name, value)
+        for name in changes:
+            validator = cls.FIELD_VALIDATORS[name]
+            if validator is not None:
+                getattr(probe, validator)()
+        return {name: getattr(probe, name) for name in changes}
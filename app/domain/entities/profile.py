@@ -15,12 +15,13 @@ Business Rules Applied:
 from dataclasses import dataclass, field
 from datetime import datetime
 import re
+from typing import ClassVar
 import uuid
 
 from ..exceptions import EmptyFieldError, InvalidLengthError, InvalidURLError
 
 
-@dataclass
+@dataclass(slots=True)
 class Profile:
     """
     Profile entity representing the portfolio owner's professional profile.
@@ -39,11 +40,11 @@ class Profile:
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
     # Constants
-    MAX_NAME_LENGTH = 100
-    MAX_HEADLINE_LENGTH = 100
-    MAX_BIO_LENGTH = 1000
-    MAX_LOCATION_LENGTH = 100
-    URL_PATTERN = re.compile(
+    MAX_NAME_LENGTH: ClassVar[int] = 100
+    MAX_HEADLINE_LENGTH: ClassVar[int] = 100
+    MAX_BIO_LENGTH: ClassVar[int] = 1000
+    MAX_LOCATION_LENGTH: ClassVar[int] = 100
+    URL_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
         r"^https?://"  # http:// or https://
         r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain...
         r"localhost|"  # localhost...
@@ -11,6 +11,7 @@ Business Rules Applied:
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import ClassVar
 import uuid
 
 from ..exceptions import (
@@ -20,13 +21,14 @@ from ..exceptions import (
     InvalidOrderIndexError,
     InvalidProgrammingLanguageLevelError,
 )
+from .partial_update import PartialUpdateMixin
 
 # Valid programming language levels
 VALID_PROGRAMMING_LANGUAGE_LEVELS = {"basic", "intermediate", "advanced", "expert"}
 
 
-@dataclass
-class ProgrammingLanguage:
+@dataclass(slots=True)
+class ProgrammingLanguage(PartialUpdateMixin):
     """
     ProgrammingLanguage entity representing a programming language proficiency.
 
@@ -42,7 +44,13 @@ class ProgrammingLanguage:
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
     # Constants
-    MAX_NAME_LENGTH = 50
+    MAX_NAME_LENGTH: ClassVar[int] = 50
+
+    # Fields an edit can change without loading the entity
+    FIELD_VALIDATORS: ClassVar[dict[str, str | None]] = {
+        "name": "_validate_name",
+        "level": "_validate_level",
+    }
 
     def __post_init__(self):
         """Validate entity invariants after initialization."""
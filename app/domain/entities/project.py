@@ -18,6 +18,7 @@ Business Rules Applied:
 from dataclasses import dataclass, field
 from datetime import datetime
 import re
+from typing import ClassVar
 import uuid
 
 from ..exceptions import (
@@ -29,10 +30,11 @@ from ..exceptions import (
     InvalidTitleError,
     InvalidURLError,
 )
+from .partial_update import PartialUpdateMixin
 
 
-@dataclass
-class Project:
+@dataclass(slots=True)
+class Project(PartialUpdateMixin):
     """
     Project entity representing a professional project.
 
@@ -53,13 +55,13 @@ class Project:
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
     # Constants
-    MAX_TITLE_LENGTH = 100
-    MIN_DESCRIPTION_LENGTH = 10
-    MAX_DESCRIPTION_LENGTH = 2000
-    MIN_DESCRIPTION_WITHOUT_URLS = 100
-    MAX_TECHNOLOGIES = 20
-    MAX_TECHNOLOGY_LENGTH = 50
-    URL_PATTERN = re.compile(
+    MAX_TITLE_LENGTH: ClassVar[int] = 100
+    MIN_DESCRIPTION_LENGTH: ClassVar[int] = 10
+    MAX_DESCRIPTION_LENGTH: ClassVar[int] = 2000
+    MIN_DESCRIPTION_WITHOUT_URLS: ClassVar[int] = 100
+    MAX_TECHNOLOGIES: ClassVar[int] = 20
+    MAX_TECHNOLOGY_LENGTH: ClassVar[int] = 50
+    URL_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
         r"^https?://"
         r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"
         r"localhost|"
@@ -69,6 +71,14 @@ class Project:
         re.IGNORECASE,
     )
 
+    # Fields an edit can change without loading the entity
+    # Dates are validated together, and the description against the URLs:
+    # changing them needs the stored entity
+    FIELD_VALIDATORS: ClassVar[dict[str, str | None]] = {
+        "title": "_validate_title",
+        "technologies": "_validate_technologies",
+    }
+
     def __post_init__(self):
         """Validate entity invariants after initialization."""
         self._validate_profile_id()
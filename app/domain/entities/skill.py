@@ -13,6 +13,7 @@ Business Rules Applied:
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import ClassVar
 import uuid
 
 from ..exceptions import (
@@ -23,13 +24,14 @@ from ..exceptions import (
     InvalidOrderIndexError,
     InvalidSkillLevelError,
 )
+from .partial_update import PartialUpdateMixin
 
 # Valid skill levels
 VALID_SKILL_LEVELS = {"basic", "intermediate", "advanced", "expert"}
 
 
-@dataclass
-class Skill:
+@dataclass(slots=True)
+class Skill(PartialUpdateMixin):
     """
     Skill entity representing a professional competency.
 
@@ -46,8 +48,15 @@ class Skill:
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
     # Constants
-    MAX_NAME_LENGTH = 50
-    MAX_CATEGORY_LENGTH = 50
+    MAX_NAME_LENGTH: ClassVar[int] = 50
+    MAX_CATEGORY_LENGTH: ClassVar[int] = 50
+
+    # Fields an edit can change without loading the entity
+    FIELD_VALIDATORS: ClassVar[dict[str, str | None]] = {
+        "name": "_validate_name",
+        "category": "_validate_category",
+        "level": "_validate_level",
+    }
 
     def __post_init__(self):
         """Validate entity invariants after initialization."""
@@ -14,6 +14,7 @@ Business Rules Applied:
 from dataclasses import dataclass, field
 from datetime import datetime
 import re
+from typing import ClassVar
 import uuid
 
 from ..exceptions import (
@@ -23,10 +24,11 @@ from ..exceptions import (
     InvalidPlatformError,
     InvalidURLError,
 )
+from .partial_update import PartialUpdateMixin
 
 
-@dataclass
-class SocialNetwork:
+@dataclass(slots=True)
+class SocialNetwork(PartialUpdateMixin):
     """
     SocialNetwork entity representing a social media profile.
 
@@ -43,9 +45,9 @@ class SocialNetwork:
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
     # Constants
-    MAX_PLATFORM_LENGTH = 50
-    MAX_USERNAME_LENGTH = 100
-    URL_PATTERN = re.compile(
+    MAX_PLATFORM_LENGTH: ClassVar[int] = 50
+    MAX_USERNAME_LENGTH: ClassVar[int] = 100
+    URL_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
         r"^https?://"
         r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"
         r"localhost|"
@@ -55,6 +57,13 @@ class SocialNetwork:
         re.IGNORECASE,
     )
 
+    # Fields an edit can change without loading the entity
+    FIELD_VALIDATORS: ClassVar[dict[str, str | None]] = {
+        "platform": "_validate_platform",
+        "url": "_validate_url",
+        "username": "_validate_username",
+    }
+
     def __post_init__(self):
         """Validate entity invariants after initialization."""
         self._validate_profile_id()
@@ -14,6 +14,7 @@ Business Rules Applied:
 from dataclasses import dataclass, field
 from datetime import datetime
 import re
+from typing import ClassVar
 import uuid
 
 from ..exceptions import (
@@ -24,10 +25,11 @@ from ..exceptions import (
     InvalidOrderIndexError,
     InvalidURLError,
 )
+from .partial_update import PartialUpdateMixin
 
 
-@dataclass
-class Tool:
+@dataclass(slots=True)
+class Tool(PartialUpdateMixin):
     """
     Tool entity representing a technology, framework, or software tool.
 
@@ -44,9 +46,9 @@ class Tool:
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
     # Constants
-    MAX_NAME_LENGTH = 50
-    MAX_CATEGORY_LENGTH = 50
-    URL_PATTERN = re.compile(
+    MAX_NAME_LENGTH: ClassVar[int] = 50
+    MAX_CATEGORY_LENGTH: ClassVar[int] = 50
+    URL_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
         r"^https?://"
         r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"
         r"localhost|"
@@ -56,6 +58,13 @@ class Tool:
         re.IGNORECASE,
     )
 
+    # Fields an edit can change without loading the entity
+    FIELD_VALIDATORS: ClassVar[dict[str, str | None]] = {
+        "name": "_validate_name",
+        "category": "_validate_category",
+        "icon_url": "_validate_icon_url",
+    }
+
     def __post_init__(self):
         """Validate entity invariants after initialization."""
         self._validate_profile_id()
@@ -0,0 +1,65 @@
+"""
+Trusted construction of entities.
+
+Creating an entity runs ``__post_init__``: every invariant is checked (URL
+patterns, lengths, date ranges...). Values loaded from storage were checked
+when they were written, so rebuilding an entity from them can skip that work.
+"""
+
+from dataclasses import MISSING, fields
+from typing import Any, TypeVar
+
+E = TypeVar("E")
+
+InitFields = tuple[tuple[str, Any, Any], ...]
+
+# Constructor fields per entity class, computed on first use
+_INIT_FIELDS: dict[type, InitFields] = {}
+
+
+def _init_fields(entity_class: type) -> InitFields:
+    """(name, default, default_factory) of each constructor field."""
+    init_fields = _INIT_FIELDS.get(entity_class)
+    if init_fields is None:
+        init_fields = tuple(
+            (f.name, f.default, f.default_factory)
+            for f in fields(entity_class)
+            if f.init
+        )
+        _INIT_FIELDS[entity_class] = init_fields
+    return init_fields
+
+
+def build_trusted(entity_class: type[E], /, **values: Any) -> E:
+    """
+    Create an entity from already validated values, without validating them.
+
+    Args:
+        entity_class: Entity dataclass to create
+        **values: Field values, as for the constructor
+
+    Returns:
+        The entity, exactly as the constructor would build it from valid values
+
+    Raises:
+        TypeError: If a field is unknown or a required one is missing
+
+    Notes:
+        - Only for values that passed validation before (e.g. loaded from
+          storage); anything else must go through the constructor
+    """
+    entity = object.__new__(entity_class)
+    remaining = dict(values)
+    for name, default, default_factory in _init_fields(entity_class):
+        if name in remaining:
+            value = remaining.pop(name)
+        elif default is not MISSING:
+            value = default
+        elif default_factory is not MISSING:
+            value = default_factory()
+        else:
+            raise TypeError(f"{entity_class.__name__} missing field: {name}")
+        object.__setattr__(entity, name, value)
+    if remaining:
+        raise TypeError(f"{entity_class.__name__} unknown fields: {sorted(remaining)}")
+    return entity
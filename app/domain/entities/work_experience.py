@@ -15,6 +15,7 @@ Business Rules Applied:
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import ClassVar
 import uuid
 
 from ..exceptions import (
@@ -25,10 +26,11 @@ from ..exceptions import (
     InvalidOrderIndexError,
     InvalidRoleError,
 )
+from .partial_update import PartialUpdateMixin
 
 
-@dataclass
-class WorkExperience:
+@dataclass(slots=True)
+class WorkExperience(PartialUpdateMixin):
     """
     WorkExperience entity representing a professional role.
 
@@ -48,11 +50,20 @@ class WorkExperience:
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
     # Constants
-    MAX_ROLE_LENGTH = 100
-    MAX_COMPANY_LENGTH = 100
-    MAX_DESCRIPTION_LENGTH = 2000
-    MAX_RESPONSIBILITIES = 20
-    MAX_RESPONSIBILITY_LENGTH = 500
+    MAX_ROLE_LENGTH: ClassVar[int] = 100
+    MAX_COMPANY_LENGTH: ClassVar[int] = 100
+    MAX_DESCRIPTION_LENGTH: ClassVar[int] = 2000
+    MAX_RESPONSIBILITIES: ClassVar[int] = 20
+    MAX_RESPONSIBILITY_LENGTH: ClassVar[int] = 500
+
+    # Fields an edit can change without loading the entity
+    # Dates are validated together: changing them needs the stored entity
+    FIELD_VALIDATORS: ClassVar[dict[str, str | None]] = {
+        "role": "_validate_role",
+        "company": "_validate_company",
+        "description": "_validate_description",
+        "responsibilities": "_validate_responsibilities",
+    }
 
     def __post_init__(self):
         """Validate entity invariants after initialization."""
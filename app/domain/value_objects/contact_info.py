@@ -16,7 +16,7 @@ from .email import Email
 from .phone import Phone
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContactInfo:
     """
     ContactInfo Value Object representing contact details.
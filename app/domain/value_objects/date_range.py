@@ -16,7 +16,7 @@ from datetime import datetime
 from ..exceptions import EmptyFieldError, InvalidDateRangeError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DateRange:
     """
     DateRange Value Object representing a time period.
@@ -11,11 +11,12 @@ Value Object Principles:
 
 from dataclasses import dataclass
 import re
+from typing import ClassVar
 
 from ..exceptions import EmptyFieldError, InvalidEmailError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Email:
     """
     Email Value Object representing a validated email address.
@@ -33,7 +34,9 @@ class Email:
     value: str
 
     # Email validation pattern (simplified RFC 5322)
-    EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+    EMAIL_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+    )
 
     def __post_init__(self):
         """Validate and normalize email after initialization."""
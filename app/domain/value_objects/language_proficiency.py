@@ -60,7 +60,7 @@ class LanguageProficiencyEnum(Enum):
         return names[self]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LanguageProficiency:
     """
     LanguageProficiency Value Object representing language proficiency (CEFR).
@@ -11,11 +11,12 @@ Value Object Principles:
 
 from dataclasses import dataclass
 import re
+from typing import ClassVar
 
 from app.domain.exceptions import EmptyFieldError, InvalidPhoneError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Phone:
     """
     Phone Value Object representing a validated phone number.
@@ -38,10 +39,10 @@ class Phone:
     value: str
 
     # E.164 pattern: + followed by 1-15 digits
-    E164_PATTERN = re.compile(r"^\+?[1-9]\d{1,14}$")
+    E164_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"^\+?[1-9]\d{1,14}$")
 
     # Pattern to extract digits from formatted numbers
-    DIGIT_PATTERN = re.compile(r"[\d+]+")
+    DIGIT_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"[\d+]+")
 
     def __post_init__(self):
         original = self.value
@@ -47,7 +47,7 @@ class ProgrammingLanguageLevelEnum(Enum):
         return self.value.capitalize()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProgrammingLanguageLevel:
     """
     ProgrammingLanguageLevel Value Object representing programming language proficiency.
@@ -47,7 +47,7 @@ class SkillLevelEnum(Enum):
         return self.value.capitalize()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SkillLevel:
     """
     SkillLevel Value Object representing skill proficiency.
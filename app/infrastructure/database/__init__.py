@@ -1,3 +1,31 @@
-from .mongo_client import MongoDBClient, get_database
+from .indexes import (
+    ASCENDING,
+    DESCENDING,
+    IndexReport,
+    IndexSpec,
+    log_index_reports,
+    reconcile_indexes,
+    require_unique_indexes,
+)
+from .mongo_client import MongoDBClient, get_database, get_read_database
+from .native_client import NativeMongoClient
+from .pool_metrics import PoolMetricsListener
+from .read_preference import build_read_preference
+from .transactions import optional_transaction
 
-__all__ = ["MongoDBClient", "get_database"]
+__all__ = [
+    "ASCENDING",
+    "DESCENDING",
+    "IndexReport",
+    "IndexSpec",
+    "MongoDBClient",
+    "NativeMongoClient",
+    "PoolMetricsListener",
+    "build_read_preference",
+    "get_database",
+    "get_read_database",
+    "log_index_reports",
+    "optional_transaction",
+    "reconcile_indexes",
+    "require_unique_indexes",
+]
@@ -0,0 +1,54 @@
+"""
+Traducción de errores de MongoDB a excepciones de la aplicación.
+
+Las reglas de unicidad (orderIndex, nombre, plataforma) las garantizan los
+índices únicos declarados en cada repositorio: en lugar de consultar antes de
+escribir, el repositorio escribe y traduce el ``DuplicateKeyError`` resultante.
+"""
+
+import re
+from typing import Any
+
+from pymongo.errors import DuplicateKeyError
+
+from app.shared.shared_exceptions import (
+    ApplicationException,
+    BusinessRuleViolationException,
+    DuplicateException,
+)
+
+# Servidores sin keyPattern en el error: el índice solo aparece en el mensaje
+_INDEX_NAME = re.compile(r"index: (\S+)")
+
+
+def _duplicated_key(error: DuplicateKeyError) -> str:
+    """Campos del índice violado, como texto ("profile_id name")."""
+    details = error.details or {}
+    key_pattern = details.get("keyPattern") or details.get("keyValue")
+    if key_pattern:
+        return " ".join(key_pattern)
+    match = _INDEX_NAME.search(str(error))
+    return match.group(1) if match else ""
+
+
+def translate_duplicate_key(
+    error: DuplicateKeyError, resource_type: str, doc: dict[str, Any]
+) -> ApplicationException:
+    """
+    Convierte una violación de índice único en la excepción de la regla.
+
+    Args:
+        error: Error devuelto por MongoDB
+        resource_type: Nombre de la entidad para el mensaje ("Skill", ...)
+        doc: Documento que se intentaba escribir (aporta el valor duplicado)
+    """
+    key = _duplicated_key(error)
+    if "order_index" in key:
+        return BusinessRuleViolationException(
+            "orderIndex must be unique per profile",
+            {"orderIndex": doc.get("order_index")},
+        )
+    for field in ("name", "platform"):
+        if field in key:
+            return DuplicateException(resource_type, field, str(doc.get(field)))
+    return DuplicateException(resource_type, "id", str(doc.get("_id")))
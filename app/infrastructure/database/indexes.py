@@ -0,0 +1,165 @@
+"""
+Registro y reconciliación de índices de MongoDB.
+
+Cada repositorio declara en ``indexes`` los índices que necesitan sus
+consultas. Al arrancar, ``reconcile_indexes`` compara ese registro con los
+índices existentes: crea los que faltan e informa de los que sobran, sin
+borrarlos nunca (un índice sobrante puede estar en uso por otra versión
+desplegada de la API).
+"""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+ASCENDING = 1
+DESCENDING = -1
+
+# Compara sin distinguir mayúsculas ("Python" == "python"); las consultas que
+# quieran usar un índice con esta collation deben pasar la misma
+CASE_INSENSITIVE: dict[str, Any] = {"locale": "en", "strength": 2}
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """Declaración de un índice: campos en orden y opciones."""
+
+    keys: tuple[tuple[str, int], ...]
+    unique: bool = False
+    collation: Mapping[str, Any] | None = None
+
+    @property
+    def name(self) -> str:
+        # Mismo nombre que genera MongoDB por defecto (p. ej. "profile_id_1_name_1")
+        return "_".join(f"{key}_{direction}" for key, direction in self.keys)
+
+    def matches(self, info: Mapping[str, Any]) -> bool:
+        """Indica si un índice existente (``index_information``) es equivalente."""
+        existing_keys = tuple((k, int(d)) for k, d in info.get("key", []))
+        if existing_keys != self.keys or bool(info.get("unique")) != self.unique:
+            return False
+        # MongoDB devuelve la collation completa; basta con las opciones declaradas
+        existing_collation = info.get("collation") or {}
+        if self.collation is None:
+            return not existing_collation
+        return all(existing_collation.get(k) == v for k, v in self.collation.items())
+
+
+@dataclass
+class IndexReport:
+    """Resultado de reconciliar los índices de una colección."""
+
+    collection: str
+    created: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    extra: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    # Índices únicos que faltan o no se pudieron crear (en missing o failed):
+    # sin ellos no se garantizan las reglas de unicidad
+    unique_unavailable: list[str] = field(default_factory=list)
+
+    @property
+    def in_sync(self) -> bool:
+        return not (self.missing or self.extra or self.failed)
+
+
+async def reconcile_indexes(
+    db: AsyncIOMotorDatabase,
+    registry: Mapping[str, Sequence[IndexSpec]],
+    dry_run: bool = False,
+) -> list[IndexReport]:
+    """
+    Crea los índices declarados que faltan y lista los no declarados.
+
+    Con ``dry_run`` no se modifica nada: los índices que faltan se informan
+    en ``missing`` en lugar de crearse.
+    """
+    reports = []
+    for collection_name, specs in registry.items():
+        collection = db[collection_name]
+        existing: Mapping[str, Any] = await collection.index_information()
+        report = IndexReport(collection=collection_name)
+
+        for spec in specs:
+            if any(spec.matches(info) for info in existing.values()):
+                continue
+            if dry_run:
+                report.missing.append(spec.name)
+                if spec.unique:
+                    report.unique_unavailable.append(spec.name)
+                continue
+            try:
+                options: dict[str, Any] = {"name": spec.name, "unique": spec.unique}
+                if spec.collation is not None:
+                    options["collation"] = dict(spec.collation)
+                await collection.create_index(list(spec.keys), **options)
+                report.created.append(spec.name)
+            except OperationFailure as e:
+                # Conflicto de opciones o datos que violan un índice único
+                logger.error(
+                    "No se pudo crear el índice %s.%s: %s",
+                    collection_name,
+                    spec.name,
+                    e,
+                )
+                report.failed.append(spec.name)
+                if spec.unique:
+                    report.unique_unavailable.append(spec.name)
+
+        for name, info in existing.items():
+            if name == "_id_":
+                continue
+            if not any(spec.matches(info) for spec in specs):
+                report.extra.append(name)
+
+        reports.append(report)
+    return reports
+
+
+def require_unique_indexes(reports: Sequence[IndexReport]) -> None:
+    """
+    Lanza ``RuntimeError`` si falta algún índice único declarado.
+
+    Las reglas de unicidad (nombre, plataforma, orderIndex) solo las
+    garantizan esos índices: los repositorios no consultan antes de escribir.
+    """
+    unavailable = [
+        f"{report.collection}.{name}"
+        for report in reports
+        for name in report.unique_unavailable
+    ]
+    if unavailable:
+        raise RuntimeError(
+            "Faltan índices únicos (ejecuta scripts/reconcile_indexes.py): "
+            + ", ".join(unavailable)
+        )
+
+
+def log_index_reports(reports: Sequence[IndexReport], dry_run: bool = False) -> None:
+    """Resume en el log el resultado de ``reconcile_indexes``."""
+    for report in reports:
+        if report.created:
+            logger.info(
+                "Índices creados en %s: %s",
+                report.collection,
+                ", ".join(report.created),
+            )
+        if report.missing:
+            logger.warning(
+                "Índices pendientes en %s%s: %s",
+                report.collection,
+                " (dry-run)" if dry_run else "",
+                ", ".join(report.missing),
+            )
+        if report.extra:
+            logger.warning(
+                "Índices no declarados en %s: %s",
+                report.collection,
+                ", ".join(report.extra),
+            )
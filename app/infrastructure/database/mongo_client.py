@@ -1,41 +1,136 @@
+import asyncio
 import logging
+from typing import Any, cast
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 from app.config.settings import settings
 
+from .native_client import NativeMongoClient
+from .pool_metrics import PoolMetricsListener
+from .read_preference import build_read_preference
+
 logger = logging.getLogger(__name__)
 
 
 class MongoDBClient:
-    """Cliente MongoDB usando Motor (async). Patrón singleton a nivel de clase."""
+    """
+    Cliente MongoDB asíncrono. Patrón singleton a nivel de clase.
+
+    ``MONGODB_BACKEND`` elige Motor o el ``AsyncMongoClient`` nativo de
+    PyMongo; este último va envuelto en ``NativeMongoClient``, con la misma
+    interfaz, así que los repositorios no distinguen el backend.
+
+    El pool de conexiones se configura con las variables ``MONGODB_*_POOL_*``
+    y ``pool_metrics`` recoge sus contadores en vivo.
+
+    ``read_db`` es la misma base de datos con la preferencia de lectura de
+    ``MONGODB_READ_PREFERENCE``, para las lecturas públicas; ``db`` lee
+    siempre del primario.
+    """
 
     client: AsyncIOMotorClient | None = None
     db: AsyncIOMotorDatabase | None = None
+    read_db: AsyncIOMotorDatabase | None = None
+    # Las transacciones requieren un replica set o un clúster sharded
+    supports_transactions: bool = False
+    pool_metrics: PoolMetricsListener | None = None
 
     @classmethod
     async def connect(cls) -> None:
         """Inicializa el cliente y verifica la conexión a MongoDB."""
         try:
             logger.info("Conectando a MongoDB: %s", settings.MONGODB_URL)
-            cls.client = AsyncIOMotorClient(settings.MONGODB_URL)
+            cls.pool_metrics = PoolMetricsListener()
+            cls.client = cls._create_client(
+                settings.MONGODB_URL, **cls._client_options(cls.pool_metrics)
+            )
             cls.db = cls.client[settings.MONGODB_DB_NAME]
+            cls.read_db = cls._read_database(cls.db)
 
             await cls.client.admin.command("ping")
+            cls.supports_transactions = await cls._detect_transactions(cls.client)
+            await cls._prewarm_pool(cls.client, settings.MONGODB_MIN_POOL_SIZE)
             logger.info("Conectado a MongoDB: %s", settings.MONGODB_DB_NAME)
 
         except Exception as e:
             logger.error("Error conectando a MongoDB: %s", e)
             raise
 
+    @staticmethod
+    def _client_options(listener: PoolMetricsListener) -> dict[str, Any]:
+        """Opciones del pool y de la conexión (las no configuradas, del driver)."""
+        options: dict[str, Any] = {
+            "maxPoolSize": settings.MONGODB_MAX_POOL_SIZE,
+            "minPoolSize": settings.MONGODB_MIN_POOL_SIZE,
+            "serverSelectionTimeoutMS": settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+            "appname": settings.MONGODB_APP_NAME,
+            "event_listeners": [listener],
+        }
+        if settings.MONGODB_MAX_IDLE_TIME_MS is not None:
+            options["maxIdleTimeMS"] = settings.MONGODB_MAX_IDLE_TIME_MS
+        if settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS is not None:
+            options["waitQueueTimeoutMS"] = settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS
+        compressors = [c.strip() for c in settings.MONGODB_COMPRESSORS.split(",")]
+        if any(compressors):
+            options["compressors"] = [c for c in compressors if c]
+        return options
+
+    @staticmethod
+    def _read_database(db: AsyncIOMotorDatabase) -> AsyncIOMotorDatabase:
+        """``db`` con la preferencia de lectura de las lecturas públicas."""
+        if settings.MONGODB_READ_PREFERENCE == "primary":
+            return db
+        return db.with_options(
+            read_preference=build_read_preference(
+                settings.MONGODB_READ_PREFERENCE,
+                settings.MONGODB_MAX_STALENESS_SECONDS,
+            )
+        )
+
+    @staticmethod
+    def _create_client(url: str, **options: Any) -> AsyncIOMotorClient:
+        """Crea el cliente del backend configurado en MONGODB_BACKEND."""
+        if settings.MONGODB_BACKEND == "pymongo":
+            return cast(AsyncIOMotorClient, NativeMongoClient(url, **options))
+        return AsyncIOMotorClient(url, **options)
+
+    @staticmethod
+    async def _prewarm_pool(client: AsyncIOMotorClient, size: int) -> None:
+        """
+        Abre ``size`` conexiones al arrancar.
+
+        El driver rellena minPoolSize en segundo plano; los ``ping`` en
+        paralelo lo adelantan para que las primeras peticiones no paguen el
+        handshake (TCP, TLS y autenticación).
+        """
+        if size > 0:
+            await asyncio.gather(*(client.admin.command("ping") for _ in range(size)))
+
+    @staticmethod
+    async def _detect_transactions(client: AsyncIOMotorClient) -> bool:
+        """Un servidor standalone no admite transacciones."""
+        try:
+            hello = await client.admin.command("hello")
+        except Exception:
+            return False
+        return "setName" in hello or hello.get("msg") == "isdbgrid"
+
     @classmethod
     async def disconnect(cls) -> None:
         """Cierra la conexión a MongoDB."""
         if cls.client is not None:
             logger.info("Desconectando de MongoDB")
-            cls.client.close()
+            # Motor cierra de forma síncrona; el cliente nativo, con await
+            if isinstance(cls.client, NativeMongoClient):
+                await cls.client.close()
+            else:
+                cls.client.close()
             cls.client = None
             cls.db = None
+            cls.read_db = None
+            cls.supports_transactions = False
+            cls.pool_metrics = None
             logger.info("Desconectado de MongoDB")
 
     @classmethod
@@ -58,7 +153,21 @@ class MongoDBClient:
             )
         return cls.db
 
+    @classmethod
+    def get_read_db(cls) -> AsyncIOMotorDatabase:
+        """Obtiene la base de datos de las lecturas públicas."""
+        if cls.read_db is None:
+            raise RuntimeError(
+                "Base de datos no inicializada. Llama a connect() primero."
+            )
+        return cls.read_db
+
 
 async def get_database() -> AsyncIOMotorDatabase:
     """Dependency injection para obtener la BD en los routers de FastAPI."""
     return MongoDBClient.get_db()
+
+
+async def get_read_database() -> AsyncIOMotorDatabase:
+    """Dependency injection de la BD de lecturas públicas (puede ir a secundarios)."""
+    return MongoDBClient.get_read_db()
@@ -0,0 +1,125 @@
+"""
+Adaptador del ``AsyncMongoClient`` nativo de PyMongo a la interfaz de Motor.
+
+Motor ejecuta cada operación en un pool de hilos; el cliente asíncrono de
+PyMongo (4.9+) habla con MongoDB directamente desde el event loop, sin ese
+salto de hilo ni el límite de concurrencia del executor.
+
+Las dos APIs coinciden casi por completo. Este adaptador solo cubre las
+diferencias que usan los repositorios, así que funcionan igual con los dos
+clientes:
+
+- ``aggregate`` es una corrutina en PyMongo y devuelve el cursor al esperarla;
+  en Motor devuelve el cursor directamente. ``NativeCollection.aggregate``
+  devuelve un cursor diferido que lanza la agregación al iterarlo.
+- ``start_session`` es una corrutina en Motor y un método normal en PyMongo.
+- ``close`` es una corrutina en PyMongo (en Motor, síncrono).
+
+El resto de atributos se delega sin cambios: ``find`` y sus cursores, las
+escrituras, ``index_information``, ``command``...
+"""
+
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, Sequence
+from functools import partial
+from typing import Any
+
+from pymongo import AsyncMongoClient
+
+
+class DeferredCommandCursor:
+    """
+    Cursor de ``aggregate`` con la interfaz de Motor (iterable sin ``await``).
+
+    La agregación se envía al servidor la primera vez que se itera el cursor
+    o se llama a ``to_list``.
+    """
+
+    def __init__(self, open_cursor: Callable[[], Awaitable[Any]]):
+        self._open_cursor = open_cursor
+        self._cursor: Any = None
+
+    async def _get_cursor(self) -> Any:
+        if self._cursor is None:
+            self._cursor = await self._open_cursor()
+        return self._cursor
+
+    def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[dict[str, Any]]:
+        cursor = await self._get_cursor()
+        async for doc in cursor:
+            yield doc
+
+    async def to_list(self, length: int | None = None) -> list[dict[str, Any]]:
+        cursor = await self._get_cursor()
+        docs: list[dict[str, Any]] = await cursor.to_list(length)
+        return docs
+
+    async def close(self) -> None:
+        if self._cursor is not None:
+            await self._cursor.close()
+
+
+class NativeCollection:
+    """``AsyncCollection`` de PyMongo vista como una colección de Motor."""
+
+    def __init__(self, collection: Any):
+        self._collection = collection
+
+    def aggregate(
+        self, pipeline: Sequence[Mapping[str, Any]], *args: Any, **kwargs: Any
+    ) -> DeferredCommandCursor:
+        return DeferredCommandCursor(
+            partial(self._collection.aggregate, pipeline, *args, **kwargs)
+        )
+
+    def with_options(self, *args: Any, **kwargs: Any) -> "NativeCollection":
+        return NativeCollection(self._collection.with_options(*args, **kwargs))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._collection, name)
+
+
+class NativeDatabase:
+    """``AsyncDatabase`` de PyMongo vista como una base de datos de Motor."""
+
+    def __init__(self, database: Any, client: "NativeMongoClient"):
+        self._database = database
+        self.client = client
+
+    def __getitem__(self, name: str) -> NativeCollection:
+        return NativeCollection(self._database[name])
+
+    def get_collection(self, name: str, *args: Any, **kwargs: Any) -> NativeCollection:
+        return NativeCollection(self._database.get_collection(name, *args, **kwargs))
+
+    def with_options(self, *args: Any, **kwargs: Any) -> "NativeDatabase":
+        return NativeDatabase(self._database.with_options(*args, **kwargs), self.client)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._database, name)
+
+
+class NativeMongoClient:
+    """``AsyncMongoClient`` de PyMongo con la interfaz de Motor."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        self._client: AsyncMongoClient = AsyncMongoClient(*args, **kwargs)
+
+    def __getitem__(self, name: str) -> NativeDatabase:
+        return NativeDatabase(self._client[name], self)
+
+    def get_database(self, name: str, *args: Any, **kwargs: Any) -> NativeDatabase:
+        return NativeDatabase(self._client.get_database(name, *args, **kwargs), self)
+
+    async def start_session(self, **kwargs: Any) -> Any:
+        # La sesión es la de PyMongo: las operaciones la reciben en ``session=``
+        return self._client.start_session(**kwargs)
+
+    async def close(self) -> None:
+        await self._client.close()
+
+    def __getattr__(self, name: str) -> Any:
+        # admin, server_info, list_database_names...
+        return getattr(self._client, name)
@@ -0,0 +1,127 @@
+"""
+Métricas del pool de conexiones a MongoDB.
+
+``PoolMetricsListener`` es un ``ConnectionPoolListener`` de PyMongo: el
+driver le notifica cada conexión abierta, cerrada, prestada y devuelta, y el
+listener mantiene contadores por servidor. Con ellos se ve si el pool se
+satura (conexiones en espera, latencia de checkout) para ajustar el número
+de workers frente a ``maxPoolSize``.
+
+Motor notifica los eventos desde los hilos de su executor, así que los
+contadores se protegen con un lock.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+import threading
+from typing import Any
+
+from pymongo.monitoring import ConnectionPoolListener
+
+# Latencias de checkout recientes que se guardan para el percentil 99
+LATENCY_WINDOW = 1000
+
+
+@dataclass
+class _ServerPool:
+    """Contadores del pool de un servidor."""
+
+    open: int = 0
+    checked_out: int = 0
+    waiting: int = 0
+    checkouts: int = 0
+    failed_checkouts: int = 0
+    cleared: int = 0
+    latencies_ms: deque[float] = field(
+        default_factory=lambda: deque(maxlen=LATENCY_WINDOW)
+    )
+
+    def snapshot(self) -> dict[str, Any]:
+        latencies = sorted(self.latencies_ms)
+        return {
+            "open": self.open,
+            "checked_out": self.checked_out,
+            "available": max(self.open - self.checked_out, 0),
+            "wait_queue": self.waiting,
+            "checkouts": self.checkouts,
+            "failed_checkouts": self.failed_checkouts,
+            "cleared": self.cleared,
+            "checkout_ms": {
+                "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+                "p99": latencies[int(len(latencies) * 0.99)] if latencies else 0.0,
+                "max": latencies[-1] if latencies else 0.0,
+            },
+        }
+
+
+class PoolMetricsListener(ConnectionPoolListener):
+    """Contadores en vivo del pool de conexiones de cada servidor."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pools: dict[str, _ServerPool] = {}
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Estado del pool de cada servidor, por ``host:puerto``."""
+        with self._lock:
+            return {address: pool.snapshot() for address, pool in self._pools.items()}
+
+    @staticmethod
+    def _address(event: Any) -> str:
+        return "{}:{}".format(*event.address)
+
+    def _pool(self, event: Any) -> _ServerPool:
+        return self._pools.setdefault(self._address(event), _ServerPool())
+
+    def pool_created(self, event: Any) -> None:
+        with self._lock:
+            self._pool(event)
+
+    def pool_ready(self, event: Any) -> None:
+        pass
+
+    def pool_cleared(self, event: Any) -> None:
+        with self._lock:
+            self._pool(event).cleared += 1
+
+    def pool_closed(self, event: Any) -> None:
+        with self._lock:
+            self._pools.pop(self._address(event), None)
+
+    def connection_created(self, event: Any) -> None:
+        with self._lock:
+            self._pool(event).open += 1
+
+    def connection_ready(self, event: Any) -> None:
+        pass
+
+    def connection_closed(self, event: Any) -> None:
+        with self._lock:
+            pool = self._pool(event)
+            pool.open = max(pool.open - 1, 0)
+
+    def connection_check_out_started(self, event: Any) -> None:
+        with self._lock:
+            self._pool(event).waiting += 1
+
+    def connection_check_out_failed(self, event: Any) -> None:
+        with self._lock:
+            pool = self._pool(event)
+            pool.failed_checkouts += 1
+            pool.waiting = max(pool.waiting - 1, 0)
+
+    def connection_checked_out(self, event: Any) -> None:
+        with self._lock:
+            pool = self._pool(event)
+            pool.checked_out += 1
+            pool.checkouts += 1
+            pool.waiting = max(pool.waiting - 1, 0)
+            # ``duration`` (segundos) existe desde PyMongo 4.7
+            duration = getattr(event, "duration", None)
+            if duration is not None:
+                pool.latencies_ms.append(duration * 1000)
+
+    def connection_checked_in(self, event: Any) -> None:
+        with self._lock:
+            pool = self._pool(event)
+            pool.checked_out = max(pool.checked_out - 1, 0)
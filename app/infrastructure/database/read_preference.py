@@ -0,0 +1,54 @@
+"""
+Preferencia de lectura de los endpoints públicos.
+
+Las lecturas públicas (``GET /cv``, ``/projects``, ``/skills``...) pueden ir
+a los secundarios del replica set para repartir la carga; las escrituras van
+siempre al primario, sea cual sea la preferencia de lectura.
+
+``maxStalenessSeconds`` descarta los secundarios cuyo retraso estimado supera
+el límite. El servidor exige al menos 90 segundos.
+"""
+
+from pymongo.read_preferences import (
+    Nearest,
+    Primary,
+    PrimaryPreferred,
+    Secondary,
+    SecondaryPreferred,
+)
+
+# Modos que pueden leer de un secundario
+NonPrimaryMode = PrimaryPreferred | Secondary | SecondaryPreferred | Nearest
+
+READ_PREFERENCE_MODES: dict[str, type[NonPrimaryMode]] = {
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+# Límite inferior de maxStalenessSeconds que acepta el servidor
+MIN_MAX_STALENESS_SECONDS = 90
+
+
+def build_read_preference(
+    mode: str, max_staleness: int | None = None
+) -> Primary | NonPrimaryMode:
+    """
+    Crea la preferencia de lectura ``mode`` con el límite de retraso dado.
+
+    ``primary`` no admite ``max_staleness``: siempre lee el dato más reciente.
+    """
+    if mode == "primary":
+        if max_staleness is not None:
+            raise ValueError("maxStalenessSeconds no se aplica al modo primary")
+        return Primary()
+    if mode not in READ_PREFERENCE_MODES:
+        raise ValueError(f"Preferencia de lectura desconocida: {mode}")
+    if max_staleness is None:
+        return READ_PREFERENCE_MODES[mode]()
+    if max_staleness < MIN_MAX_STALENESS_SECONDS:
+        raise ValueError(
+            f"maxStalenessSeconds debe ser al menos {MIN_MAX_STALENESS_SECONDS}"
+        )
+    return READ_PREFERENCE_MODES[mode](max_staleness=max_staleness)
@@ -0,0 +1,38 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import inspect
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorClientSession, AsyncIOMotorDatabase
+
+from .mongo_client import MongoDBClient
+
+
+@asynccontextmanager
+async def optional_transaction(
+    db: AsyncIOMotorDatabase,
+) -> AsyncIterator[AsyncIOMotorClientSession | None]:
+    """
+    Abre una transacción si el despliegue la admite y cede su sesión.
+
+    En un servidor standalone cede ``None``: las operaciones se ejecutan sin
+    sesión, igual que antes. Al salir con una excepción la transacción se
+    aborta; si no, se confirma.
+    """
+    if not MongoDBClient.supports_transactions:
+        yield None
+        return
+
+    async with (
+        await db.client.start_session() as session,
+        await _start_transaction(session),
+    ):
+        yield session
+
+
+async def _start_transaction(session: AsyncIOMotorClientSession) -> Any:
+    transaction = session.start_transaction()
+    # Con el AsyncMongoClient nativo start_transaction es una corrutina
+    if inspect.isawaitable(transaction):
+        transaction = await transaction
+    return transaction
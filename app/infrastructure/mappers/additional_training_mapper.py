@@ -3,11 +3,14 @@ from typing import Any
 from app.domain.entities import AdditionalTraining
 from app.shared.interfaces.mapper import IMapper
 
+from .hydration import hydrate
+
 
 class AdditionalTrainingMapper(IMapper[AdditionalTraining, dict[str, Any]]):
 
     def to_domain(self, persistence_model: dict[str, Any]) -> AdditionalTraining:
-        return AdditionalTraining(
+        return hydrate(
+            AdditionalTraining,
             id=str(persistence_model["_id"]),
             profile_id=persistence_model["profile_id"],
             title=persistence_model["title"],
@@ -3,11 +3,14 @@ from typing import Any
 from app.domain.entities import ContactInformation
 from app.shared.interfaces.mapper import IMapper
 
+from .hydration import hydrate
+
 
 class ContactInformationMapper(IMapper[ContactInformation, dict[str, Any]]):
 
     def to_domain(self, persistence_model: dict[str, Any]) -> ContactInformation:
-        return ContactInformation(
+        return hydrate(
+            ContactInformation,
             id=str(persistence_model["_id"]),
             profile_id=persistence_model["profile_id"],
             email=persistence_model["email"],
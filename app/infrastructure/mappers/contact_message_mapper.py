@@ -3,11 +3,16 @@ from typing import Any
 from app.domain.entities import ContactMessage
 from app.shared.interfaces.mapper import IMapper
 
+from .hydration import hydrate
+
 
 class ContactMessageMapper(IMapper[ContactMessage, dict[str, Any]]):
 
+    view_defaults = {"status": "pending"}
+
     def to_domain(self, persistence_model: dict[str, Any]) -> ContactMessage:
-        return ContactMessage(
+        return hydrate(
+            ContactMessage,
             id=str(persistence_model["_id"]),
             name=persistence_model["name"],
             email=persistence_model["email"],
@@ -3,11 +3,14 @@ from typing import Any
 from app.domain.entities import Education
 from app.shared.interfaces.mapper import IMapper
 
+from .hydration import hydrate
+
 
 class EducationMapper(IMapper[Education, dict[str, Any]]):
 
     def to_domain(self, persistence_model: dict[str, Any]) -> Education:
-        return Education(
+        return hydrate(
+            Education,
             id=str(persistence_model["_id"]),
             profile_id=persistence_model["profile_id"],
             institution=persistence_model["institution"],
@@ -3,11 +3,16 @@ from typing import Any
 from app.domain.entities import WorkExperience
 from app.shared.interfaces.mapper import IMapper
 
+from .hydration import hydrate
+
 
 class WorkExperienceMapper(IMapper[WorkExperience, dict[str, Any]]):
 
+    view_defaults = {"responsibilities": []}
+
     def to_domain(self, persistence_model: dict[str, Any]) -> WorkExperience:
-        return WorkExperience(
+        return hydrate(
+            WorkExperience,
             id=str(persistence_model["_id"]),
             profile_id=persistence_model["profile_id"],
             role=persistence_model["role"],
@@ -0,0 +1,25 @@
+"""
+Hidratación de entidades al leer de MongoDB.
+
+Los documentos guardados ya pasaron la validación del dominio al escribirse,
+así que ``to_domain`` crea las entidades sin volver a validarlas
+(``build_trusted``): en cada lectura de listas y del CV se ahorran las
+expresiones regulares de URLs, longitudes y demás reglas.
+
+``MAPPER_VALIDATE_ON_READ=true`` vuelve a validar en cada lectura, para
+depurar datos escritos por otras vías (scripts, migraciones, a mano).
+"""
+
+from typing import Any, TypeVar
+
+from app.config.settings import settings
+from app.domain.entities import build_trusted
+
+E = TypeVar("E")
+
+
+def hydrate(entity_class: type[E], /, **values: Any) -> E:
+    """Crea la entidad a partir de un documento guardado."""
+    if settings.MAPPER_VALIDATE_ON_READ:
+        return entity_class(**values)
+    return build_trusted(entity_class, **values)
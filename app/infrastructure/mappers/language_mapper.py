@@ -3,11 +3,14 @@ from typing import Any
 from app.domain.entities import Language
 from app.shared.interfaces.mapper import IMapper
 
+from .hydration import hydrate
+
 
 class LanguageMapper(IMapper[Language, dict[str, Any]]):
 
     def to_domain(self, persistence_model: dict[str, Any]) -> Language:
-        return Language(
+        return hydrate(
+            Language,
             id=str(persistence_model["_id"]),
             profile_id=persistence_model["profile_id"],
             name=persistence_model["name"],
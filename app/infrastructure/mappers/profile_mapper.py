@@ -3,11 +3,14 @@ from typing import Any
 from app.domain.entities import Profile
 from app.shared.interfaces.mapper import IMapper
 
+from .hydration import hydrate
+
 
 class ProfileMapper(IMapper[Profile, dict[str, Any]]):
 
     def to_domain(self, persistence_model: dict[str, Any]) -> Profile:
-        return Profile(
+        return hydrate(
+            Profile,
             id=str(persistence_model["_id"]),
             name=persistence_model["name"],
             headline=persistence_model["headline"],
@@ -3,11 +3,14 @@ from typing import Any
 from app.domain.entities import ProgrammingLanguage
 from app.shared.interfaces.mapper import IMapper
 
+from .hydration import hydrate
+
 
 class ProgrammingLanguageMapper(IMapper[ProgrammingLanguage, dict[str, Any]]):
 
     def to_domain(self, persistence_model: dict[str, Any]) -> ProgrammingLanguage:
-        return ProgrammingLanguage(
+        return hydrate(
+            ProgrammingLanguage,
             id=str(persistence_model["_id"]),
             profile_id=persistence_model["profile_id"],
             name=persistence_model["name"],
@@ -3,11 +3,16 @@ from typing import Any
 from app.domain.entities import Project
 from app.shared.interfaces.mapper import IMapper
 
+from .hydration import hydrate
+
 
 class ProjectMapper(IMapper[Project, dict[str, Any]]):
 
+    view_defaults = {"technologies": []}
+
     def to_domain(self, persistence_model: dict[str, Any]) -> Project:
-        return Project(
+        return hydrate(
+            Project,
             id=str(persistence_model["_id"]),
             profile_id=persistence_model["profile_id"],
             title=persistence_model["title"],
@@ -3,11 +3,14 @@ from typing import Any
 from app.domain.entities import SocialNetwork
 from app.shared.interfaces.mapper import IMapper
 
+from .hydration import hydrate
+
 
 class SocialNetworkMapper(IMapper[SocialNetwork, dict[str, Any]]):
 
     def to_domain(self, persistence_model: dict[str, Any]) -> SocialNetwork:
-        return SocialNetwork(
+        return hydrate(
+            SocialNetwork,
             id=str(persistence_model["_id"]),
             profile_id=persistence_model["profile_id"],
             platform=persistence_model["platform"],
@@ -2,8 +2,13 @@ from .additional_training_repository import AdditionalTrainingRepository
 from .certification_repository import CertificationRepository
 from .contact_information_repository import ContactInformationRepository
 from .contact_message_repository import ContactMessageRepository
+from .contact_message_stats_repository import ContactMessageStatsRepository
+from .content_version_repository import ContentVersionRepository
+from .cv_repository import CVRepository
+from .cv_snapshot_repository import CVSnapshotRepository
 from .education_repository import EducationRepository
 from .experience_repository import WorkExperienceRepository
+from .index_registry import build_index_registry
 from .language_repository import LanguageRepository
 from .profile_repository import ProfileRepository
 from .programming_language_repository import ProgrammingLanguageRepository
@@ -17,6 +22,10 @@ __all__ = [
     "CertificationRepository",
     "ContactInformationRepository",
     "ContactMessageRepository",
+    "ContactMessageStatsRepository",
+    "ContentVersionRepository",
+    "CVRepository",
+    "CVSnapshotRepository",
     "EducationRepository",
     "WorkExperienceRepository",
     "ProfileRepository",
@@ -26,4 +35,5 @@ __all__ = [
     "ToolRepository",
     "ProgrammingLanguageRepository",
     "LanguageRepository",
+    "build_index_registry",
 ]
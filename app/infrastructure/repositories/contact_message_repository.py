@@ -1,11 +1,21 @@
+from collections.abc import AsyncIterator, Mapping, Sequence
 from datetime import datetime
 from typing import Any
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from app.domain.entities import ContactMessage
+from app.infrastructure.database.indexes import ASCENDING, DESCENDING, IndexSpec
 from app.infrastructure.mappers import ContactMessageMapper
-from app.shared.interfaces.repository import IContactMessageRepository
+from app.shared.interfaces.filter_spec import FilterSpec
+from app.shared.interfaces.repository import (
+    DEFAULT_BATCH_SIZE,
+    IContactMessageRepository,
+)
+
+from .filters import to_query
+from .projection import stream_projected
+from .streaming import collect
 
 
 class ContactMessageRepository(IContactMessageRepository):
@@ -13,6 +23,13 @@ class ContactMessageRepository(IContactMessageRepository):
 
     collection_name = "contact_messages"
 
+    # Índices que necesitan las consultas de este repositorio
+    indexes = (
+        # Paginación por cursor: orden total (created_at, _id)
+        IndexSpec(keys=(("created_at", DESCENDING), ("_id", DESCENDING))),
+        IndexSpec(keys=(("status", ASCENDING), ("created_at", DESCENDING))),
+    )
+
     def __init__(self, db: AsyncIOMotorDatabase):
         self._db = db
         self._collection = db[self.collection_name]
@@ -53,6 +70,33 @@ class ContactMessageRepository(IContactMessageRepository):
         docs = await cursor.to_list(length=limit)
         return self._mapper.to_domain_list(docs)
 
+    async def list_page(
+        self,
+        limit: int,
+        after: tuple[datetime, str] | None = None,
+        ascending: bool = False,
+    ) -> list[ContactMessage]:
+        # Keyset: se continúa desde la última clave vista en lugar de usar skip,
+        # así cualquier página recorre solo ``limit`` entradas del índice
+        direction = 1 if ascending else -1
+        query: dict[str, Any] = {}
+        if after is not None:
+            created_at, message_id = after
+            op = "$gt" if ascending else "$lt"
+            query = {
+                "$or": [
+                    {"created_at": {op: created_at}},
+                    {"created_at": created_at, "_id": {op: message_id}},
+                ]
+            }
+        cursor = (
+            self._collection.find(query)
+            .sort([("created_at", direction), ("_id", direction)])
+            .limit(limit)
+        )
+        docs = await cursor.to_list(length=limit)
+        return self._mapper.to_domain_list(docs)
+
     async def count(self, filters: dict[str, Any] | None = None) -> int:
         return await self._collection.count_documents(filters or {})
 
@@ -60,25 +104,53 @@ class ContactMessageRepository(IContactMessageRepository):
         count = await self._collection.count_documents({"_id": entity_id})
         return count > 0
 
-    async def find_by(self, **filters: Any) -> list[ContactMessage]:
-        docs = await self._collection.find(filters).to_list(length=100)
-        return self._mapper.to_domain_list(docs)
+    async def stream(
+        self,
+        filters: Mapping[str, Any] | None = None,
+        sort: Sequence[tuple[str, int]] | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        limit: int | None = None,
+    ) -> AsyncIterator[ContactMessage]:
+        cursor = self._collection.find(to_query(filters or {}))
+        if sort:
+            cursor = cursor.sort(list(sort))
+        if limit:
+            cursor = cursor.limit(limit)
+        # El cursor pide los documentos por lotes de batch_size
+        async for doc in cursor.batch_size(batch_size):
+            yield self._mapper.to_domain(doc)
+
+    async def find_by(
+        self, spec: FilterSpec | None = None, /, **filters: Any
+    ) -> list[ContactMessage]:
+        spec = (spec or FilterSpec()).and_where(**filters)
+        entities = self.stream(spec.where, spec.sort, limit=spec.limit)
+        return await collect(entities, self.max_results, self.collection_name)
 
-    async def get_pending_messages(self) -> list[ContactMessage]:
-        docs = (
-            await self._collection.find({"status": "pending"})
-            .sort("created_at", -1)
-            .to_list(length=100)
+    async def find_views(
+        self,
+        fields: Sequence[str],
+        spec: FilterSpec | None = None,
+        /,
+        **filters: Any,
+    ) -> list[dict[str, Any]]:
+        spec = (spec or FilterSpec()).and_where(**filters)
+        docs = stream_projected(
+            self._collection,
+            to_query(spec.where),
+            fields,
+            spec.sort,
+            spec.limit,
         )
-        return self._mapper.to_domain_list(docs)
+        views = (self._mapper.to_view(doc, fields) async for doc in docs)
+        return await collect(views, self.max_results, self.collection_name)
+
+    async def get_pending_messages(self) -> list[ContactMessage]:
+        return await self.get_messages_by_status("pending")
 
     async def get_messages_by_status(self, status: str) -> list[ContactMessage]:
-        docs = (
-            await self._collection.find({"status": status})
-            .sort("created_at", -1)
-            .to_list(length=100)
-        )
-        return self._mapper.to_domain_list(docs)
+        messages = self.stream({"status": status}, sort=[("created_at", -1)])
+        return await collect(messages, self.max_results, self.collection_name)
 
     async def mark_as_read(self, message_id: str) -> bool:
         result = await self._collection.update_one(
@@ -0,0 +1,75 @@
+from datetime import date
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.shared.interfaces.contact_message_stats import (
+    IContactMessageStatsRepository,
+)
+
+from .contact_message_repository import ContactMessageRepository
+
+
+class ContactMessageStatsRepository(IContactMessageStatsRepository):
+    """
+    Daily contact message counters stored in MongoDB.
+
+    One document per UTC day (``_id`` = ISO date, e.g. "2025-01-15") holding
+    the number of messages created that day. ISO dates sort like the days
+    they name, so range reads are plain ``_id`` comparisons.
+    """
+
+    collection_name = "contact_message_stats"
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self._db = db
+        self._collection = db[self.collection_name]
+
+    async def increment(self, day: date, amount: int = 1) -> None:
+        await self._collection.update_one(
+            {"_id": day.isoformat()}, {"$inc": {"count": amount}}, upsert=True
+        )
+
+    async def get_daily_counts(self, since: date) -> dict[date, int]:
+        cursor = self._collection.find({"_id": {"$gte": since.isoformat()}})
+        return {
+            date.fromisoformat(doc["_id"]): doc["count"]
+            async for doc in cursor
+            if doc["count"]
+        }
+
+    async def get_total(self) -> int:
+        cursor = self._collection.aggregate(
+            [{"$group": {"_id": None, "total": {"$sum": "$count"}}}]
+        )
+        docs = await cursor.to_list(length=1)
+        return docs[0]["total"] if docs else 0
+
+    async def rebuild(self) -> int:
+        """
+        Recompute every bucket from the stored messages.
+
+        A single aggregation groups the messages by day and replaces the
+        counters collection atomically (``$out``). Increments that land while
+        it runs are overwritten, so run it when the contact form is quiet.
+
+        Returns:
+            Number of day buckets written
+        """
+        messages = self._db[ContactMessageRepository.collection_name]
+        await messages.aggregate(
+            [
+                {
+                    "$group": {
+                        "_id": {
+                            "$dateToString": {
+                                "format": "%Y-%m-%d",
+                                "date": "$created_at",
+                            }
+                        },
+                        "count": {"$sum": 1},
+                    }
+                },
+                {"$out": self.collection_name},
+            ]
+        ).to_list(length=None)
+        return await self._collection.count_documents({})
@@ -0,0 +1,42 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.shared.interfaces.content_version import (
+    ContentVersion,
+    IContentVersionRepository,
+)
+
+
+class ContentVersionRepository(IContentVersionRepository):
+    """
+    Per-collection content versions stored in MongoDB.
+
+    One tiny document per scope (``_id`` = collection name) holding a
+    counter that every repository write increments. Shared by all workers,
+    so a validator issued by one worker is never wrongly confirmed by
+    another.
+    """
+
+    collection_name = "content_versions"
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self._db = db
+        self._collection = db[self.collection_name]
+
+    async def bump(self, scope: str) -> None:
+        await self._collection.update_one(
+            {"_id": scope},
+            {"$inc": {"version": 1}, "$set": {"updated_at": datetime.utcnow()}},
+            upsert=True,
+        )
+
+    async def get_versions(self, scopes: Sequence[str]) -> dict[str, ContentVersion]:
+        cursor = self._collection.find({"_id": {"$in": list(scopes)}})
+        docs = await cursor.to_list(length=len(scopes))
+        found = {
+            doc["_id"]: ContentVersion(doc["version"], doc.get("updated_at"))
+            for doc in docs
+        }
+        return {scope: found.get(scope, ContentVersion()) for scope in scopes}
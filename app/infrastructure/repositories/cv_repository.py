@@ -0,0 +1,178 @@
+from collections.abc import Sequence
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.infrastructure.mappers import (
+    AdditionalTrainingMapper,
+    CertificationMapper,
+    ContactInformationMapper,
+    EducationMapper,
+    LanguageMapper,
+    ProfileMapper,
+    ProgrammingLanguageMapper,
+    ProjectMapper,
+    SkillMapper,
+    SocialNetworkMapper,
+    ToolMapper,
+    WorkExperienceMapper,
+)
+from app.shared.interfaces.mapper import IMapper
+from app.shared.interfaces.repository import ICVRepository
+
+from .additional_training_repository import AdditionalTrainingRepository
+from .certification_repository import CertificationRepository
+from .contact_information_repository import ContactInformationRepository
+from .education_repository import EducationRepository
+from .experience_repository import WorkExperienceRepository
+from .language_repository import LanguageRepository
+from .profile_repository import ProfileRepository
+from .programming_language_repository import ProgrammingLanguageRepository
+from .project_repository import ProjectRepository
+from .ranking import rank_slot_stages
+from .skill_repository import SkillRepository
+from .social_network_repository import SocialNetworkRepository
+from .tool_repository import ToolRepository
+
+
+class CVRepository(ICVRepository):
+    """
+    Aggregated CV read model using a single MongoDB aggregation.
+
+    The pipeline starts on ``profiles`` and pulls every section collection in
+    with ``$unionWith``, tagging each document with its section. Two
+    ``$group`` stages fold the stream into ONE document shaped as
+    ``{section: [docs, ...]}``, which the existing mappers hydrate in bulk.
+
+    Requires MongoDB 4.4+ (``$unionWith``). The assembled document is subject
+    to the 16MB BSON limit, far above the size of a portfolio CV.
+
+    Only the requested sections are pulled in: a section left out costs no
+    ``$unionWith``. ``languages`` and ``programming_languages`` are opt-in.
+
+    With ``rank_ordering`` the ordered sections derive ``order_index`` from
+    their rank keys, like the section repositories do (MongoDB 5.0+).
+    """
+
+    collection_name = ProfileRepository.collection_name
+
+    # section -> (collection, mapper, descending order_index; None = unordered)
+    SECTIONS: dict[str, tuple[str, IMapper[Any, dict[str, Any]], bool | None]] = {
+        "contact_info": (
+            ContactInformationRepository.collection_name,
+            ContactInformationMapper(),
+            None,
+        ),
+        "social_networks": (
+            SocialNetworkRepository.collection_name,
+            SocialNetworkMapper(),
+            False,
+        ),
+        "work_experiences": (
+            WorkExperienceRepository.collection_name,
+            WorkExperienceMapper(),
+            True,
+        ),
+        "projects": (ProjectRepository.collection_name, ProjectMapper(), True),
+        "skills": (SkillRepository.collection_name, SkillMapper(), False),
+        "tools": (ToolRepository.collection_name, ToolMapper(), False),
+        "education": (EducationRepository.collection_name, EducationMapper(), True),
+        "additional_training": (
+            AdditionalTrainingRepository.collection_name,
+            AdditionalTrainingMapper(),
+            True,
+        ),
+        "certifications": (
+            CertificationRepository.collection_name,
+            CertificationMapper(),
+            True,
+        ),
+        "languages": (LanguageRepository.collection_name, LanguageMapper(), False),
+        "programming_languages": (
+            ProgrammingLanguageRepository.collection_name,
+            ProgrammingLanguageMapper(),
+            False,
+        ),
+    }
+
+    # Sections loaded only when requested
+    OPTIONAL_SECTIONS = frozenset({"languages", "programming_languages"})
+
+    def __init__(self, db: AsyncIOMotorDatabase, rank_ordering: bool = False):
+        self._db = db
+        self._rank_ordering = rank_ordering
+        self._collection = db[self.collection_name]
+        self._profile_mapper = ProfileMapper()
+
+    async def get_cv_sections(
+        self, profile_id: str, sections: Sequence[str] | None = None
+    ) -> dict[str, Any] | None:
+        selected = self._selected(sections)
+        cursor = self._collection.aggregate(self.build_pipeline(profile_id, selected))
+        docs = await cursor.to_list(length=1)
+        if not docs or not docs[0].get("profile"):
+            return None
+        return self._hydrate(docs[0], selected)
+
+    def build_pipeline(
+        self, profile_id: str, sections: Sequence[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Build the aggregation that folds the CV sections into one document."""
+        pipeline: list[dict[str, Any]] = [
+            {"$limit": 1},
+            self._tag_stage("profile"),
+        ]
+        for section in self._selected(sections):
+            collection, _, descending = self.SECTIONS[section]
+            section_pipeline: list[dict[str, Any]] = [
+                {"$match": {"profile_id": profile_id}}
+            ]
+            if self._rank_ordering and descending is not None:
+                section_pipeline.extend(rank_slot_stages())
+            section_pipeline.append(self._tag_stage(section))
+            pipeline.append(
+                {"$unionWith": {"coll": collection, "pipeline": section_pipeline}}
+            )
+        pipeline.extend(
+            [
+                {"$group": {"_id": "$section", "docs": {"$push": "$doc"}}},
+                {
+                    "$group": {
+                        "_id": None,
+                        "sections": {"$push": {"k": "$_id", "v": "$docs"}},
+                    }
+                },
+                {"$replaceRoot": {"newRoot": {"$arrayToObject": "$sections"}}},
+            ]
+        )
+        return pipeline
+
+    def _selected(self, sections: Sequence[str] | None) -> list[str]:
+        """Requested sections in CV order (None = the non-optional ones)."""
+        if sections is None:
+            return [
+                name for name in self.SECTIONS if name not in self.OPTIONAL_SECTIONS
+            ]
+        return [name for name in self.SECTIONS if name in sections]
+
+    @staticmethod
+    def _tag_stage(section: str) -> dict[str, Any]:
+        return {
+            "$project": {"_id": 0, "section": {"$literal": section}, "doc": "$$ROOT"}
+        }
+
+    def _hydrate(self, doc: dict[str, Any], selected: list[str]) -> dict[str, Any]:
+        sections: dict[str, Any] = {
+            "profile": self._profile_mapper.to_domain(doc["profile"][0])
+        }
+        for section in selected:
+            _, mapper, descending = self.SECTIONS[section]
+            entities = mapper.to_domain_list(doc.get(section, []))
+            if descending is not None:
+                entities.sort(key=lambda e: e.order_index, reverse=descending)
+            sections[section] = entities
+
+        if "contact_info" in sections:
+            contact_info = sections["contact_info"]
+            sections["contact_info"] = contact_info[0] if contact_info else None
+        return sections
@@ -0,0 +1,74 @@
+from datetime import datetime
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.shared.interfaces.repository import ICVSnapshotRepository
+
+
+class CVSnapshotRepository(ICVSnapshotRepository):
+    """
+    Materialized CV snapshots stored in MongoDB.
+
+    One document per profile, keyed by ``_id = profile_id``, holding every
+    serialized CV section plus an ``updated_at`` timestamp and the version
+    of each section (``section_versions``). Reads are a single primary-key
+    lookup.
+    """
+
+    collection_name = "cv_snapshots"
+
+    # Metadatos internos que no forman parte del CV
+    _PROJECTION = {"_id": 0, "updated_at": 0, "section_versions": 0}
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self._db = db
+        self._collection = db[self.collection_name]
+
+    async def get(self, profile_id: str) -> dict[str, Any] | None:
+        return await self._collection.find_one({"_id": profile_id}, self._PROJECTION)
+
+    async def save(
+        self, profile_id: str, snapshot: dict[str, Any], version: int
+    ) -> None:
+        # Misma condición que save_section, sección a sección y en una sola
+        # escritura: una reconstrucción lenta no pisa las secciones que otra
+        # recarga más reciente ya guardó. $literal evita que los valores se
+        # evalúen como expresiones
+        fields: dict[str, Any] = {"updated_at": datetime.utcnow()}
+        for section, value in snapshot.items():
+            stored_version = f"$section_versions.{section}"
+            fields[section] = {
+                "$cond": [
+                    {"$gte": [stored_version, version]},
+                    f"${section}",
+                    {"$literal": value},
+                ]
+            }
+            fields[f"section_versions.{section}"] = {"$max": [stored_version, version]}
+        await self._collection.update_one(
+            {"_id": profile_id}, [{"$set": fields}], upsert=True
+        )
+
+    async def save_section(
+        self, profile_id: str, section: str, value: Any, version: int
+    ) -> bool:
+        version_field = f"section_versions.{section}"
+        # Sin upsert: un snapshot parcial nunca debe servirse como CV completo.
+        # Solo se escribe si la versión guardada es anterior (o no existe): una
+        # recarga lenta no pisa a otra más reciente que terminó antes
+        result = await self._collection.update_one(
+            {"_id": profile_id, version_field: {"$not": {"$gte": version}}},
+            {
+                "$set": {
+                    section: value,
+                    version_field: version,
+                    "updated_at": datetime.utcnow(),
+                }
+            },
+        )
+        return result.matched_count > 0
+
+    async def delete(self, profile_id: str) -> bool:
+        result = await self._collection.delete_one({"_id": profile_id})
+        return result.deleted_count > 0
@@ -0,0 +1,49 @@
+"""
+Traducción de ``FilterSpec`` a consultas de MongoDB.
+
+Los valores simples son igualdad y se pasan tal cual; el resto de condiciones
+se convierten en su operador. ``Prefix`` y ``Contains`` son expresiones
+regulares: un ``Prefix`` sensible a mayúsculas va anclado (``^...``), y
+MongoDB lo resuelve como un rango sobre el índice del campo si lo hay;
+``Contains`` y los prefijos sin distinguir mayúsculas se evalúan sobre los
+documentos que ya acota el resto del filtro (normalmente ``profile_id``).
+``Not`` usa ``$not``, que también acepta los documentos sin el campo.
+"""
+
+from collections.abc import Mapping
+import re
+from typing import Any
+
+from app.shared.interfaces.filter_spec import Contains, In, Not, Prefix, Range
+
+
+def to_query(filters: Mapping[str, Any]) -> dict[str, Any]:
+    """Consulta de MongoDB equivalente a las condiciones de ``filters``."""
+    return {field: _condition(value) for field, value in filters.items()}
+
+
+def _condition(value: Any) -> Any:
+    if isinstance(value, In):
+        return {"$in": list(value.values)}
+    if isinstance(value, Range):
+        bounds = {
+            "$gt": value.gt,
+            "$gte": value.gte,
+            "$lt": value.lt,
+            "$lte": value.lte,
+        }
+        return {op: bound for op, bound in bounds.items() if bound is not None}
+    if isinstance(value, Prefix):
+        return _regex("^" + re.escape(value.text), value.ignore_case)
+    if isinstance(value, Contains):
+        return _regex(re.escape(value.text), value.ignore_case)
+    if isinstance(value, Not):
+        return {"$not": _condition(value.condition)}
+    return value
+
+
+def _regex(pattern: str, ignore_case: bool) -> dict[str, str]:
+    query = {"$regex": pattern}
+    if ignore_case:
+        query["$options"] = "i"
+    return query
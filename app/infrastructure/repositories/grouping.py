@@ -0,0 +1,89 @@
+"""
+Agrupaciones y recuentos resueltos con pipelines de agregación.
+
+En lugar de traer todos los documentos y agrupar en Python, ``$group`` hace el
+trabajo en MongoDB: por la red solo viajan los grupos (con los campos que usa
+el mapper) o, para las estadísticas, únicamente los recuentos.
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from .ranking import ranked_pipeline
+
+
+def grouped_pipeline(
+    filters: Mapping[str, Any],
+    field: str,
+    projection: Sequence[str],
+    rank_ordering: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Agrupa por ``field`` los documentos de ``filters`` ordenados por orderIndex.
+
+    Cada grupo guarda solo ``_id`` y los campos de ``projection``. Los grupos
+    salen en el orden del primer elemento de cada uno, como en la lista.
+    """
+    order = [("order_index", 1)]
+    if rank_ordering:
+        pipeline = ranked_pipeline(filters, order)
+    else:
+        pipeline = [{"$match": dict(filters)}, {"$sort": dict(order)}]
+    item = {name: f"${name}" for name in ("_id", *projection)}
+    pipeline += [
+        {
+            "$group": {
+                "_id": f"${field}",
+                "first": {"$first": "$order_index"},
+                "items": {"$push": item},
+            }
+        },
+        {"$sort": {"first": 1}},
+    ]
+    return pipeline
+
+
+def count_pipeline(
+    filters: Mapping[str, Any], fields: Sequence[str]
+) -> list[dict[str, Any]]:
+    """Recuentos por valor de cada campo de ``fields`` en un único documento."""
+    return [
+        {"$match": dict(filters)},
+        {
+            "$facet": {
+                field: [{"$group": {"_id": f"${field}", "count": {"$sum": 1}}}]
+                for field in fields
+            }
+        },
+    ]
+
+
+async def group_documents(
+    collection: AsyncIOMotorCollection,
+    filters: Mapping[str, Any],
+    field: str,
+    projection: Sequence[str],
+    rank_ordering: bool = False,
+) -> dict[Any, list[dict[str, Any]]]:
+    """Documentos de ``filters`` por valor de ``field`` (None si no lo tienen)."""
+    cursor = collection.aggregate(
+        grouped_pipeline(filters, field, projection, rank_ordering)
+    )
+    return {group["_id"]: group["items"] async for group in cursor}
+
+
+async def count_documents_by(
+    collection: AsyncIOMotorCollection,
+    filters: Mapping[str, Any],
+    fields: Sequence[str],
+) -> dict[str, dict[Any, int]]:
+    """Número de documentos de ``filters`` por valor de cada campo."""
+    cursor = collection.aggregate(count_pipeline(filters, fields))
+    docs = await cursor.to_list(length=1)
+    facets = docs[0] if docs else {}
+    return {
+        field: {bucket["_id"]: bucket["count"] for bucket in facets.get(field, [])}
+        for field in fields
+    }
@@ -0,0 +1,50 @@
+from app.infrastructure.database.indexes import IndexSpec
+from app.shared.interfaces.repository import IOrderedRepository
+
+from .additional_training_repository import AdditionalTrainingRepository
+from .certification_repository import CertificationRepository
+from .contact_information_repository import ContactInformationRepository
+from .contact_message_repository import ContactMessageRepository
+from .education_repository import EducationRepository
+from .experience_repository import WorkExperienceRepository
+from .language_repository import LanguageRepository
+from .programming_language_repository import ProgrammingLanguageRepository
+from .project_repository import ProjectRepository
+from .ranking import RANK_INDEX
+from .skill_repository import SkillRepository
+from .social_network_repository import SocialNetworkRepository
+from .tool_repository import ToolRepository
+
+# Repositorios que declaran índices propios (el resto solo consulta por _id)
+INDEXED_REPOSITORIES = (
+    AdditionalTrainingRepository,
+    CertificationRepository,
+    ContactInformationRepository,
+    ContactMessageRepository,
+    EducationRepository,
+    WorkExperienceRepository,
+    LanguageRepository,
+    ProgrammingLanguageRepository,
+    ProjectRepository,
+    SkillRepository,
+    SocialNetworkRepository,
+    ToolRepository,
+)
+
+
+def build_index_registry(
+    rank_ordering: bool = False,
+) -> dict[str, tuple[IndexSpec, ...]]:
+    """
+    Índices declarados por colección, tal y como los espera la API.
+
+    En modo rank las colecciones ordenadas necesitan además el índice de rank.
+    """
+    return {
+        repo.collection_name: (
+            (*repo.indexes, RANK_INDEX)
+            if rank_ordering and issubclass(repo, IOrderedRepository)
+            else repo.indexes
+        )
+        for repo in INDEXED_REPOSITORIES
+    }
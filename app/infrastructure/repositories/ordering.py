@@ -0,0 +1,232 @@
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+import logging
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorClientSession, AsyncIOMotorCollection
+from pymongo import ASCENDING, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from app.shared.shared_exceptions import BusinessRuleViolationException
+
+logger = logging.getLogger(__name__)
+
+# Código de error de MongoDB para una violación de índice único
+_DUPLICATE_KEY = 11000
+
+# order_index nunca es negativo en el dominio: los valores negativos sirven de
+# zona de paso para no violar el índice único (profile_id, order_index)
+_PARKED = -1
+
+
+async def move_order_index(
+    collection: AsyncIOMotorCollection,
+    profile_id: str,
+    entity_id: str,
+    old_index: int,
+    new_index: int,
+    session: AsyncIOMotorClientSession | None = None,
+) -> None:
+    """
+    Mueve un elemento a ``new_index`` desplazando los que quedan en medio.
+
+    MongoDB comprueba los índices únicos documento a documento, así que un
+    ``$inc`` sobre el rango chocaría con el vecino aún sin mover. El rango se
+    lleva primero a valores negativos distintos y después se devuelve ya
+    desplazado.
+
+    Son cuatro escrituras: con ``session`` (una transacción abierta con
+    ``optional_transaction``) se confirman o abortan juntas. Sin ella
+    (servidor standalone) se guarda antes el order_index del rango y, si una
+    escritura falla, ``restore_order_indexes`` lo devuelve a su sitio.
+    """
+    if old_index < new_index:
+        shifted: dict[str, Any] = {"$gt": old_index, "$lte": new_index}
+        delta = -1
+    else:
+        shifted = {"$gte": new_index, "$lt": old_index}
+        delta = 1
+
+    original = None
+    if session is None:
+        original = await _current_orders(
+            collection, {"profile_id": profile_id, "order_index": shifted}
+        )
+        original[entity_id] = old_index
+
+    async with _restore_on_failure(collection, profile_id, original):
+        await collection.update_one(
+            {"_id": entity_id}, {"$set": {"order_index": _PARKED}}, session=session
+        )
+        # i -> -(i + delta) - 2: todos por debajo de _PARKED y sin repetidos
+        await collection.update_many(
+            {"profile_id": profile_id, "order_index": shifted},
+            [
+                {
+                    "$set": {
+                        "order_index": {
+                            "$subtract": [-2, {"$add": ["$order_index", delta]}]
+                        }
+                    }
+                }
+            ],
+            session=session,
+        )
+        # -(i + delta) - 2 -> i + delta
+        await collection.update_many(
+            {"profile_id": profile_id, "order_index": {"$lt": _PARKED}},
+            [{"$set": {"order_index": {"$subtract": [-2, "$order_index"]}}}],
+            session=session,
+        )
+        await collection.update_one(
+            {"_id": entity_id}, {"$set": {"order_index": new_index}}, session=session
+        )
+
+
+async def restore_order_indexes(
+    collection: AsyncIOMotorCollection,
+    profile_id: str,
+    original: Mapping[str, int],
+) -> None:
+    """
+    Devuelve cada elemento de ``original`` (id -> order_index) a su posición.
+
+    Deshace un cambio de orden interrumpido fuera de una transacción, que
+    puede haber dejado elementos aparcados en valores negativos. Se aparcan
+    todos por debajo del menor order_index actual y después se recolocan,
+    así que nunca repiten valor aunque el cambio se cortara a medias.
+    """
+    if not original:
+        return
+    lowest = await collection.find_one(
+        {"profile_id": profile_id},
+        {"order_index": 1},
+        sort=[("order_index", ASCENDING)],
+    )
+    floor = min(lowest["order_index"], 0) - 1 if lowest else -1
+    parked = [
+        UpdateOne(
+            {"_id": entity_id, "profile_id": profile_id},
+            {"$set": {"order_index": floor - position}},
+        )
+        for position, entity_id in enumerate(original)
+    ]
+    placed = [
+        UpdateOne(
+            {"_id": entity_id, "profile_id": profile_id},
+            {"$set": {"order_index": order_index}},
+        )
+        for entity_id, order_index in original.items()
+    ]
+    await collection.bulk_write(parked + placed, ordered=True)
+
+
+async def _current_orders(
+    collection: AsyncIOMotorCollection, query: Mapping[str, Any]
+) -> dict[str, int]:
+    cursor = collection.find(query, {"order_index": 1})
+    return {doc["_id"]: doc["order_index"] for doc in await cursor.to_list(None)}
+
+
+@asynccontextmanager
+async def _restore_on_failure(
+    collection: AsyncIOMotorCollection,
+    profile_id: str,
+    original: Mapping[str, int] | None,
+) -> AsyncIterator[None]:
+    """Restaura ``original`` si el bloque falla; con ``None`` no hace nada."""
+    try:
+        yield
+    except Exception:
+        if original is not None:
+            try:
+                await restore_order_indexes(collection, profile_id, original)
+            except Exception:
+                logger.exception("No se pudo restaurar el orden de %s", profile_id)
+        raise
+
+
+def reorder_operations(profile_id: str, orders: Mapping[str, int]) -> list[UpdateOne]:
+    """
+    Operaciones de ``bulk_write`` que aplican un nuevo orden completo.
+
+    Igual que en ``move_order_index``, cada elemento pasa antes por un valor
+    negativo único (-2 - índice), de modo que un intercambio de posiciones
+    nunca deja dos documentos con el mismo order_index.
+    """
+    parked = [
+        UpdateOne(
+            {"_id": entity_id, "profile_id": profile_id},
+            {"$set": {"order_index": -2 - order_index}},
+        )
+        for entity_id, order_index in orders.items()
+    ]
+    placed = [
+        UpdateOne(
+            {"_id": entity_id, "profile_id": profile_id},
+            {"$set": {"order_index": order_index}},
+        )
+        for entity_id, order_index in orders.items()
+    ]
+    return parked + placed
+
+
+async def run_order_bulk_write(
+    collection: AsyncIOMotorCollection,
+    operations: list[UpdateOne],
+    order_values: list[int],
+    session: AsyncIOMotorClientSession | None = None,
+) -> Any:
+    """
+    Ejecuta un ``bulk_write`` ordenado que cambia order_index.
+
+    Raises:
+        BusinessRuleViolationException: Si el resultado repite un order_index
+    """
+    try:
+        return await collection.bulk_write(operations, ordered=True, session=session)
+    except BulkWriteError as e:
+        if any(
+            error.get("code") == _DUPLICATE_KEY
+            for error in e.details.get("writeErrors", [])
+        ):
+            raise BusinessRuleViolationException(
+                "orderIndex must be unique per profile", {"orderIndex": order_values}
+            ) from e
+        raise
+
+
+async def bulk_write_orders(
+    collection: AsyncIOMotorCollection,
+    profile_id: str,
+    orders: Mapping[str, int],
+    session: AsyncIOMotorClientSession | None = None,
+) -> int:
+    """
+    Aplica un nuevo orden en un único ``bulk_write`` (un solo viaje).
+
+    Un ``bulk_write`` ordenado se detiene en el primer error sin deshacer lo
+    anterior. Con ``session`` la transacción lo aborta todo; sin ella
+    (servidor standalone) se guarda antes el order_index de los elementos y,
+    si falla, ``restore_order_indexes`` devuelve a su sitio los que quedaron
+    aparcados en -2 - índice.
+
+    Returns:
+        Número de elementos del perfil encontrados
+    """
+    original = None
+    if session is None:
+        original = await _current_orders(
+            collection, {"profile_id": profile_id, "_id": {"$in": list(orders)}}
+        )
+
+    async with _restore_on_failure(collection, profile_id, original):
+        result = await run_order_bulk_write(
+            collection,
+            reorder_operations(profile_id, orders),
+            sorted(orders.values()),
+            session,
+        )
+    # Cada elemento se toca dos veces (aparcado y colocado)
+    matched: int = result.matched_count
+    return matched // 2
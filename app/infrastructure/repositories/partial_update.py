@@ -0,0 +1,45 @@
+"""
+Actualizaciones parciales: solo los campos cambiados, en un viaje.
+
+``find_one_and_update`` escribe los campos con ``$set`` y devuelve el
+documento ya actualizado, sin leerlo antes ni reescribirlo entero (al oplog
+solo llegan los campos cambiados).
+"""
+
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ReturnDocument
+
+
+def fields_update(changes: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Actualización de ``changes`` más ``updated_at``.
+
+    Un valor None borra el campo, igual que lo omite el mapper al guardar
+    la entidad completa.
+    """
+    update: dict[str, Any] = {
+        "$set": {
+            **{name: value for name, value in changes.items() if value is not None},
+            "updated_at": datetime.utcnow(),
+        }
+    }
+    cleared = {name: "" for name, value in changes.items() if value is None}
+    if cleared:
+        update["$unset"] = cleared
+    return update
+
+
+async def update_document_fields(
+    collection: AsyncIOMotorCollection, entity_id: str, changes: Mapping[str, Any]
+) -> dict[str, Any] | None:
+    """Aplica ``changes`` y devuelve el documento actualizado (None si no existe)."""
+    doc: dict[str, Any] | None = await collection.find_one_and_update(
+        {"_id": entity_id},
+        fields_update(changes),
+        return_document=ReturnDocument.AFTER,
+    )
+    return doc
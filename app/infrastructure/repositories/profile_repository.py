@@ -1,10 +1,17 @@
+from collections.abc import AsyncIterator, Mapping, Sequence
 from typing import Any
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from app.domain.entities import Profile
 from app.infrastructure.mappers import ProfileMapper
-from app.shared.interfaces.repository import IProfileRepository
+from app.shared.interfaces.content_version import IContentVersionRepository
+from app.shared.interfaces.filter_spec import FilterSpec
+from app.shared.interfaces.repository import DEFAULT_BATCH_SIZE, IProfileRepository
+
+from .filters import to_query
+from .projection import stream_projected
+from .streaming import collect
 
 
 class ProfileRepository(IProfileRepository):
@@ -12,23 +19,37 @@ class ProfileRepository(IProfileRepository):
 
     collection_name = "profiles"
 
-    def __init__(self, db: AsyncIOMotorDatabase):
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        versions: IContentVersionRepository | None = None,
+    ):
         self._db = db
         self._collection = db[self.collection_name]
         self._mapper = ProfileMapper()
+        self._versions = versions
+
+    async def _touch(self) -> None:
+        # Invalida los ETag emitidos para esta colección
+        if self._versions is not None:
+            await self._versions.bump(self.collection_name)
 
     async def add(self, entity: Profile) -> Profile:
         doc = self._mapper.to_persistence(entity)
         await self._collection.insert_one(doc)
+        await self._touch()
         return entity
 
     async def update(self, entity: Profile) -> Profile:
         doc = self._mapper.to_persistence(entity)
         await self._collection.replace_one({"_id": entity.id}, doc)
+        await self._touch()
         return entity
 
     async def delete(self, entity_id: str) -> bool:
         result = await self._collection.delete_one({"_id": entity_id})
+        if result.deleted_count > 0:
+            await self._touch()
         return result.deleted_count > 0
 
     async def get_by_id(self, entity_id: str) -> Profile | None:
@@ -57,9 +78,46 @@ class ProfileRepository(IProfileRepository):
         count = await self._collection.count_documents({"_id": entity_id})
         return count > 0
 
-    async def find_by(self, **filters: Any) -> list[Profile]:
-        docs = await self._collection.find(filters).to_list(length=100)
-        return self._mapper.to_domain_list(docs)
+    async def stream(
+        self,
+        filters: Mapping[str, Any] | None = None,
+        sort: Sequence[tuple[str, int]] | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        limit: int | None = None,
+    ) -> AsyncIterator[Profile]:
+        cursor = self._collection.find(to_query(filters or {}))
+        if sort:
+            cursor = cursor.sort(list(sort))
+        if limit:
+            cursor = cursor.limit(limit)
+        # El cursor pide los documentos por lotes de batch_size
+        async for doc in cursor.batch_size(batch_size):
+            yield self._mapper.to_domain(doc)
+
+    async def find_by(
+        self, spec: FilterSpec | None = None, /, **filters: Any
+    ) -> list[Profile]:
+        spec = (spec or FilterSpec()).and_where(**filters)
+        entities = self.stream(spec.where, spec.sort, limit=spec.limit)
+        return await collect(entities, self.max_results, self.collection_name)
+
+    async def find_views(
+        self,
+        fields: Sequence[str],
+        spec: FilterSpec | None = None,
+        /,
+        **filters: Any,
+    ) -> list[dict[str, Any]]:
+        spec = (spec or FilterSpec()).and_where(**filters)
+        docs = stream_projected(
+            self._collection,
+            to_query(spec.where),
+            fields,
+            spec.sort,
+            spec.limit,
+        )
+        views = (self._mapper.to_view(doc, fields) async for doc in docs)
+        return await collect(views, self.max_results, self.collection_name)
 
     async def get_profile(self) -> Profile | None:
         doc = await self._collection.find_one()
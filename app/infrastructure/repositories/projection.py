@@ -0,0 +1,66 @@
+"""
+Proyecciones para las vistas de lectura (``find_views``).
+
+Con una proyección MongoDB solo envía los campos pedidos: los documentos
+pesan menos en la red y hay menos BSON que decodificar. El mapper convierte
+esos documentos parciales en vistas (``IMapper.to_view``), no en entidades.
+
+``stream_views`` lee además los documentos como ``RawBSONDocument``: el
+driver no los decodifica a dict al recibirlos, y ``to_view`` renombra los
+campos (``_id`` → ``id``) en una sola pasada sobre el BSON.
+"""
+
+from collections.abc import AsyncIterator, Mapping, Sequence
+from typing import Any
+
+from bson.raw_bson import RawBSONDocument
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from app.shared.interfaces.repository import DEFAULT_BATCH_SIZE
+
+from .ranking import ranked_pipeline
+
+
+def projection(fields: Sequence[str]) -> dict[str, int]:
+    """Proyección de MongoDB con ``_id`` y los campos de ``fields``."""
+    return {"_id": 1, **{name: 1 for name in fields if name != "id"}}
+
+
+def raw_documents(collection: AsyncIOMotorCollection) -> AsyncIOMotorCollection:
+    """
+    La misma colección, devolviendo ``RawBSONDocument`` en lugar de dicts.
+
+    Conserva las demás opciones de decodificación (p. ej. ``tz_aware``), así
+    que las fechas se leen igual que en el camino normal.
+    """
+    codec_options = collection.codec_options.with_options(
+        document_class=RawBSONDocument
+    )
+    return collection.with_options(codec_options=codec_options)
+
+
+def stream_projected(
+    collection: AsyncIOMotorCollection,
+    query: Mapping[str, Any],
+    fields: Sequence[str],
+    sort: Sequence[tuple[str, int]] | None = None,
+    limit: int | None = None,
+    rank_ordering: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Documentos parciales de ``query`` con solo los campos de ``fields``.
+
+    En modo rank la proyección va al final del pipeline: el ``order_index``
+    derivado se calcula (y se ordena por él) antes de descartar campos.
+    """
+    if rank_ordering:
+        pipeline = ranked_pipeline(query, sort, limit)
+        pipeline.append({"$project": projection(fields)})
+        return collection.aggregate(pipeline, batchSize=batch_size)
+    cursor = collection.find(query, projection(fields))
+    if sort:
+        cursor = cursor.sort(list(sort))
+    if limit:
+        cursor = cursor.limit(limit)
+    return cursor.batch_size(batch_size)
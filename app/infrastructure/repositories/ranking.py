@@ -0,0 +1,368 @@
+"""
+Orden fraccional con claves de texto (estilo LexoRank).
+
+En el modo ``rank`` el orden de una colección lo decide el campo ``rank``, una
+cadena que se compara lexicográficamente. Mover un elemento solo reescribe su
+``rank`` (una clave entre la de sus nuevos vecinos), sin desplazar al resto.
+
+``order_index`` se sigue exponiendo: las lecturas reparten los valores
+guardados en el perfil, de menor a mayor, siguiendo el orden de ``rank``
+(``rank_slot_stages``). El conjunto de valores visibles es el mismo que el
+guardado, así que la unicidad se comprueba igual que en el modo ``index``.
+``rebalance_ranks`` vuelve a espaciar las claves cuando crecen demasiado y, de
+paso, materializa el orden actual en ``order_index``.
+"""
+
+import asyncio
+from collections.abc import Mapping, Sequence
+import logging
+import string
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorClientSession, AsyncIOMotorCollection
+from pymongo import UpdateOne
+
+from app.infrastructure.database.indexes import ASCENDING, IndexSpec
+
+from .ordering import run_order_bulk_write
+
+logger = logging.getLogger(__name__)
+
+# Base 36: el orden ASCII de los dígitos coincide con su valor
+RANK_ALPHABET = string.digits + string.ascii_lowercase
+_BASE = len(RANK_ALPHABET)
+
+# Longitud a partir de la cual conviene reequilibrar las claves del perfil
+MAX_RANK_LENGTH = 12
+
+# Índice de las lecturas en modo rank (no único: los documentos creados en
+# modo index no tienen rank hasta el primer reequilibrado)
+RANK_INDEX = IndexSpec(keys=(("profile_id", ASCENDING), ("rank", ASCENDING)))
+
+# Reequilibrados pendientes por (colección, perfil); evita lanzar dos a la vez
+_rebalances: dict[tuple[str, str], asyncio.Task[None]] = {}
+
+
+def rank_between(before: str | None, after: str | None) -> str:
+    """
+    Clave estrictamente entre ``before`` y ``after`` (None = sin límite).
+
+    Las claves son fracciones en base 36 sin ceros finales; la generada
+    tampoco termina en cero, así que siempre cabe otra a cada lado.
+    """
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"rank {before!r} must sort before {after!r}")
+
+    low = before or ""
+    high = after
+    digits: list[str] = []
+    position = 0
+    while True:
+        low_digit = RANK_ALPHABET.index(low[position]) if position < len(low) else 0
+        high_digit = (
+            RANK_ALPHABET.index(high[position])
+            if high is not None and position < len(high)
+            else _BASE
+        )
+        if high_digit - low_digit > 1:
+            digits.append(RANK_ALPHABET[(low_digit + high_digit) // 2])
+            return "".join(digits)
+        digits.append(RANK_ALPHABET[low_digit])
+        if high_digit > low_digit:
+            # El prefijo ya es menor que after: deja de acotar por arriba
+            high = None
+        position += 1
+
+
+def spread_ranks(count: int) -> list[str]:
+    """``count`` claves crecientes, repartidas con hueco entre cada par."""
+    width = 1
+    while _BASE**width <= count:
+        width += 1
+    # Un dígito más deja sitio para muchas inserciones antes de reequilibrar
+    width += 1
+    step = _BASE**width // (count + 1)
+
+    ranks = []
+    for i in range(1, count + 1):
+        value = i * step
+        digits = []
+        for _ in range(width):
+            value, digit = divmod(value, _BASE)
+            digits.append(RANK_ALPHABET[digit])
+        ranks.append("".join(reversed(digits)).rstrip("0"))
+    return ranks
+
+
+def needs_rebalance(rank: str, max_length: int = MAX_RANK_LENGTH) -> bool:
+    return len(rank) > max_length
+
+
+def rank_slot_stages() -> list[dict[str, Any]]:
+    """
+    Etapas de agregación que recalculan ``order_index`` a partir de ``rank``.
+
+    Por perfil, el documento n-ésimo según ``rank`` recibe el n-ésimo menor
+    ``order_index`` guardado. Requiere MongoDB 5.0+ (``$setWindowFields``).
+    """
+    return [
+        {
+            "$setWindowFields": {
+                "partitionBy": "$profile_id",
+                "sortBy": {"order_index": 1},
+                "output": {
+                    "_slots": {
+                        "$push": "$order_index",
+                        "window": {"documents": ["unbounded", "unbounded"]},
+                    }
+                },
+            }
+        },
+        {
+            "$setWindowFields": {
+                "partitionBy": "$profile_id",
+                "sortBy": {"rank": 1},
+                "output": {"_position": {"$documentNumber": {}}},
+            }
+        },
+        {
+            "$set": {
+                "order_index": {
+                    "$arrayElemAt": ["$_slots", {"$subtract": ["$_position", 1]}]
+                }
+            }
+        },
+        {"$unset": ["_slots", "_position"]},
+    ]
+
+
+def ranked_pipeline(
+    filters: Mapping[str, Any],
+    sort: Sequence[tuple[str, int]] | None = None,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Consulta ``filters`` con el ``order_index`` derivado del orden por rank.
+
+    El filtro se aplica después de recalcular: así un subconjunto (p. ej. una
+    categoría) conserva los valores que tiene en el perfil completo.
+    """
+    scope = {"profile_id": filters["profile_id"]} if "profile_id" in filters else {}
+    pipeline = [{"$match": scope}, *rank_slot_stages(), {"$match": dict(filters)}]
+    if sort:
+        pipeline.append({"$sort": dict(sort)})
+    if limit:
+        pipeline.append({"$limit": limit})
+    return pipeline
+
+
+async def ranked_document(
+    collection: AsyncIOMotorCollection, doc: Mapping[str, Any]
+) -> dict[str, Any]:
+    """
+    ``doc`` con el ``order_index`` derivado del orden por rank.
+
+    Las lecturas de un solo documento (por id, por nombre, tras una
+    actualización parcial) devuelven así la misma posición que las listas.
+    """
+    cursor = collection.aggregate(
+        ranked_pipeline({"profile_id": doc["profile_id"], "_id": doc["_id"]})
+    )
+    docs = await cursor.to_list(length=1)
+    # Borrado entre las dos lecturas: se devuelve el leído
+    ranked: dict[str, Any] = docs[0] if docs else dict(doc)
+    return ranked
+
+
+def keep_ordering(doc: Mapping[str, Any]) -> list[dict[str, Any]]:
+    """
+    Actualización que sustituye el documento conservando su rank y su orden.
+
+    En modo rank el orden solo lo cambian las operaciones de ordenación; el
+    ``order_index`` de una entidad leída puede ser el derivado, no el guardado.
+    """
+    return [
+        {
+            "$replaceWith": {
+                "$mergeObjects": [
+                    {"$literal": dict(doc)},
+                    {"rank": "$rank", "order_index": "$order_index"},
+                ]
+            }
+        }
+    ]
+
+
+async def _neighbour_ranks(
+    collection: AsyncIOMotorCollection,
+    query: dict[str, Any],
+    position: int,
+) -> tuple[str | None, str | None]:
+    """Ranks de los documentos en ``position - 1`` y ``position``."""
+    cursor = (
+        collection.find(query, {"rank": 1})
+        .sort("rank", 1)
+        .skip(max(position - 1, 0))
+        .limit(2 if position > 0 else 1)
+    )
+    docs = await cursor.to_list(length=2)
+    if position > 0 and not docs:
+        # Más allá del final: el vecino anterior es el último
+        cursor = collection.find(query, {"rank": 1}).sort("rank", -1).limit(1)
+        docs = await cursor.to_list(length=1)
+        return (docs[0].get("rank") if docs else None), None
+    ranks = [doc.get("rank") for doc in docs]
+    if position == 0:
+        return None, ranks[0] if ranks else None
+    before = ranks[0] if ranks else None
+    after = ranks[1] if len(ranks) > 1 else None
+    return before, after
+
+
+async def insert_rank(
+    collection: AsyncIOMotorCollection, profile_id: str, order_index: int
+) -> str:
+    """Rank para un elemento nuevo que ocupará ``order_index``."""
+    position = await collection.count_documents(
+        {"profile_id": profile_id, "order_index": {"$lt": order_index}}
+    )
+    before, after = await _neighbour_ranks(
+        collection, {"profile_id": profile_id}, position
+    )
+    return rank_between(before, after)
+
+
+async def move_rank(
+    collection: AsyncIOMotorCollection,
+    profile_id: str,
+    entity_id: str,
+    new_order_index: int,
+) -> str | None:
+    """
+    Mueve un elemento a la posición de ``new_order_index`` reescribiendo solo
+    su rank: dos lecturas pequeñas y una única escritura.
+
+    Returns:
+        El nuevo rank, o None si el elemento no existe en el perfil
+    """
+    # Posición final = cuántos valores del perfil quedan por delante
+    position = await collection.count_documents(
+        {"profile_id": profile_id, "order_index": {"$lt": new_order_index}}
+    )
+    before, after = await _neighbour_ranks(
+        collection, {"profile_id": profile_id, "_id": {"$ne": entity_id}}, position
+    )
+    rank = rank_between(before, after)
+    result = await collection.update_one(
+        {"_id": entity_id, "profile_id": profile_id}, {"$set": {"rank": rank}}
+    )
+    return rank if result.matched_count else None
+
+
+def _plan(
+    docs: list[dict[str, Any]],
+    orders: Mapping[str, int] | None,
+    seed: bool,
+) -> list[UpdateOne]:
+    """Operaciones que dejan ranks espaciados y order_index materializado."""
+    if seed:
+        current = sorted(docs, key=lambda d: d["order_index"])
+    else:
+        # Sin rank (creados en modo index) van primero, como en las lecturas
+        current = sorted(docs, key=lambda d: (d.get("rank") or "", d["order_index"]))
+    slots = sorted(doc["order_index"] for doc in docs)
+    visible = {doc["_id"]: slot for doc, slot in zip(current, slots, strict=True)}
+    visible.update({k: v for k, v in (orders or {}).items() if k in visible})
+
+    final = sorted(current, key=lambda d: visible[d["_id"]])
+    parked, placed = [], []
+    for doc, rank in zip(final, spread_ranks(len(final)), strict=True):
+        order_index = visible[doc["_id"]]
+        changes: dict[str, Any] = {}
+        if doc.get("rank") != rank:
+            changes["rank"] = rank
+        if doc["order_index"] != order_index:
+            changes["order_index"] = order_index
+            # Igual que en ordering: paso previo por un negativo único
+            parked.append(
+                UpdateOne(
+                    {"_id": doc["_id"]}, {"$set": {"order_index": -2 - order_index}}
+                )
+            )
+        if changes:
+            placed.append(UpdateOne({"_id": doc["_id"]}, {"$set": changes}))
+    return parked + placed
+
+
+async def _apply(
+    collection: AsyncIOMotorCollection,
+    profile_id: str,
+    orders: Mapping[str, int] | None,
+    seed: bool,
+    session: AsyncIOMotorClientSession | None,
+) -> tuple[list[dict[str, Any]], int]:
+    cursor = collection.find(
+        {"profile_id": profile_id}, {"rank": 1, "order_index": 1}, session=session
+    )
+    docs = await cursor.to_list(length=None)
+    operations = _plan(docs, orders, seed)
+    if operations:
+        await run_order_bulk_write(
+            collection, operations, sorted((orders or {}).values()), session
+        )
+    return docs, len(operations)
+
+
+async def rebalance_ranks(
+    collection: AsyncIOMotorCollection,
+    profile_id: str,
+    seed: bool = False,
+    session: AsyncIOMotorClientSession | None = None,
+) -> int:
+    """
+    Reparte de nuevo las claves del perfil y materializa su orden en
+    ``order_index``, en un único ``bulk_write``.
+
+    Con ``seed`` el orden de partida es ``order_index`` en lugar de ``rank``
+    (al activar el modo rank o volver a él tras usar el modo index).
+
+    Returns:
+        Número de operaciones escritas
+    """
+    _, written = await _apply(collection, profile_id, None, seed, session)
+    return written
+
+
+async def reorder_ranks(
+    collection: AsyncIOMotorCollection,
+    profile_id: str,
+    orders: Mapping[str, int],
+    session: AsyncIOMotorClientSession | None = None,
+) -> int:
+    """
+    Aplica un orden completo en modo rank: un reequilibrado en el que los
+    elementos de ``orders`` toman el order_index indicado.
+
+    Returns:
+        Número de elementos de ``orders`` encontrados en el perfil
+    """
+    docs, _ = await _apply(collection, profile_id, orders, False, session)
+    found = {doc["_id"] for doc in docs}
+    return sum(1 for entity_id in orders if entity_id in found)
+
+
+def schedule_rebalance(collection: AsyncIOMotorCollection, profile_id: str) -> None:
+    """Reequilibra el perfil en segundo plano, sin bloquear la petición."""
+    key = (collection.name, profile_id)
+    if key in _rebalances:
+        return
+
+    async def run() -> None:
+        try:
+            await rebalance_ranks(collection, profile_id)
+        except Exception:
+            logger.exception("Error reequilibrando %s/%s", *key)
+        finally:
+            _rebalances.pop(key, None)
+
+    _rebalances[key] = asyncio.create_task(run())
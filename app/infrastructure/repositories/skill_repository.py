@@ -1,40 +1,153 @@
+from collections.abc import AsyncIterator, Mapping, Sequence
 from typing import Any
 
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from motor.motor_asyncio import (
+    AsyncIOMotorCommandCursor,
+    AsyncIOMotorCursor,
+    AsyncIOMotorDatabase,
+)
+from pymongo.errors import DuplicateKeyError
 
 from app.domain.entities import Skill
+from app.infrastructure.database.errors import translate_duplicate_key
+from app.infrastructure.database.indexes import (
+    ASCENDING,
+    CASE_INSENSITIVE,
+    IndexSpec,
+)
+from app.infrastructure.database.transactions import optional_transaction
 from app.infrastructure.mappers import SkillMapper
-from app.shared.interfaces.repository import IOrderedRepository, IUniqueNameRepository
+from app.shared.interfaces.content_version import IContentVersionRepository
+from app.shared.interfaces.filter_spec import FilterSpec
+from app.shared.interfaces.repository import (
+    DEFAULT_BATCH_SIZE,
+    IGroupableRepository,
+    IOrderedRepository,
+    IUniqueNameRepository,
+)
 
+from .filters import to_query
+from .grouping import count_documents_by, group_documents
+from .ordering import bulk_write_orders, move_order_index
+from .partial_update import update_document_fields
+from .projection import raw_documents, stream_projected
+from .ranking import (
+    insert_rank,
+    keep_ordering,
+    move_rank,
+    needs_rebalance,
+    ranked_document,
+    ranked_pipeline,
+    reorder_ranks,
+    schedule_rebalance,
+)
+from .streaming import collect
 
-class SkillRepository(IUniqueNameRepository[Skill], IOrderedRepository[Skill]):
+
+class SkillRepository(
+    IUniqueNameRepository[Skill], IOrderedRepository[Skill], IGroupableRepository[Skill]
+):
     """Concrete implementation of Skill repository using MongoDB."""
 
     collection_name = "skills"
 
-    def __init__(self, db: AsyncIOMotorDatabase):
+    # Índices que necesitan las consultas de este repositorio
+    indexes = (
+        IndexSpec(
+            keys=(("profile_id", ASCENDING), ("order_index", ASCENDING)),
+            unique=True,
+        ),
+        # Filtro ?level=
+        IndexSpec(keys=(("profile_id", ASCENDING), ("level", ASCENDING))),
+        IndexSpec(
+            keys=(("profile_id", ASCENDING), ("name", ASCENDING)),
+            unique=True,
+            collation=CASE_INSENSITIVE,
+        ),
+    )
+
+    # Campos que lee el mapper; son los únicos que viajan en las agrupaciones
+    group_projection = (
+        "profile_id",
+        "name",
+        "category",
+        "order_index",
+        "level",
+        "created_at",
+        "updated_at",
+    )
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        versions: IContentVersionRepository | None = None,
+        rank_ordering: bool = False,
+    ):
         self._db = db
         self._collection = db[self.collection_name]
         self._mapper = SkillMapper()
+        self._versions = versions
+        # Modo rank: el orden lo decide el campo rank (ver ranking.py)
+        self._rank_ordering = rank_ordering
+
+    async def _touch(self) -> None:
+        # Invalida los ETag emitidos para esta colección
+        if self._versions is not None:
+            await self._versions.bump(self.collection_name)
 
     async def add(self, entity: Skill) -> Skill:
         doc = self._mapper.to_persistence(entity)
-        await self._collection.insert_one(doc)
+        if self._rank_ordering:
+            doc["rank"] = await insert_rank(
+                self._collection, entity.profile_id, entity.order_index
+            )
+        try:
+            await self._collection.insert_one(doc)
+        except DuplicateKeyError as e:
+            raise translate_duplicate_key(e, "Skill", doc) from e
+        await self._touch()
         return entity
 
     async def update(self, entity: Skill) -> Skill:
         doc = self._mapper.to_persistence(entity)
-        await self._collection.replace_one({"_id": entity.id}, doc)
+        try:
+            if self._rank_ordering:
+                await self._collection.update_one(
+                    {"_id": entity.id}, keep_ordering(doc)
+                )
+            else:
+                await self._collection.replace_one({"_id": entity.id}, doc)
+        except DuplicateKeyError as e:
+            raise translate_duplicate_key(e, "Skill", doc) from e
+        await self._touch()
         return entity
 
+    async def update_fields(
+        self, entity_id: str, changes: Mapping[str, Any]
+    ) -> Skill | None:
+        try:
+            doc = await update_document_fields(self._collection, entity_id, changes)
+        except DuplicateKeyError as e:
+            raise translate_duplicate_key(e, "Skill", dict(changes)) from e
+        if doc is None:
+            return None
+        await self._touch()
+        if self._rank_ordering:
+            doc = await ranked_document(self._collection, doc)
+        return self._mapper.to_domain(doc)
+
     async def delete(self, entity_id: str) -> bool:
         result = await self._collection.delete_one({"_id": entity_id})
+        if result.deleted_count > 0:
+            await self._touch()
         return result.deleted_count > 0
 
     async def get_by_id(self, entity_id: str) -> Skill | None:
         doc = await self._collection.find_one({"_id": entity_id})
         if doc is None:
             return None
+        if self._rank_ordering:
+            doc = await ranked_document(self._collection, doc)
         return self._mapper.to_domain(doc)
 
     async def list_all(
@@ -57,28 +170,107 @@ class SkillRepository(IUniqueNameRepository[Skill], IOrderedRepository[Skill]):
         count = await self._collection.count_documents({"_id": entity_id})
         return count > 0
 
-    async def find_by(self, **filters: Any) -> list[Skill]:
-        docs = await self._collection.find(filters).to_list(length=100)
-        return self._mapper.to_domain_list(docs)
+    async def stream(
+        self,
+        filters: Mapping[str, Any] | None = None,
+        sort: Sequence[tuple[str, int]] | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        limit: int | None = None,
+    ) -> AsyncIterator[Skill]:
+        query = to_query(filters or {})
+        cursor: AsyncIOMotorCursor | AsyncIOMotorCommandCursor
+        if self._rank_ordering:
+            cursor = self._collection.aggregate(
+                ranked_pipeline(query, sort, limit), batchSize=batch_size
+            )
+        else:
+            cursor = self._collection.find(query)
+            if sort:
+                cursor = cursor.sort(list(sort))
+            if limit:
+                cursor = cursor.limit(limit)
+            cursor.batch_size(batch_size)
+        # El cursor pide los documentos por lotes de batch_size
+        async for doc in cursor:
+            yield self._mapper.to_domain(doc)
+
+    async def find_by(
+        self, spec: FilterSpec | None = None, /, **filters: Any
+    ) -> list[Skill]:
+        spec = (spec or FilterSpec()).and_where(**filters)
+        entities = self.stream(spec.where, spec.sort, limit=spec.limit)
+        return await collect(entities, self.max_results, self.collection_name)
+
+    async def find_views(
+        self,
+        fields: Sequence[str],
+        spec: FilterSpec | None = None,
+        /,
+        **filters: Any,
+    ) -> list[dict[str, Any]]:
+        spec = (spec or FilterSpec()).and_where(**filters)
+        docs = stream_projected(
+            self._collection,
+            to_query(spec.where),
+            fields,
+            spec.sort,
+            spec.limit,
+            self._rank_ordering,
+        )
+        views = (self._mapper.to_view(doc, fields) async for doc in docs)
+        return await collect(views, self.max_results, self.collection_name)
+
+    async def stream_views(
+        self,
+        fields: Sequence[str],
+        spec: FilterSpec | None = None,
+        /,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **filters: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        spec = (spec or FilterSpec()).and_where(**filters)
+        # Documentos sin decodificar: to_view lee del BSON solo lo proyectado
+        docs = stream_projected(
+            raw_documents(self._collection),
+            to_query(spec.where),
+            fields,
+            spec.sort,
+            spec.limit,
+            self._rank_ordering,
+            batch_size,
+        )
+        async for doc in docs:
+            yield self._mapper.to_view(doc, fields)
 
     async def exists_by_name(self, profile_id: str, name: str) -> bool:
         count = await self._collection.count_documents(
-            {"profile_id": profile_id, "name": name}
+            {"profile_id": profile_id, "name": name}, collation=CASE_INSENSITIVE
         )
         return count > 0
 
     async def get_by_name(self, profile_id: str, name: str) -> Skill | None:
-        doc = await self._collection.find_one({"profile_id": profile_id, "name": name})
+        doc = await self._collection.find_one(
+            {"profile_id": profile_id, "name": name}, collation=CASE_INSENSITIVE
+        )
         if doc is None:
             return None
+        if self._rank_ordering:
+            doc = await ranked_document(self._collection, doc)
         return self._mapper.to_domain(doc)
 
     async def get_by_order_index(
         self, profile_id: str, order_index: int
     ) -> Skill | None:
-        doc = await self._collection.find_one(
-            {"profile_id": profile_id, "order_index": order_index}
-        )
+        if self._rank_ordering:
+            cursor = self._collection.aggregate(
+                ranked_pipeline({"profile_id": profile_id, "order_index": order_index})
+            )
+            docs = await cursor.to_list(length=1)
+            doc = docs[0] if docs else None
+        else:
+            doc = await self._collection.find_one(
+                {"profile_id": profile_id, "order_index": order_index}
+            )
         if doc is None:
             return None
         return self._mapper.to_domain(doc)
@@ -86,15 +278,27 @@ class SkillRepository(IUniqueNameRepository[Skill], IOrderedRepository[Skill]):
     async def get_all_ordered(
         self, profile_id: str, ascending: bool = True
     ) -> list[Skill]:
-        cursor = self._collection.find({"profile_id": profile_id}).sort(
-            "order_index", 1 if ascending else -1
+        entities = self.stream(
+            {"profile_id": profile_id},
+            sort=[("order_index", 1 if ascending else -1)],
         )
-        docs = await cursor.to_list(length=100)
-        return self._mapper.to_domain_list(docs)
+        return await collect(entities, self.max_results, self.collection_name)
 
     async def reorder(
         self, profile_id: str, entity_id: str, new_order_index: int
     ) -> None:
+        if self._rank_ordering:
+            # Solo se reescribe el elemento movido
+            rank = await move_rank(
+                self._collection, profile_id, entity_id, new_order_index
+            )
+            if rank is None:
+                return
+            if needs_rebalance(rank):
+                schedule_rebalance(self._collection, profile_id)
+            await self._touch()
+            return
+
         entity = await self.get_by_id(entity_id)
         if entity is None:
             return
@@ -104,23 +308,39 @@ class SkillRepository(IUniqueNameRepository[Skill], IOrderedRepository[Skill]):
         if old_index == new_order_index:
             return
 
-        if old_index < new_order_index:
-            await self._collection.update_many(
-                {
-                    "profile_id": profile_id,
-                    "order_index": {"$gt": old_index, "$lte": new_order_index},
-                },
-                {"$inc": {"order_index": -1}},
-            )
-        else:
-            await self._collection.update_many(
-                {
-                    "profile_id": profile_id,
-                    "order_index": {"$gte": new_order_index, "$lt": old_index},
-                },
-                {"$inc": {"order_index": 1}},
+        async with optional_transaction(self._db) as session:
+            await move_order_index(
+                self._collection,
+                profile_id,
+                entity_id,
+                old_index,
+                new_order_index,
+                session,
             )
+        await self._touch()
+
+    async def bulk_reorder(self, profile_id: str, orders: Mapping[str, int]) -> int:
+        reorder = reorder_ranks if self._rank_ordering else bulk_write_orders
+        async with optional_transaction(self._db) as session:
+            found = await reorder(self._collection, profile_id, orders, session)
+        await self._touch()
+        return found
+
+    async def group_by(self, profile_id: str, field: str) -> dict[Any, list[Skill]]:
+        groups = await group_documents(
+            self._collection,
+            {"profile_id": profile_id},
+            field,
+            self.group_projection,
+            self._rank_ordering,
+        )
+        return {
+            value: self._mapper.to_domain_list(docs) for value, docs in groups.items()
+        }
 
-        await self._collection.update_one(
-            {"_id": entity_id}, {"$set": {"order_index": new_order_index}}
+    async def count_by(
+        self, profile_id: str, fields: Sequence[str]
+    ) -> dict[str, dict[Any, int]]:
+        return await count_documents_by(
+            self._collection, {"profile_id": profile_id}, fields
         )
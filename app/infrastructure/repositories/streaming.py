@@ -0,0 +1,42 @@
+"""
+Utilidades para recorrer cursores de MongoDB por lotes.
+
+``stream`` (ver ``IRepository``) produce entidades a medida que llegan los
+lotes del cursor; ``collect`` lo convierte en lista con un máximo explícito
+para los métodos que devuelven ``list``.
+"""
+
+from collections.abc import AsyncIterator
+import logging
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+async def collect(entities: AsyncIterator[T], maximum: int, source: str) -> list[T]:
+    """
+    Materializa ``entities`` hasta ``maximum`` elementos.
+
+    Si quedan más, deja de leer el cursor y lo registra como aviso en lugar
+    de truncar en silencio. Los generadores se cierran siempre (``aclose``),
+    lo que libera su cursor aunque no se haya agotado.
+    """
+    items: list[T] = []
+    try:
+        async for entity in entities:
+            if len(items) == maximum:
+                logger.warning(
+                    "Resultado de %s truncado a %d elementos; usa stream() "
+                    "para recorrerlo completo",
+                    source,
+                    maximum,
+                )
+                break
+            items.append(entity)
+    finally:
+        aclose = getattr(entities, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    return items
@@ -5,9 +5,16 @@ from fastapi import FastAPI
 
 from app.api.exception_handlers import register_exception_handlers
 from app.api.middleware import setup_middleware
+from app.api.responses import FastJSONResponse
 from app.api.v1.router import api_v1_router
 from app.config.settings import settings
-from app.infrastructure.database.mongo_client import MongoDBClient
+from app.infrastructure.database import (
+    MongoDBClient,
+    log_index_reports,
+    reconcile_indexes,
+    require_unique_indexes,
+)
+from app.infrastructure.repositories import build_index_registry
 
 # Configurar logging
 logging.basicConfig(
@@ -29,6 +36,10 @@ async def lifespan(_app: FastAPI):
     # Conectar a MongoDB
     await MongoDBClient.connect()
 
+    # Crear los índices que faltan (mongo-init.js solo se ejecuta en desarrollo)
+    # o, con MONGODB_ENSURE_INDEXES=false, comprobar que existen
+    await ensure_indexes()
+
     yield  # Aquí la aplicación está corriendo
 
     # Shutdown
@@ -37,6 +48,26 @@ async def lifespan(_app: FastAPI):
     logger.info("✓ Aplicación detenida")
 
 
+async def ensure_indexes() -> None:
+    """
+    Reconcilia los índices declarados por los repositorios con los existentes.
+
+    Con MONGODB_ENSURE_INDEXES=false (o en dry-run) solo se comprueban, sin
+    crearlos: entonces scripts/reconcile_indexes.py es un paso obligatorio
+    del despliegue. Si falta un índice único, o no se pueden comprobar, la
+    aplicación no arranca: las reglas de unicidad dependen de ellos. Los
+    demás solo se registran; sin ellos la API funciona, solo más lenta.
+    """
+    dry_run = settings.MONGODB_INDEXES_DRY_RUN or not settings.MONGODB_ENSURE_INDEXES
+    reports = await reconcile_indexes(
+        MongoDBClient.get_db(),
+        build_index_registry(settings.rank_ordering),
+        dry_run=dry_run,
+    )
+    log_index_reports(reports, dry_run=dry_run)
+    require_unique_indexes(reports)
+
+
 # Crear aplicación FastAPI
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -46,6 +77,8 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    # Respuestas JSON con orjson (también las de los exception handlers)
+    default_response_class=FastJSONResponse,
 )
 
 # Configurar middlewares
@@ -19,9 +19,21 @@ The domain and application layers depend on these interfaces,
 while the infrastructure layer provides concrete implementations.
 """
 
+# Contact message counters interface
+from .contact_message_stats import IContactMessageStatsRepository
+
+# Content version interface
+from .content_version import ContentVersion, IContentVersionRepository
+
+# CV change notification interface
+from .cv_change_listener import ICVChangeListener
+
 # Email service interface
 from .email_service import EmailMessage, IEmailService
 
+# Filter specification
+from .filter_spec import Contains, FilterSpec, In, Not, Prefix, Range
+
 # Mapper interfaces
 from .mapper import IDTOMapper, IMapper, IValueObjectMapper
 
@@ -33,6 +45,9 @@ from .repository import (
     ContactMessageRepository,
     EducationRepository,
     IContactMessageRepository,
+    ICVRepository,
+    ICVSnapshotRepository,
+    IGroupableRepository,
     IOrderedRepository,
     IProfileRepository,
     IRepository,
@@ -55,13 +70,30 @@ __all__ = [
     # Email service interface
     "IEmailService",
     "EmailMessage",
+    # Contact message counters interface
+    "IContactMessageStatsRepository",
+    # Content version interface
+    "IContentVersionRepository",
+    "ContentVersion",
+    # CV change notification interface
+    "ICVChangeListener",
+    # Filter specification
+    "FilterSpec",
+    "In",
+    "Range",
+    "Prefix",
+    "Contains",
+    "Not",
     # Repository interfaces
     "IRepository",
     "IProfileRepository",
     "IOrderedRepository",
     "IContactMessageRepository",
     "IUniqueNameRepository",
+    "IGroupableRepository",
     "ISocialNetworkRepository",
+    "ICVRepository",
+    "ICVSnapshotRepository",
     # Repository type aliases
     "ProfileRepository",
     "WorkExperienceRepository",
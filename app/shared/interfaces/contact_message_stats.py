@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+
+class IContactMessageStatsRepository(ABC):
+    """
+    Pre-aggregated message counters, one bucket per (UTC) day.
+
+    Kept up to date by the contact message use cases so that statistics
+    cost O(days) instead of O(messages).
+    """
+
+    @abstractmethod
+    async def increment(self, day: date, amount: int = 1) -> None:
+        """Add ``amount`` (negative on deletion) to the bucket of ``day``."""
+        ...
+
+    @abstractmethod
+    async def get_daily_counts(self, since: date) -> dict[date, int]:
+        """Counts per day from ``since`` (inclusive); empty days are omitted."""
+        ...
+
+    @abstractmethod
+    async def get_total(self) -> int: ...
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class ContentVersion:
+    """Monotonic write counter of a collection, used for HTTP validators."""
+
+    version: int = 0
+    updated_at: datetime | None = None
+
+
+class IContentVersionRepository(ABC):
+    @abstractmethod
+    async def bump(self, scope: str) -> None: ...
+
+    @abstractmethod
+    async def get_versions(self, scopes: Sequence[str]) -> dict[str, ContentVersion]:
+        """Versions of ``scopes``; never-written scopes map to version 0."""
+        ...
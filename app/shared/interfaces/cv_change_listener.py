@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class ICVChangeListener(ABC):
+    """
+    Notified by command use cases after a CV section has been written.
+
+    ``section`` uses the field names of the complete CV response
+    (``profile``, ``contact_info``, ``skills``, ``work_experiences``, ...).
+    """
+
+    @abstractmethod
+    async def section_changed(self, section: str) -> None: ...
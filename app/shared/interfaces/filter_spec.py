@@ -0,0 +1,92 @@
+"""
+Filter Specification (Port).
+
+Typed description of a repository query: which entities match, in which
+order and how many. Repositories translate it into their own query language
+so filtering happens in the data store, not after fetching everything.
+
+Conditions are values in ``FilterSpec.where``. A plain value means equality
+(``None`` also matches entities where the field is missing); the classes
+below cover the other operators.
+
+Example:
+    spec = FilterSpec(
+        where={"profile_id": pid, "expiry_date": Range(lt=now)},
+        sort=(("order_index", 1),),
+        limit=10,
+    )
+    expired = await repo.find_by(spec)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+
+@dataclass(frozen=True)
+class In:
+    """The field equals any of ``values``."""
+
+    values: tuple[Any, ...]
+
+    def __post_init__(self) -> None:
+        # Accept any iterable, keep it hashable
+        object.__setattr__(self, "values", tuple(self.values))
+
+
+@dataclass(frozen=True)
+class Range:
+    """The field lies within the given bounds (None = unbounded)."""
+
+    gt: Any = None
+    gte: Any = None
+    lt: Any = None
+    lte: Any = None
+
+    def __post_init__(self) -> None:
+        if all(bound is None for bound in (self.gt, self.gte, self.lt, self.lte)):
+            raise ValueError("Range needs at least one bound")
+
+
+@dataclass(frozen=True)
+class Prefix:
+    """The field starts with ``text``."""
+
+    text: str
+    ignore_case: bool = False
+
+
+@dataclass(frozen=True)
+class Contains:
+    """The field contains ``text`` (case-insensitive by default)."""
+
+    text: str
+    ignore_case: bool = True
+
+
+@dataclass(frozen=True)
+class Not:
+    """The field does not satisfy ``condition`` (missing fields included)."""
+
+    condition: In | Range | Prefix | Contains
+
+
+@dataclass(frozen=True)
+class FilterSpec:
+    """Conditions by field (all must hold), plus optional sort and limit."""
+
+    where: Mapping[str, Any] = field(default_factory=dict)
+    sort: tuple[tuple[str, int], ...] = ()  # (field, 1 | -1) pairs
+    limit: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.limit is not None and self.limit < 1:
+            raise ValueError("limit must be positive")
+
+    def and_where(self, **conditions: Any) -> FilterSpec:
+        """Return a copy with extra conditions (replacing same-field ones)."""
+        if not conditions:
+            return self
+        return replace(self, where={**self.where, **conditions})
@@ -17,7 +17,9 @@ Key Principles:
 """
 
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from collections.abc import Mapping, Sequence
+from copy import copy
+from typing import Any, ClassVar, Generic, TypeVar
 
 # Generic types for domain and persistence models
 TDomain = TypeVar("TDomain")
@@ -62,6 +64,9 @@ class IMapper(ABC, Generic[TDomain, TPersistence]):
         - Mappers should handle nested objects and collections
     """
 
+    # Values of optional fields the stored documents may omit (see to_view)
+    view_defaults: ClassVar[Mapping[str, Any]] = {}
+
     @abstractmethod
     def to_domain(self, persistence_model: TPersistence) -> TDomain:
         """
@@ -106,6 +111,40 @@ class IMapper(ABC, Generic[TDomain, TPersistence]):
         """
         pass
 
+    def to_view(
+        self, persistence_model: Mapping[str, Any], fields: Sequence[str]
+    ) -> dict[str, Any]:
+        """
+        Convert a partial document into a read view with only ``fields``.
+
+        Args:
+            persistence_model: Document loaded with a projection of ``fields``
+            fields: Entity field names to include (``id`` is always included)
+
+        Returns:
+            Plain dict keyed by entity field name
+
+        Notes:
+            - Does not build the domain entity: a partial document would
+              fail its validation, and read views never go back to storage
+            - Fields missing from the document take ``view_defaults`` or None
+            - Default implementation assumes document keys equal entity
+              field names, with ``_id`` as ``id``
+
+        Examples:
+            view = mapper.to_view(doc, ("name", "level"))
+        """
+        view: dict[str, Any] = {"id": str(persistence_model["_id"])}
+        for name in fields:
+            if name == "id":
+                continue
+            if name in persistence_model:
+                view[name] = persistence_model[name]
+            else:
+                # Copy, so views never share a mutable default
+                view[name] = copy(self.view_defaults.get(name))
+        return view
+
     def to_domain_list(self, persistence_models: list[TPersistence]) -> list[TDomain]:
         """
         Convert a list of persistence models to domain entities.
@@ -17,8 +17,12 @@ Key Principles:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Mapping, Sequence
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
+from app.shared.interfaces.filter_spec import FilterSpec
+
 # Import entities only for type checking to avoid circular imports
 if TYPE_CHECKING:
     from app.domain.entities import (
@@ -40,6 +44,12 @@ if TYPE_CHECKING:
 # Generic type representing any domain entity
 T = TypeVar("T")
 
+# Documents fetched per round trip when streaming
+DEFAULT_BATCH_SIZE = 100
+
+# Upper bound for methods that return a list (find_by, get_all_ordered, ...)
+MAX_LIST_RESULTS = 1000
+
 
 class IRepository(ABC, Generic[T]):
     """
@@ -66,8 +76,13 @@ class IRepository(ABC, Generic[T]):
         - All methods are async to support async database drivers (Motor for MongoDB)
         - Methods should raise domain exceptions on failure
         - Implementations handle mapping between domain entities and persistence models
+        - List-returning methods stop at ``max_results`` and log when they do;
+          use ``stream`` to walk result sets of any size
     """
 
+    # Explicit cap for list-returning methods (override per repository/instance)
+    max_results: int = MAX_LIST_RESULTS
+
     @abstractmethod
     async def add(self, entity: T) -> T:
         """
@@ -80,7 +95,8 @@ class IRepository(ABC, Generic[T]):
             The persisted entity (may include generated fields like timestamps)
 
         Raises:
-            DuplicateValueError: If entity with same unique constraint already exists
+            DuplicateException: If entity with same unique name already exists
+            BusinessRuleViolationException: If its orderIndex is already taken
             DomainError: For other business rule violations
 
         Notes:
@@ -104,6 +120,7 @@ class IRepository(ABC, Generic[T]):
 
         Raises:
             NotFoundException: If entity with given ID doesn't exist
+            DuplicateException: If the change collides with a unique name
             DomainError: For business rule violations
 
         Notes:
@@ -114,6 +131,36 @@ class IRepository(ABC, Generic[T]):
         """
         pass
 
+    async def update_fields(
+        self, entity_id: str, changes: Mapping[str, Any]
+    ) -> T | None:
+        """
+        Write some fields of an entity without loading it first.
+
+        Args:
+            entity_id: The unique identifier of the entity
+            changes: New value of each changed field, already validated
+                (see PartialUpdateMixin.validate_changes); None clears it
+
+        Returns:
+            The updated entity, or None if not found
+
+        Raises:
+            DuplicateException: If the change collides with a unique name
+
+        Notes:
+            - Should update updated_at timestamp
+            - Default implementation loads the entity and calls ``update``;
+              implementations should write only the changed fields in one
+              round trip
+        """
+        entity = await self.get_by_id(entity_id)
+        if entity is None:
+            return None
+        for name, value in {**changes, "updated_at": datetime.utcnow()}.items():
+            setattr(entity, name, value)
+        return await self.update(entity)
+
     @abstractmethod
     async def delete(self, entity_id: str) -> bool:
         """
@@ -213,30 +260,135 @@ class IRepository(ABC, Generic[T]):
         pass
 
     @abstractmethod
-    async def find_by(self, **filters) -> list[T]:
+    def stream(
+        self,
+        filters: Mapping[str, Any] | None = None,
+        sort: Sequence[tuple[str, int]] | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        limit: int | None = None,
+    ) -> AsyncIterator[T]:
         """
-        Find entities matching specified filters.
+        Iterate over the entities matching ``filters`` without loading them all.
 
         Args:
-            **filters: Arbitrary keyword arguments representing field:value filters
+            filters: Optional conditions by field (same as ``FilterSpec.where``)
+            sort: Optional (field, direction) pairs, direction 1 or -1
+            batch_size: Documents fetched from the database per round trip
+            limit: Optional maximum number of entities, applied by the database
 
         Returns:
-            List of entities matching all filters (may be empty)
+            Async iterator yielding mapped entities
 
         Examples:
-            # Find by single field
-            profiles = await repo.find_by(name="John Doe")
+            async for skill in repo.stream({"profile_id": pid}, batch_size=500):
+                ...
 
-            # Find by multiple fields
+        Notes:
+            - Memory use is bounded by batch_size, not by the result size
+            - Without limit there is no maximum: stop iterating to stop fetching
+        """
+        pass
+
+    @abstractmethod
+    async def find_by(
+        self, spec: FilterSpec | None = None, /, **filters: Any
+    ) -> list[T]:
+        """
+        Find entities matching a filter specification.
+
+        Args:
+            spec: Optional conditions, sort and limit (see ``FilterSpec``)
+            **filters: Extra conditions by field, added to ``spec.where``
+
+        Returns:
+            List of entities matching all conditions (may be empty)
+
+        Examples:
+            # Equality on one or more fields
             skills = await repo.find_by(category="Programming", level="expert")
 
+            # Other operators, sort and limit
+            expired = await repo.find_by(
+                FilterSpec(sort=(("order_index", 1),)),
+                profile_id=pid,
+                expiry_date=Range(lt=now),
+            )
+
         Notes:
-            - Should support equality filters on any entity field
+            - Conditions are evaluated by the database, ideally on an index
             - Should return empty list if no entities match
-            - Implementations may support more complex query operations
+            - Returns at most ``max_results`` entities; use ``stream`` for more
         """
         pass
 
+    async def find_views(
+        self,
+        fields: Sequence[str],
+        spec: FilterSpec | None = None,
+        /,
+        **filters: Any,
+    ) -> list[dict[str, Any]]:
+        """
+        Find matching entities as read views with only some fields.
+
+        Args:
+            fields: Entity field names to load (``id`` is always included)
+            spec: Optional conditions, sort and limit (see ``FilterSpec``)
+            **filters: Extra conditions by field, added to ``spec.where``
+
+        Returns:
+            One dict per matching entity, keyed by field name
+
+        Examples:
+            titles = await repo.find_views(("role", "company"), profile_id=pid)
+
+        Notes:
+            - Same conditions and limits as ``find_by``
+            - Views are read-only data, not entities: they can't be updated
+            - Default implementation loads full entities and keeps ``fields``;
+              repositories that can project at the data store override it
+        """
+        entities = await self.find_by(spec, **filters)
+        return [
+            {name: getattr(entity, name) for name in ("id", *fields)}
+            for entity in entities
+        ]
+
+    async def stream_views(
+        self,
+        fields: Sequence[str],
+        spec: FilterSpec | None = None,
+        /,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **filters: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over matching entities as read views without loading them all.
+
+        Args:
+            fields: Entity field names to load (``id`` is always included)
+            spec: Optional conditions, sort and limit (see ``FilterSpec``)
+            batch_size: Documents fetched from the database per round trip
+            **filters: Extra conditions by field, added to ``spec.where``
+
+        Returns:
+            Async iterator yielding one dict per matching entity
+
+        Examples:
+            async for view in repo.stream_views(("name",), profile_id=pid):
+                ...
+
+        Notes:
+            - Same views as ``find_views``, without its ``max_results`` cap
+            - Default implementation streams full entities and keeps
+              ``fields``; repositories that can skip decoding into dicts
+              override it
+        """
+        spec = (spec or FilterSpec()).and_where(**filters)
+        entities = self.stream(spec.where, spec.sort, batch_size, spec.limit)
+        async for entity in entities:
+            yield {name: getattr(entity, name) for name in ("id", *fields)}
+
 
 class IProfileRepository(IRepository["Profile"]):
     """
@@ -304,7 +456,7 @@ class IOrderedRepository(IRepository[T], Generic[T]):
             ascending: Sort direction
 
         Returns:
-            List of entities sorted by orderIndex
+            List of entities sorted by orderIndex (at most ``max_results``)
         """
         pass
 
@@ -326,6 +478,28 @@ class IOrderedRepository(IRepository[T], Generic[T]):
         """
         pass
 
+    @abstractmethod
+    async def bulk_reorder(self, profile_id: str, orders: Mapping[str, int]) -> int:
+        """
+        Apply a new orderIndex to many entities at once.
+
+        Args:
+            profile_id: The profile ID
+            orders: New orderIndex by entity ID
+
+        Returns:
+            Number of entities of the profile that were found
+
+        Raises:
+            BusinessRuleViolationException: If two entities would end up
+                sharing an orderIndex
+
+        Notes:
+            - Should be a single round trip, atomic when the database allows
+            - Entities not listed keep their orderIndex
+        """
+        pass
+
 
 class IContactMessageRepository(IRepository["ContactMessage"]):
     """
@@ -344,6 +518,29 @@ class IContactMessageRepository(IRepository["ContactMessage"]):
         """
         pass
 
+    @abstractmethod
+    async def list_page(
+        self,
+        limit: int,
+        after: tuple[datetime, str] | None = None,
+        ascending: bool = False,
+    ) -> list[ContactMessage]:
+        """
+        Get one page of messages using keyset pagination.
+
+        Messages are ordered by (created_at, id). The page starts right after
+        the ``after`` key, so every page costs the same regardless of depth.
+
+        Args:
+            limit: Maximum number of messages to return
+            after: (created_at, id) of the last message of the previous page
+            ascending: Oldest first if True, newest first otherwise
+
+        Returns:
+            Up to ``limit`` messages following ``after``
+        """
+        pass
+
     @abstractmethod
     async def get_messages_by_status(self, status: str) -> list[ContactMessage]:
         """
@@ -420,6 +617,46 @@ class IUniqueNameRepository(IRepository[T], Generic[T]):
         pass
 
 
+class IGroupableRepository(IRepository[T], Generic[T]):
+    """
+    Repository interface for entities grouped and counted by a field.
+
+    Used for Skill and Tool entities. Grouping and counting run in the
+    database, so only the groups (or just the counts) are transferred.
+    """
+
+    @abstractmethod
+    async def group_by(self, profile_id: str, field: str) -> dict[Any, list[T]]:
+        """
+        Get the profile's entities grouped by the value of a field.
+
+        Args:
+            profile_id: The profile ID
+            field: The field to group by
+
+        Returns:
+            Entities by field value (None when missing). Each group is sorted
+            by orderIndex and groups follow the orderIndex of their first entity
+        """
+        pass
+
+    @abstractmethod
+    async def count_by(
+        self, profile_id: str, fields: Sequence[str]
+    ) -> dict[str, dict[Any, int]]:
+        """
+        Count the profile's entities per value of each field.
+
+        Args:
+            profile_id: The profile ID
+            fields: The fields to count by
+
+        Returns:
+            For each field, the number of entities by value (None when missing)
+        """
+        pass
+
+
 class ISocialNetworkRepository(IRepository["SocialNetwork"]):
     """
     SocialNetwork-specific repository interface.
@@ -461,6 +698,39 @@ class ISocialNetworkRepository(IRepository["SocialNetwork"]):
         pass
 
 
+class ICVRepository(ABC):
+    """
+    Read-only repository interface for the aggregated CV.
+
+    Assembles every CV section for a profile in a single storage round trip,
+    as an alternative to querying each section repository separately.
+    """
+
+    @abstractmethod
+    async def get_cv_sections(
+        self, profile_id: str, sections: Sequence[str] | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Load the CV sections of a profile at once.
+
+        Args:
+            profile_id: The profile ID related documents are stored under
+            sections: Sections to load besides the profile, which is always
+                loaded (None = every section except ``languages`` and
+                ``programming_languages``)
+
+        Returns:
+            Mapping of section name to hydrated domain entities, or None if
+            no profile exists. Keys: ``profile``, ``contact_info`` (entity or
+            None), and the lists ``social_networks``, ``work_experiences``,
+            ``projects``, ``skills``, ``tools``, ``education``,
+            ``additional_training``, ``certifications``, ``languages`` and
+            ``programming_languages``, ordered as the CV presents them; only
+            the loaded sections are present.
+        """
+        pass
+
+
 # Type aliases for convenience
 # Using string literals to avoid circular imports at runtime
 ProfileRepository = IProfileRepository
@@ -476,3 +746,81 @@ SocialNetworkRepository = ISocialNetworkRepository
 ToolRepository = IUniqueNameRepository["Tool"]
 ProgrammingLanguageRepository = IOrderedRepository["ProgrammingLanguage"]
 LanguageRepository = IOrderedRepository["Language"]
+
+
+class ICVSnapshotRepository(ABC):
+    """
+    Repository interface for the materialized CV snapshot.
+
+    Stores the fully assembled CV per profile as one serialized document so
+    that reads cost a single lookup. Writers keep it current section by
+    section.
+    """
+
+    @abstractmethod
+    async def get(self, profile_id: str) -> dict[str, Any] | None:
+        """
+        Get the stored snapshot for a profile.
+
+        Args:
+            profile_id: The profile ID the snapshot belongs to
+
+        Returns:
+            The serialized CV (one key per section), or None if not built
+        """
+        pass
+
+    @abstractmethod
+    async def save(
+        self, profile_id: str, snapshot: dict[str, Any], version: int
+    ) -> None:
+        """
+        Store a complete snapshot, creating it if missing.
+
+        As in ``save_section``, each section is only written if its stored
+        version is older than ``version``: a slow rebuild never overwrites
+        a section that a newer refresh already stored.
+
+        Args:
+            profile_id: The profile ID the snapshot belongs to
+            snapshot: The serialized CV
+            version: Version of every section in ``snapshot``
+        """
+        pass
+
+    @abstractmethod
+    async def save_section(
+        self, profile_id: str, section: str, value: Any, version: int
+    ) -> bool:
+        """
+        Overwrite a single section of an existing snapshot.
+
+        A missing snapshot is left missing: a partial document must never
+        be served as a complete CV. The section is only written if its
+        stored version is older than ``version``, so out-of-order refreshes
+        never overwrite newer data.
+
+        Args:
+            profile_id: The profile ID the snapshot belongs to
+            section: Section name (e.g. ``skills``)
+            value: The serialized section
+            version: Version of ``value`` (greater is newer)
+
+        Returns:
+            True if a snapshot was updated, False if none exists or it
+            already holds a newer version of the section
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, profile_id: str) -> bool:
+        """
+        Drop the snapshot for a profile so that it is rebuilt on next read.
+
+        Args:
+            profile_id: The profile ID the snapshot belongs to
+
+        Returns:
+            True if a snapshot was deleted, False if none existed
+        """
+        pass
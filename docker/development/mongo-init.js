@@ -11,22 +11,41 @@ db.createCollection('social_networks');
 db.createCollection('projects');
 db.createCollection('work_experiences');
 db.createCollection('education');
-db.createCollection('additional_training');
+db.createCollection('additional_trainings');
 db.createCollection('certifications');
 db.createCollection('skills');
 db.createCollection('tools');
+db.createCollection('programming_languages');
+db.createCollection('languages');
 db.createCollection('contact_messages');
 
 // Crear índices para optimización
-db.profiles.createIndex({ "id": 1 }, { unique: true });
-db.contact_information.createIndex({ "id": 1 }, { unique: true });
-db.social_networks.createIndex({ "order_index": 1 });
-db.projects.createIndex({ "order_index": 1 });
-db.work_experiences.createIndex({ "order_index": 1 });
-db.education.createIndex({ "order_index": 1 });
-db.skills.createIndex({ "order_index": 1 });
-db.tools.createIndex({ "order_index": 1 });
-db.contact_messages.createIndex({ "sent_at": -1 });
+// Deben coincidir con los declarados en `indexes` de cada repositorio
+// (app/infrastructure/repositories). La API los reconcilia igualmente al
+// arrancar, también en producción, donde este script no se ejecuta.
+const ordered = [
+  'social_networks',
+  'projects',
+  'work_experiences',
+  'education',
+  'additional_trainings',
+  'certifications',
+  'skills',
+  'tools',
+  'programming_languages',
+  'languages',
+];
+ordered.forEach((name) => {
+  db[name].createIndex({ "profile_id": 1, "order_index": 1 }, { unique: true });
+});
+// Unicidad sin distinguir mayúsculas ("Python" y "python" chocan)
+const caseInsensitive = { unique: true, collation: { locale: 'en', strength: 2 } };
+db.skills.createIndex({ "profile_id": 1, "name": 1 }, caseInsensitive);
+db.tools.createIndex({ "profile_id": 1, "name": 1 }, caseInsensitive);
+db.social_networks.createIndex({ "profile_id": 1, "platform": 1 }, caseInsensitive);
+db.contact_information.createIndex({ "profile_id": 1 });
+db.contact_messages.createIndex({ "created_at": -1 });
+db.contact_messages.createIndex({ "status": 1, "created_at": -1 });
 
 print('✅ Base de datos portfolio_db inicializada correctamente');
 print('✅ Colecciones e índices creados');
\ No newline at end of file
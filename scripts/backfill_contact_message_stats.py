@@ -0,0 +1,37 @@
+"""
+Reconstruye los contadores diarios de mensajes de contacto.
+
+La API mantiene los contadores con $inc al crear y borrar mensajes; este
+script los recalcula desde los mensajes guardados (al desplegar los
+contadores por primera vez o si alguna actualización se perdió).
+
+Uso:
+    python scripts/backfill_contact_message_stats.py
+"""
+
+import asyncio
+import os
+import sys
+
+# Add project root to PYTHONPATH
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from app.infrastructure.database import MongoDBClient  # noqa: E402
+from app.infrastructure.repositories import ContactMessageStatsRepository  # noqa: E402
+
+
+async def main() -> int:
+    await MongoDBClient.connect()
+    try:
+        repo = ContactMessageStatsRepository(MongoDBClient.get_db())
+        buckets = await repo.rebuild()
+        print(f"✅ {repo.collection_name}: {buckets} días")
+    finally:
+        await MongoDBClient.disconnect()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,107 @@
+"""
+Benchmark: CV fetch modes of GetCompleteCVUseCase.
+
+Runs the real repositories and mappers against an in-memory Mongo stand-in
+that adds a fixed latency to every round trip, and reports the mean and p99
+latency of ``GET /cv`` assembly for the sequential, concurrent and
+single-aggregation fetch modes, and for a warm in-process cache.
+
+Usage:
+    python scripts/benchmarks/bench_cv_fetch.py [--latency-ms 2] [--runs 200]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from mongo_standin import StandInDatabase, seed_portfolio  # noqa: E402
+
+from app.application.dto import GetCompleteCVRequest  # noqa: E402
+from app.application.services import CVResultCache  # noqa: E402
+from app.application.use_cases.cv import GetCompleteCVUseCase  # noqa: E402
+from app.infrastructure.repositories import (  # noqa: E402
+    AdditionalTrainingRepository,
+    CertificationRepository,
+    ContactInformationRepository,
+    CVRepository,
+    EducationRepository,
+    ProfileRepository,
+    ProjectRepository,
+    SkillRepository,
+    SocialNetworkRepository,
+    ToolRepository,
+    WorkExperienceRepository,
+)
+
+
+def build_use_case(db, **options) -> GetCompleteCVUseCase:
+    return GetCompleteCVUseCase(
+        profile_repository=ProfileRepository(db),
+        experience_repository=WorkExperienceRepository(db),
+        skill_repository=SkillRepository(db),
+        education_repository=EducationRepository(db),
+        contact_info_repository=ContactInformationRepository(db),
+        social_network_repository=SocialNetworkRepository(db),
+        project_repository=ProjectRepository(db),
+        tool_repository=ToolRepository(db),
+        additional_training_repository=AdditionalTrainingRepository(db),
+        certification_repository=CertificationRepository(db),
+        **options,
+    )
+
+
+async def measure(use_case: GetCompleteCVUseCase, runs: int) -> list[float]:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await use_case.execute(GetCompleteCVRequest())
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def report(label: str, samples: list[float]) -> None:
+    p99 = statistics.quantiles(samples, n=100)[98]
+    print(
+        f"{label:<28} mean={statistics.mean(samples):7.2f} ms"
+        f"  p50={statistics.median(samples):7.2f} ms  p99={p99:7.2f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--items", type=int, default=10)
+    args = parser.parse_args()
+
+    db = StandInDatabase(latency=args.latency_ms / 1000)
+    seed_portfolio(db, items_per_section=args.items)
+
+    print(
+        f"Round-trip latency {args.latency_ms} ms, {args.items} items per section, "
+        f"{args.runs} runs\n"
+    )
+    report("sequential", await measure(build_use_case(db), args.runs))
+    for cap in (None, 5, 2):
+        samples = await measure(
+            build_use_case(db, concurrent=True, max_concurrency=cap), args.runs
+        )
+        report(f"concurrent (cap={cap or 'none'})", samples)
+    report(
+        "aggregated ($unionWith)",
+        await measure(build_use_case(db, cv_repository=CVRepository(db)), args.runs),
+    )
+    cached = build_use_case(db, concurrent=True, cache=CVResultCache())
+    await cached.execute(GetCompleteCVRequest())  # warm up
+    report("cached (warm hit)", await measure(cached, args.runs))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
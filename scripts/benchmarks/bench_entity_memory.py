@@ -0,0 +1,199 @@
+"""
+Benchmark: memory per instance of the domain entities and their response DTOs.
+
+Entities and DTOs are slotted dataclasses. For every entity type, hydrates
+``--count`` entities from one stored document (``mapper.to_domain``, as the
+repositories do) and builds their response DTOs (``from_entity``), keeping
+all of them alive, and reports the bytes each instance retains (tracemalloc).
+Columns:
+
+- built: what each ``to_domain`` / ``from_entity`` result retains (the
+  instance plus anything the mapper creates for it, such as list copies)
+- slots / __dict__: the bare instance, filled with shared values, in its
+  slotted class and in the same class without slots (as before)
+
+Usage:
+    python scripts/benchmarks/bench_entity_memory.py [--count 100000]
+"""
+
+import argparse
+from dataclasses import fields, make_dataclass
+from datetime import datetime
+import gc
+import os
+import sys
+import tracemalloc
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from mongo_standin import PROFILE_ID, StandInDatabase, seed_portfolio  # noqa: E402
+
+from app.application.dto import (  # noqa: E402
+    AdditionalTrainingResponse,
+    CertificationResponse,
+    ContactInformationResponse,
+    ContactMessageResponse,
+    EducationResponse,
+    LanguageResponse,
+    ProfileResponse,
+    ProgrammingLanguageResponse,
+    ProjectResponse,
+    SkillResponse,
+    SocialNetworkResponse,
+    ToolResponse,
+    WorkExperienceResponse,
+)
+from app.infrastructure.mappers import (  # noqa: E402
+    AdditionalTrainingMapper,
+    CertificationMapper,
+    ContactInformationMapper,
+    ContactMessageMapper,
+    EducationMapper,
+    LanguageMapper,
+    ProfileMapper,
+    ProgrammingLanguageMapper,
+    ProjectMapper,
+    SkillMapper,
+    SocialNetworkMapper,
+    ToolMapper,
+    WorkExperienceMapper,
+)
+
+NOW = datetime(2025, 1, 1)
+
+# Collections not covered by seed_portfolio
+EXTRA_DOCUMENTS = {
+    "languages": {
+        "_id": "lang-1",
+        "profile_id": PROFILE_ID,
+        "name": "English",
+        "order_index": 0,
+        "proficiency": "c1",
+        "created_at": NOW,
+        "updated_at": NOW,
+    },
+    "programming_languages": {
+        "_id": "pl-1",
+        "profile_id": PROFILE_ID,
+        "name": "Python",
+        "order_index": 0,
+        "level": "expert",
+        "created_at": NOW,
+        "updated_at": NOW,
+    },
+    "contact_messages": {
+        "_id": "msg-1",
+        "name": "Ada",
+        "email": "ada@example.com",
+        "message": "Hello, I would like to talk about a project.",
+        "created_at": NOW,
+    },
+}
+
+# (collection, mapper, response DTO) of every entity type
+SECTIONS = [
+    ("profiles", ProfileMapper, ProfileResponse),
+    ("contact_information", ContactInformationMapper, ContactInformationResponse),
+    ("social_networks", SocialNetworkMapper, SocialNetworkResponse),
+    ("work_experiences", WorkExperienceMapper, WorkExperienceResponse),
+    ("projects", ProjectMapper, ProjectResponse),
+    ("skills", SkillMapper, SkillResponse),
+    ("tools", ToolMapper, ToolResponse),
+    ("education", EducationMapper, EducationResponse),
+    ("additional_trainings", AdditionalTrainingMapper, AdditionalTrainingResponse),
+    ("certifications", CertificationMapper, CertificationResponse),
+    ("languages", LanguageMapper, LanguageResponse),
+    ("programming_languages", ProgrammingLanguageMapper, ProgrammingLanguageResponse),
+    ("contact_messages", ContactMessageMapper, ContactMessageResponse),
+]
+
+
+def sample_documents() -> dict[str, dict]:
+    db = StandInDatabase(latency=0)
+    seed_portfolio(db, items_per_section=1)
+    documents = {name: docs[0] for name, docs in db.documents().items()}
+    return {**documents, **EXTRA_DOCUMENTS}
+
+
+def bytes_per_instance(build, count: int) -> float:
+    """Memory retained by each of ``count`` live results of ``build()``."""
+    instances = [None] * count
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        instances[i] = build()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return retained / count
+
+
+def copies(instance, instance_class=None):
+    """Builder of copies of ``instance`` (in ``instance_class`` if given)."""
+    instance_class = instance_class or type(instance)
+    values = [(f.name, getattr(instance, f.name)) for f in fields(instance)]
+
+    def build():
+        copy = object.__new__(instance_class)
+        for name, value in values:
+            object.__setattr__(copy, name, value)
+        return copy
+
+    return build
+
+
+def without_slots(instance_class: type) -> type:
+    """The same fields in a class with a per-instance ``__dict__``."""
+    names = [f.name for f in fields(instance_class)]
+    return make_dataclass(f"{instance_class.__name__}Dict", names)
+
+
+def report(label: str, instance, built: float, count: int) -> None:
+    slotted = bytes_per_instance(copies(instance), count)
+    with_dict = bytes_per_instance(
+        copies(instance, without_slots(type(instance))), count
+    )
+    print(
+        f"{label:<30} {built:9.0f} B {slotted:9.0f} B {with_dict:9.0f} B"
+        f" {1 - slotted / with_dict:7.0%}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    documents = sample_documents()
+    print(f"{args.count} live instances per type (bytes per instance)\n")
+    print(f"{'':<30} {'built':>11} {'slots':>11} {'__dict__':>11} {'saved':>7}")
+    for collection, mapper_class, dto_class in SECTIONS:
+        mapper = mapper_class()
+        document = documents[collection]
+        entity = mapper.to_domain(document)
+        report(
+            type(entity).__name__,
+            entity,
+            bytes_per_instance(
+                lambda mapper=mapper, document=document: mapper.to_domain(document),
+                args.count,
+            ),
+            args.count,
+        )
+        report(
+            f"  {dto_class.__name__}",
+            dto_class.from_entity(entity),
+            bytes_per_instance(
+                lambda dto_class=dto_class, entity=entity: dto_class.from_entity(
+                    entity
+                ),
+                args.count,
+            ),
+            args.count,
+        )
+
+
+if __name__ == "__main__":
+    main()
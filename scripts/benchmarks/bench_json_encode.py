@@ -0,0 +1,117 @@
+"""
+Benchmark: JSON encoding of the ``GET /cv`` payload, stdlib vs orjson.
+
+Assembles the CV once (real repositories and mappers over the in-memory Mongo
+stand-in, no latency) and measures, for the two ways ``/cv`` is answered:
+
+- response_model: ``CVCompleteResponse`` validated and dumped by pydantic,
+  then rendered by Starlette's ``JSONResponse`` (before) or by
+  ``FastJSONResponse`` (after)
+- views_response (``?include=`` / ``?exclude=``): ``jsonable_encoder`` +
+  ``JSONResponse`` (before) or ``FastJSONResponse`` straight over the dump
+  (after)
+
+the encode time and the peak memory allocated per encode (tracemalloc), and
+checks that before and after produce the same bytes.
+
+Usage:
+    python scripts/benchmarks/bench_json_encode.py [--items 10] [--runs 2000]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from bench_cv_fetch import build_use_case  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from mongo_standin import StandInDatabase, seed_portfolio  # noqa: E402
+
+from app.api.responses import FastJSONResponse  # noqa: E402
+from app.api.schemas.cv_schema import CVCompleteResponse  # noqa: E402
+from app.application.dto import GetCompleteCVRequest  # noqa: E402
+
+
+def load_cv(items: int) -> CVCompleteResponse:
+    db = StandInDatabase(latency=0)
+    seed_portfolio(db, items_per_section=items)
+    result = asyncio.run(build_use_case(db).execute(GetCompleteCVRequest()))
+    return CVCompleteResponse.model_validate(result)
+
+
+def measure(encode, content, runs: int) -> tuple[list[float], float]:
+    """Encode time samples (µs) and mean peak allocation per encode (KiB)."""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        encode(content)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+
+    peaks = []
+    tracemalloc.start()
+    for _ in range(min(runs, 200)):
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        encode(content)
+        peaks.append((tracemalloc.get_traced_memory()[1] - baseline) / 1024)
+    tracemalloc.stop()
+    return samples, statistics.mean(peaks)
+
+
+def report(label: str, samples: list[float], peak_kib: float) -> None:
+    p99 = statistics.quantiles(samples, n=100)[98]
+    print(
+        f"{label:<8} mean={statistics.mean(samples):8.1f} µs"
+        f"  p99={p99:8.1f} µs  peak alloc={peak_kib:8.1f} KiB"
+    )
+
+
+def compare(title: str, before, after, content, runs: int) -> None:
+    if before(content) != after(content):
+        sys.exit(f"{title}: before and after must produce the same bytes")
+    print(f"{title} ({len(after(content)) / 1024:.1f} KiB of JSON)")
+    before_samples, before_peak = measure(before, content, runs)
+    after_samples, after_peak = measure(after, content, runs)
+    report("before", before_samples, before_peak)
+    report("after", after_samples, after_peak)
+    ratio = statistics.mean(after_samples) / statistics.mean(before_samples)
+    print(f"after / before: {ratio:.2f}\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=2000)
+    args = parser.parse_args()
+
+    cv = load_cv(args.items)
+    print(f"GET /cv with {args.items} items per section, {args.runs} runs\n")
+
+    # What FastAPI hands the response class after the response_model dump
+    compare(
+        "response_model",
+        lambda content: JSONResponse(content).body,
+        lambda content: FastJSONResponse(content).body,
+        cv.model_dump(mode="json"),
+        args.runs,
+    )
+    # What the router hands views_response
+    compare(
+        "views_response",
+        lambda content: JSONResponse(jsonable_encoder(content)).body,
+        lambda content: FastJSONResponse(content).body,
+        cv.model_dump(),
+        args.runs,
+    )
+
+
+if __name__ == "__main__":
+    main()
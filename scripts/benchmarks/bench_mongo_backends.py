@@ -0,0 +1,108 @@
+"""
+Benchmark: Motor vs PyMongo's native AsyncMongoClient (MONGODB_BACKEND).
+
+Seeds a throwaway database on a real MongoDB with the benchmark portfolio,
+then drives the real repositories with ``--concurrency`` simultaneous
+``GET /cv`` assemblies (concurrent fetch mode, one query per section) plus a
+skills listing, and reports requests/sec, mean and p99 latency per backend.
+Motor runs every operation in its thread pool; the native client stays on
+the event loop.
+
+Requires a running MongoDB; the database is dropped at the end.
+
+Usage:
+    python scripts/benchmarks/bench_mongo_backends.py \\
+        [--url mongodb://localhost:27017] [--requests 2000] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from bench_cv_fetch import build_use_case  # noqa: E402
+from mongo_standin import PROFILE_ID, StandInDatabase, seed_portfolio  # noqa: E402
+from motor.motor_asyncio import AsyncIOMotorClient  # noqa: E402
+
+from app.application.dto import GetCompleteCVRequest  # noqa: E402
+from app.infrastructure.database import NativeMongoClient  # noqa: E402
+from app.infrastructure.repositories import SkillRepository  # noqa: E402
+
+BACKENDS = {"motor": AsyncIOMotorClient, "pymongo": NativeMongoClient}
+
+
+async def seed(db, items: int) -> None:
+    standin = StandInDatabase(latency=0)
+    seed_portfolio(standin, items_per_section=items)
+    for name, docs in standin.documents().items():
+        await db[name].insert_many([dict(doc) for doc in docs])
+
+
+async def run_load(db, requests: int, concurrency: int) -> tuple[float, list[float]]:
+    """Run ``requests`` requests, ``concurrency`` at a time; elapsed and latencies."""
+    use_case = build_use_case(db, concurrent=True)
+    skills = SkillRepository(db)
+    samples: list[float] = []
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for i in remaining:
+            started = time.perf_counter()
+            if i % 2:
+                await skills.get_all_ordered(profile_id=PROFILE_ID)
+            else:
+                await use_case.execute(GetCompleteCVRequest())
+            samples.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, samples
+
+
+def report(label: str, elapsed: float, samples: list[float]) -> None:
+    p99 = statistics.quantiles(samples, n=100)[98]
+    print(
+        f"{label:<8} {len(samples) / elapsed:9.1f} req/s"
+        f"  mean={statistics.mean(samples):7.2f} ms  p99={p99:7.2f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="mongodb://localhost:27017")
+    parser.add_argument("--db", default="portfolio_bench_backends")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--items", type=int, default=10)
+    args = parser.parse_args()
+
+    seeder = AsyncIOMotorClient(args.url)
+    await seeder.drop_database(args.db)
+    await seed(seeder[args.db], args.items)
+
+    print(
+        f"{args.requests} requests, {args.concurrency} concurrent, "
+        f"{args.items} items per section\n"
+    )
+    try:
+        for name, client_class in BACKENDS.items():
+            client = client_class(args.url, maxPoolSize=args.concurrency)
+            db = client[args.db]
+            await run_load(db, args.concurrency, args.concurrency)  # warm up
+            report(name, *await run_load(db, args.requests, args.concurrency))
+            closing = client.close()
+            if closing is not None:
+                await closing
+    finally:
+        await seeder.drop_database(args.db)
+        seeder.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
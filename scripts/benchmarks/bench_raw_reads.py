@@ -0,0 +1,119 @@
+"""
+Benchmark: CPU cost of a public list read, regular path vs raw BSON path.
+
+Encodes the documents of a ``GET /skills`` page to BSON once (as the driver
+receives them) and measures, without any I/O, the per-request CPU time of:
+
+- regular: BSON → dict → ``SkillMapper.to_domain`` → ``SkillResponse`` DTO →
+  ``response_model`` validation and serialization → JSON
+- raw (``PUBLIC_RAW_READS``): ``RawBSONDocument`` → ``to_view`` → JSON
+
+and checks that both produce the same bytes.
+
+Usage:
+    python scripts/benchmarks/bench_raw_reads.py [--items 50] [--runs 2000]
+"""
+
+import argparse
+from datetime import datetime
+import os
+import statistics
+import sys
+import time
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+import bson  # noqa: E402
+from bson.raw_bson import RawBSONDocument  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from app.api.raw_reads import encode_item, response_fields  # noqa: E402
+from app.api.responses import FastJSONResponse  # noqa: E402
+from app.api.schemas.skill_schema import SkillResponse  # noqa: E402
+from app.application.dto import SkillResponse as SkillDTO  # noqa: E402
+from app.infrastructure.mappers import SkillMapper  # noqa: E402
+
+FIELDS = response_fields(SkillResponse)
+LIST_ADAPTER = TypeAdapter(list[SkillResponse])
+
+
+def seed_documents(items: int) -> list[bytes]:
+    now = datetime(2025, 1, 1, 12, 30, 15, 123000)
+    docs = []
+    for i in range(items):
+        doc = {
+            "_id": f"skill-{i}",
+            "profile_id": "default_profile",
+            "name": f"Skill {i}",
+            "category": "backend",
+            "order_index": i,
+            "created_at": now,
+            "updated_at": now,
+        }
+        # Optional fields are omitted when unset, as SkillMapper stores them
+        if i % 2:
+            doc["level"] = "advanced"
+        docs.append(bson.encode(doc))
+    return docs
+
+
+def regular_path(raw_docs: list[bytes]) -> bytes:
+    mapper = SkillMapper()
+    dtos = [
+        SkillDTO.from_entity(mapper.to_domain(bson.decode(raw))) for raw in raw_docs
+    ]
+    # What FastAPI does with response_model=list[SkillResponse]
+    content = LIST_ADAPTER.dump_python(
+        LIST_ADAPTER.validate_python(dtos, from_attributes=True), mode="json"
+    )
+    return FastJSONResponse(content).body
+
+
+def raw_path(raw_docs: list[bytes]) -> bytes:
+    mapper = SkillMapper()
+    items = (
+        encode_item(mapper.to_view(RawBSONDocument(raw), FIELDS), FIELDS)
+        for raw in raw_docs
+    )
+    return b"[" + b",".join(items) + b"]"
+
+
+def measure(path, raw_docs: list[bytes], runs: int) -> list[float]:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        path(raw_docs)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return samples
+
+
+def report(label: str, samples: list[float]) -> None:
+    p99 = statistics.quantiles(samples, n=100)[98]
+    print(
+        f"{label:<10} mean={statistics.mean(samples):9.1f} µs"
+        f"  p50={statistics.median(samples):9.1f} µs  p99={p99:9.1f} µs"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=2000)
+    args = parser.parse_args()
+
+    raw_docs = seed_documents(args.items)
+    if regular_path(raw_docs) != raw_path(raw_docs):
+        sys.exit("Both paths must produce the same bytes")
+
+    print(f"GET /skills with {args.items} items, {args.runs} runs (CPU only)\n")
+    regular = measure(regular_path, raw_docs, args.runs)
+    raw = measure(raw_path, raw_docs, args.runs)
+    report("regular", regular)
+    report("raw", raw)
+    print(f"\nraw / regular: {statistics.mean(raw) / statistics.mean(regular):.2f}")
+
+
+if __name__ == "__main__":
+    main()
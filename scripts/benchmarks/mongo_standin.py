@@ -0,0 +1,213 @@
+"""
+In-memory stand-in for a Motor database, used by the benchmark scripts.
+
+Implements the small subset of the Motor collection API that the
+repositories use (``find``/``sort``/``skip``/``limit``/``to_list``,
+``find_one``, ``count_documents`` and the ``aggregate`` stages used by
+``CVRepository``) and sleeps for ``latency`` seconds on every round trip, so the numbers reflect network-bound behaviour without
+needing a running MongoDB.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any
+
+PROFILE_ID = "default_profile"
+
+
+def _matches(doc: dict[str, Any], filters: dict[str, Any] | None) -> bool:
+    return all(doc.get(key) == value for key, value in (filters or {}).items())
+
+
+def _resolve(expr: Any, doc: dict[str, Any]) -> Any:
+    """Evaluate the tiny expression subset used by the CV pipeline."""
+    if expr == "$$ROOT":
+        return doc
+    if isinstance(expr, str) and expr.startswith("$"):
+        return doc.get(expr[1:])
+    if isinstance(expr, dict):
+        if "$literal" in expr:
+            return expr["$literal"]
+        return {key: _resolve(value, doc) for key, value in expr.items()}
+    return expr
+
+
+class StandInCursor:
+    """Chainable cursor; the round trip happens in ``to_list``."""
+
+    def __init__(self, docs: list[dict[str, Any]], latency: float):
+        self._docs = docs
+        self._latency = latency
+
+    def sort(self, key: str, direction: int = 1) -> "StandInCursor":
+        self._docs.sort(key=lambda d: d.get(key), reverse=direction < 0)
+        return self
+
+    def skip(self, count: int) -> "StandInCursor":
+        self._docs = self._docs[count:]
+        return self
+
+    def limit(self, count: int) -> "StandInCursor":
+        if count:
+            self._docs = self._docs[:count]
+        return self
+
+    async def to_list(self, length: int | None = None) -> list[dict[str, Any]]:
+        await asyncio.sleep(self._latency)
+        return [dict(d) for d in self._docs[:length]]
+
+
+class StandInCollection:
+    def __init__(self, latency: float, db: "StandInDatabase | None" = None):
+        self.docs: list[dict[str, Any]] = []
+        self._latency = latency
+        self._db = db
+
+    def find(self, filters: dict[str, Any] | None = None) -> StandInCursor:
+        return StandInCursor(
+            [d for d in self.docs if _matches(d, filters)], self._latency
+        )
+
+    async def find_one(
+        self, filters: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
+        await asyncio.sleep(self._latency)
+        return next((dict(d) for d in self.docs if _matches(d, filters)), None)
+
+    async def count_documents(self, filters: dict[str, Any] | None = None) -> int:
+        await asyncio.sleep(self._latency)
+        return sum(1 for d in self.docs if _matches(d, filters))
+
+    def aggregate(self, pipeline: list[dict[str, Any]]) -> StandInCursor:
+        """Evaluate the pipeline server-side; one round trip on ``to_list``."""
+        return StandInCursor(self._run_pipeline(self.docs, pipeline), self._latency)
+
+    def _run_pipeline(
+        self, docs: list[dict[str, Any]], pipeline: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        docs = [dict(d) for d in docs]
+        for stage in pipeline:
+            (op, spec), = stage.items()
+            if op == "$match":
+                docs = [d for d in docs if _matches(d, spec)]
+            elif op == "$limit":
+                docs = docs[:spec]
+            elif op == "$project":
+                docs = [
+                    {key: _resolve(value, d) for key, value in spec.items() if value}
+                    for d in docs
+                ]
+            elif op == "$unionWith":
+                other = self._db[spec["coll"]] if self._db else self
+                docs += other._run_pipeline(other.docs, spec["pipeline"])
+            elif op == "$group":
+                docs = self._group(docs, spec)
+            elif op == "$replaceRoot":
+                pairs = spec["newRoot"]["$arrayToObject"].lstrip("$")
+                docs = [{p["k"]: p["v"] for p in d[pairs]} for d in docs]
+            else:
+                raise NotImplementedError(f"Stage {op} not supported by stand-in")
+        return docs
+
+    @staticmethod
+    def _group(
+        docs: list[dict[str, Any]], spec: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        (out_field, accumulator), = (i for i in spec.items() if i[0] != "_id")
+        groups: dict[Any, list[Any]] = {}
+        for d in docs:
+            key = _resolve(spec["_id"], d)
+            groups.setdefault(key, []).append(_resolve(accumulator["$push"], d))
+        return [{"_id": key, out_field: values} for key, values in groups.items()]
+
+
+class StandInDatabase:
+    def __init__(self, latency: float):
+        self._latency = latency
+        self._collections: dict[str, StandInCollection] = {}
+
+    def __getitem__(self, name: str) -> StandInCollection:
+        if name not in self._collections:
+            self._collections[name] = StandInCollection(self._latency, self)
+        return self._collections[name]
+
+    def documents(self) -> dict[str, list[dict[str, Any]]]:
+        """Stored documents by collection (e.g. to load them into a real MongoDB)."""
+        return {name: coll.docs for name, coll in self._collections.items()}
+
+
+def seed_portfolio(db: StandInDatabase, items_per_section: int = 10) -> None:
+    """Populate every CV collection with valid documents for ``PROFILE_ID``."""
+    now = datetime(2025, 1, 1)
+    stamps = {"created_at": now, "updated_at": now}
+    db["profiles"].docs.append(
+        {"_id": "profile-1", "name": "Alex", "headline": "Developer", **stamps}
+    )
+    db["contact_information"].docs.append(
+        {"_id": "contact-1", "profile_id": PROFILE_ID, "email": "a@b.com", **stamps}
+    )
+    for i in range(items_per_section):
+        common = {"profile_id": PROFILE_ID, "order_index": i, **stamps}
+        db["social_networks"].docs.append(
+            {
+                "_id": f"sn-{i}",
+                "platform": f"Platform {i}",
+                "url": f"https://example.com/{i}",
+                **common,
+            }
+        )
+        db["work_experiences"].docs.append(
+            {
+                "_id": f"exp-{i}",
+                "role": "Developer",
+                "company": f"Company {i}",
+                "start_date": datetime(2020, 1, 1),
+                "responsibilities": ["Build APIs", "Review code"],
+                **common,
+            }
+        )
+        db["projects"].docs.append(
+            {
+                "_id": f"proj-{i}",
+                "title": f"Project {i}",
+                "description": "A project description long enough to pass the "
+                "sufficiency rule that applies when no URLs are given at all.",
+                "start_date": datetime(2024, 1, 1),
+                "technologies": ["Python", "FastAPI", "MongoDB"],
+                **common,
+            }
+        )
+        db["skills"].docs.append(
+            {"_id": f"skill-{i}", "name": f"Skill {i}", "category": "backend", **common}
+        )
+        db["tools"].docs.append(
+            {"_id": f"tool-{i}", "name": f"Tool {i}", "category": "devops", **common}
+        )
+        db["education"].docs.append(
+            {
+                "_id": f"edu-{i}",
+                "institution": f"University {i}",
+                "degree": "BSc",
+                "field": "Computer Science",
+                "start_date": datetime(2015, 9, 1),
+                **common,
+            }
+        )
+        db["additional_trainings"].docs.append(
+            {
+                "_id": f"train-{i}",
+                "title": f"Course {i}",
+                "provider": "Udemy",
+                "completion_date": datetime(2023, 4, 15),
+                **common,
+            }
+        )
+        db["certifications"].docs.append(
+            {
+                "_id": f"cert-{i}",
+                "title": f"Certification {i}",
+                "issuer": "Amazon",
+                "issue_date": datetime(2023, 6, 15),
+                **common,
+            }
+        )
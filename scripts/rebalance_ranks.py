@@ -0,0 +1,56 @@
+"""
+Reequilibra las claves de orden (rank) de las colecciones ordenadas.
+
+Con ORDERING_MODE=rank la API reequilibra en segundo plano cuando una clave
+crece demasiado; este script lo hace para todos los perfiles de una vez y
+materializa el orden actual en order_index.
+
+Uso:
+    python scripts/rebalance_ranks.py          # reparte de nuevo los ranks
+    python scripts/rebalance_ranks.py --seed   # los crea desde order_index
+                                               # (al activar el modo rank)
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# Add project root to PYTHONPATH
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from app.infrastructure.database import MongoDBClient  # noqa: E402
+from app.infrastructure.repositories.index_registry import (  # noqa: E402
+    INDEXED_REPOSITORIES,
+)
+from app.infrastructure.repositories.ranking import rebalance_ranks  # noqa: E402
+from app.shared.interfaces.repository import IOrderedRepository  # noqa: E402
+
+
+async def main(seed: bool) -> int:
+    await MongoDBClient.connect()
+    try:
+        db = MongoDBClient.get_db()
+        for repo in INDEXED_REPOSITORIES:
+            if not issubclass(repo, IOrderedRepository):
+                continue
+            collection = db[repo.collection_name]
+            written = 0
+            for profile_id in await collection.distinct("profile_id"):
+                written += await rebalance_ranks(collection, profile_id, seed=seed)
+            print(f"✅ {repo.collection_name}: {written} escrituras")
+    finally:
+        await MongoDBClient.disconnect()
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--seed",
+        action="store_true",
+        help="Crear los ranks a partir de order_index en lugar del rank actual",
+    )
+    sys.exit(asyncio.run(main(parser.parse_args().seed)))
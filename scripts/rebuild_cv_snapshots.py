@@ -0,0 +1,71 @@
+"""
+Regenera en bloque los snapshots materializados del CV (colección cv_snapshots).
+
+Útil tras una migración, una restauración o cualquier escritura hecha por
+fuera de la API, que no pasa por los casos de uso y no actualiza el snapshot.
+
+Uso:
+    python scripts/rebuild_cv_snapshots.py
+"""
+
+import asyncio
+import os
+import sys
+
+# Add project root to PYTHONPATH
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from app.application.services import CVSnapshotService  # noqa: E402
+from app.application.use_cases import GetCompleteCVUseCase  # noqa: E402
+from app.infrastructure.database.mongo_client import MongoDBClient  # noqa: E402
+from app.infrastructure.repositories import (  # noqa: E402
+    AdditionalTrainingRepository,
+    CertificationRepository,
+    ContactInformationRepository,
+    CVSnapshotRepository,
+    EducationRepository,
+    ProfileRepository,
+    ProjectRepository,
+    SkillRepository,
+    SocialNetworkRepository,
+    ToolRepository,
+    WorkExperienceRepository,
+)
+from app.shared.shared_exceptions import NotFoundException  # noqa: E402
+
+
+async def main() -> int:
+    await MongoDBClient.connect()
+    try:
+        db = MongoDBClient.get_db()
+        cv_use_case = GetCompleteCVUseCase(
+            profile_repository=ProfileRepository(db),
+            experience_repository=WorkExperienceRepository(db),
+            skill_repository=SkillRepository(db),
+            education_repository=EducationRepository(db),
+            contact_info_repository=ContactInformationRepository(db),
+            social_network_repository=SocialNetworkRepository(db),
+            project_repository=ProjectRepository(db),
+            tool_repository=ToolRepository(db),
+            additional_training_repository=AdditionalTrainingRepository(db),
+            certification_repository=CertificationRepository(db),
+            concurrent=True,
+        )
+        service = CVSnapshotService(
+            snapshot_repository=CVSnapshotRepository(db), cv_use_case=cv_use_case
+        )
+        try:
+            snapshot = await service.rebuild()
+        except NotFoundException:
+            print("⚠️  No hay perfil: no se genera ningún snapshot")
+            return 1
+        print(f"✅ Snapshot del CV regenerado ({len(snapshot)} secciones)")
+        return 0
+    finally:
+        await MongoDBClient.disconnect()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
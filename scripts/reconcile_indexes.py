@@ -0,0 +1,64 @@
+"""
+Reconcilia los índices de MongoDB con los declarados por los repositorios.
+
+Crea los índices que faltan e informa de los que existen pero no están
+declarados (nunca los borra). La API hace lo mismo al arrancar; este script
+permite revisarlo antes de un despliegue.
+
+Uso:
+    python scripts/reconcile_indexes.py            # crea los que faltan
+    python scripts/reconcile_indexes.py --dry-run  # solo informa
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# Add project root to PYTHONPATH
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from app.config.settings import settings  # noqa: E402
+from app.infrastructure.database import (  # noqa: E402
+    MongoDBClient,
+    reconcile_indexes,
+)
+from app.infrastructure.repositories import build_index_registry  # noqa: E402
+
+
+async def main(dry_run: bool) -> int:
+    await MongoDBClient.connect()
+    try:
+        reports = await reconcile_indexes(
+            MongoDBClient.get_db(),
+            build_index_registry(settings.rank_ordering),
+            dry_run=dry_run,
+        )
+    finally:
+        await MongoDBClient.disconnect()
+
+    for report in reports:
+        status = "✅" if report.in_sync else "⚠️ "
+        print(f"{status} {report.collection}")
+        for label, names in (
+            ("creados", report.created),
+            ("pendientes", report.missing),
+            ("no declarados", report.extra),
+            ("con error", report.failed),
+        ):
+            if names:
+                print(f"    {label}: {', '.join(names)}")
+
+    # Sin los índices únicos la API no arranca
+    unavailable = any(report.failed or report.unique_unavailable for report in reports)
+    return 1 if unavailable else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Solo informar, no crear índices"
+    )
+    sys.exit(asyncio.run(main(parser.parse_args().dry_run)))
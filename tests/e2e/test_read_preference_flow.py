@@ -0,0 +1,66 @@
+"""
+E2E tests for read-preference routing.
+
+Run against a replica set with public reads on secondaries, e.g. the local
+single-node one (``make test-e2e-replica-set``)::
+
+    MONGODB_URL="mongodb://localhost:27018/?replicaSet=rs0"
+    MONGODB_READ_PREFERENCE=secondaryPreferred
+    MONGODB_MAX_STALENESS_SECONDS=90
+
+Skipped when MONGODB_READ_PREFERENCE is unset or ``primary``.
+"""
+
+import os
+
+from httpx import AsyncClient
+import pytest
+
+from app.api.middlewares.read_your_writes_middleware import PRIMARY_READS_COOKIE
+
+READ_PREFERENCE = os.getenv("MONGODB_READ_PREFERENCE", "primary")
+
+pytestmark = [
+    pytest.mark.e2e,
+    pytest.mark.skipif(
+        READ_PREFERENCE == "primary",
+        reason="MONGODB_READ_PREFERENCE not set — public reads use the primary",
+    ),
+]
+
+PREFIX = "/api/v1"
+
+PROFILE_DATA = {"name": "Alex Zapata", "headline": "Full Stack Developer"}
+
+SKILL_PYTHON = {
+    "name": "Python",
+    "category": "backend",
+    "order_index": 0,
+    "level": "expert",
+}
+
+
+class TestReadPreferenceFlow:
+    async def test_public_reads_use_the_configured_read_preference(
+        self, client: AsyncClient
+    ):
+        from app.infrastructure.database.mongo_client import MongoDBClient
+
+        assert MongoDBClient.read_db.read_preference.mongos_mode == READ_PREFERENCE
+        assert MongoDBClient.db.read_preference.mongos_mode == "primary"
+
+        resp = await client.get(f"{PREFIX}/skills")
+        assert resp.status_code == 200
+        assert PRIMARY_READS_COOKIE not in resp.cookies
+
+    async def test_editor_reads_their_own_write(self, client: AsyncClient):
+        resp = await client.post(f"{PREFIX}/profile", json=PROFILE_DATA)
+        assert resp.status_code == 201
+        resp = await client.post(f"{PREFIX}/skills", json=SKILL_PYTHON)
+        assert resp.status_code == 201
+        assert PRIMARY_READS_COOKIE in client.cookies
+
+        # Immediately after the write, the pinned client reads the primary
+        resp = await client.get(f"{PREFIX}/skills")
+        assert resp.status_code == 200
+        assert [skill["name"] for skill in resp.json()] == ["Python"]
@@ -13,15 +13,16 @@ class TestListContactMessages:
         response = await client.get(PREFIX)
         assert response.status_code == 200
 
-    async def test_list_messages_returns_list(self, client: AsyncClient):
+    async def test_list_messages_returns_page(self, client: AsyncClient):
         response = await client.get(PREFIX)
         data = response.json()
-        assert isinstance(data, list)
-        assert len(data) > 0
+        assert isinstance(data["messages"], list)
+        assert len(data["messages"]) > 0
+        assert "next_cursor" in data
 
     async def test_message_response_schema(self, client: AsyncClient):
         response = await client.get(PREFIX)
-        data = response.json()
+        data = response.json()["messages"]
         msg = data[0]
         assert "id" in msg
         assert "name" in msg
@@ -32,17 +33,27 @@ class TestListContactMessages:
 
     async def test_messages_sorted_by_date_desc(self, client: AsyncClient):
         response = await client.get(PREFIX)
-        data = response.json()
+        data = response.json()["messages"]
         dates = [m["created_at"] for m in data]
         assert dates == sorted(dates, reverse=True)
 
     async def test_message_status_is_valid(self, client: AsyncClient):
         response = await client.get(PREFIX)
-        data = response.json()
+        data = response.json()["messages"]
         valid_statuses = {"pending", "read", "replied"}
         for msg in data:
             assert msg["status"] in valid_statuses
 
+    async def test_limit_caps_page_size(self, client: AsyncClient):
+        response = await client.get(PREFIX, params={"limit": 1})
+        data = response.json()
+        assert len(data["messages"]) == 1
+        assert data["next_cursor"] is not None
+
+    async def test_limit_above_maximum_returns_422(self, client: AsyncClient):
+        response = await client.get(PREFIX, params={"limit": 1000})
+        assert response.status_code == 422
+
 
 class TestGetContactMessage:
     async def test_get_message_returns_200(self, client: AsyncClient):
@@ -0,0 +1,259 @@
+"""
+Contract tests: PUBLIC_RAW_READS responses are byte-for-byte the regular ones.
+
+Both paths run for real (routers, use cases, repositories and mappers) over
+an in-memory Motor stand-in holding several items per collection in a
+shuffled order, so the comparison also covers the sort direction.
+"""
+
+from datetime import datetime
+from typing import Any
+
+import bson
+from bson.codec_options import DEFAULT_CODEC_OPTIONS, CodecOptions
+from httpx import AsyncClient
+import pytest
+
+from app.api.dependencies import get_content_version_repository, get_request_database
+from app.config.settings import settings
+from app.domain.entities import (
+    AdditionalTraining,
+    Language,
+    ProgrammingLanguage,
+    Skill,
+    SocialNetwork,
+    Tool,
+)
+from app.infrastructure.mappers import (
+    AdditionalTrainingMapper,
+    LanguageMapper,
+    ProgrammingLanguageMapper,
+    SkillMapper,
+    SocialNetworkMapper,
+    ToolMapper,
+)
+from app.main import app
+
+pytestmark = pytest.mark.integration
+
+PROFILE_ID = "default_profile"
+
+RAW_READ_PATHS = [
+    "/api/v1/skills",
+    "/api/v1/skills?category=backend",
+    "/api/v1/skills?category=none",
+    "/api/v1/skills?level=expert",
+    "/api/v1/tools",
+    "/api/v1/tools?category=devops",
+    "/api/v1/languages",
+    "/api/v1/languages?proficiency=C2",
+    "/api/v1/programming-languages",
+    "/api/v1/programming-languages?level=EXPERT",
+    "/api/v1/social-networks",
+    "/api/v1/additional-training",
+]
+
+# Stored out of order; the responses must sort them
+ORDER_INDEXES = (2, 0, 3, 1)
+
+
+class _Cursor:
+    """The part of AsyncIOMotorCursor the repositories use."""
+
+    def __init__(self, docs, projection, codec_options: CodecOptions):
+        self._docs = docs
+        self._projection = projection
+        self._codec_options = codec_options
+
+    def sort(self, keys, direction=None) -> "_Cursor":
+        if isinstance(keys, str):
+            keys = [(keys, direction)]
+        for name, order in reversed(keys):
+            self._docs.sort(key=lambda doc: doc[name], reverse=order < 0)
+        return self
+
+    def skip(self, count: int) -> "_Cursor":
+        self._docs = self._docs[count:]
+        return self
+
+    def limit(self, count: int) -> "_Cursor":
+        if count:
+            self._docs = self._docs[:count]
+        return self
+
+    def batch_size(self, size: int) -> "_Cursor":
+        return self
+
+    def _decoded(self) -> list[Any]:
+        # As the driver: projected, then decoded with the collection options
+        docs = self._docs
+        if self._projection:
+            docs = [{k: doc[k] for k in self._projection if k in doc} for doc in docs]
+        return [bson.decode(bson.encode(doc), self._codec_options) for doc in docs]
+
+    async def __aiter__(self):
+        for doc in self._decoded():
+            yield doc
+
+    async def to_list(self, length: int | None = None) -> list[Any]:
+        return self._decoded()[:length]
+
+
+class _Collection:
+    """Documents kept as BSON, read with the collection's codec options."""
+
+    def __init__(
+        self, docs: list[bytes], codec_options: CodecOptions = DEFAULT_CODEC_OPTIONS
+    ):
+        self.docs = docs
+        self.codec_options = codec_options
+
+    def with_options(self, codec_options: CodecOptions) -> "_Collection":
+        return _Collection(self.docs, codec_options)
+
+    def find(self, query=None, projection=None) -> _Cursor:
+        docs = [bson.decode(data) for data in self.docs]
+        matched = [
+            doc
+            for doc in docs
+            if all(doc.get(key) == value for key, value in (query or {}).items())
+        ]
+        return _Cursor(matched, projection, self.codec_options)
+
+
+class _Database:
+    def __init__(self):
+        self._collections: dict[str, _Collection] = {}
+
+    def __getitem__(self, name: str) -> _Collection:
+        return self._collections.setdefault(name, _Collection([]))
+
+    def insert(self, name: str, doc: dict[str, Any]) -> None:
+        self[name].docs.append(bson.encode(doc))
+
+
+def _seed(db: _Database) -> None:
+    created = datetime(2025, 1, 2, 3, 4, 5, 678000)
+    for i in ORDER_INDEXES:
+        level = "expert" if i % 2 else None
+        entities = [
+            (
+                "skills",
+                SkillMapper(),
+                Skill.create(
+                    profile_id=PROFILE_ID,
+                    name=f"Skill {i}",
+                    category="backend" if i % 2 else "frontend",
+                    order_index=i,
+                    level=level,
+                ),
+            ),
+            (
+                "tools",
+                ToolMapper(),
+                Tool.create(
+                    profile_id=PROFILE_ID,
+                    name=f"Tool {i}",
+                    category="devops",
+                    order_index=i,
+                ),
+            ),
+            (
+                "languages",
+                LanguageMapper(),
+                Language.create(
+                    profile_id=PROFILE_ID,
+                    name=f"Language {i}",
+                    order_index=i,
+                    proficiency="c2" if i % 2 else "b1",
+                ),
+            ),
+            (
+                "programming_languages",
+                ProgrammingLanguageMapper(),
+                ProgrammingLanguage.create(
+                    profile_id=PROFILE_ID,
+                    name=f"Programming language {i}",
+                    order_index=i,
+                    level=level,
+                ),
+            ),
+            (
+                "social_networks",
+                SocialNetworkMapper(),
+                SocialNetwork.create(
+                    profile_id=PROFILE_ID,
+                    platform=f"Platform {i}",
+                    url=f"https://example.com/{i}",
+                    order_index=i,
+                ),
+            ),
+            (
+                "additional_trainings",
+                AdditionalTrainingMapper(),
+                AdditionalTraining.create(
+                    profile_id=PROFILE_ID,
+                    title=f"Course {i}",
+                    provider="Udemy",
+                    completion_date=datetime(2023, 4, 15),
+                    order_index=i,
+                ),
+            ),
+        ]
+        for collection, mapper, entity in entities:
+            doc = mapper.to_persistence(entity)
+            doc.update(created_at=created, updated_at=created)
+            db.insert(collection, doc)
+
+
+@pytest.fixture
+def stored_items():
+    """Real list dependencies over the stand-in, instead of the mocked ones."""
+    db = _Database()
+    _seed(db)
+    mocked = dict(app.dependency_overrides)
+    app.dependency_overrides.clear()
+    app.dependency_overrides[get_request_database] = lambda: db
+    app.dependency_overrides[get_content_version_repository] = lambda: None
+    yield db
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(mocked)
+
+
+async def _get(client: AsyncClient, monkeypatch, path: str, raw: bool):
+    monkeypatch.setattr(settings, "PUBLIC_RAW_READS", raw)
+    return await client.get(path)
+
+
+@pytest.mark.parametrize("path", RAW_READ_PATHS)
+async def test_raw_read_returns_the_same_bytes(
+    client: AsyncClient, monkeypatch, stored_items, path: str
+):
+    regular = await _get(client, monkeypatch, path, raw=False)
+    raw = await _get(client, monkeypatch, path, raw=True)
+
+    assert regular.status_code == raw.status_code == 200
+    assert raw.headers["content-type"] == regular.headers["content-type"]
+    assert raw.content == regular.content
+
+
+async def test_items_keep_the_list_order(
+    client: AsyncClient, monkeypatch, stored_items
+):
+    regular = await _get(client, monkeypatch, "/api/v1/skills", raw=False)
+    raw = await _get(client, monkeypatch, "/api/v1/skills", raw=True)
+
+    # ListSkillsRequest default: newest (highest order_index) first
+    assert [s["order_index"] for s in raw.json()] == [3, 2, 1, 0]
+    assert [s["order_index"] for s in regular.json()] == [3, 2, 1, 0]
+
+
+async def test_sparse_fieldsets_keep_their_own_path(
+    client: AsyncClient, monkeypatch, stored_items
+):
+    path = "/api/v1/skills?fields=name"
+    regular = await _get(client, monkeypatch, path, raw=False)
+    raw = await _get(client, monkeypatch, path, raw=True)
+
+    assert regular.status_code == 200
+    assert raw.content == regular.content
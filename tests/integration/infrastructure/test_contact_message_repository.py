@@ -70,6 +70,39 @@ class TestContactMessageRepositoryCRUD:
         assert await contact_message_repo.exists("nonexistent") is False
 
 
+class TestContactMessageRepositoryListPage:
+    async def test_pages_cover_every_message_once(
+        self, contact_message_repo: ContactMessageRepository
+    ):
+        # Dos mensajes con la misma fecha: el desempate lo hace el _id
+        for i, day in enumerate([1, 2, 2, 3, 4]):
+            await contact_message_repo.add(
+                make_contact_message(id=f"m{i}", created_at=datetime(2024, 1, day))
+            )
+
+        seen = []
+        after = None
+        while True:
+            page = await contact_message_repo.list_page(limit=2, after=after)
+            if not page:
+                break
+            seen.extend(m.id for m in page)
+            after = (page[-1].created_at, page[-1].id)
+
+        assert seen == ["m4", "m3", "m2", "m1", "m0"]
+
+    async def test_ascending(self, contact_message_repo: ContactMessageRepository):
+        for i in range(3):
+            await contact_message_repo.add(
+                make_contact_message(id=f"m{i}", created_at=datetime(2024, 1, i + 1))
+            )
+
+        page = await contact_message_repo.list_page(
+            limit=2, after=(datetime(2024, 1, 1), "m0"), ascending=True
+        )
+        assert [m.id for m in page] == ["m1", "m2"]
+
+
 class TestContactMessageRepositoryStatusQueries:
     async def test_get_pending_messages(
         self, contact_message_repo: ContactMessageRepository
@@ -28,9 +28,11 @@ from app.api.dependencies import (
     get_additional_training_repository,
     get_certification_repository,
     get_contact_message_repository,
+    get_contact_message_stats_use_case,
     get_create_contact_information_use_case,
     get_create_contact_message_use_case,
     get_create_profile_use_case,
+    get_cv_fields_use_case,
     get_delete_additional_training_use_case,
     get_delete_certification_use_case,
     get_delete_contact_information_use_case,
@@ -57,7 +59,10 @@ from app.api.dependencies import (
     get_generate_cv_pdf_use_case,
     get_get_complete_cv_use_case,
     get_get_contact_information_use_case,
+    get_get_cv_snapshot_use_case,
     get_get_profile_use_case,
+    get_group_skills_use_case,
+    get_group_tools_use_case,
     get_language_repository,
     get_list_additional_trainings_use_case,
     get_list_certifications_use_case,
@@ -71,9 +76,19 @@ from app.api.dependencies import (
     get_list_tools_use_case,
     get_programming_language_repository,
     get_project_repository,
+    get_reorder_additional_trainings_use_case,
+    get_reorder_certifications_use_case,
+    get_reorder_education_use_case,
+    get_reorder_experiences_use_case,
+    get_reorder_projects_use_case,
+    get_reorder_skills_use_case,
+    get_reorder_social_networks_use_case,
+    get_reorder_tools_use_case,
     get_skill_repository,
+    get_skill_stats_use_case,
     get_social_network_repository,
     get_tool_repository,
+    get_tool_stats_use_case,
     get_update_contact_information_use_case,
     get_update_profile_use_case,
     get_work_experience_repository,
@@ -97,14 +112,38 @@ from app.application.dto import (
 )
 from app.application.dto.additional_training_dto import AdditionalTrainingListResponse
 from app.application.dto.certification_dto import CertificationListResponse
-from app.application.dto.contact_message_dto import ContactMessageListResponse
+from app.application.dto.contact_message_dto import (
+    ContactMessageListResponse,
+    ContactMessageStatsResponse,
+)
 from app.application.dto.language_dto import LanguageListResponse
 from app.application.dto.programming_language_dto import ProgrammingLanguageListResponse
 from app.application.dto.project_dto import ProjectListResponse
-from app.application.dto.skill_dto import SkillListResponse
+from app.application.dto.skill_dto import (
+    SkillGroupsResponse,
+    SkillListResponse,
+    SkillStatsResponse,
+)
 from app.application.dto.social_network_dto import SocialNetworkListResponse
-from app.application.dto.tool_dto import ToolListResponse
+from app.application.dto.tool_dto import (
+    ToolGroupsResponse,
+    ToolListResponse,
+    ToolStatsResponse,
+)
 from app.application.dto.work_experience_dto import WorkExperienceListResponse
+from app.application.use_cases import (
+    GetContactInformationFieldsUseCase,
+    GetCVFieldsUseCase,
+    GetProfileFieldsUseCase,
+    ListAdditionalTrainingFieldsUseCase,
+    ListCertificationFieldsUseCase,
+    ListEducationFieldsUseCase,
+    ListExperienceFieldsUseCase,
+    ListProjectFieldsUseCase,
+    ListSkillFieldsUseCase,
+    ListSocialNetworkFieldsUseCase,
+    ListToolFieldsUseCase,
+)
 from app.main import app
 from app.shared.shared_exceptions import NotFoundException
 
@@ -422,6 +461,18 @@ MOCK_MESSAGES = [
     ),
 ]
 
+MOCK_MESSAGE_STATS = ContactMessageStatsResponse(
+    total=len(MOCK_MESSAGES),
+    today=1,
+    this_week=3,
+    this_month=3,
+    # The last 7 days, including days without messages
+    by_day={
+        (NOW - timedelta(days=days_ago)).date().isoformat(): 1 if days_ago < 2 else 0
+        for days_ago in range(7)
+    },
+)
+
 # -- Tools --
 MOCK_TOOLS = [
     ToolDTO(
@@ -628,6 +679,18 @@ def _mock_repo(items):
         return [_make_entity_from_dto(dto) for dto in items]
 
     repo.find_by = AsyncMock(side_effect=mock_find_by)
+
+    async def mock_find_views(fields, spec=None, /, **kwargs):
+        # Equality filters only; mock items may use another profile_id
+        where = {**(spec.where if spec else {}), **kwargs}
+        where.pop("profile_id", None)
+        return [
+            {"id": dto.id, **{name: getattr(dto, name) for name in fields}}
+            for dto in items
+            if all(getattr(dto, k, None) == v for k, v in where.items())
+        ]
+
+    repo.find_views = AsyncMock(side_effect=mock_find_views)
     repo.delete = AsyncMock(return_value=True)
 
     return repo
@@ -670,12 +733,65 @@ def _mock_skill_list_uc():
         skills = MOCK_SKILLS
         if request.category:
             skills = [s for s in skills if s.category == request.category]
+        if request.level:
+            skills = [s for s in skills if s.level == request.level]
         return SkillListResponse(skills=skills, total=len(skills))
 
     uc.execute = AsyncMock(side_effect=execute)
     return uc
 
 
+def _group_by(items, field):
+    """Group items by field ("none" when unset), each group by order_index."""
+    groups = {}
+    for item in sorted(items, key=lambda i: i.order_index):
+        value = getattr(item, field)
+        groups.setdefault(value if value is not None else "none", []).append(item)
+    return groups
+
+
+def _count_by(items, field):
+    return {value: len(group) for value, group in _group_by(items, field).items()}
+
+
+def _mock_skill_group_uc():
+    """Skill group UC that groups MOCK_SKILLS by the requested field."""
+    uc = AsyncMock()
+
+    async def execute(request):
+        return SkillGroupsResponse(groups=_group_by(MOCK_SKILLS, request.field))
+
+    uc.execute = AsyncMock(side_effect=execute)
+    return uc
+
+
+def _mock_skill_stats_uc():
+    return _mock_list_uc(
+        SkillStatsResponse(
+            total=len(MOCK_SKILLS),
+            by_level=_count_by(MOCK_SKILLS, "level"),
+            by_category=_count_by(MOCK_SKILLS, "category"),
+        )
+    )
+
+
+def _mock_message_list_uc():
+    """Contact message list UC that pages MOCK_MESSAGES by limit and cursor."""
+    uc = AsyncMock()
+
+    async def execute(request):
+        start = int(request.cursor or 0)
+        end = start + request.limit
+        page = MOCK_MESSAGES[start:end]
+        next_cursor = str(end) if end < len(MOCK_MESSAGES) else None
+        return ContactMessageListResponse(
+            messages=page, total=len(page), next_cursor=next_cursor
+        )
+
+    uc.execute = AsyncMock(side_effect=execute)
+    return uc
+
+
 def _mock_tool_list_uc():
     """Tool list UC that respects category filter."""
     uc = AsyncMock()
@@ -690,6 +806,138 @@ def _mock_tool_list_uc():
     return uc
 
 
+def _mock_tool_group_uc():
+    return _mock_list_uc(ToolGroupsResponse(groups=_group_by(MOCK_TOOLS, "category")))
+
+
+def _mock_tool_stats_uc():
+    return _mock_list_uc(
+        ToolStatsResponse(
+            total=len(MOCK_TOOLS), by_category=_count_by(MOCK_TOOLS, "category")
+        )
+    )
+
+
+def _mock_experience_list_uc():
+    """Experience list UC that respects company and current_only filters."""
+    uc = AsyncMock()
+
+    async def execute(request):
+        experiences = MOCK_EXPERIENCES
+        if request.company:
+            company = request.company.lower()
+            experiences = [e for e in experiences if company in e.company.lower()]
+        if request.current_only:
+            experiences = [e for e in experiences if e.is_current]
+        return WorkExperienceListResponse(
+            experiences=experiences, total=len(experiences)
+        )
+
+    uc.execute = AsyncMock(side_effect=execute)
+    return uc
+
+
+def _mock_certification_list_uc():
+    """Certification list UC that respects issuer and expiry filters."""
+    uc = AsyncMock()
+
+    async def execute(request):
+        certs = MOCK_CERTIFICATIONS
+        if request.issuer:
+            issuer = request.issuer.lower()
+            certs = [c for c in certs if issuer in c.issuer.lower()]
+        if request.expired_only:
+            certs = [c for c in certs if c.is_expired]
+        if request.expiring_within_days is not None:
+            last_day = datetime.utcnow().date() + timedelta(
+                days=request.expiring_within_days
+            )
+            certs = [
+                c
+                for c in certs
+                if c.expiry_date is not None
+                and not c.is_expired
+                and c.expiry_date.date() <= last_day
+            ]
+        return CertificationListResponse(certifications=certs, total=len(certs))
+
+    uc.execute = AsyncMock(side_effect=execute)
+    return uc
+
+
+def _mock_social_network_list_uc():
+    """Social network list UC that respects platform filter."""
+    uc = AsyncMock()
+
+    async def execute(request):
+        networks = MOCK_SOCIAL_NETWORKS
+        if request.platform:
+            networks = [s for s in networks if s.platform == request.platform]
+        return SocialNetworkListResponse(social_networks=networks, total=len(networks))
+
+    uc.execute = AsyncMock(side_effect=execute)
+    return uc
+
+
+def _mock_language_list_uc():
+    """Language list UC that respects proficiency filter."""
+    uc = AsyncMock()
+
+    async def execute(request):
+        languages = MOCK_LANGUAGES
+        if request.proficiency:
+            proficiency = request.proficiency.lower()
+            languages = [lang for lang in languages if lang.proficiency == proficiency]
+        return LanguageListResponse(languages=languages, total=len(languages))
+
+    uc.execute = AsyncMock(side_effect=execute)
+    return uc
+
+
+def _mock_programming_language_list_uc():
+    """Programming language list UC that respects level filter."""
+    uc = AsyncMock()
+
+    async def execute(request):
+        languages = MOCK_PROGRAMMING_LANGUAGES
+        if request.level:
+            languages = [pl for pl in languages if pl.level == request.level.lower()]
+        return ProgrammingLanguageListResponse(
+            programming_languages=languages, total=len(languages)
+        )
+
+    uc.execute = AsyncMock(side_effect=execute)
+    return uc
+
+
+def _mock_cv_fields_uc():
+    """Sparse CV use case over mock repositories."""
+    return GetCVFieldsUseCase(
+        sections={
+            "profile": GetProfileFieldsUseCase(_mock_repo([MOCK_PROFILE])),
+            "contact_info": GetContactInformationFieldsUseCase(
+                _mock_repo([MOCK_CONTACT_INFO])
+            ),
+            "social_networks": ListSocialNetworkFieldsUseCase(
+                _mock_repo(MOCK_SOCIAL_NETWORKS)
+            ),
+            "work_experiences": ListExperienceFieldsUseCase(
+                _mock_repo(MOCK_EXPERIENCES)
+            ),
+            "projects": ListProjectFieldsUseCase(_mock_repo(MOCK_PROJECTS)),
+            "skills": ListSkillFieldsUseCase(_mock_repo(MOCK_SKILLS)),
+            "tools": ListToolFieldsUseCase(_mock_repo(MOCK_TOOLS)),
+            "education": ListEducationFieldsUseCase(_mock_repo(MOCK_EDUCATION)),
+            "additional_training": ListAdditionalTrainingFieldsUseCase(
+                _mock_repo(MOCK_TRAININGS)
+            ),
+            "certifications": ListCertificationFieldsUseCase(
+                _mock_repo(MOCK_CERTIFICATIONS)
+            ),
+        }
+    )
+
+
 # =====================================================================
 # APPLY OVERRIDES
 # =====================================================================
@@ -715,6 +963,8 @@ async def _apply_dependency_overrides():
 
     # -- Skills --
     app.dependency_overrides[get_list_skills_use_case] = _mock_skill_list_uc
+    app.dependency_overrides[get_group_skills_use_case] = _mock_skill_group_uc
+    app.dependency_overrides[get_skill_stats_use_case] = _mock_skill_stats_uc
     app.dependency_overrides[get_add_skill_use_case] = lambda: _mock_command_uc(
         return_value=MOCK_SKILLS[0]
     )
@@ -722,6 +972,9 @@ async def _apply_dependency_overrides():
         MOCK_SKILLS, "skill_id", MOCK_SKILLS[0]
     )
     app.dependency_overrides[get_delete_skill_use_case] = lambda: _mock_command_uc()
+    app.dependency_overrides[get_reorder_skills_use_case] = lambda: _mock_command_uc(
+        return_value=MOCK_SKILLS
+    )
     app.dependency_overrides[get_skill_repository] = lambda: _mock_repo(MOCK_SKILLS)
 
     # -- Education --
@@ -732,17 +985,15 @@ async def _apply_dependency_overrides():
         MOCK_EDUCATION, "education_id", MOCK_EDUCATION[0]
     )
     app.dependency_overrides[get_delete_education_use_case] = lambda: _mock_command_uc()
+    app.dependency_overrides[get_reorder_education_use_case] = lambda: _mock_command_uc(
+        return_value=MOCK_EDUCATION
+    )
     app.dependency_overrides[get_education_repository] = lambda: _mock_repo(
         MOCK_EDUCATION
     )
 
     # -- Work Experience --
-    exp_list_response = WorkExperienceListResponse(
-        experiences=MOCK_EXPERIENCES, total=len(MOCK_EXPERIENCES)
-    )
-    app.dependency_overrides[get_list_experiences_use_case] = lambda: _mock_list_uc(
-        exp_list_response
-    )
+    app.dependency_overrides[get_list_experiences_use_case] = _mock_experience_list_uc
     app.dependency_overrides[get_add_experience_use_case] = lambda: _mock_command_uc(
         return_value=MOCK_EXPERIENCES[0]
     )
@@ -752,6 +1003,9 @@ async def _apply_dependency_overrides():
     app.dependency_overrides[get_delete_experience_use_case] = (
         lambda: _mock_command_uc()
     )
+    app.dependency_overrides[get_reorder_experiences_use_case] = (
+        lambda: _mock_command_uc(return_value=MOCK_EXPERIENCES)
+    )
     app.dependency_overrides[get_work_experience_repository] = lambda: _mock_repo(
         MOCK_EXPERIENCES
     )
@@ -770,14 +1024,14 @@ async def _apply_dependency_overrides():
         MOCK_PROJECTS, "project_id", MOCK_PROJECTS[0]
     )
     app.dependency_overrides[get_delete_project_use_case] = lambda: _mock_command_uc()
+    app.dependency_overrides[get_reorder_projects_use_case] = lambda: _mock_command_uc(
+        return_value=MOCK_PROJECTS
+    )
     app.dependency_overrides[get_project_repository] = lambda: _mock_repo(MOCK_PROJECTS)
 
     # -- Certifications --
-    cert_list_response = CertificationListResponse(
-        certifications=MOCK_CERTIFICATIONS, total=len(MOCK_CERTIFICATIONS)
-    )
-    app.dependency_overrides[get_list_certifications_use_case] = lambda: _mock_list_uc(
-        cert_list_response
+    app.dependency_overrides[get_list_certifications_use_case] = (
+        _mock_certification_list_uc
     )
     app.dependency_overrides[get_add_certification_use_case] = lambda: _mock_command_uc(
         return_value=MOCK_CERTIFICATIONS[0]
@@ -788,6 +1042,9 @@ async def _apply_dependency_overrides():
     app.dependency_overrides[get_delete_certification_use_case] = (
         lambda: _mock_command_uc()
     )
+    app.dependency_overrides[get_reorder_certifications_use_case] = (
+        lambda: _mock_command_uc(return_value=MOCK_CERTIFICATIONS)
+    )
     app.dependency_overrides[get_certification_repository] = lambda: _mock_repo(
         MOCK_CERTIFICATIONS
     )
@@ -808,6 +1065,9 @@ async def _apply_dependency_overrides():
     app.dependency_overrides[get_delete_additional_training_use_case] = (
         lambda: _mock_command_uc()
     )
+    app.dependency_overrides[get_reorder_additional_trainings_use_case] = (
+        lambda: _mock_command_uc(return_value=MOCK_TRAININGS)
+    )
     app.dependency_overrides[get_additional_training_repository] = lambda: _mock_repo(
         MOCK_TRAININGS
     )
@@ -827,12 +1087,7 @@ async def _apply_dependency_overrides():
     )
 
     # -- Contact Messages --
-    msg_list_response = ContactMessageListResponse(
-        messages=MOCK_MESSAGES, total=len(MOCK_MESSAGES)
-    )
-    app.dependency_overrides[get_list_contact_messages_use_case] = (
-        lambda: _mock_list_uc(msg_list_response)
-    )
+    app.dependency_overrides[get_list_contact_messages_use_case] = _mock_message_list_uc
     app.dependency_overrides[get_create_contact_message_use_case] = (
         lambda: _mock_command_uc(return_value=MOCK_MESSAGES[0])
     )
@@ -842,9 +1097,14 @@ async def _apply_dependency_overrides():
     app.dependency_overrides[get_contact_message_repository] = lambda: _mock_repo(
         MOCK_MESSAGES
     )
+    app.dependency_overrides[get_contact_message_stats_use_case] = (
+        lambda: _mock_list_uc(MOCK_MESSAGE_STATS)
+    )
 
     # -- Tools --
     app.dependency_overrides[get_list_tools_use_case] = _mock_tool_list_uc
+    app.dependency_overrides[get_group_tools_use_case] = _mock_tool_group_uc
+    app.dependency_overrides[get_tool_stats_use_case] = _mock_tool_stats_uc
     app.dependency_overrides[get_add_tool_use_case] = lambda: _mock_command_uc(
         return_value=MOCK_TOOLS[0]
     )
@@ -852,14 +1112,14 @@ async def _apply_dependency_overrides():
         MOCK_TOOLS, "tool_id", MOCK_TOOLS[0]
     )
     app.dependency_overrides[get_delete_tool_use_case] = lambda: _mock_command_uc()
+    app.dependency_overrides[get_reorder_tools_use_case] = lambda: _mock_command_uc(
+        return_value=MOCK_TOOLS
+    )
     app.dependency_overrides[get_tool_repository] = lambda: _mock_repo(MOCK_TOOLS)
 
     # -- Social Networks --
-    social_list_response = SocialNetworkListResponse(
-        social_networks=MOCK_SOCIAL_NETWORKS, total=len(MOCK_SOCIAL_NETWORKS)
-    )
-    app.dependency_overrides[get_list_social_networks_use_case] = lambda: _mock_list_uc(
-        social_list_response
+    app.dependency_overrides[get_list_social_networks_use_case] = (
+        _mock_social_network_list_uc
     )
     app.dependency_overrides[get_add_social_network_use_case] = (
         lambda: _mock_command_uc(return_value=MOCK_SOCIAL_NETWORKS[0])
@@ -870,17 +1130,15 @@ async def _apply_dependency_overrides():
     app.dependency_overrides[get_delete_social_network_use_case] = (
         lambda: _mock_command_uc()
     )
+    app.dependency_overrides[get_reorder_social_networks_use_case] = (
+        lambda: _mock_command_uc(return_value=MOCK_SOCIAL_NETWORKS)
+    )
     app.dependency_overrides[get_social_network_repository] = lambda: _mock_repo(
         MOCK_SOCIAL_NETWORKS
     )
 
     # -- Languages --
-    lang_list_response = LanguageListResponse(
-        languages=MOCK_LANGUAGES, total=len(MOCK_LANGUAGES)
-    )
-    app.dependency_overrides[get_list_languages_use_case] = lambda: _mock_list_uc(
-        lang_list_response
-    )
+    app.dependency_overrides[get_list_languages_use_case] = _mock_language_list_uc
     app.dependency_overrides[get_add_language_use_case] = lambda: _mock_command_uc(
         return_value=MOCK_LANGUAGES[0]
     )
@@ -901,12 +1159,8 @@ async def _apply_dependency_overrides():
     )
 
     # -- Programming Languages --
-    pl_list_response = ProgrammingLanguageListResponse(
-        programming_languages=MOCK_PROGRAMMING_LANGUAGES,
-        total=len(MOCK_PROGRAMMING_LANGUAGES),
-    )
     app.dependency_overrides[get_list_programming_languages_use_case] = (
-        lambda: _mock_list_uc(pl_list_response)
+        _mock_programming_language_list_uc
     )
     app.dependency_overrides[get_add_programming_language_use_case] = (
         lambda: _mock_command_uc(return_value=MOCK_PROGRAMMING_LANGUAGES[0])
@@ -954,6 +1208,9 @@ async def _apply_dependency_overrides():
     app.dependency_overrides[get_get_complete_cv_use_case] = lambda: _mock_command_uc(
         return_value=cv_response
     )
+    # Snapshot read model disabled: /cv goes through GetCompleteCVUseCase
+    app.dependency_overrides[get_get_cv_snapshot_use_case] = lambda: None
+    app.dependency_overrides[get_cv_fields_use_case] = _mock_cv_fields_uc
 
     pdf_response = GenerateCVPDFResponse(
         success=True,
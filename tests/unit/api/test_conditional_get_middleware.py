@@ -0,0 +1,123 @@
+"""Tests for the conditional GET (ETag / 304) middleware."""
+
+from datetime import datetime
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+import pytest
+
+from app.api.middlewares.conditional_get_middleware import ConditionalGetMiddleware
+from app.shared.interfaces.content_version import (
+    ContentVersion,
+    IContentVersionRepository,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+class _FakeVersions(IContentVersionRepository):
+    def __init__(self):
+        self.versions: dict[str, ContentVersion] = {}
+        self.lookups = 0
+
+    async def bump(self, scope):
+        current = self.versions.get(scope, ContentVersion())
+        self.versions[scope] = ContentVersion(
+            current.version + 1, datetime(2025, 1, 1, 12, 0, 0)
+        )
+
+    async def get_versions(self, scopes):
+        self.lookups += 1
+        return {scope: self.versions.get(scope, ContentVersion()) for scope in scopes}
+
+
+@pytest.fixture
+def versions():
+    return _FakeVersions()
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+async def client(versions, calls):
+    app = FastAPI()
+    app.add_middleware(
+        ConditionalGetMiddleware,
+        version_store_factory=lambda request: versions,
+        prefix="/api/v1",
+    )
+
+    @app.get("/api/v1/skills")
+    async def list_skills():
+        calls.append("skills")
+        return [{"name": "Python"}]
+
+    @app.post("/api/v1/skills")
+    async def create_skill():
+        return {"ok": True}
+
+    @app.get("/api/v1/contact-messages")
+    async def list_messages():
+        return []
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
+
+
+class TestConditionalGetMiddleware:
+    async def test_emits_validators(self, client, versions):
+        await versions.bump("skills")
+
+        response = await client.get("/api/v1/skills")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["last-modified"] == "Wed, 01 Jan 2025 12:00:00 GMT"
+
+    async def test_matching_etag_returns_304_without_running_endpoint(
+        self, client, calls
+    ):
+        etag = (await client.get("/api/v1/skills")).headers["etag"]
+
+        response = await client.get("/api/v1/skills", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert calls == ["skills"]
+
+    async def test_weak_and_listed_etags_match(self, client):
+        etag = (await client.get("/api/v1/skills")).headers["etag"]
+
+        response = await client.get(
+            "/api/v1/skills", headers={"If-None-Match": f'"other", W/{etag}'}
+        )
+
+        assert response.status_code == 304
+
+    async def test_write_changes_etag(self, client, versions):
+        etag = (await client.get("/api/v1/skills")).headers["etag"]
+        await versions.bump("skills")
+
+        response = await client.get("/api/v1/skills", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    async def test_unrelated_write_keeps_etag(self, client, versions):
+        etag = (await client.get("/api/v1/skills")).headers["etag"]
+        await versions.bump("projects")
+
+        response = await client.get("/api/v1/skills", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+
+    async def test_non_public_and_write_requests_are_untouched(self, client, versions):
+        assert "etag" not in (await client.get("/api/v1/contact-messages")).headers
+        assert "etag" not in (await client.post("/api/v1/skills")).headers
+        assert versions.lookups == 0
@@ -9,22 +9,39 @@ PREFIX = "/api/v1/contact-messages"
 
 
 class TestListMessages:
-    async def test_list_messages_returns_list(self, client: AsyncClient):
+    async def test_list_messages_returns_page(self, client: AsyncClient):
         response = await client.get(PREFIX)
         assert response.status_code == 200
         data = response.json()
-        assert isinstance(data, list)
-        assert len(data) > 0
+        assert isinstance(data["messages"], list)
+        assert len(data["messages"]) > 0
+        assert data["next_cursor"] is None
 
     async def test_list_messages_has_required_fields(self, client: AsyncClient):
         response = await client.get(PREFIX)
         data = response.json()
-        first = data[0]
+        first = data["messages"][0]
         assert "id" in first
         assert "name" in first
         assert "email" in first
         assert "message" in first
 
+    async def test_list_messages_follows_next_cursor(self, client: AsyncClient):
+        first = (await client.get(PREFIX, params={"limit": 2})).json()
+        assert len(first["messages"]) == 2
+        assert first["next_cursor"] is not None
+
+        params = {"limit": 2, "cursor": first["next_cursor"]}
+        second = (await client.get(PREFIX, params=params)).json()
+        seen = {m["id"] for m in first["messages"]}
+        assert second["messages"]
+        assert not seen & {m["id"] for m in second["messages"]}
+        assert second["next_cursor"] is None
+
+    async def test_list_messages_rejects_out_of_range_limit(self, client: AsyncClient):
+        response = await client.get(PREFIX, params={"limit": 0})
+        assert response.status_code == 422
+
 
 class TestGetMessage:
     async def test_get_message_by_id(self, client: AsyncClient):
@@ -104,7 +121,7 @@ class TestMessageStats:
     async def test_stats_total_matches_list(self, client: AsyncClient):
         list_response = await client.get(PREFIX)
         stats_response = await client.get(f"{PREFIX}/stats/summary")
-        total_list = len(list_response.json())
+        total_list = len(list_response.json()["messages"])
         total_stats = stats_response.json()["total"]
         assert total_list == total_stats
 
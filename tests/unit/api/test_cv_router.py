@@ -52,6 +52,55 @@ class TestGetCompleteCV:
         assert len(data["education"]) > 0
 
 
+class TestGetCVSparseFields:
+    async def test_only_requested_sections_and_fields(self, client: AsyncClient):
+        response = await client.get(
+            PREFIX, params={"fields": "profile.name,skills.name,skills.level"}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == {"profile", "skills"}
+        assert set(data["profile"]) == {"id", "name"}
+        assert len(data["skills"]) > 0
+        assert all(set(s) == {"id", "name", "level"} for s in data["skills"])
+
+    async def test_section_without_field_is_complete(self, client: AsyncClient):
+        response = await client.get(PREFIX, params={"fields": "education"})
+        assert response.status_code == 200
+        education = response.json()["education"]
+        assert "institution" in education[0]
+        assert "is_ongoing" not in education[0]
+
+    async def test_unknown_section_returns_422(self, client: AsyncClient):
+        response = await client.get(PREFIX, params={"fields": "hobbies.name"})
+        assert response.status_code == 422
+
+
+class TestGetCVSelectedSections:
+    async def test_include_returns_only_those_sections(self, client: AsyncClient):
+        response = await client.get(PREFIX, params={"include": "projects"})
+        assert response.status_code == 200
+        assert set(response.json()) == {"profile", "projects", "missing_sections"}
+
+    async def test_exclude_drops_sections(self, client: AsyncClient):
+        response = await client.get(PREFIX, params={"exclude": "tools,skills"})
+        assert response.status_code == 200
+        data = response.json()
+        assert "tools" not in data
+        assert "skills" not in data
+        assert "education" in data
+        assert "languages" not in data
+
+    async def test_default_cv_has_no_opt_in_sections(self, client: AsyncClient):
+        response = await client.get(PREFIX)
+        assert response.json()["languages"] is None
+
+    @pytest.mark.parametrize("params", [{"include": "hobbies"}, {"exclude": "profile"}])
+    async def test_invalid_selection_returns_422(self, client: AsyncClient, params):
+        response = await client.get(PREFIX, params=params)
+        assert response.status_code == 422
+
+
 class TestDownloadCVPDF:
     async def test_download_returns_501(self, client: AsyncClient):
         response = await client.get(f"{PREFIX}/download")
@@ -34,3 +34,24 @@ class TestHealthCheckDB:
         assert "status" in data
         assert "database" in data
         assert data["database"] in ("connected", "disconnected")
+
+
+class TestHealthCheckCache:
+    async def test_health_cache_reports_cv_cache(self, client: AsyncClient):
+        response = await client.get(f"{PREFIX}/health/cache")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "ok"
+        assert isinstance(data["cv"]["enabled"], bool)
+        if data["cv"]["enabled"]:
+            assert {"hits", "misses", "evictions"} <= set(data["cv"])
+
+
+class TestHealthCheckPool:
+    async def test_health_pool_reports_limits_and_servers(self, client: AsyncClient):
+        response = await client.get(f"{PREFIX}/health/pool")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] in ("ok", "disconnected")
+        assert data["limits"]["max_pool_size"] >= 1
+        assert isinstance(data["servers"], dict)
@@ -0,0 +1,83 @@
+"""Tests for the raw public read responses (PUBLIC_RAW_READS)."""
+
+from datetime import datetime
+
+import pytest
+
+from app.api.raw_reads import (
+    CHUNK_BYTES,
+    encode_item,
+    raw_list_response,
+    response_fields,
+)
+from app.api.schemas.skill_schema import SkillResponse
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+async def _body(response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+class TestEncodeItem:
+    async def test_fields_follow_the_schema_order(self):
+        view = {"id": "s-1", "name": "Python", "level": None}
+
+        assert encode_item(view, ("name", "level", "id")) == (
+            b'{"name":"Python","level":null,"id":"s-1"}'
+        )
+
+    async def test_datetimes_and_non_ascii_text(self):
+        view = {"name": "Español", "created_at": datetime(2025, 1, 2, 3, 4, 5, 600)}
+
+        assert encode_item(view, ("name", "created_at")) == (
+            '{"name":"Español","created_at":"2025-01-02T03:04:05.000600"}'.encode()
+        )
+
+    async def test_response_fields_are_the_schema_fields(self):
+        assert set(response_fields(SkillResponse)) == {
+            "id",
+            "name",
+            "category",
+            "order_index",
+            "level",
+            "created_at",
+            "updated_at",
+        }
+
+
+class TestRawListResponse:
+    async def test_empty_list(self):
+        response = await raw_list_response(_aiter([]), ("id",))
+
+        assert response.media_type == "application/json"
+        assert await _body(response) == b"[]"
+
+    async def test_items_are_joined_as_a_json_array(self):
+        views = [{"id": "s-1"}, {"id": "s-2"}, {"id": "s-3"}]
+
+        response = await raw_list_response(_aiter(views), ("id",))
+
+        assert await _body(response) == b'[{"id":"s-1"},{"id":"s-2"},{"id":"s-3"}]'
+
+    async def test_large_lists_are_sent_in_chunks(self):
+        views = [{"id": "x" * 1000} for _ in range(3 * CHUNK_BYTES // 1000)]
+
+        response = await raw_list_response(_aiter(views), ("id",))
+        chunks = [chunk async for chunk in response.body_iterator]
+
+        assert len(chunks) > 1
+        assert b"".join(chunks).count(b'"id"') == len(views)
+
+    async def test_query_errors_are_raised_before_answering(self):
+        async def failing():
+            raise RuntimeError("connection lost")
+            yield  # pragma: no cover
+
+        with pytest.raises(RuntimeError):
+            await raw_list_response(failing(), ("id",))
@@ -0,0 +1,67 @@
+"""Tests for the read-your-writes middleware."""
+
+from fastapi import FastAPI, HTTPException, Request
+from httpx import ASGITransport, AsyncClient
+import pytest
+
+from app.api.middlewares.read_your_writes_middleware import (
+    PRIMARY_READS_COOKIE,
+    ReadYourWritesMiddleware,
+    reads_from_primary,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+async def client():
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, pin_seconds=120, path="/api/v1")
+
+    @app.get("/api/v1/skills")
+    async def list_skills(request: Request):
+        return {"primary": reads_from_primary(request)}
+
+    @app.post("/api/v1/skills")
+    async def create_skill(request: Request):
+        return {"primary": reads_from_primary(request)}
+
+    @app.delete("/api/v1/skills/{skill_id}")
+    async def delete_skill(skill_id: str):
+        raise HTTPException(status_code=404)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
+
+
+class TestReadYourWritesMiddleware:
+    async def test_public_reads_do_not_use_the_primary(self, client):
+        response = await client.get("/api/v1/skills")
+
+        assert response.json() == {"primary": False}
+        assert PRIMARY_READS_COOKIE not in response.cookies
+
+    async def test_writes_use_the_primary_and_pin_the_client(self, client):
+        response = await client.post("/api/v1/skills")
+
+        assert response.json() == {"primary": True}
+        cookie = response.headers["set-cookie"]
+        assert cookie.startswith(f"{PRIMARY_READS_COOKIE}=1")
+        assert "Max-Age=120" in cookie
+        assert "Path=/api/v1" in cookie
+        assert "HttpOnly" in cookie
+
+    async def test_reads_after_a_write_use_the_primary(self, client):
+        await client.post("/api/v1/skills")
+
+        response = await client.get("/api/v1/skills")
+
+        assert response.json() == {"primary": True}
+
+    async def test_failed_writes_do_not_pin(self, client):
+        response = await client.delete("/api/v1/skills/missing")
+
+        assert response.status_code == 404
+        assert "set-cookie" not in response.headers
@@ -0,0 +1,94 @@
+"""Tests for the orjson based default response class."""
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+import pytest
+
+from app.api.responses import FastJSONResponse, dumps
+from app.api.schemas.skill_schema import SkillResponse
+from app.domain.value_objects import SkillLevel
+from app.main import app
+
+
+@dataclass
+class _ItemDTO:
+    id: str
+    level: SkillLevel | None
+    created_at: datetime
+
+
+class TestDumps:
+    def test_matches_the_stdlib_response_for_jsonable_content(self):
+        content = {
+            "name": "Español",
+            "tags": ["a", "b"],
+            "count": 3,
+            "ratio": 0.5,
+            "ok": True,
+            "none": None,
+        }
+
+        assert dumps(content) == JSONResponse(content).body
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            datetime(2025, 1, 2, 3, 4, 5),
+            datetime(2025, 1, 2, 3, 4, 5, 600),
+            datetime(2025, 1, 2, 3, 4, 5, 120000, tzinfo=UTC),
+            date(2025, 1, 2),
+            UUID("12345678-1234-5678-1234-567812345678"),
+        ],
+    )
+    def test_native_types_match_jsonable_encoder(self, value):
+        content = {"value": value}
+
+        assert dumps(content) == JSONResponse(jsonable_encoder(content)).body
+
+    def test_dataclass_dtos_with_enum_value_objects(self):
+        dto = _ItemDTO(
+            id="s-1",
+            level=SkillLevel.create("advanced"),
+            created_at=datetime(2025, 1, 2),
+        )
+
+        assert dumps([dto]) == JSONResponse(jsonable_encoder([dto])).body
+        assert dumps(dto) == (
+            b'{"id":"s-1","level":{"level":"advanced"},'
+            b'"created_at":"2025-01-02T00:00:00"}'
+        )
+
+    def test_schemas_mappings_and_sets(self):
+        schema = SkillResponse(
+            id="s-1",
+            name="Python",
+            category="backend",
+            order_index=0,
+            created_at=datetime(2025, 1, 2),
+            updated_at=datetime(2025, 1, 2),
+        )
+
+        assert dumps({"skill": schema}) == (
+            JSONResponse(jsonable_encoder({"skill": schema})).body
+        )
+        assert dumps({1: {"tags": frozenset({"x"})}}) == b'{"1":{"tags":["x"]}}'
+
+    def test_unsupported_types_raise(self):
+        with pytest.raises(TypeError):
+            dumps({"value": object()})
+
+
+class TestFastJSONResponse:
+    def test_renders_with_orjson(self):
+        response = FastJSONResponse({"id": "s-1"}, status_code=201)
+
+        assert response.body == b'{"id":"s-1"}'
+        assert response.status_code == 201
+        assert response.media_type == "application/json"
+
+    def test_is_the_application_default(self):
+        assert app.router.default_response_class is FastJSONResponse
@@ -0,0 +1,154 @@
+"""Tests for the precompiled response serializers."""
+
+from dataclasses import asdict, dataclass
+from datetime import datetime
+
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter, ValidationError
+import pytest
+
+from app.api.responses import dumps
+from app.api.schemas.cv_schema import CVCompleteResponse
+from app.api.schemas.skill_schema import SkillResponse
+from app.api.serializers import ResponseSerializer, serializer_for
+from app.application.dto import (
+    CompleteCVResponse,
+    ProfileResponse as ProfileDTO,
+    SkillResponse as SkillDTO,
+)
+
+NOW = datetime(2025, 1, 2, 3, 4, 5, 600)
+
+
+def _skill(i: int, level: str | None = "expert") -> SkillDTO:
+    return SkillDTO(
+        id=f"skill-{i}",
+        profile_id="default_profile",
+        name=f"Skill {i}",
+        category="backend",
+        order_index=i,
+        level=level,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def _pydantic_json(response_type, dto) -> bytes:
+    """What FastAPI renders for ``dto`` with ``response_type`` as response_model."""
+    adapter = TypeAdapter(response_type)
+    return dumps(
+        adapter.dump_python(
+            adapter.validate_python(dto, from_attributes=True),
+            mode="json",
+            by_alias=True,
+        )
+    )
+
+
+class _Contact(BaseModel):
+    name: str
+    email: EmailStr
+    tags: list[str] = []
+
+
+class _Aliased(BaseModel):
+    display_name: str = Field(serialization_alias="displayName")
+
+
+@dataclass
+class _ContactDTO:
+    name: str
+    email: str
+
+
+@dataclass
+class _NamedDTO:
+    display_name: str
+
+
+class TestContent:
+    @pytest.mark.parametrize("validate", [False, True])
+    def test_lists_match_the_response_model(self, validate):
+        serializer = ResponseSerializer(list[SkillResponse], validate=validate)
+        skills = [_skill(0), _skill(1, level=None)]
+
+        content = serializer.content(skills)
+
+        assert dumps(content) == _pydantic_json(list[SkillResponse], skills)
+        assert list(content[0]) == list(SkillResponse.model_fields)
+
+    def test_the_cv_and_its_snapshot_match_the_response_model(self):
+        serializer = ResponseSerializer(CVCompleteResponse, validate=True)
+        cv = CompleteCVResponse(
+            profile=ProfileDTO(
+                id="profile-1",
+                name="Alex",
+                headline="Developer",
+                bio=None,
+                location=None,
+                avatar_url=None,
+                created_at=NOW,
+                updated_at=NOW,
+            ),
+            work_experiences=[],
+            skills=[_skill(0), _skill(1)],
+            education=[],
+        )
+        expected = _pydantic_json(CVCompleteResponse, cv)
+
+        assert dumps(serializer.content(cv)) == expected
+        # CV_SNAPSHOTS_ENABLED serves the CV as a stored dict
+        assert dumps(serializer.content(asdict(cv))) == expected
+
+    def test_fields_missing_on_the_dto_take_the_schema_default(self):
+        serializer = ResponseSerializer(_Contact, validate=True)
+
+        content = serializer.content(_ContactDTO(name="Ada", email="ada@example.com"))
+
+        assert content == {"name": "Ada", "email": "ada@example.com", "tags": []}
+
+    def test_fields_pydantic_may_change_go_through_pydantic(self):
+        serializer = ResponseSerializer(_Contact, validate=False)
+        dto = _ContactDTO(name="Ada", email="ada@EXAMPLE.com")
+
+        assert dumps(serializer.content(dto)) == _pydantic_json(_Contact, dto)
+
+    def test_schemas_with_aliases_go_through_pydantic(self):
+        serializer = ResponseSerializer(_Aliased, validate=False)
+
+        assert serializer.content(_NamedDTO(display_name="Ada")) == {
+            "displayName": "Ada"
+        }
+
+    def test_missing_required_fields_raise(self):
+        serializer = ResponseSerializer(_Contact, validate=False)
+
+        with pytest.raises(TypeError):
+            serializer.content({"name": "Ada"})
+
+    def test_only_validates_when_asked(self):
+        invalid = [_skill(0, level="guru")]
+
+        lenient = ResponseSerializer(list[SkillResponse], validate=False)
+        strict = ResponseSerializer(list[SkillResponse], validate=True)
+
+        assert lenient.content(invalid)[0]["level"] == "guru"
+        with pytest.raises(ValidationError):
+            strict.content(invalid)
+
+
+class TestResponse:
+    def test_renders_the_content(self):
+        serializer = ResponseSerializer(SkillResponse, validate=False)
+
+        response = serializer.response(_skill(0), status_code=201)
+
+        assert response.status_code == 201
+        assert response.body == _pydantic_json(SkillResponse, _skill(0))
+
+
+class TestSerializerFor:
+    def test_compiled_once_per_response_type(self):
+        assert serializer_for(list[SkillResponse]) is serializer_for(
+            list[SkillResponse]
+        )
+        assert serializer_for(SkillResponse) is not serializer_for(list[SkillResponse])
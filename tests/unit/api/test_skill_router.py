@@ -35,6 +35,26 @@ class TestListSkills:
         assert indices == sorted(indices)
 
 
+class TestListSkillsSparseFields:
+    async def test_only_requested_fields_and_id(self, client: AsyncClient):
+        response = await client.get(PREFIX, params={"fields": "name,level"})
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) > 0
+        assert all(set(s) == {"id", "name", "level"} for s in data)
+
+    async def test_fields_combine_with_filters(self, client: AsyncClient):
+        response = await client.get(
+            PREFIX, params={"fields": "name,category", "category": "backend"}
+        )
+        assert response.status_code == 200
+        assert all(s["category"] == "backend" for s in response.json())
+
+    async def test_unknown_field_returns_422(self, client: AsyncClient):
+        response = await client.get(PREFIX, params={"fields": "name,salary"})
+        assert response.status_code == 422
+
+
 class TestGetSkill:
     async def test_get_skill_by_id(self, client: AsyncClient):
         response = await client.get(f"{PREFIX}/skill_001")
@@ -0,0 +1,36 @@
+"""Tests for the memory layout of the DTOs (slotted dataclasses)."""
+
+from dataclasses import is_dataclass
+
+import pytest
+
+from app.application import dto
+from app.application.dto import SkillResponse
+
+from .conftest import make_entity
+
+DTO_CLASSES = [
+    cls for cls in vars(dto).values() if isinstance(cls, type) and is_dataclass(cls)
+]
+
+
+@pytest.mark.parametrize("cls", DTO_CLASSES, ids=lambda cls: cls.__name__)
+def test_instances_have_no_dict(cls):
+    assert "__dict__" not in dir(cls)
+
+
+def test_from_entity_builds_slotted_responses():
+    entity = make_entity(
+        id="s-1",
+        profile_id="p-1",
+        name="Python",
+        category="backend",
+        order_index=0,
+        level="expert",
+    )
+
+    response = SkillResponse.from_entity(entity)
+
+    assert response.name == "Python"
+    with pytest.raises(AttributeError):
+        response.extra = True
@@ -0,0 +1,103 @@
+"""Tests for the in-process CV cache and CV change listener composition."""
+
+import pytest
+
+from app.application.services.composite_cv_change_listener import (
+    CompositeCVChangeListener,
+)
+from app.application.services.cv_cache import CVResultCache
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCVResultCache:
+    def test_hit_and_miss_counters(self):
+        cache = CVResultCache()
+
+        assert cache.get("p") is None
+        cache.put("p", "cv")
+        assert cache.get("p") == "cv"
+
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_entries_expire_after_ttl(self):
+        clock = _FakeClock()
+        cache = CVResultCache(ttl_seconds=10, clock=clock)
+        cache.put("p", "cv")
+
+        clock.now = 9.9
+        assert cache.get("p") == "cv"
+        clock.now = 10
+        assert cache.get("p") is None
+        assert cache.expirations == 1
+
+    def test_lru_eviction(self):
+        cache = CVResultCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # "b" becomes least recently used
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_section_change_invalidates_everything(self):
+        cache = CVResultCache()
+        cache.put("p", "cv")
+
+        await cache.section_changed("skills")
+
+        assert cache.get("p") is None
+        assert cache.invalidations == 1
+
+    def test_put_from_before_invalidation_is_discarded(self):
+        cache = CVResultCache()
+        generation = cache.generation
+        cache.invalidate()
+
+        assert cache.put("p", "stale", generation) is False
+        assert cache.get("p") is None
+
+    def test_stats(self):
+        cache = CVResultCache(max_entries=4, ttl_seconds=30)
+        cache.put("p", "cv")
+        cache.get("p")
+        cache.get("q")
+
+        stats = cache.stats()
+
+        assert stats["size"] == 1
+        assert stats["hit_ratio"] == 0.5
+        assert stats["max_entries"] == 4
+
+    @pytest.mark.parametrize("options", [{"max_entries": 0}, {"ttl_seconds": 0}])
+    def test_invalid_options_raise(self, options):
+        with pytest.raises(ValueError):
+            CVResultCache(**options)
+
+
+class TestCompositeCVChangeListener:
+    @pytest.mark.asyncio
+    async def test_notifies_every_listener_in_order(self):
+        calls = []
+
+        class _Listener:
+            def __init__(self, name):
+                self.name = name
+
+            async def section_changed(self, section):
+                calls.append((self.name, section))
+
+        composite = CompositeCVChangeListener([_Listener("a"), _Listener("b")])
+        await composite.section_changed("tools")
+
+        assert calls == [("a", "tools"), ("b", "tools")]
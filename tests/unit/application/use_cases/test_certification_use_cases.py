@@ -0,0 +1,104 @@
+"""Tests for Certification use cases."""
+
+from datetime import date, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.dto import ListCertificationsRequest
+from app.application.use_cases.certification.list_certifications import (
+    ListCertificationsUseCase,
+)
+from app.shared.interfaces import Contains, Range
+from app.shared.shared_exceptions import ValidationException
+
+pytestmark = pytest.mark.asyncio
+
+PROFILE_ID = "profile-001"
+
+
+def _conditions(repo):
+    return repo.find_by.call_args.kwargs
+
+
+class TestListCertificationsUseCase:
+    async def test_list_without_filters(self):
+        repo = AsyncMock()
+        repo.find_by.return_value = []
+
+        uc = ListCertificationsUseCase(repo)
+        await uc.execute(ListCertificationsRequest(profile_id=PROFILE_ID))
+
+        repo.find_by.assert_awaited_once_with(profile_id=PROFILE_ID)
+
+    async def test_issuer_is_a_case_insensitive_substring(self):
+        repo = AsyncMock()
+        repo.find_by.return_value = []
+
+        uc = ListCertificationsUseCase(repo)
+        await uc.execute(ListCertificationsRequest(profile_id=PROFILE_ID, issuer="aws"))
+
+        assert _conditions(repo)["issuer"] == Contains("aws")
+
+    async def test_expired_only_is_an_upper_bound_on_expiry(self):
+        repo = AsyncMock()
+        repo.find_by.return_value = []
+
+        uc = ListCertificationsUseCase(repo)
+        await uc.execute(
+            ListCertificationsRequest(profile_id=PROFILE_ID, expired_only=True)
+        )
+
+        expiry = _conditions(repo)["expiry_date"]
+        assert isinstance(expiry, Range)
+        assert expiry.lt <= datetime.utcnow()
+        assert expiry.gte is None
+
+    async def test_expiring_within_days_ends_after_the_last_day(self):
+        repo = AsyncMock()
+        repo.find_by.return_value = []
+
+        uc = ListCertificationsUseCase(repo)
+        await uc.execute(
+            ListCertificationsRequest(profile_id=PROFILE_ID, expiring_within_days=0)
+        )
+
+        expiry = _conditions(repo)["expiry_date"]
+        # Hoy incluido: el límite es el inicio de mañana
+        assert expiry.gte <= datetime.utcnow()
+        assert (expiry.lt.date() - date.today()).days == 1
+        assert expiry.lt.time() == datetime.min.time()
+
+    async def test_expiring_window_counts_local_days(self, monkeypatch):
+        class _LocalDate(date):
+            @classmethod
+            def today(cls):
+                # Local date already a day ahead of UTC (e.g. UTC+2 at 23:30 UTC)
+                return date(2025, 3, 11)
+
+        monkeypatch.setattr(
+            "app.application.use_cases.certification.list_certifications.date",
+            _LocalDate,
+        )
+        repo = AsyncMock()
+        repo.find_by.return_value = []
+
+        uc = ListCertificationsUseCase(repo)
+        await uc.execute(
+            ListCertificationsRequest(profile_id=PROFILE_ID, expiring_within_days=7)
+        )
+
+        assert _conditions(repo)["expiry_date"].lt == datetime(2025, 3, 19)
+
+    async def test_expired_and_expiring_are_mutually_exclusive(self):
+        repo = AsyncMock()
+
+        uc = ListCertificationsUseCase(repo)
+        with pytest.raises(ValidationException):
+            await uc.execute(
+                ListCertificationsRequest(
+                    profile_id=PROFILE_ID, expired_only=True, expiring_within_days=30
+                )
+            )
+
+        repo.find_by.assert_not_awaited()
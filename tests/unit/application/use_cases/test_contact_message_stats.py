@@ -0,0 +1,111 @@
+from datetime import date, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.dto import (
+    DeleteContactMessageRequest,
+    GetContactMessageStatsRequest,
+)
+from app.application.use_cases.contact_message.delete_contact_message import (
+    DeleteContactMessageUseCase,
+)
+from app.application.use_cases.contact_message.get_contact_message_stats import (
+    GetContactMessageStatsUseCase,
+)
+from app.domain.entities.contact_message import ContactMessage
+from app.shared.shared_exceptions import NotFoundException
+
+pytestmark = [pytest.mark.unit, pytest.mark.asyncio]
+
+TODAY = date(2025, 3, 31)
+
+
+def _stats_repo(counts, total):
+    repo = AsyncMock()
+    repo.get_daily_counts.return_value = counts
+    repo.get_total.return_value = total
+    return repo
+
+
+class TestGetContactMessageStatsUseCase:
+    async def test_reads_only_the_last_month_of_buckets(self):
+        repo = _stats_repo({}, 0)
+
+        uc = GetContactMessageStatsUseCase(stats_repository=repo)
+        await uc.execute(GetContactMessageStatsRequest(today=TODAY))
+
+        repo.get_daily_counts.assert_awaited_once_with(date(2025, 3, 1))
+
+    async def test_windows_are_summed_from_daily_counts(self):
+        repo = _stats_repo(
+            {
+                date(2025, 3, 31): 2,
+                date(2025, 3, 30): 1,
+                date(2025, 3, 24): 4,  # 7 days ago: still this week
+                date(2025, 3, 23): 8,
+                date(2025, 3, 1): 16,  # 30 days ago: still this month
+            },
+            total=100,
+        )
+
+        uc = GetContactMessageStatsUseCase(stats_repository=repo)
+        result = await uc.execute(GetContactMessageStatsRequest(today=TODAY))
+
+        assert result.total == 100
+        assert result.today == 2
+        assert result.this_week == 7
+        assert result.this_month == 31
+
+    async def test_by_day_lists_the_last_seven_days(self):
+        repo = _stats_repo({date(2025, 3, 30): 3}, total=3)
+
+        uc = GetContactMessageStatsUseCase(stats_repository=repo)
+        result = await uc.execute(GetContactMessageStatsRequest(today=TODAY))
+
+        assert list(result.by_day) == [
+            "2025-03-31",
+            "2025-03-30",
+            "2025-03-29",
+            "2025-03-28",
+            "2025-03-27",
+            "2025-03-26",
+            "2025-03-25",
+        ]
+        assert result.by_day["2025-03-30"] == 3
+        assert result.by_day["2025-03-31"] == 0
+
+
+class TestDeleteContactMessageCounters:
+    async def test_decrements_the_bucket_of_the_creation_day(self):
+        message = ContactMessage.create(
+            name="Ana García",
+            email="ana@example.com",
+            message="Hola, me interesa tu trabajo en proyectos backend.",
+        )
+        message.created_at = datetime(2025, 1, 15, 10, 0)
+        repo = AsyncMock()
+        repo.get_by_id.return_value = message
+        repo.delete.return_value = True
+        stats = AsyncMock()
+
+        uc = DeleteContactMessageUseCase(
+            contact_message_repository=repo, stats_repository=stats
+        )
+        await uc.execute(DeleteContactMessageRequest(message_id=message.id))
+
+        stats.increment.assert_awaited_once_with(date(2025, 1, 15), -1)
+
+    async def test_missing_message_leaves_counters_alone(self):
+        repo = AsyncMock()
+        repo.get_by_id.return_value = None
+        repo.delete.return_value = False
+        stats = AsyncMock()
+
+        uc = DeleteContactMessageUseCase(
+            contact_message_repository=repo, stats_repository=stats
+        )
+        with pytest.raises(NotFoundException):
+            await uc.execute(DeleteContactMessageRequest(message_id="nope"))
+
+        stats.increment.assert_not_awaited()
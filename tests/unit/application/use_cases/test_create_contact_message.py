@@ -87,3 +87,30 @@ class TestCreateContactMessageUseCase:
         response = await uc.execute(_make_request())
 
         assert response.name == entity.name
+
+    async def test_increments_the_daily_counter(self):
+        repo = AsyncMock()
+        stats = AsyncMock()
+        entity = _make_entity()
+        repo.add.return_value = entity
+
+        uc = CreateContactMessageUseCase(
+            contact_message_repository=repo, stats_repository=stats
+        )
+        await uc.execute(_make_request())
+
+        stats.increment.assert_awaited_once_with(entity.created_at.date())
+
+    async def test_execute_succeeds_when_counter_update_fails(self):
+        repo = AsyncMock()
+        stats = AsyncMock()
+        stats.increment.side_effect = ConnectionError("mongo down")
+        entity = _make_entity()
+        repo.add.return_value = entity
+
+        uc = CreateContactMessageUseCase(
+            contact_message_repository=repo, stats_repository=stats
+        )
+        response = await uc.execute(_make_request())
+
+        assert response.name == entity.name
@@ -1,18 +1,23 @@
 """Tests for CV use cases."""
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock
 
 import pytest
 
 from app.application.dto import GenerateCVPDFRequest, GetCompleteCVRequest
+from app.application.services.cv_cache import CVResultCache
+from app.application.services.cv_snapshot_service import CVSnapshotService
 from app.application.use_cases.cv.generate_cv_pdf import GenerateCVPDFUseCase
 from app.application.use_cases.cv.get_complete_cv import GetCompleteCVUseCase
+from app.application.use_cases.cv.get_cv_snapshot import GetCVSnapshotUseCase
 from app.domain.entities.education import Education
+from app.domain.entities.language import Language
 from app.domain.entities.profile import Profile
 from app.domain.entities.skill import Skill
 from app.domain.entities.work_experience import WorkExperience
-from app.shared.shared_exceptions import NotFoundException
+from app.shared.shared_exceptions import NotFoundException, ValidationException
 
 pytestmark = pytest.mark.asyncio
 
@@ -97,7 +102,7 @@ def _make_all_repos(profile, *, contact_info=None):
     )
 
 
-def _make_use_case(profile, **repo_overrides):
+def _make_use_case(profile, **options):
     repos = _make_all_repos(profile)
     (
         profile_repo,
@@ -122,9 +127,20 @@ def _make_use_case(profile, **repo_overrides):
         tool_repository=tool_repo,
         additional_training_repository=additional_training_repo,
         certification_repository=certification_repo,
+        **options,
     )
 
 
+def _slow(value, delay):
+    """Build an async side effect that returns ``value`` after ``delay`` seconds."""
+
+    async def _side_effect(*_args, **_kwargs):
+        await asyncio.sleep(delay)
+        return value
+
+    return _side_effect
+
+
 class TestGetCompleteCVUseCase:
     async def test_get_cv_success(self):
         profile = _make_profile()
@@ -206,6 +222,425 @@ class TestGetCompleteCVUseCase:
         assert result.certifications == []
 
 
+class TestGetCompleteCVConcurrentFetch:
+    async def test_concurrent_matches_sequential(self):
+        profile = _make_profile()
+        repos = _make_all_repos(profile)
+        repos[1].get_all_ordered.return_value = [_make_experience(profile.id)]
+        repos[2].find_by.return_value = [_make_skill(profile.id)]
+        repos[3].get_all_ordered.return_value = [_make_education(profile.id)]
+        names = (
+            "profile_repository",
+            "experience_repository",
+            "skill_repository",
+            "education_repository",
+            "contact_info_repository",
+            "social_network_repository",
+            "project_repository",
+            "tool_repository",
+            "additional_training_repository",
+            "certification_repository",
+        )
+        kwargs = dict(zip(names, repos, strict=True))
+
+        sequential = await GetCompleteCVUseCase(**kwargs).execute(
+            GetCompleteCVRequest()
+        )
+        concurrent = await GetCompleteCVUseCase(
+            **kwargs, concurrent=True, max_concurrency=4
+        ).execute(GetCompleteCVRequest())
+
+        assert concurrent == sequential
+        assert concurrent.missing_sections == []
+
+    async def test_concurrent_no_profile_raises(self):
+        uc = _make_use_case(None, concurrent=True)
+        with pytest.raises(NotFoundException):
+            await uc.execute(GetCompleteCVRequest())
+
+    async def test_sections_run_in_parallel(self):
+        profile = _make_profile()
+        uc = _make_use_case(profile, concurrent=True)
+        for repo in (uc.experience_repo, uc.project_repo, uc.education_repo):
+            repo.get_all_ordered.side_effect = _slow([], 0.05)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await uc.execute(GetCompleteCVRequest())
+
+        # Three 50 ms calls overlap instead of adding up to 150 ms
+        assert loop.time() - started < 0.12
+
+    async def test_max_concurrency_is_respected(self):
+        profile = _make_profile()
+        uc = _make_use_case(profile, concurrent=True, max_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def tracked(*_args, **_kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        for repo in (uc.experience_repo, uc.project_repo, uc.education_repo):
+            repo.get_all_ordered.side_effect = tracked
+
+        await uc.execute(GetCompleteCVRequest())
+
+        assert peak <= 2
+
+    async def test_optional_section_timeout_returns_partial_cv(self):
+        profile = _make_profile()
+        uc = _make_use_case(profile, concurrent=True, section_timeout=0.02)
+        uc.project_repo.get_all_ordered.side_effect = _slow([object()], 1)
+        uc.contact_info_repo.find_by.side_effect = _slow([object()], 1)
+
+        result = await uc.execute(GetCompleteCVRequest())
+
+        assert result.profile.name == "Alex"
+        assert result.projects == []
+        assert result.contact_info is None
+        assert result.missing_sections == ["contact_info", "projects"]
+
+    async def test_sequential_section_timeout_returns_partial_cv(self):
+        profile = _make_profile()
+        uc = _make_use_case(profile, section_timeout=0.02)
+        uc.tool_repo.find_by.side_effect = _slow([object()], 1)
+
+        result = await uc.execute(GetCompleteCVRequest())
+
+        assert result.tools == []
+        assert result.missing_sections == ["tools"]
+
+    async def test_profile_timeout_raises(self):
+        profile = _make_profile()
+        uc = _make_use_case(profile, concurrent=True, section_timeout=0.02)
+        uc.profile_repo.get_profile.side_effect = _slow(profile, 1)
+
+        with pytest.raises(TimeoutError):
+            await uc.execute(GetCompleteCVRequest())
+
+    @pytest.mark.parametrize(
+        "options",
+        [{"max_concurrency": 0}, {"section_timeout": 0}],
+    )
+    async def test_invalid_options_raise(self, options):
+        with pytest.raises(ValueError):
+            _make_use_case(_make_profile(), **options)
+
+
+class TestGetCompleteCVAggregatedFetch:
+    async def test_uses_single_aggregated_read(self):
+        profile = _make_profile()
+        cv_repo = AsyncMock()
+        cv_repo.get_cv_sections.return_value = {
+            "profile": profile,
+            "contact_info": None,
+            "social_networks": [],
+            "work_experiences": [_make_experience(profile.id)],
+            "projects": [],
+            "skills": [_make_skill(profile.id)],
+            "tools": [],
+            "education": [_make_education(profile.id)],
+            "additional_training": [],
+            "certifications": [],
+        }
+        uc = _make_use_case(profile, cv_repository=cv_repo)
+
+        result = await uc.execute(GetCompleteCVRequest())
+
+        cv_repo.get_cv_sections.assert_awaited_once_with(
+            "default_profile", GetCompleteCVUseCase.DEFAULT_SECTIONS
+        )
+        uc.profile_repo.get_profile.assert_not_called()
+        uc.skill_repo.find_by.assert_not_called()
+        assert result.profile.name == "Alex"
+        assert len(result.work_experiences) == 1
+        assert len(result.skills) == 1
+        assert len(result.education) == 1
+
+    async def test_aggregated_no_profile_raises(self):
+        cv_repo = AsyncMock()
+        cv_repo.get_cv_sections.return_value = None
+        uc = _make_use_case(_make_profile(), cv_repository=cv_repo)
+
+        with pytest.raises(NotFoundException):
+            await uc.execute(GetCompleteCVRequest())
+
+
+class TestGetCompleteCVSectionSelection:
+    async def test_include_queries_only_the_requested_sections(self):
+        uc = _make_use_case(_make_profile())
+
+        result = await uc.execute(GetCompleteCVRequest(include=("projects",)))
+
+        assert result.profile.name == "Alex"
+        uc.project_repo.get_all_ordered.assert_awaited_once()
+        uc.skill_repo.find_by.assert_not_called()
+        uc.experience_repo.get_all_ordered.assert_not_called()
+        uc.contact_info_repo.find_by.assert_not_called()
+
+    async def test_exclude_skips_the_sections(self):
+        uc = _make_use_case(_make_profile(), concurrent=True)
+
+        await uc.execute(GetCompleteCVRequest(exclude=("tools", "skills")))
+
+        uc.tool_repo.find_by.assert_not_called()
+        uc.skill_repo.find_by.assert_not_called()
+        uc.project_repo.get_all_ordered.assert_awaited_once()
+
+    async def test_languages_are_opt_in(self):
+        profile = _make_profile()
+        language = Language.create(
+            profile_id=profile.id, name="English", order_index=0, proficiency="c1"
+        )
+        language_repo = AsyncMock()
+        language_repo.get_all_ordered.return_value = [language]
+        uc = _make_use_case(profile, language_repository=language_repo)
+
+        default = await uc.execute(GetCompleteCVRequest())
+        selected = await uc.execute(
+            GetCompleteCVRequest(include=("profile", "languages"))
+        )
+
+        assert default.languages is None
+        assert [lang.name for lang in selected.languages] == ["English"]
+        language_repo.get_all_ordered.assert_awaited_once_with(
+            profile_id="default_profile"
+        )
+
+    @pytest.mark.parametrize(
+        "request_",
+        [
+            GetCompleteCVRequest(include=("hobbies",)),
+            GetCompleteCVRequest(exclude=("profile",)),
+            # Opt-in section without its repository
+            GetCompleteCVRequest(include=("programming_languages",)),
+        ],
+    )
+    async def test_invalid_selection_raises(self, request_):
+        uc = _make_use_case(_make_profile())
+
+        with pytest.raises(ValidationException):
+            await uc.execute(request_)
+
+    async def test_select_sections_keeps_cv_order(self):
+        request = GetCompleteCVRequest(
+            include=("languages", "skills", "tools"), exclude=("tools",)
+        )
+
+        sections = GetCompleteCVUseCase.select_sections(request)
+
+        assert sections == ("profile", "skills", "languages")
+
+    async def test_aggregated_read_receives_the_selection(self):
+        profile = _make_profile()
+        cv_repo = AsyncMock()
+        cv_repo.get_cv_sections.return_value = {"profile": profile, "projects": []}
+        uc = _make_use_case(profile, cv_repository=cv_repo)
+
+        result = await uc.execute(GetCompleteCVRequest(include=("projects",)))
+
+        cv_repo.get_cv_sections.assert_awaited_once_with(
+            "default_profile", ("profile", "projects")
+        )
+        assert result.projects == []
+
+    async def test_custom_selection_is_not_cached(self):
+        cache = CVResultCache()
+        uc = _make_use_case(_make_profile(), cache=cache)
+
+        await uc.execute(GetCompleteCVRequest(include=("skills",)))
+
+        assert cache.stats()["size"] == 0
+
+
+class TestGetCompleteCVCached:
+    async def test_warm_hit_skips_repositories(self):
+        uc = _make_use_case(_make_profile(), cache=CVResultCache())
+
+        first = await uc.execute(GetCompleteCVRequest())
+        second = await uc.execute(GetCompleteCVRequest())
+
+        assert second is first
+        uc.profile_repo.get_profile.assert_awaited_once()
+        uc.skill_repo.find_by.assert_awaited_once()
+
+    async def test_invalidation_forces_rebuild(self):
+        cache = CVResultCache()
+        uc = _make_use_case(_make_profile(), cache=cache)
+
+        await uc.execute(GetCompleteCVRequest())
+        await cache.section_changed("skills")
+        await uc.execute(GetCompleteCVRequest())
+
+        assert uc.profile_repo.get_profile.await_count == 2
+
+    async def test_partial_cv_is_not_cached(self):
+        cache = CVResultCache()
+        uc = _make_use_case(_make_profile(), cache=cache, section_timeout=0.02)
+        uc.tool_repo.find_by.side_effect = _slow([], 1)
+
+        await uc.execute(GetCompleteCVRequest())
+
+        assert cache.stats()["size"] == 0
+
+
+def _make_snapshot_service(profile, snapshot=None):
+    snapshot_repo = AsyncMock()
+    snapshot_repo.get.return_value = snapshot
+    return CVSnapshotService(snapshot_repo, _make_use_case(profile))
+
+
+class TestCVSnapshotService:
+    async def test_returns_stored_snapshot(self):
+        stored = {"profile": {"name": "Alex"}}
+        service = _make_snapshot_service(_make_profile(), snapshot=stored)
+
+        result = await service.get_or_build()
+
+        assert result is stored
+        service.cv_use_case.profile_repo.get_profile.assert_not_called()
+
+    async def test_builds_and_stores_snapshot_on_miss(self):
+        profile = _make_profile()
+        service = _make_snapshot_service(profile)
+        service.cv_use_case.skill_repo.find_by.return_value = [_make_skill(profile.id)]
+
+        result = await service.get_or_build()
+
+        assert result["profile"]["name"] == "Alex"
+        assert result["skills"][0]["name"] == "Python"
+        service.snapshot_repo.save.assert_awaited_once()
+        assert service.snapshot_repo.save.await_args.args == ("default_profile", result)
+
+    async def test_partial_cv_is_not_stored(self):
+        service = _make_snapshot_service(_make_profile())
+        service.cv_use_case.section_timeout = 0.02
+        service.cv_use_case.tool_repo.find_by.side_effect = _slow([], 1)
+
+        result = await service.rebuild()
+
+        assert result["missing_sections"] == ["tools"]
+        service.snapshot_repo.save.assert_not_awaited()
+
+    async def test_rebuild_from_replica_reads_is_served_but_not_stored(self):
+        service = _make_snapshot_service(_make_profile())
+        service.store_rebuilds = False
+
+        result = await service.get_or_build()
+
+        assert result["profile"]["name"] == "Alex"
+        service.snapshot_repo.save.assert_not_awaited()
+
+    async def test_no_profile_raises(self):
+        service = _make_snapshot_service(None)
+
+        with pytest.raises(NotFoundException):
+            await service.get_or_build()
+
+    async def test_section_change_rewrites_only_that_section(self):
+        profile = _make_profile()
+        service = _make_snapshot_service(profile)
+        service.cv_use_case.skill_repo.find_by.return_value = [_make_skill(profile.id)]
+
+        await service.section_changed("skills")
+
+        service.snapshot_repo.save_section.assert_awaited_once()
+        profile_id, section, value = service.snapshot_repo.save_section.await_args.args
+        assert (profile_id, section) == ("default_profile", "skills")
+        assert [skill["name"] for skill in value] == ["Python"]
+        service.cv_use_case.experience_repo.get_all_ordered.assert_not_called()
+
+    async def test_section_version_is_taken_before_loading(self):
+        service = _make_snapshot_service(_make_profile())
+        versions = []
+
+        async def load_section(section):
+            versions.append(service._next_version())
+            return []
+
+        service.cv_use_case.load_section = load_section
+
+        await service.section_changed("skills")
+
+        version = service.snapshot_repo.save_section.await_args.kwargs["version"]
+        assert version <= versions[0]
+
+    async def test_stored_snapshot_recomputes_expiry(self):
+        stored = {
+            "certifications": [
+                {"expiry_date": datetime(2000, 1, 1), "is_expired": False},
+                {"expiry_date": datetime(2999, 1, 1), "is_expired": True},
+                {"expiry_date": None, "is_expired": True},
+            ]
+        }
+        service = _make_snapshot_service(_make_profile(), snapshot=stored)
+
+        result = await service.get_or_build()
+
+        assert [c["is_expired"] for c in result["certifications"]] == [
+            True,
+            False,
+            False,
+        ]
+
+    async def test_contact_info_section_serializes_single_item(self):
+        service = _make_snapshot_service(_make_profile())
+
+        await service.section_changed("contact_info")
+
+        _, section, value = service.snapshot_repo.save_section.await_args.args
+        assert section == "contact_info"
+        assert value is None
+
+    async def test_unknown_section_is_ignored(self):
+        service = _make_snapshot_service(_make_profile())
+
+        await service.section_changed("contact_messages")
+
+        service.snapshot_repo.save_section.assert_not_awaited()
+        service.snapshot_repo.delete.assert_not_awaited()
+
+    async def test_opt_in_section_is_not_stored(self):
+        service = _make_snapshot_service(_make_profile())
+
+        await service.section_changed("languages")
+
+        service.snapshot_repo.save_section.assert_not_awaited()
+
+    async def test_failed_refresh_invalidates_snapshot(self):
+        service = _make_snapshot_service(_make_profile())
+        service.cv_use_case.skill_repo.find_by.side_effect = RuntimeError("down")
+
+        await service.section_changed("skills")
+
+        service.snapshot_repo.save_section.assert_not_awaited()
+        service.snapshot_repo.delete.assert_awaited_once_with("default_profile")
+
+    async def test_failed_invalidation_does_not_raise(self):
+        service = _make_snapshot_service(_make_profile())
+        service.snapshot_repo.save_section.side_effect = RuntimeError("down")
+        service.snapshot_repo.delete.side_effect = RuntimeError("down")
+
+        await service.section_changed("skills")
+
+        service.snapshot_repo.delete.assert_awaited_once()
+
+
+class TestGetCVSnapshotUseCase:
+    async def test_returns_snapshot_from_service(self):
+        stored = {"profile": {"name": "Alex"}}
+        service = _make_snapshot_service(_make_profile(), snapshot=stored)
+
+        result = await GetCVSnapshotUseCase(service).execute(GetCompleteCVRequest())
+
+        assert result is stored
+
+
 class TestGenerateCVPDFUseCase:
     async def test_generate_pdf_placeholder(self):
         profile = _make_profile()
@@ -14,6 +14,7 @@ from app.application.use_cases.education.add_education import AddEducationUseCas
 from app.application.use_cases.education.delete_education import DeleteEducationUseCase
 from app.application.use_cases.education.edit_education import EditEducationUseCase
 from app.domain.entities.education import Education
+from app.domain.exceptions import DomainError
 from app.shared.shared_exceptions import (
     BusinessRuleViolationException,
     NotFoundException,
@@ -41,7 +42,6 @@ class TestAddEducationUseCase:
     async def test_add_education_success(self):
         repo = AsyncMock()
         education = _make_education()
-        repo.get_by_order_index.return_value = None
         repo.add.return_value = education
 
         uc = AddEducationUseCase(repo)
@@ -56,12 +56,14 @@ class TestAddEducationUseCase:
         result = await uc.execute(request)
 
         assert result.institution == "MIT"
-        repo.get_by_order_index.assert_awaited_once_with(PROFILE_ID, 0)
+        repo.get_by_order_index.assert_not_awaited()
         repo.add.assert_awaited_once()
 
     async def test_add_education_duplicate_order_raises(self):
         repo = AsyncMock()
-        repo.get_by_order_index.return_value = _make_education()
+        repo.add.side_effect = BusinessRuleViolationException(
+            "orderIndex must be unique per profile", {"orderIndex": 0}
+        )
 
         uc = AddEducationUseCase(repo)
         request = AddEducationRequest(
@@ -75,8 +77,6 @@ class TestAddEducationUseCase:
         with pytest.raises(BusinessRuleViolationException):
             await uc.execute(request)
 
-        repo.add.assert_not_awaited()
-
 
 class TestDeleteEducationUseCase:
     async def test_delete_education_success(self):
@@ -100,21 +100,50 @@ class TestDeleteEducationUseCase:
 
 class TestEditEducationUseCase:
     async def test_edit_education_success(self):
+        repo = AsyncMock()
+        repo.update_fields.return_value = _make_education(institution="Stanford")
+
+        uc = EditEducationUseCase(repo)
+        request = EditEducationRequest(education_id="edu-001", institution="Stanford")
+        result = await uc.execute(request)
+
+        assert result.institution == "Stanford"
+        repo.update_fields.assert_awaited_once_with(
+            "edu-001", {"institution": "Stanford"}
+        )
+        repo.get_by_id.assert_not_awaited()
+
+    async def test_edit_education_dates_load_the_education(self):
         repo = AsyncMock()
         education = _make_education()
         repo.get_by_id.return_value = education
         repo.update.return_value = education
 
         uc = EditEducationUseCase(repo)
-        request = EditEducationRequest(education_id="edu-001", institution="Stanford")
+        request = EditEducationRequest(
+            education_id="edu-001", end_date=datetime(2022, 6, 1)
+        )
         result = await uc.execute(request)
 
-        assert result.institution == "Stanford"
+        assert result.end_date == datetime(2022, 6, 1)
         repo.update.assert_awaited_once()
+        repo.update_fields.assert_not_awaited()
+
+    async def test_edit_education_invalid_dates_raise(self):
+        repo = AsyncMock()
+        repo.get_by_id.return_value = _make_education()
+
+        uc = EditEducationUseCase(repo)
+        request = EditEducationRequest(
+            education_id="edu-001", end_date=datetime(2017, 6, 1)
+        )
+        with pytest.raises(DomainError):
+            await uc.execute(request)
+        repo.update.assert_not_awaited()
 
     async def test_edit_education_not_found_raises(self):
         repo = AsyncMock()
-        repo.get_by_id.return_value = None
+        repo.update_fields.return_value = None
 
         uc = EditEducationUseCase(repo)
         request = EditEducationRequest(
@@ -74,9 +74,9 @@ class TestDeleteLanguageUseCase:
 class TestEditLanguageUseCase:
     async def test_edit_language_success(self):
         repo = AsyncMock()
-        lang = _make_language()
-        repo.get_by_id.return_value = lang
-        repo.update.return_value = lang
+        repo.update_fields.return_value = _make_language(
+            name="Spanish", proficiency="b2"
+        )
 
         uc = EditLanguageUseCase(repo)
         request = EditLanguageRequest(
@@ -85,11 +85,14 @@ class TestEditLanguageUseCase:
         result = await uc.execute(request)
 
         assert result.name == "Spanish"
-        repo.update.assert_awaited_once()
+        repo.update_fields.assert_awaited_once_with(
+            "lang-001", {"name": "Spanish", "proficiency": "b2"}
+        )
+        repo.get_by_id.assert_not_awaited()
 
     async def test_edit_language_not_found_raises(self):
         repo = AsyncMock()
-        repo.get_by_id.return_value = None
+        repo.update_fields.return_value = None
 
         uc = EditLanguageUseCase(repo)
         request = EditLanguageRequest(language_id="nonexistent", name="Spanish")
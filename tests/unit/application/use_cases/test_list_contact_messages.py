@@ -0,0 +1,109 @@
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.dto import ContactMessageCursor, ListContactMessagesRequest
+from app.application.use_cases.contact_message.list_contact_messages import (
+    ListContactMessagesUseCase,
+)
+from app.domain.entities.contact_message import ContactMessage
+from app.shared.shared_exceptions import ValidationException
+
+pytestmark = [pytest.mark.unit, pytest.mark.asyncio]
+
+
+def _make_messages(count):
+    messages = []
+    for i in range(count):
+        message = ContactMessage.create(
+            name="Ana García",
+            email="ana@example.com",
+            message="Hola, me interesa tu trabajo en proyectos backend.",
+        )
+        message.created_at = datetime(2025, 1, count - i)
+        messages.append(message)
+    return messages
+
+
+class TestContactMessageCursor:
+    def test_round_trip(self):
+        cursor = ContactMessageCursor(datetime(2025, 1, 15, 10, 30), "msg-1")
+
+        assert ContactMessageCursor.decode(cursor.encode()) == cursor
+
+    def test_token_is_opaque(self):
+        token = ContactMessageCursor(datetime(2025, 1, 15), "msg-1").encode()
+
+        assert "msg-1" not in token
+        assert "=" not in token
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "WzEsIDJd"])
+    def test_decode_rejects_malformed_tokens(self, token):
+        with pytest.raises(ValueError):
+            ContactMessageCursor.decode(token)
+
+
+class TestListContactMessagesUseCase:
+    async def test_first_page_asks_for_one_extra_message(self):
+        repo = AsyncMock()
+        repo.list_page.return_value = _make_messages(3)
+
+        uc = ListContactMessagesUseCase(contact_message_repository=repo)
+        await uc.execute(ListContactMessagesRequest(limit=2))
+
+        repo.list_page.assert_awaited_once_with(limit=3, after=None, ascending=False)
+
+    async def test_next_cursor_points_at_last_message_of_the_page(self):
+        messages = _make_messages(3)
+        repo = AsyncMock()
+        repo.list_page.return_value = messages
+
+        uc = ListContactMessagesUseCase(contact_message_repository=repo)
+        response = await uc.execute(ListContactMessagesRequest(limit=2))
+
+        assert [m.id for m in response.messages] == [m.id for m in messages[:2]]
+        assert response.total == 2
+        cursor = ContactMessageCursor.decode(response.next_cursor)
+        assert cursor.as_key() == (messages[1].created_at, messages[1].id)
+
+    async def test_last_page_has_no_next_cursor(self):
+        repo = AsyncMock()
+        repo.list_page.return_value = _make_messages(2)
+
+        uc = ListContactMessagesUseCase(contact_message_repository=repo)
+        response = await uc.execute(ListContactMessagesRequest(limit=2))
+
+        assert len(response.messages) == 2
+        assert response.next_cursor is None
+
+    async def test_cursor_is_passed_as_keyset_position(self):
+        repo = AsyncMock()
+        repo.list_page.return_value = []
+        cursor = ContactMessageCursor(datetime(2025, 1, 15), "msg-9")
+
+        uc = ListContactMessagesUseCase(contact_message_repository=repo)
+        await uc.execute(
+            ListContactMessagesRequest(limit=5, cursor=cursor.encode(), ascending=True)
+        )
+
+        repo.list_page.assert_awaited_once_with(
+            limit=6, after=(datetime(2025, 1, 15), "msg-9"), ascending=True
+        )
+
+    @pytest.mark.parametrize("limit", [0, 101])
+    async def test_rejects_limit_out_of_range(self, limit):
+        repo = AsyncMock()
+
+        uc = ListContactMessagesUseCase(contact_message_repository=repo)
+        with pytest.raises(ValidationException):
+            await uc.execute(ListContactMessagesRequest(limit=limit))
+
+        repo.list_page.assert_not_awaited()
+
+    async def test_rejects_malformed_cursor(self):
+        repo = AsyncMock()
+
+        uc = ListContactMessagesUseCase(contact_message_repository=repo)
+        with pytest.raises(ValidationException):
+            await uc.execute(ListContactMessagesRequest(cursor="garbage"))
@@ -0,0 +1,231 @@
+"""Tests for the sparse fieldset use cases."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.application.dto import (
+    GetCVFieldsRequest,
+    ListFieldsRequest,
+    ListSkillsRequest,
+)
+from app.application.use_cases.certification.list_certification_fields import (
+    ListCertificationFieldsUseCase,
+)
+from app.application.use_cases.cv.get_cv_fields import GetCVFieldsUseCase
+from app.application.use_cases.profile.get_profile_fields import (
+    GetProfileFieldsUseCase,
+)
+from app.application.use_cases.skill.list_skill_fields import ListSkillFieldsUseCase
+from app.application.use_cases.skill.list_skills import ListSkillsUseCase
+from app.application.use_cases.work_experience.list_experience_fields import (
+    ListExperienceFieldsUseCase,
+)
+from app.domain.entities.skill import Skill
+from app.shared.interfaces import FilterSpec
+from app.shared.shared_exceptions import ValidationException
+
+pytestmark = pytest.mark.asyncio
+
+PROFILE_ID = "profile-001"
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+def _repo(views):
+    repo = AsyncMock()
+    repo.find_views.return_value = views
+    return repo
+
+
+class _InMemorySkills:
+    """Skill repository over a list, sorting the views as MongoDB would."""
+
+    def __init__(self, skills):
+        self.skills = skills
+
+    async def find_by(self, spec=None, /, **filters):
+        return list(self.skills)
+
+    async def find_views(self, fields, spec=None, /, **filters):
+        skills = list(self.skills)
+        for name, direction in reversed(spec.sort):
+            skills.sort(key=lambda s: getattr(s, name), reverse=direction < 0)
+        return [{name: getattr(s, name) for name in ("id", *fields)} for s in skills]
+
+
+class TestListFieldsUseCase:
+    async def test_queries_only_the_requested_fields(self):
+        repo = _repo([{"id": "s-1", "name": "Python"}])
+
+        uc = ListSkillFieldsUseCase(repo)
+        result = await uc.execute(
+            ListFieldsRequest(profile_id=PROFILE_ID, fields=("name",))
+        )
+
+        repo.find_views.assert_awaited_once_with(
+            ("name",),
+            FilterSpec(where={"profile_id": PROFILE_ID}, sort=(("order_index", 1),)),
+        )
+        assert result == [{"id": "s-1", "name": "Python"}]
+
+    async def test_filters_without_value_are_ignored(self):
+        repo = _repo([])
+
+        uc = ListSkillFieldsUseCase(repo)
+        await uc.execute(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=("name", "name", "level"),
+                filters={"category": "Backend", "level": None},
+                ascending=False,
+            )
+        )
+
+        fields, spec = repo.find_views.await_args.args
+        assert fields == ("name", "level")
+        assert spec.where == {"category": "Backend", "profile_id": PROFILE_ID}
+        assert spec.sort == (("order_index", -1),)
+
+    @pytest.mark.parametrize(
+        ("ascending", "expected"),
+        [(None, [2, 1, 0]), (True, [0, 1, 2])],  # None: the list default
+    )
+    async def test_keeps_the_order_of_the_full_list(self, ascending, expected):
+        repo = _InMemorySkills(
+            [
+                Skill.create(
+                    profile_id=PROFILE_ID,
+                    name=f"Skill {i}",
+                    category="backend",
+                    order_index=i,
+                )
+                for i in (1, 0, 2)
+            ]
+        )
+        request = ListSkillsRequest(profile_id=PROFILE_ID)
+        if ascending is not None:
+            request.ascending = ascending
+
+        full = await ListSkillsUseCase(repo).execute(request)
+        views = await ListSkillFieldsUseCase(repo).execute(
+            ListFieldsRequest(
+                profile_id=PROFILE_ID,
+                fields=("order_index",),
+                ascending=request.ascending,
+            )
+        )
+
+        assert [s.order_index for s in full.skills] == expected
+        assert [v["order_index"] for v in views] == expected
+        assert [v["id"] for v in views] == [s.id for s in full.skills]
+
+    async def test_unknown_field_is_rejected(self):
+        repo = _repo([])
+
+        uc = ListSkillFieldsUseCase(repo)
+        with pytest.raises(ValidationException):
+            await uc.execute(
+                ListFieldsRequest(profile_id=PROFILE_ID, fields=("name", "salary"))
+            )
+        repo.find_views.assert_not_awaited()
+
+    async def test_computed_fields_cannot_be_requested(self):
+        assert "is_expired" not in ListCertificationFieldsUseCase.selectable_fields()
+        assert "is_current" not in ListExperienceFieldsUseCase.selectable_fields()
+
+    async def test_stream_yields_the_repository_views(self):
+        repo = MagicMock()
+        repo.stream_views.return_value = _aiter([{"id": "s-1", "name": "Python"}])
+
+        uc = ListSkillFieldsUseCase(repo)
+        views = [
+            view
+            async for view in uc.stream(
+                ListFieldsRequest(profile_id=PROFILE_ID, fields=("name", "name"))
+            )
+        ]
+
+        repo.stream_views.assert_called_once_with(
+            ("name",),
+            FilterSpec(where={"profile_id": PROFILE_ID}, sort=(("order_index", 1),)),
+        )
+        assert views == [{"id": "s-1", "name": "Python"}]
+
+    async def test_stream_rejects_unknown_fields_on_first_iteration(self):
+        repo = MagicMock()
+
+        uc = ListSkillFieldsUseCase(repo)
+        views = uc.stream(ListFieldsRequest(profile_id=PROFILE_ID, fields=("salary",)))
+        with pytest.raises(ValidationException):
+            await anext(views)
+        repo.stream_views.assert_not_called()
+
+        uc = ListCertificationFieldsUseCase(_repo([]))
+        with pytest.raises(ValidationException):
+            await uc.execute(
+                ListFieldsRequest(profile_id=PROFILE_ID, fields=("is_expired",))
+            )
+
+    async def test_at_least_one_field_is_required(self):
+        uc = ListSkillFieldsUseCase(_repo([]))
+
+        with pytest.raises(ValidationException):
+            await uc.execute(ListFieldsRequest(profile_id=PROFILE_ID, fields=()))
+
+    async def test_profile_is_neither_scoped_nor_ordered(self):
+        repo = _repo([{"id": "p-1", "name": "Ada"}])
+
+        uc = GetProfileFieldsUseCase(repo)
+        await uc.execute(ListFieldsRequest(profile_id=PROFILE_ID, fields=("name",)))
+
+        repo.find_views.assert_awaited_once_with(("name",), FilterSpec())
+
+
+class TestGetCVFieldsUseCase:
+    def _use_case(self, profile_views, skill_views):
+        self.profile_repo = _repo(profile_views)
+        self.skill_repo = _repo(skill_views)
+        return GetCVFieldsUseCase(
+            sections={
+                "profile": GetProfileFieldsUseCase(self.profile_repo),
+                "skills": ListSkillFieldsUseCase(self.skill_repo),
+            }
+        )
+
+    async def test_returns_only_the_requested_sections(self):
+        uc = self._use_case([], [{"id": "s-1", "name": "Python"}])
+
+        cv = await uc.execute(GetCVFieldsRequest(fields={"skills": ("name",)}))
+
+        assert cv == {"skills": [{"id": "s-1", "name": "Python"}]}
+        self.profile_repo.find_views.assert_not_awaited()
+
+    async def test_single_sections_are_one_view(self):
+        uc = self._use_case([{"id": "p-1", "headline": "Dev"}], [])
+
+        cv = await uc.execute(GetCVFieldsRequest(fields={"profile": ("headline",)}))
+
+        assert cv == {"profile": {"id": "p-1", "headline": "Dev"}}
+
+    async def test_section_without_fields_loads_every_stored_field(self):
+        uc = self._use_case([], [])
+
+        await uc.execute(GetCVFieldsRequest(fields={"skills": ()}))
+
+        fields = self.skill_repo.find_views.await_args.args[0]
+        assert fields == ListSkillFieldsUseCase.selectable_fields()
+
+    async def test_unknown_section_or_field_is_rejected_before_querying(self):
+        uc = self._use_case([], [])
+
+        with pytest.raises(ValidationException):
+            await uc.execute(GetCVFieldsRequest(fields={"hobbies": ("name",)}))
+        with pytest.raises(ValidationException):
+            await uc.execute(
+                GetCVFieldsRequest(fields={"profile": ("name",), "skills": ("salary",)})
+            )
+        self.profile_repo.find_views.assert_not_awaited()
@@ -86,9 +86,7 @@ class TestDeleteProgrammingLanguageUseCase:
 class TestEditProgrammingLanguageUseCase:
     async def test_edit_success(self):
         repo = AsyncMock()
-        pl = _make_pl()
-        repo.get_by_id.return_value = pl
-        repo.update.return_value = pl
+        repo.update_fields.return_value = _make_pl(name="Go", level="intermediate")
 
         uc = EditProgrammingLanguageUseCase(repo)
         request = EditProgrammingLanguageRequest(
@@ -97,11 +95,14 @@ class TestEditProgrammingLanguageUseCase:
         result = await uc.execute(request)
 
         assert result.name == "Go"
-        repo.update.assert_awaited_once()
+        repo.update_fields.assert_awaited_once_with(
+            "pl-001", {"name": "Go", "level": "intermediate"}
+        )
+        repo.get_by_id.assert_not_awaited()
 
     async def test_edit_not_found_raises(self):
         repo = AsyncMock()
-        repo.get_by_id.return_value = None
+        repo.update_fields.return_value = None
 
         uc = EditProgrammingLanguageUseCase(repo)
         request = EditProgrammingLanguageRequest(
@@ -0,0 +1,136 @@
+"""Tests for the reorder use cases."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.dto import ReorderItem, ReorderRequest, SkillResponse
+from app.application.use_cases.education.reorder_education import (
+    ReorderEducationUseCase,
+)
+from app.application.use_cases.skill.reorder_skills import ReorderSkillsUseCase
+from app.domain.entities.skill import Skill
+from app.domain.exceptions import InvalidOrderIndexError
+from app.shared.shared_exceptions import (
+    BusinessRuleViolationException,
+    NotFoundException,
+    ValidationException,
+)
+
+pytestmark = pytest.mark.asyncio
+
+PROFILE_ID = "profile-001"
+
+
+def _make_skills(*names):
+    return [
+        Skill.create(
+            profile_id=PROFILE_ID, name=name, category="backend", order_index=i
+        )
+        for i, name in enumerate(names)
+    ]
+
+
+def _request(**orders):
+    items = [ReorderItem(id=item_id, order_index=i) for item_id, i in orders.items()]
+    return ReorderRequest(profile_id=PROFILE_ID, items=items)
+
+
+def _repo(entities):
+    repo = AsyncMock()
+    repo.get_all_ordered.return_value = entities
+    repo.bulk_reorder.return_value = len(entities)
+    return repo
+
+
+class TestReorderSkillsUseCase:
+    async def test_swaps_two_items_in_one_write(self):
+        python, go = _make_skills("Python", "Go")
+        repo = _repo([python, go])
+
+        uc = ReorderSkillsUseCase(repo)
+        result = await uc.execute(_request(**{python.id: 1, go.id: 0}))
+
+        repo.get_all_ordered.assert_awaited_once_with(PROFILE_ID)
+        repo.bulk_reorder.assert_awaited_once_with(PROFILE_ID, {python.id: 1, go.id: 0})
+        assert [s.name for s in result] == ["Go", "Python"]
+        assert all(isinstance(s, SkillResponse) for s in result)
+
+    async def test_returns_items_left_out_in_place(self):
+        python, go, rust = _make_skills("Python", "Go", "Rust")
+        repo = _repo([python, go, rust])
+
+        uc = ReorderSkillsUseCase(repo)
+        result = await uc.execute(_request(**{python.id: 5}))
+
+        repo.bulk_reorder.assert_awaited_once_with(PROFILE_ID, {python.id: 5})
+        assert [(s.name, s.order_index) for s in result] == [
+            ("Go", 1),
+            ("Rust", 2),
+            ("Python", 5),
+        ]
+
+    async def test_collision_with_unlisted_item_raises(self):
+        python, go = _make_skills("Python", "Go")
+        repo = _repo([python, go])
+
+        uc = ReorderSkillsUseCase(repo)
+        with pytest.raises(BusinessRuleViolationException):
+            await uc.execute(_request(**{python.id: 1}))
+        repo.bulk_reorder.assert_not_awaited()
+
+    async def test_unknown_item_raises_not_found(self):
+        repo = _repo(_make_skills("Python"))
+
+        uc = ReorderSkillsUseCase(repo)
+        with pytest.raises(NotFoundException):
+            await uc.execute(_request(missing=0))
+        repo.bulk_reorder.assert_not_awaited()
+
+    async def test_repeated_item_raises_validation(self):
+        (python,) = _make_skills("Python")
+        repo = _repo([python])
+        request = ReorderRequest(
+            profile_id=PROFILE_ID,
+            items=[ReorderItem(python.id, 0), ReorderItem(python.id, 1)],
+        )
+
+        uc = ReorderSkillsUseCase(repo)
+        with pytest.raises(ValidationException):
+            await uc.execute(request)
+        repo.get_all_ordered.assert_not_awaited()
+
+    async def test_empty_request_raises_validation(self):
+        repo = _repo([])
+
+        uc = ReorderSkillsUseCase(repo)
+        with pytest.raises(ValidationException):
+            await uc.execute(ReorderRequest(profile_id=PROFILE_ID, items=[]))
+
+    async def test_negative_index_raises(self):
+        (python,) = _make_skills("Python")
+        repo = _repo([python])
+
+        uc = ReorderSkillsUseCase(repo)
+        with pytest.raises(InvalidOrderIndexError):
+            await uc.execute(_request(**{python.id: -1}))
+        repo.bulk_reorder.assert_not_awaited()
+
+    async def test_notifies_cv_listener(self):
+        python, go = _make_skills("Python", "Go")
+        listener = AsyncMock()
+
+        uc = ReorderSkillsUseCase(_repo([python, go]), cv_listener=listener)
+        await uc.execute(_request(**{python.id: 1, go.id: 0}))
+
+        listener.section_changed.assert_awaited_once_with("skills")
+
+
+class TestReorderEducationUseCase:
+    async def test_uses_its_own_section_and_resource(self):
+        listener = AsyncMock()
+
+        uc = ReorderEducationUseCase(_repo([]), cv_listener=listener)
+        with pytest.raises(NotFoundException, match="Education"):
+            await uc.execute(_request(missing=0))
+        listener.section_changed.assert_not_awaited()
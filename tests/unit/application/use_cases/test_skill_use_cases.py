@@ -8,14 +8,23 @@ from app.application.dto import (
     AddSkillRequest,
     DeleteSkillRequest,
     EditSkillRequest,
+    GetSkillStatsRequest,
+    GroupSkillsRequest,
     ListSkillsRequest,
 )
 from app.application.use_cases.skill.add_skill import AddSkillUseCase
 from app.application.use_cases.skill.delete_skill import DeleteSkillUseCase
 from app.application.use_cases.skill.edit_skill import EditSkillUseCase
+from app.application.use_cases.skill.get_skill_stats import GetSkillStatsUseCase
+from app.application.use_cases.skill.group_skills import GroupSkillsUseCase
 from app.application.use_cases.skill.list_skills import ListSkillsUseCase
 from app.domain.entities.skill import Skill
-from app.shared.shared_exceptions import DuplicateException, NotFoundException
+from app.domain.exceptions import DomainError
+from app.shared.shared_exceptions import (
+    DuplicateException,
+    NotFoundException,
+    ValidationException,
+)
 
 pytestmark = pytest.mark.asyncio
 
@@ -53,12 +62,13 @@ class TestAddSkillUseCase:
 
         assert result.name == "Python"
         assert result.category == "backend"
-        repo.exists_by_name.assert_awaited_once_with(PROFILE_ID, "Python")
+        # Uniqueness is enforced on write: no read before the insert
+        repo.exists_by_name.assert_not_awaited()
         repo.add.assert_awaited_once()
 
     async def test_add_skill_duplicate_name_raises(self):
         repo = AsyncMock()
-        repo.exists_by_name.return_value = True
+        repo.add.side_effect = DuplicateException("Skill", "name", "Python")
 
         uc = AddSkillUseCase(repo)
         request = AddSkillRequest(
@@ -70,7 +80,38 @@ class TestAddSkillUseCase:
         with pytest.raises(DuplicateException):
             await uc.execute(request)
 
-        repo.add.assert_not_awaited()
+    async def test_add_skill_notifies_cv_listener(self):
+        repo = AsyncMock()
+        repo.exists_by_name.return_value = False
+        repo.add.return_value = _make_skill()
+        listener = AsyncMock()
+
+        uc = AddSkillUseCase(repo, cv_listener=listener)
+        await uc.execute(
+            AddSkillRequest(
+                profile_id=PROFILE_ID, name="Python", category="backend", order_index=0
+            )
+        )
+
+        listener.section_changed.assert_awaited_once_with("skills")
+
+    async def test_failed_add_does_not_notify_cv_listener(self):
+        repo = AsyncMock()
+        repo.add.side_effect = DuplicateException("Skill", "name", "Python")
+        listener = AsyncMock()
+
+        uc = AddSkillUseCase(repo, cv_listener=listener)
+        with pytest.raises(DuplicateException):
+            await uc.execute(
+                AddSkillRequest(
+                    profile_id=PROFILE_ID,
+                    name="Python",
+                    category="backend",
+                    order_index=0,
+                )
+            )
+
+        listener.section_changed.assert_not_awaited()
 
 
 class TestDeleteSkillUseCase:
@@ -92,26 +133,53 @@ class TestDeleteSkillUseCase:
         with pytest.raises(NotFoundException):
             await uc.execute(DeleteSkillRequest(skill_id="nonexistent"))
 
+    async def test_delete_skill_notifies_cv_listener(self):
+        repo = AsyncMock()
+        repo.delete.return_value = True
+        listener = AsyncMock()
+
+        uc = DeleteSkillUseCase(repo, cv_listener=listener)
+        await uc.execute(DeleteSkillRequest(skill_id="skill-001"))
+
+        listener.section_changed.assert_awaited_once_with("skills")
+
 
 class TestEditSkillUseCase:
     async def test_edit_skill_success(self):
         repo = AsyncMock()
-        skill = _make_skill()
-        repo.get_by_id.return_value = skill
-        repo.exists_by_name.return_value = False
-        repo.update.return_value = skill
+        repo.update_fields.return_value = _make_skill(name="Go")
 
         uc = EditSkillUseCase(repo)
         request = EditSkillRequest(skill_id="skill-001", name="Go", category="backend")
         result = await uc.execute(request)
 
         assert result.name == "Go"
-        repo.get_by_id.assert_awaited_once_with("skill-001")
-        repo.update.assert_awaited_once()
+        repo.update_fields.assert_awaited_once_with(
+            "skill-001", {"name": "Go", "category": "backend"}
+        )
+        repo.get_by_id.assert_not_awaited()
+
+    async def test_edit_skill_normalizes_level(self):
+        repo = AsyncMock()
+        repo.update_fields.return_value = _make_skill()
+
+        uc = EditSkillUseCase(repo)
+        await uc.execute(EditSkillRequest(skill_id="skill-001", level="Advanced"))
+
+        repo.update_fields.assert_awaited_once_with("skill-001", {"level": "advanced"})
+
+    async def test_edit_skill_invalid_name_raises_without_writing(self):
+        repo = AsyncMock()
+
+        uc = EditSkillUseCase(repo)
+        request = EditSkillRequest(skill_id="skill-001", name="   ")
+        with pytest.raises(DomainError):
+            await uc.execute(request)
+        repo.update_fields.assert_not_awaited()
 
     async def test_edit_skill_not_found_raises(self):
         repo = AsyncMock()
-        repo.get_by_id.return_value = None
+        repo.update_fields.return_value = None
 
         uc = EditSkillUseCase(repo)
         request = EditSkillRequest(skill_id="nonexistent", name="Go")
@@ -120,9 +188,7 @@ class TestEditSkillUseCase:
 
     async def test_edit_skill_duplicate_name_raises(self):
         repo = AsyncMock()
-        skill = _make_skill()
-        repo.get_by_id.return_value = skill
-        repo.exists_by_name.return_value = True
+        repo.update_fields.side_effect = DuplicateException("Skill", "name", "Go")
 
         uc = EditSkillUseCase(repo)
         request = EditSkillRequest(skill_id="skill-001", name="Go")
@@ -131,9 +197,7 @@ class TestEditSkillUseCase:
 
     async def test_edit_skill_same_name_no_duplicate_check(self):
         repo = AsyncMock()
-        skill = _make_skill()
-        repo.get_by_id.return_value = skill
-        repo.update.return_value = skill
+        repo.update_fields.return_value = _make_skill()
 
         uc = EditSkillUseCase(repo)
         request = EditSkillRequest(skill_id="skill-001", name="Python")
@@ -167,6 +231,16 @@ class TestListSkillsUseCase:
         assert result.total == 1
         repo.find_by.assert_awaited_once_with(profile_id=PROFILE_ID, category="backend")
 
+    async def test_list_skills_filter_by_level(self):
+        repo = AsyncMock()
+        repo.find_by.return_value = [_make_skill()]
+
+        uc = ListSkillsUseCase(repo)
+        request = ListSkillsRequest(profile_id=PROFILE_ID, level="expert")
+        await uc.execute(request)
+
+        repo.find_by.assert_awaited_once_with(profile_id=PROFILE_ID, level="expert")
+
     async def test_list_skills_empty(self):
         repo = AsyncMock()
         repo.find_by.return_value = []
@@ -177,3 +251,47 @@ class TestListSkillsUseCase:
 
         assert result.total == 0
         assert result.skills == []
+
+
+class TestGroupSkillsUseCase:
+    async def test_group_skills_by_level(self):
+        repo = AsyncMock()
+        repo.group_by.return_value = {
+            "expert": [_make_skill()],
+            None: [_make_skill(name="Go", order_index=1, level=None)],
+        }
+
+        uc = GroupSkillsUseCase(repo)
+        request = GroupSkillsRequest(profile_id=PROFILE_ID, field="level")
+        result = await uc.execute(request)
+
+        repo.group_by.assert_awaited_once_with(PROFILE_ID, "level")
+        assert list(result.groups) == ["expert", "none"]
+        assert result.groups["none"][0].name == "Go"
+
+    async def test_group_skills_unknown_field_raises(self):
+        repo = AsyncMock()
+
+        uc = GroupSkillsUseCase(repo)
+        with pytest.raises(ValidationException):
+            await uc.execute(GroupSkillsRequest(profile_id=PROFILE_ID, field="name"))
+
+        repo.group_by.assert_not_awaited()
+
+
+class TestGetSkillStatsUseCase:
+    async def test_skill_stats_from_counts(self):
+        repo = AsyncMock()
+        repo.count_by.return_value = {
+            "level": {"expert": 2, None: 1},
+            "category": {"backend": 2, "frontend": 1},
+        }
+
+        uc = GetSkillStatsUseCase(repo)
+        result = await uc.execute(GetSkillStatsRequest(profile_id=PROFILE_ID))
+
+        repo.count_by.assert_awaited_once_with(PROFILE_ID, ("level", "category"))
+        assert result.total == 3
+        assert result.by_level == {"expert": 2, "none": 1}
+        assert result.by_category == {"backend": 2, "frontend": 1}
+        repo.find_by.assert_not_awaited()
@@ -24,6 +24,7 @@ from app.application.use_cases.work_experience.list_experiences import (
     ListExperiencesUseCase,
 )
 from app.domain.entities.work_experience import WorkExperience
+from app.shared.interfaces import Contains, FilterSpec
 from app.shared.shared_exceptions import (
     BusinessRuleViolationException,
     NotFoundException,
@@ -50,7 +51,6 @@ class TestAddExperienceUseCase:
     async def test_add_experience_success(self):
         repo = AsyncMock()
         exp = _make_experience()
-        repo.get_by_order_index.return_value = None
         repo.add.return_value = exp
 
         uc = AddExperienceUseCase(repo)
@@ -69,7 +69,9 @@ class TestAddExperienceUseCase:
 
     async def test_add_experience_duplicate_order_raises(self):
         repo = AsyncMock()
-        repo.get_by_order_index.return_value = _make_experience()
+        repo.add.side_effect = BusinessRuleViolationException(
+            "orderIndex must be unique per profile", {"orderIndex": 0}
+        )
 
         uc = AddExperienceUseCase(repo)
         request = AddExperienceRequest(
@@ -82,8 +84,6 @@ class TestAddExperienceUseCase:
         with pytest.raises(BusinessRuleViolationException):
             await uc.execute(request)
 
-        repo.add.assert_not_awaited()
-
 
 class TestDeleteExperienceUseCase:
     async def test_delete_experience_success(self):
@@ -106,21 +106,36 @@ class TestDeleteExperienceUseCase:
 
 class TestEditExperienceUseCase:
     async def test_edit_experience_success(self):
+        repo = AsyncMock()
+        repo.update_fields.return_value = _make_experience(role="Senior Dev")
+
+        uc = EditExperienceUseCase(repo)
+        request = EditExperienceRequest(experience_id="exp-001", role="Senior Dev")
+        result = await uc.execute(request)
+
+        assert result.role == "Senior Dev"
+        repo.update_fields.assert_awaited_once_with("exp-001", {"role": "Senior Dev"})
+        repo.get_by_id.assert_not_awaited()
+
+    async def test_edit_experience_dates_load_the_experience(self):
         repo = AsyncMock()
         exp = _make_experience()
         repo.get_by_id.return_value = exp
         repo.update.return_value = exp
 
         uc = EditExperienceUseCase(repo)
-        request = EditExperienceRequest(experience_id="exp-001", role="Senior Dev")
+        request = EditExperienceRequest(
+            experience_id="exp-001", role="Lead", end_date=datetime(2024, 1, 1)
+        )
         result = await uc.execute(request)
 
-        assert result.role == "Senior Dev"
+        assert result.role == "Lead"
         repo.update.assert_awaited_once()
+        repo.update_fields.assert_not_awaited()
 
     async def test_edit_experience_not_found_raises(self):
         repo = AsyncMock()
-        repo.get_by_id.return_value = None
+        repo.update_fields.return_value = None
 
         uc = EditExperienceUseCase(repo)
         request = EditExperienceRequest(experience_id="nonexistent", role="Dev")
@@ -129,9 +144,7 @@ class TestEditExperienceUseCase:
 
     async def test_edit_experience_with_responsibilities(self):
         repo = AsyncMock()
-        exp = _make_experience()
-        repo.get_by_id.return_value = exp
-        repo.update.return_value = exp
+        repo.update_fields.return_value = _make_experience()
 
         uc = EditExperienceUseCase(repo)
         request = EditExperienceRequest(
@@ -140,7 +153,9 @@ class TestEditExperienceUseCase:
         )
         await uc.execute(request)
 
-        repo.update.assert_awaited_once()
+        repo.update_fields.assert_awaited_once_with(
+            "exp-001", {"responsibilities": ["Code review", "Architecture"]}
+        )
 
 
 class TestListExperiencesUseCase:
@@ -171,3 +186,22 @@ class TestListExperiencesUseCase:
         repo.get_all_ordered.assert_awaited_once_with(
             profile_id=PROFILE_ID, ascending=True
         )
+
+    async def test_list_experiences_filters_in_repository(self):
+        repo = AsyncMock()
+        repo.find_by.return_value = [_make_experience()]
+
+        uc = ListExperiencesUseCase(repo)
+        request = ListExperiencesRequest(
+            profile_id=PROFILE_ID, company="tech", current_only=True
+        )
+        result = await uc.execute(request)
+
+        assert result.total == 1
+        repo.find_by.assert_awaited_once_with(
+            FilterSpec(sort=(("order_index", -1),)),
+            profile_id=PROFILE_ID,
+            company=Contains("tech"),
+            end_date=None,
+        )
+        repo.get_all_ordered.assert_not_awaited()
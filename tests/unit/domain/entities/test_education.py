@@ -772,3 +772,26 @@ class TestEducationEdgeCases:
         # They should be very close (within a second)
         time_diff = abs((education.updated_at - education.created_at).total_seconds())
         assert time_diff < 1
+
+
+class TestEducationValidateChanges:
+    """Tests for validating field changes without the stored education."""
+
+    def test_field_changes_can_update_partially(self):
+        """Should validate changes to fields with their own rules."""
+        changes = {"institution": "MIT", "description": "   "}
+
+        assert Education.can_update_partially(changes)
+        assert Education.validate_changes(changes) == {
+            "institution": "MIT",
+            "description": None,
+        }
+
+    def test_date_changes_need_the_stored_education(self):
+        """Should not validate dates without the other end of the range."""
+        assert not Education.can_update_partially({"end_date": datetime(2024, 1, 1)})
+
+    def test_invalid_institution_raises_error(self):
+        """Should raise the entity's error for an invalid change."""
+        with pytest.raises(InvalidInstitutionError):
+            Education.validate_changes({"institution": ""})
@@ -95,3 +95,33 @@ class TestSkillUpdate:
 
         assert skill.name == "Advanced Python"
         assert skill.level == "advanced"
+
+
+@pytest.mark.entity
+class TestSkillValidateChanges:
+    """Test validating field changes without the stored skill."""
+
+    def test_validate_changes_normalizes_level(self):
+        """Should return the changes as the entity stores them."""
+        changes = Skill.validate_changes({"name": "Go", "level": "Advanced"})
+
+        assert changes == {"name": "Go", "level": "advanced"}
+
+    def test_validate_changes_empty_level_becomes_none(self):
+        """Should clear the level when changed to whitespace."""
+        assert Skill.validate_changes({"level": "  "}) == {"level": None}
+
+    def test_validate_changes_runs_field_rules(self):
+        """Should raise the entity's errors for invalid changes."""
+        with pytest.raises(InvalidNameError):
+            Skill.validate_changes({"name": "   "})
+
+        with pytest.raises(InvalidSkillLevelError):
+            Skill.validate_changes({"level": "master"})
+
+    def test_validate_changes_rejects_unknown_fields(self):
+        """Should refuse fields that cannot be changed on their own."""
+        assert not Skill.can_update_partially({"order_index": 3})
+
+        with pytest.raises(ValueError):
+            Skill.validate_changes({"order_index": 3})
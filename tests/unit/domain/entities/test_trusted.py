@@ -0,0 +1,73 @@
+"""
+Tests for trusted entity construction (build_trusted).
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.domain.entities import Skill, build_trusted
+
+
+@pytest.mark.entity
+class TestBuildTrusted:
+    """Test building entities from already validated values."""
+
+    def test_same_entity_as_the_constructor(self, profile_id):
+        """Should build the entity the constructor builds from valid values."""
+        values = {
+            "id": "skill-1",
+            "profile_id": profile_id,
+            "name": "Python",
+            "category": "backend",
+            "order_index": 0,
+            "level": "expert",
+            "created_at": datetime(2025, 1, 1),
+            "updated_at": datetime(2025, 1, 2),
+        }
+
+        assert build_trusted(Skill, **values) == Skill(**values)
+
+    def test_skips_validation(self, profile_id):
+        """Should not check invariants."""
+        skill = build_trusted(
+            Skill,
+            id="skill-1",
+            profile_id=profile_id,
+            name="",
+            category="x",
+            order_index=-1,
+        )
+
+        assert skill.name == ""
+        assert skill.order_index == -1
+
+    def test_fills_defaults(self, profile_id):
+        """Should apply field defaults and default factories."""
+        skill = build_trusted(
+            Skill,
+            id="skill-1",
+            profile_id=profile_id,
+            name="Go",
+            category="backend",
+            order_index=0,
+        )
+
+        assert skill.level is None
+        assert isinstance(skill.created_at, datetime)
+
+    def test_unknown_or_missing_fields_raise(self, profile_id):
+        """Should reject values the constructor would reject by signature."""
+        with pytest.raises(TypeError):
+            build_trusted(Skill, id="s-1", profile_id=profile_id, name="Go")
+
+        with pytest.raises(TypeError):
+            build_trusted(
+                Skill,
+                id="s-1",
+                profile_id=profile_id,
+                name="Go",
+                category="backend",
+                order_index=0,
+                salary=1,
+            )
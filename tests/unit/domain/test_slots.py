@@ -0,0 +1,63 @@
+"""
+Unit tests for the memory layout of entities and value objects.
+
+Entities and value objects are slotted dataclasses: no per-instance
+``__dict__``, class constants kept out of the fields.
+"""
+
+from dataclasses import FrozenInstanceError, fields, is_dataclass
+
+import pytest
+
+from app.domain import entities, value_objects
+from app.domain.entities import Project, Skill
+from app.domain.value_objects import SkillLevel
+
+DATACLASSES = [
+    cls
+    for module in (entities, value_objects)
+    for cls in vars(module).values()
+    if isinstance(cls, type) and is_dataclass(cls)
+]
+
+
+@pytest.mark.parametrize("cls", DATACLASSES, ids=lambda cls: cls.__name__)
+def test_instances_have_no_dict(cls):
+    assert "__dict__" not in dir(cls)
+
+
+def test_constants_are_not_fields():
+    names = {f.name for f in fields(Project)}
+
+    assert "URL_PATTERN" not in names
+    assert "FIELD_VALIDATORS" not in names
+    assert Project.MAX_TITLE_LENGTH == 100
+
+
+def test_created_entities_reject_unknown_attributes():
+    skill = Skill.create(
+        profile_id="profile-1", name="Python", category="backend", order_index=0
+    )
+
+    with pytest.raises(AttributeError):
+        skill.nickname = "py"
+
+
+def test_update_info_still_mutates_the_entity():
+    skill = Skill.create(
+        profile_id="profile-1", name="Python", category="backend", order_index=0
+    )
+    created = skill.updated_at
+
+    skill.update_info(name="Go", level="expert")
+
+    assert skill.name == "Go"
+    assert skill.level == "expert"
+    assert skill.updated_at >= created
+
+
+def test_value_objects_stay_frozen():
+    level = SkillLevel.create("advanced")
+
+    with pytest.raises(FrozenInstanceError):
+        level.level = None
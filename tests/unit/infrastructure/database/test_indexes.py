@@ -0,0 +1,216 @@
+"""Unit tests for the index registry and its startup reconciliation."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from pymongo.errors import OperationFailure
+import pytest
+
+from app.infrastructure.database.indexes import (
+    ASCENDING,
+    CASE_INSENSITIVE,
+    DESCENDING,
+    IndexReport,
+    IndexSpec,
+    reconcile_indexes,
+    require_unique_indexes,
+)
+from app.infrastructure.repositories import build_index_registry
+from app.main import ensure_indexes
+
+ORDERED = IndexSpec(keys=(("profile_id", ASCENDING), ("order_index", ASCENDING)))
+UNIQUE_NAME = IndexSpec(
+    keys=(("profile_id", ASCENDING), ("name", ASCENDING)),
+    unique=True,
+    collation=CASE_INSENSITIVE,
+)
+RECENT = IndexSpec(keys=(("created_at", DESCENDING),))
+
+
+def make_db(existing: dict) -> tuple[MagicMock, MagicMock]:
+    collection = MagicMock()
+    collection.index_information = AsyncMock(return_value=existing)
+    collection.create_index = AsyncMock()
+    db = MagicMock()
+    db.__getitem__ = MagicMock(return_value=collection)
+    return db, collection
+
+
+ID_INDEX = {"_id_": {"key": [("_id", 1)]}}
+
+
+class TestIndexSpec:
+    def test_name_follows_mongo_default(self):
+        assert ORDERED.name == "profile_id_1_order_index_1"
+        assert RECENT.name == "created_at_-1"
+
+    def test_matches_on_keys_and_unique(self):
+        info = {"key": [("profile_id", 1), ("order_index", 1)]}
+
+        assert ORDERED.matches(info)
+        assert not ORDERED.matches({**info, "unique": True})
+        assert not RECENT.matches(info)
+
+    def test_matches_on_declared_collation(self):
+        info = {
+            "key": [("profile_id", 1), ("name", 1)],
+            "unique": True,
+            "collation": {"locale": "en", "strength": 2, "caseLevel": False},
+        }
+
+        assert UNIQUE_NAME.matches(info)
+        assert not UNIQUE_NAME.matches({**info, "collation": {"locale": "simple"}})
+        info.pop("collation")
+        assert not UNIQUE_NAME.matches(info)
+
+
+class TestReconcileIndexes:
+    @pytest.mark.asyncio
+    async def test_creates_missing_indexes(self):
+        db, collection = make_db(dict(ID_INDEX))
+
+        reports = await reconcile_indexes(db, {"skills": (ORDERED,)})
+
+        collection.create_index.assert_awaited_once_with(
+            [("profile_id", 1), ("order_index", 1)],
+            name="profile_id_1_order_index_1",
+            unique=False,
+        )
+        assert reports[0].created == ["profile_id_1_order_index_1"]
+        assert reports[0].in_sync
+
+    @pytest.mark.asyncio
+    async def test_existing_index_is_left_alone(self):
+        db, collection = make_db(
+            {**ID_INDEX, "custom": {"key": [("profile_id", 1), ("order_index", 1)]}}
+        )
+
+        reports = await reconcile_indexes(db, {"skills": (ORDERED,)})
+
+        collection.create_index.assert_not_awaited()
+        assert reports[0].created == []
+        assert reports[0].extra == []
+
+    @pytest.mark.asyncio
+    async def test_reports_undeclared_indexes_without_dropping(self):
+        db, collection = make_db({**ID_INDEX, "id_1": {"key": [("id", 1)]}})
+
+        reports = await reconcile_indexes(db, {"profiles": ()})
+
+        assert reports[0].extra == ["id_1"]
+        assert not reports[0].in_sync
+        collection.drop_index.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_dry_run_only_reports(self):
+        db, collection = make_db(dict(ID_INDEX))
+
+        reports = await reconcile_indexes(db, {"skills": (ORDERED,)}, dry_run=True)
+
+        collection.create_index.assert_not_awaited()
+        assert reports[0].missing == ["profile_id_1_order_index_1"]
+
+    @pytest.mark.asyncio
+    async def test_creation_failure_is_reported(self):
+        db, collection = make_db(dict(ID_INDEX))
+        collection.create_index.side_effect = OperationFailure("conflict")
+
+        reports = await reconcile_indexes(db, {"skills": (ORDERED, RECENT)})
+
+        assert reports[0].failed == ["profile_id_1_order_index_1", "created_at_-1"]
+
+    @pytest.mark.asyncio
+    async def test_creates_unique_index_with_collation(self):
+        db, collection = make_db(dict(ID_INDEX))
+
+        await reconcile_indexes(db, {"skills": (UNIQUE_NAME,)})
+
+        collection.create_index.assert_awaited_once_with(
+            [("profile_id", 1), ("name", 1)],
+            name="profile_id_1_name_1",
+            unique=True,
+            collation={"locale": "en", "strength": 2},
+        )
+
+    @pytest.mark.asyncio
+    async def test_unavailable_unique_indexes_are_reported(self):
+        db, collection = make_db(dict(ID_INDEX))
+
+        [dry_run] = await reconcile_indexes(
+            db, {"skills": (ORDERED, UNIQUE_NAME)}, dry_run=True
+        )
+        collection.create_index.side_effect = OperationFailure("duplicate key")
+        [failed] = await reconcile_indexes(db, {"skills": (ORDERED, UNIQUE_NAME)})
+
+        assert dry_run.unique_unavailable == ["profile_id_1_name_1"]
+        assert failed.unique_unavailable == ["profile_id_1_name_1"]
+
+
+class TestRequireUniqueIndexes:
+    def test_passes_when_only_plain_indexes_are_missing(self):
+        require_unique_indexes(
+            [IndexReport("skills", missing=["created_at_-1"], failed=["x_1"])]
+        )
+
+    def test_raises_naming_the_missing_unique_indexes(self):
+        reports = [
+            IndexReport("skills", unique_unavailable=["profile_id_1_name_1"]),
+            IndexReport("tools"),
+        ]
+
+        with pytest.raises(RuntimeError, match="skills.profile_id_1_name_1"):
+            require_unique_indexes(reports)
+
+
+class TestEnsureIndexes:
+    @pytest.fixture
+    def db(self, monkeypatch):
+        db, collection = make_db(dict(ID_INDEX))
+        monkeypatch.setattr("app.main.MongoDBClient.get_db", lambda: db)
+        return collection
+
+    @pytest.mark.asyncio
+    async def test_fails_startup_when_a_unique_index_cannot_be_built(self, db):
+        db.create_index.side_effect = OperationFailure("duplicate key")
+
+        with pytest.raises(RuntimeError, match="únicos"):
+            await ensure_indexes()
+
+    @pytest.mark.asyncio
+    async def test_only_verifies_when_creation_is_disabled(self, db, monkeypatch):
+        monkeypatch.setattr("app.main.settings.MONGODB_ENSURE_INDEXES", False)
+
+        with pytest.raises(RuntimeError):
+            await ensure_indexes()
+        db.create_index.assert_not_awaited()
+
+
+class TestIndexRegistry:
+    def test_covers_the_queried_fields(self):
+        registry = build_index_registry()
+        unique_order = IndexSpec(keys=ORDERED.keys, unique=True)
+
+        assert unique_order in registry["work_experiences"]
+        assert unique_order in registry["additional_trainings"]
+        assert UNIQUE_NAME in registry["skills"]
+        assert UNIQUE_NAME in registry["tools"]
+        assert (
+            IndexSpec(
+                keys=(("profile_id", ASCENDING), ("platform", ASCENDING)),
+                unique=True,
+                collation=CASE_INSENSITIVE,
+            )
+            in registry["social_networks"]
+        )
+        assert (
+            IndexSpec(keys=(("status", ASCENDING), ("created_at", DESCENDING)))
+            in registry["contact_messages"]
+        )
+
+    def test_rank_mode_adds_the_rank_index_to_ordered_collections(self):
+        registry = build_index_registry(rank_ordering=True)
+        rank = IndexSpec(keys=(("profile_id", ASCENDING), ("rank", ASCENDING)))
+
+        assert rank in registry["projects"]
+        assert rank in registry["skills"]
+        assert rank not in registry["contact_messages"]
+        assert rank not in build_index_registry()["projects"]
@@ -0,0 +1,131 @@
+"""Unit tests for MongoDBClient pool and read preference configuration."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from pymongo.read_preferences import SecondaryPreferred
+import pytest
+
+from app.infrastructure.database import mongo_client
+from app.infrastructure.database.mongo_client import MongoDBClient
+from app.infrastructure.database.native_client import NativeMongoClient
+from app.infrastructure.database.pool_metrics import PoolMetricsListener
+
+
+@pytest.fixture
+def pool_settings(monkeypatch):
+    def _set(**values):
+        defaults = {
+            "MONGODB_MAX_POOL_SIZE": 20,
+            "MONGODB_MIN_POOL_SIZE": 2,
+            "MONGODB_MAX_IDLE_TIME_MS": None,
+            "MONGODB_WAIT_QUEUE_TIMEOUT_MS": None,
+            "MONGODB_SERVER_SELECTION_TIMEOUT_MS": 5000,
+            "MONGODB_COMPRESSORS": "",
+            "MONGODB_APP_NAME": "portfolio-test",
+        }
+        for name, value in {**defaults, **values}.items():
+            monkeypatch.setattr(mongo_client.settings, name, value, raising=False)
+
+    return _set
+
+
+class TestClientOptions:
+    def test_pool_limits_and_listener(self, pool_settings):
+        pool_settings()
+        listener = PoolMetricsListener()
+
+        options = MongoDBClient._client_options(listener)
+
+        assert options == {
+            "maxPoolSize": 20,
+            "minPoolSize": 2,
+            "serverSelectionTimeoutMS": 5000,
+            "appname": "portfolio-test",
+            "event_listeners": [listener],
+        }
+
+    def test_optional_settings_are_passed_when_set(self, pool_settings):
+        pool_settings(
+            MONGODB_MAX_IDLE_TIME_MS=60000,
+            MONGODB_WAIT_QUEUE_TIMEOUT_MS=2000,
+            MONGODB_COMPRESSORS="zstd, zlib",
+        )
+
+        options = MongoDBClient._client_options(PoolMetricsListener())
+
+        assert options["maxIdleTimeMS"] == 60000
+        assert options["waitQueueTimeoutMS"] == 2000
+        assert options["compressors"] == ["zstd", "zlib"]
+
+
+class TestPrewarmPool:
+    @pytest.mark.asyncio
+    async def test_opens_min_pool_size_connections(self):
+        client = MagicMock()
+        client.admin.command = AsyncMock(return_value={"ok": 1})
+
+        await MongoDBClient._prewarm_pool(client, 3)
+
+        assert client.admin.command.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_zero_skips_prewarm(self):
+        client = MagicMock()
+        client.admin.command = AsyncMock()
+
+        await MongoDBClient._prewarm_pool(client, 0)
+
+        client.admin.command.assert_not_called()
+
+
+class TestReadDatabase:
+    def test_primary_reads_use_the_same_database(self, monkeypatch):
+        monkeypatch.setattr(
+            mongo_client.settings, "MONGODB_READ_PREFERENCE", "primary", raising=False
+        )
+        db = MagicMock()
+
+        assert MongoDBClient._read_database(db) is db
+        db.with_options.assert_not_called()
+
+    def test_secondary_reads_get_the_read_preference(self, monkeypatch):
+        monkeypatch.setattr(
+            mongo_client.settings,
+            "MONGODB_READ_PREFERENCE",
+            "secondaryPreferred",
+            raising=False,
+        )
+        monkeypatch.setattr(
+            mongo_client.settings, "MONGODB_MAX_STALENESS_SECONDS", 90, raising=False
+        )
+        db = MagicMock()
+
+        read_db = MongoDBClient._read_database(db)
+
+        assert read_db is db.with_options.return_value
+        preference = db.with_options.call_args.kwargs["read_preference"]
+        assert isinstance(preference, SecondaryPreferred)
+        assert preference.max_staleness == 90
+
+
+class TestDisconnect:
+    @pytest.mark.asyncio
+    async def test_closes_motor_synchronously(self, monkeypatch):
+        client = MagicMock()
+        monkeypatch.setattr(MongoDBClient, "client", client)
+
+        await MongoDBClient.disconnect()
+
+        client.close.assert_called_once_with()
+        assert MongoDBClient.client is None
+
+    @pytest.mark.asyncio
+    async def test_awaits_the_native_client(self, monkeypatch):
+        client = MagicMock(spec=NativeMongoClient)
+        client.close = AsyncMock()
+        monkeypatch.setattr(MongoDBClient, "client", client)
+
+        await MongoDBClient.disconnect()
+
+        client.close.assert_awaited_once_with()
+        assert MongoDBClient.client is None
@@ -0,0 +1,129 @@
+"""Unit tests for the native AsyncMongoClient adapter."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.infrastructure.database import native_client
+from app.infrastructure.database.native_client import (
+    DeferredCommandCursor,
+    NativeCollection,
+    NativeMongoClient,
+)
+
+
+class _AsyncCursor:
+    """Minimal AsyncCommandCursor: async iteration and to_list."""
+
+    def __init__(self, docs):
+        self._docs = docs
+        self.to_list = AsyncMock(return_value=docs)
+        self.close = AsyncMock()
+
+    async def __aiter__(self):
+        for doc in self._docs:
+            yield doc
+
+
+def _native_collection(docs):
+    collection = MagicMock()
+    collection.aggregate = AsyncMock(return_value=_AsyncCursor(docs))
+    return NativeCollection(collection), collection
+
+
+@pytest.fixture
+def pymongo_client(monkeypatch):
+    client = MagicMock()
+    client.close = AsyncMock()
+    monkeypatch.setattr(native_client, "AsyncMongoClient", lambda *a, **k: client)
+    return client
+
+
+class TestDeferredCommandCursor:
+    @pytest.mark.asyncio
+    async def test_aggregate_runs_only_when_consumed(self):
+        native, collection = _native_collection([{"_id": 1}, {"_id": 2}])
+
+        cursor = native.aggregate([{"$match": {}}], batchSize=10)
+
+        assert isinstance(cursor, DeferredCommandCursor)
+        collection.aggregate.assert_not_called()
+        assert [doc["_id"] async for doc in cursor] == [1, 2]
+        collection.aggregate.assert_awaited_once_with([{"$match": {}}], batchSize=10)
+
+    @pytest.mark.asyncio
+    async def test_to_list_reuses_the_cursor(self):
+        native, collection = _native_collection([{"_id": 1}])
+        cursor = native.aggregate([])
+
+        assert await cursor.to_list(length=1) == [{"_id": 1}]
+        await cursor.close()
+
+        collection.aggregate.assert_awaited_once()
+        opened = collection.aggregate.return_value
+        opened.to_list.assert_awaited_once_with(1)
+        opened.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_before_use_does_not_run_the_aggregation(self):
+        native, collection = _native_collection([])
+
+        await native.aggregate([]).close()
+
+        collection.aggregate.assert_not_called()
+
+
+class TestNativeCollection:
+    def test_other_attributes_are_delegated(self):
+        collection = MagicMock()
+        native = NativeCollection(collection)
+
+        assert native.find is collection.find
+        assert native.insert_one is collection.insert_one
+
+    def test_with_options_keeps_the_adapter(self):
+        collection = MagicMock()
+
+        native = NativeCollection(collection).with_options(read_preference="x")
+
+        assert isinstance(native, NativeCollection)
+        collection.with_options.assert_called_once_with(read_preference="x")
+
+
+class TestNativeMongoClient:
+    def test_databases_wrap_their_collections(self, pymongo_client):
+        client = NativeMongoClient("mongodb://localhost")
+
+        db = client["portfolio_db"]
+
+        assert db.client is client
+        assert isinstance(db["skills"], NativeCollection)
+        pymongo_client.__getitem__.assert_called_once_with("portfolio_db")
+
+    def test_database_with_options_keeps_the_adapter(self, pymongo_client):
+        client = NativeMongoClient("mongodb://localhost")
+
+        db = client["portfolio_db"].with_options(read_preference="x")
+
+        assert db.client is client
+        assert isinstance(db["skills"], NativeCollection)
+        pymongo_client["portfolio_db"].with_options.assert_called_once_with(
+            read_preference="x"
+        )
+
+    @pytest.mark.asyncio
+    async def test_start_session_is_awaitable_like_motor(self, pymongo_client):
+        client = NativeMongoClient("mongodb://localhost")
+
+        session = await client.start_session()
+
+        assert session is pymongo_client.start_session.return_value
+
+    @pytest.mark.asyncio
+    async def test_close_awaits_the_native_client(self, pymongo_client):
+        await NativeMongoClient("mongodb://localhost").close()
+
+        pymongo_client.close.assert_awaited_once()
+
+    def test_admin_is_delegated(self, pymongo_client):
+        assert NativeMongoClient("mongodb://localhost").admin is pymongo_client.admin
@@ -0,0 +1,78 @@
+"""Unit tests for PoolMetricsListener."""
+
+from types import SimpleNamespace
+
+from app.infrastructure.database.pool_metrics import PoolMetricsListener
+
+ADDRESS = ("localhost", 27017)
+
+
+def _event(**attrs):
+    return SimpleNamespace(address=ADDRESS, **attrs)
+
+
+def _checkout(listener, duration=0.002):
+    listener.connection_check_out_started(_event())
+    listener.connection_checked_out(_event(connection_id=1, duration=duration))
+
+
+class TestPoolMetricsListener:
+    def test_tracks_open_checked_out_and_available(self):
+        listener = PoolMetricsListener()
+        listener.pool_created(_event(options={}))
+        for connection_id in (1, 2, 3):
+            listener.connection_created(_event(connection_id=connection_id))
+        _checkout(listener)
+        _checkout(listener)
+        listener.connection_checked_in(_event(connection_id=1))
+
+        pool = listener.stats()["localhost:27017"]
+
+        assert pool["open"] == 3
+        assert pool["checked_out"] == 1
+        assert pool["available"] == 2
+        assert pool["checkouts"] == 2
+
+    def test_pending_checkouts_are_the_wait_queue(self):
+        listener = PoolMetricsListener()
+        for _ in range(3):
+            listener.connection_check_out_started(_event())
+        listener.connection_checked_out(_event(connection_id=1, duration=0.001))
+        listener.connection_check_out_failed(_event(reason="timeout", duration=1.0))
+
+        pool = listener.stats()["localhost:27017"]
+
+        assert pool["wait_queue"] == 1
+        assert pool["failed_checkouts"] == 1
+
+    def test_checkout_latency_in_milliseconds(self):
+        listener = PoolMetricsListener()
+        for duration in (0.001, 0.002, 0.009):
+            _checkout(listener, duration)
+
+        latency = listener.stats()["localhost:27017"]["checkout_ms"]
+
+        assert latency["mean"] == 4.0
+        assert latency["max"] == 9.0
+        assert latency["p99"] == 9.0
+
+    def test_closed_pool_is_dropped(self):
+        listener = PoolMetricsListener()
+        listener.connection_created(_event(connection_id=1))
+        listener.pool_cleared(_event(service_id=None))
+
+        assert listener.stats()["localhost:27017"]["cleared"] == 1
+
+        listener.pool_closed(_event())
+
+        assert listener.stats() == {}
+
+    def test_events_without_duration_are_counted(self):
+        listener = PoolMetricsListener()
+        listener.connection_check_out_started(_event())
+        listener.connection_checked_out(_event(connection_id=1))
+
+        pool = listener.stats()["localhost:27017"]
+
+        assert pool["checkouts"] == 1
+        assert pool["checkout_ms"]["max"] == 0.0
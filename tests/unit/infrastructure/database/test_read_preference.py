@@ -0,0 +1,29 @@
+"""Unit tests for the public read preference."""
+
+from pymongo.read_preferences import Primary, SecondaryPreferred
+import pytest
+
+from app.infrastructure.database.read_preference import build_read_preference
+
+
+class TestBuildReadPreference:
+    def test_primary(self):
+        assert isinstance(build_read_preference("primary"), Primary)
+
+    def test_secondary_preferred_with_max_staleness(self):
+        preference = build_read_preference("secondaryPreferred", 120)
+
+        assert isinstance(preference, SecondaryPreferred)
+        assert preference.max_staleness == 120
+
+    def test_max_staleness_below_server_minimum_is_rejected(self):
+        with pytest.raises(ValueError, match="al menos 90"):
+            build_read_preference("secondaryPreferred", 30)
+
+    def test_primary_rejects_max_staleness(self):
+        with pytest.raises(ValueError):
+            build_read_preference("primary", 90)
+
+    def test_unknown_mode_is_rejected(self):
+        with pytest.raises(ValueError, match="desconocida"):
+            build_read_preference("secondaryOnly")
@@ -0,0 +1,90 @@
+"""Unit tests for optional_transaction."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.infrastructure.database.mongo_client import MongoDBClient
+from app.infrastructure.database.transactions import optional_transaction
+
+
+@pytest.fixture
+def supports_transactions(monkeypatch):
+    def _set(value: bool) -> None:
+        monkeypatch.setattr(MongoDBClient, "supports_transactions", value)
+
+    return _set
+
+
+class TestOptionalTransaction:
+    @pytest.mark.asyncio
+    async def test_standalone_yields_no_session(self, supports_transactions):
+        supports_transactions(False)
+        db = MagicMock()
+
+        async with optional_transaction(db) as session:
+            assert session is None
+
+        db.client.start_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_replica_set_runs_in_a_transaction(self, supports_transactions):
+        supports_transactions(True)
+        session = MagicMock()
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=False)
+        transaction = session.start_transaction.return_value
+        transaction.__aenter__ = AsyncMock()
+        transaction.__aexit__ = AsyncMock(return_value=False)
+        db = MagicMock()
+        db.client.start_session = AsyncMock(return_value=session)
+
+        async with optional_transaction(db) as yielded:
+            assert yielded is session
+
+        session.start_transaction.assert_called_once_with()
+        transaction.__aexit__.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_native_client_transaction_is_awaited(self, supports_transactions):
+        # PyMongo's AsyncClientSession.start_transaction is a coroutine
+        supports_transactions(True)
+        session = MagicMock()
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=False)
+        transaction = MagicMock()
+        transaction.__aenter__ = AsyncMock()
+        transaction.__aexit__ = AsyncMock(return_value=False)
+        session.start_transaction = AsyncMock(return_value=transaction)
+        db = MagicMock()
+        db.client.start_session = AsyncMock(return_value=session)
+
+        async with optional_transaction(db) as yielded:
+            assert yielded is session
+
+        session.start_transaction.assert_awaited_once_with()
+        transaction.__aexit__.assert_awaited_once()
+
+
+class TestDetectTransactions:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "hello, expected",
+        [
+            ({"isWritablePrimary": True}, False),
+            ({"isWritablePrimary": True, "setName": "rs0"}, True),
+            ({"isWritablePrimary": True, "msg": "isdbgrid"}, True),
+        ],
+    )
+    async def test_detects_from_hello(self, hello, expected):
+        client = MagicMock()
+        client.admin.command = AsyncMock(return_value=hello)
+
+        assert await MongoDBClient._detect_transactions(client) is expected
+
+    @pytest.mark.asyncio
+    async def test_command_failure_means_no_transactions(self):
+        client = MagicMock()
+        client.admin.command = AsyncMock(side_effect=Exception("not authorized"))
+
+        assert await MongoDBClient._detect_transactions(client) is False
@@ -122,3 +122,28 @@ class TestWorkExperienceMapperToPersistence:
         entity = self.mapper.to_domain(doc)
         result = self.mapper.to_persistence(entity)
         assert result == doc
+
+
+class TestWorkExperienceMapperToView:
+    def setup_method(self):
+        self.mapper = WorkExperienceMapper()
+
+    def test_only_requested_fields(self):
+        doc = {"_id": "w-1", "role": "Dev", "company": "Acme"}
+
+        view = self.mapper.to_view(doc, ("role", "company"))
+
+        assert view == {"id": "w-1", "role": "Dev", "company": "Acme"}
+
+    def test_missing_fields_take_the_mapper_defaults(self):
+        view = self.mapper.to_view({"_id": "w-1"}, ("end_date", "responsibilities"))
+
+        assert view == {"id": "w-1", "end_date": None, "responsibilities": []}
+
+    def test_defaults_are_not_shared_between_views(self):
+        first = self.mapper.to_view({"_id": "w-1"}, ("responsibilities",))
+        first["responsibilities"].append("Code")
+
+        second = self.mapper.to_view({"_id": "w-2"}, ("responsibilities",))
+
+        assert second["responsibilities"] == []
@@ -0,0 +1,46 @@
+"""Unit tests for trusted entity hydration on reads."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.domain.entities import Project
+from app.domain.exceptions import DomainError
+from app.infrastructure.mappers import hydration
+from app.infrastructure.mappers.project_mapper import ProjectMapper
+
+from .conftest import DT_CREATED, DT_START, DT_UPDATED
+
+# Too short for the description sufficiency rule: only a write would reject it
+STORED_DOC = {
+    "_id": "proj-1",
+    "profile_id": "p-1",
+    "title": "My Project",
+    "description": "Short",
+    "start_date": DT_START,
+    "order_index": 0,
+    "technologies": ["Python"],
+    "created_at": DT_CREATED,
+    "updated_at": DT_UPDATED,
+}
+
+
+class TestHydration:
+    def test_reads_skip_entity_validation(self, monkeypatch):
+        monkeypatch.setattr(
+            hydration, "settings", SimpleNamespace(MAPPER_VALIDATE_ON_READ=False)
+        )
+
+        entity = ProjectMapper().to_domain(STORED_DOC)
+
+        assert isinstance(entity, Project)
+        assert entity.description == "Short"
+        assert entity.end_date is None
+
+    def test_debug_setting_validates_reads(self, monkeypatch):
+        monkeypatch.setattr(
+            hydration, "settings", SimpleNamespace(MAPPER_VALIDATE_ON_READ=True)
+        )
+
+        with pytest.raises(DomainError):
+            ProjectMapper().to_domain(STORED_DOC)
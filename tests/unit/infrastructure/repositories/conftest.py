@@ -25,7 +25,10 @@ def mock_collection():
     cursor.skip = MagicMock(return_value=cursor)
     cursor.limit = MagicMock(return_value=cursor)
     cursor.sort = MagicMock(return_value=cursor)
+    cursor.batch_size = MagicMock(return_value=cursor)
     cursor.to_list = AsyncMock(return_value=[])
+    # async for (stream) recorre los documentos de __aiter__
+    cursor.__aiter__.return_value = []
     collection.find = MagicMock(return_value=cursor)
 
     return collection
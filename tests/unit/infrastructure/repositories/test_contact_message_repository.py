@@ -1,5 +1,6 @@
 """Unit tests for ContactMessageRepository."""
 
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -83,26 +84,73 @@ class TestContactMessageListAll:
         cursor.sort.assert_called_once_with("name", 1)
 
 
+class TestContactMessageListPage:
+    @pytest.mark.asyncio
+    async def test_first_page_has_no_keyset_filter(self, repo, collection):
+        cursor = collection.find.return_value
+
+        await repo.list_page(limit=20)
+
+        collection.find.assert_called_once_with({})
+        cursor.sort.assert_called_once_with([("created_at", -1), ("_id", -1)])
+        cursor.limit.assert_called_once_with(20)
+        cursor.skip.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_next_page_continues_after_the_key(self, repo, collection):
+        after = (datetime(2025, 1, 15), "msg-5")
+
+        await repo.list_page(limit=20, after=after)
+
+        collection.find.assert_called_once_with(
+            {
+                "$or": [
+                    {"created_at": {"$lt": datetime(2025, 1, 15)}},
+                    {"created_at": datetime(2025, 1, 15), "_id": {"$lt": "msg-5"}},
+                ]
+            }
+        )
+
+    @pytest.mark.asyncio
+    async def test_ascending_page_uses_greater_than(self, repo, collection):
+        cursor = collection.find.return_value
+        after = (datetime(2025, 1, 15), "msg-5")
+
+        await repo.list_page(limit=5, after=after, ascending=True)
+
+        query = collection.find.call_args[0][0]
+        assert query["$or"][0] == {"created_at": {"$gt": datetime(2025, 1, 15)}}
+        cursor.sort.assert_called_once_with([("created_at", 1), ("_id", 1)])
+
+    @pytest.mark.asyncio
+    async def test_maps_documents(self, repo, collection):
+        cursor = collection.find.return_value
+        cursor.to_list = AsyncMock(return_value=[make_contact_message_doc(_id="m1")])
+
+        result = await repo.list_page(limit=1)
+
+        cursor.to_list.assert_awaited_once_with(length=1)
+        assert [m.id for m in result] == ["m1"]
+
+
 class TestContactMessageSpecialMethods:
     @pytest.mark.asyncio
     async def test_get_pending_messages(self, repo, collection):
         docs = [make_contact_message_doc(_id="m1"), make_contact_message_doc(_id="m2")]
         cursor = collection.find.return_value
-        cursor.sort = MagicMock(return_value=cursor)
-        cursor.to_list = AsyncMock(return_value=docs)
+        cursor.__aiter__.return_value = docs
 
         result = await repo.get_pending_messages()
 
         collection.find.assert_called_with({"status": "pending"})
-        cursor.sort.assert_called_with("created_at", -1)
+        cursor.sort.assert_called_with([("created_at", -1)])
         assert len(result) == 2
 
     @pytest.mark.asyncio
     async def test_get_messages_by_status(self, repo, collection):
         docs = [make_contact_message_doc(status="read")]
         cursor = collection.find.return_value
-        cursor.sort = MagicMock(return_value=cursor)
-        cursor.to_list = AsyncMock(return_value=docs)
+        cursor.__aiter__.return_value = docs
 
         result = await repo.get_messages_by_status("read")
 
@@ -0,0 +1,80 @@
+"""Unit tests for ContactMessageStatsRepository."""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.infrastructure.repositories.contact_message_stats_repository import (
+    ContactMessageStatsRepository,
+)
+
+
+@pytest.fixture
+def repo(mock_db):
+    return ContactMessageStatsRepository(mock_db)
+
+
+@pytest.fixture
+def collection(repo):
+    return repo._collection
+
+
+class TestContactMessageStatsRepository:
+    @pytest.mark.asyncio
+    async def test_increment_upserts_the_day_bucket(self, repo, collection):
+        await repo.increment(date(2025, 1, 15))
+
+        collection.update_one.assert_awaited_once_with(
+            {"_id": "2025-01-15"}, {"$inc": {"count": 1}}, upsert=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_decrement(self, repo, collection):
+        await repo.increment(date(2025, 1, 15), -1)
+
+        assert collection.update_one.call_args[0][1] == {"$inc": {"count": -1}}
+
+    @pytest.mark.asyncio
+    async def test_get_daily_counts_reads_a_range_of_buckets(self, repo, collection):
+        cursor = collection.find.return_value
+        cursor.__aiter__.return_value = [
+            {"_id": "2025-01-14", "count": 2},
+            {"_id": "2025-01-15", "count": 0},
+        ]
+
+        result = await repo.get_daily_counts(date(2025, 1, 1))
+
+        collection.find.assert_called_once_with({"_id": {"$gte": "2025-01-01"}})
+        assert result == {date(2025, 1, 14): 2}
+
+    @pytest.mark.asyncio
+    async def test_get_total_sums_on_the_server(self, repo, collection):
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(return_value=[{"_id": None, "total": 42}])
+        collection.aggregate = MagicMock(return_value=cursor)
+
+        assert await repo.get_total() == 42
+        [stage] = collection.aggregate.call_args[0][0]
+        assert stage == {"$group": {"_id": None, "total": {"$sum": "$count"}}}
+
+    @pytest.mark.asyncio
+    async def test_get_total_without_buckets(self, repo, collection):
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(return_value=[])
+        collection.aggregate = MagicMock(return_value=cursor)
+
+        assert await repo.get_total() == 0
+
+    @pytest.mark.asyncio
+    async def test_rebuild_replaces_buckets_from_messages(self, repo, collection):
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(return_value=[])
+        collection.aggregate = MagicMock(return_value=cursor)
+        collection.count_documents = AsyncMock(return_value=3)
+
+        assert await repo.rebuild() == 3
+
+        pipeline = collection.aggregate.call_args[0][0]
+        assert pipeline[0]["$group"]["count"] == {"$sum": 1}
+        assert pipeline[-1] == {"$out": "contact_message_stats"}
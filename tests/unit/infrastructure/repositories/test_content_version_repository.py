@@ -0,0 +1,46 @@
+"""Unit tests for ContentVersionRepository (HTTP validator versions)."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.infrastructure.repositories.content_version_repository import (
+    ContentVersionRepository,
+)
+from app.shared.interfaces.content_version import ContentVersion
+
+
+@pytest.fixture
+def repo(mock_db):
+    return ContentVersionRepository(mock_db)
+
+
+class TestContentVersionRepository:
+    @pytest.mark.asyncio
+    async def test_bump_increments_with_upsert(self, repo, mock_collection):
+        await repo.bump("skills")
+
+        query, update = mock_collection.update_one.call_args.args
+        assert query == {"_id": "skills"}
+        assert update["$inc"] == {"version": 1}
+        assert "updated_at" in update["$set"]
+        assert mock_collection.update_one.call_args.kwargs == {"upsert": True}
+
+    @pytest.mark.asyncio
+    async def test_get_versions_is_one_key_lookup(self, repo, mock_collection):
+        stamp = datetime(2025, 1, 1)
+        cursor = mock_collection.find.return_value
+        cursor.to_list = AsyncMock(
+            return_value=[{"_id": "skills", "version": 7, "updated_at": stamp}]
+        )
+
+        result = await repo.get_versions(["skills", "tools"])
+
+        mock_collection.find.assert_called_once_with(
+            {"_id": {"$in": ["skills", "tools"]}}
+        )
+        assert result == {
+            "skills": ContentVersion(7, stamp),
+            "tools": ContentVersion(),
+        }
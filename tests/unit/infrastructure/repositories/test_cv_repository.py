@@ -0,0 +1,145 @@
+"""Unit tests for CVRepository (single-round-trip aggregated CV)."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.infrastructure.repositories.cv_repository import CVRepository
+
+from .conftest import (
+    make_contact_info_doc,
+    make_education_doc,
+    make_language_doc,
+    make_profile_doc,
+    make_project_doc,
+    make_skill_doc,
+)
+
+
+@pytest.fixture
+def repo(mock_db):
+    return CVRepository(mock_db)
+
+
+def _set_aggregate_result(repo, docs):
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(return_value=docs)
+    repo._collection.aggregate = MagicMock(return_value=cursor)
+    return cursor
+
+
+class TestCVRepositoryPipeline:
+    def test_pipeline_unions_every_section_collection(self, repo):
+        pipeline = repo.build_pipeline("default_profile")
+
+        unions = [stage["$unionWith"] for stage in pipeline if "$unionWith" in stage]
+        assert [u["coll"] for u in unions] == [
+            "contact_information",
+            "social_networks",
+            "work_experiences",
+            "projects",
+            "skills",
+            "tools",
+            "education",
+            "additional_trainings",
+            "certifications",
+        ]
+        for union in unions:
+            assert union["pipeline"][0] == {"$match": {"profile_id": "default_profile"}}
+
+    def test_pipeline_unions_only_the_requested_sections(self, repo):
+        pipeline = repo.build_pipeline(
+            "default_profile", ["languages", "profile", "projects"]
+        )
+
+        unions = [stage["$unionWith"] for stage in pipeline if "$unionWith" in stage]
+        assert [u["coll"] for u in unions] == ["projects", "languages"]
+
+    def test_pipeline_folds_into_one_document(self, repo):
+        pipeline = repo.build_pipeline("default_profile")
+
+        assert pipeline[0] == {"$limit": 1}
+        assert "$replaceRoot" in pipeline[-1]
+
+
+class TestCVRepositoryGetCVSections:
+    @pytest.mark.asyncio
+    async def test_single_aggregate_round_trip(self, repo):
+        cursor = _set_aggregate_result(repo, [{"profile": [make_profile_doc()]}])
+
+        await repo.get_cv_sections("default_profile")
+
+        repo._collection.aggregate.assert_called_once()
+        cursor.to_list.assert_awaited_once_with(length=1)
+
+    @pytest.mark.asyncio
+    async def test_hydrates_and_orders_sections(self, repo):
+        _set_aggregate_result(
+            repo,
+            [
+                {
+                    "profile": [make_profile_doc()],
+                    "contact_info": [make_contact_info_doc()],
+                    "projects": [
+                        make_project_doc(_id="p-0", order_index=0),
+                        make_project_doc(_id="p-1", order_index=1),
+                    ],
+                    "skills": [
+                        make_skill_doc(_id="s-1", name="Go", order_index=1),
+                        make_skill_doc(_id="s-0", order_index=0),
+                    ],
+                    "education": [make_education_doc()],
+                }
+            ],
+        )
+
+        sections = await repo.get_cv_sections("default_profile")
+
+        assert sections["profile"].name == "John Doe"
+        assert sections["contact_info"].email == "test@example.com"
+        # Projects newest first, skills ascending (same as the per-repo path)
+        assert [p.id for p in sections["projects"]] == ["p-1", "p-0"]
+        assert [s.id for s in sections["skills"]] == ["s-0", "s-1"]
+        assert len(sections["education"]) == 1
+        assert sections["tools"] == []
+        assert sections["certifications"] == []
+
+    @pytest.mark.asyncio
+    async def test_hydrates_only_the_requested_sections(self, repo):
+        _set_aggregate_result(
+            repo,
+            [
+                {
+                    "profile": [make_profile_doc()],
+                    "languages": [
+                        make_language_doc(_id="l-1", order_index=1),
+                        make_language_doc(_id="l-0", order_index=0),
+                    ],
+                }
+            ],
+        )
+
+        sections = await repo.get_cv_sections("default_profile", ["languages"])
+
+        assert set(sections) == {"profile", "languages"}
+        assert [lang.id for lang in sections["languages"]] == ["l-0", "l-1"]
+
+    @pytest.mark.asyncio
+    async def test_missing_contact_info_is_none(self, repo):
+        _set_aggregate_result(repo, [{"profile": [make_profile_doc()]}])
+
+        sections = await repo.get_cv_sections("default_profile")
+
+        assert sections["contact_info"] is None
+
+    @pytest.mark.asyncio
+    async def test_no_profile_returns_none(self, repo):
+        _set_aggregate_result(repo, [{"skills": [make_skill_doc()]}])
+
+        assert await repo.get_cv_sections("default_profile") is None
+
+    @pytest.mark.asyncio
+    async def test_empty_database_returns_none(self, repo):
+        _set_aggregate_result(repo, [])
+
+        assert await repo.get_cv_sections("default_profile") is None
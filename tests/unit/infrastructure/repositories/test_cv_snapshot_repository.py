@@ -0,0 +1,118 @@
+"""Unit tests for CVSnapshotRepository (materialized CV read model)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.infrastructure.repositories.cv_snapshot_repository import (
+    CVSnapshotRepository,
+)
+
+
+@pytest.fixture
+def repo(mock_db):
+    return CVSnapshotRepository(mock_db)
+
+
+class TestCVSnapshotRepository:
+    @pytest.mark.asyncio
+    async def test_get_is_a_single_key_lookup(self, repo, mock_collection):
+        mock_collection.find_one.return_value = {"profile": {"name": "Alex"}}
+
+        result = await repo.get("default_profile")
+
+        assert result == {"profile": {"name": "Alex"}}
+        mock_collection.find_one.assert_awaited_once_with(
+            {"_id": "default_profile"},
+            {"_id": 0, "updated_at": 0, "section_versions": 0},
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_missing_returns_none(self, repo, mock_collection):
+        mock_collection.find_one.return_value = None
+
+        assert await repo.get("default_profile") is None
+
+    @pytest.mark.asyncio
+    async def test_save_upserts_every_section(self, repo, mock_collection):
+        await repo.save("default_profile", {"skills": [{"id": "$s1"}]}, version=5)
+
+        mock_collection.update_one.assert_awaited_once()
+        query, [stage] = mock_collection.update_one.call_args.args
+        assert query == {"_id": "default_profile"}
+        assert set(stage["$set"]) == {
+            "skills",
+            "section_versions.skills",
+            "updated_at",
+        }
+        assert mock_collection.update_one.call_args.kwargs == {"upsert": True}
+
+    @pytest.mark.asyncio
+    async def test_save_keeps_sections_stored_by_newer_refreshes(
+        self, repo, mock_collection
+    ):
+        await repo.save("default_profile", {"skills": [{"id": "$s1"}]}, version=5)
+
+        _, [stage] = mock_collection.update_one.call_args.args
+        fields = stage["$set"]
+        # The stored section wins when its version is not older
+        assert fields["skills"] == {
+            "$cond": [
+                {"$gte": ["$section_versions.skills", 5]},
+                "$skills",
+                {"$literal": [{"id": "$s1"}]},
+            ]
+        }
+        assert fields["section_versions.skills"] == {
+            "$max": ["$section_versions.skills", 5]
+        }
+
+    @pytest.mark.asyncio
+    async def test_save_section_sets_only_that_section(self, repo, mock_collection):
+        mock_collection.update_one.return_value = MagicMock(matched_count=1)
+
+        result = await repo.save_section(
+            "default_profile", "skills", [{"id": "s1"}], version=5
+        )
+
+        assert result is True
+        query, update = mock_collection.update_one.call_args.args
+        assert query["_id"] == "default_profile"
+        assert set(update["$set"]) == {
+            "skills",
+            "section_versions.skills",
+            "updated_at",
+        }
+        assert update["$set"]["skills"] == [{"id": "s1"}]
+        assert update["$set"]["section_versions.skills"] == 5
+        # Never creates a partial snapshot
+        assert "upsert" not in mock_collection.update_one.call_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_save_section_without_snapshot_returns_false(
+        self, repo, mock_collection
+    ):
+        mock_collection.update_one.return_value = MagicMock(matched_count=0)
+
+        assert (
+            await repo.save_section("default_profile", "skills", [], version=5) is False
+        )
+
+    @pytest.mark.asyncio
+    async def test_save_section_only_overwrites_older_versions(
+        self, repo, mock_collection
+    ):
+        mock_collection.update_one.return_value = MagicMock(matched_count=0)
+
+        assert await repo.save_section("default_profile", "skills", [], 5) is False
+
+        query, _ = mock_collection.update_one.call_args.args
+        # Matches a missing version too (snapshots stored before versioning)
+        assert query["section_versions.skills"] == {"$not": {"$gte": 5}}
+
+    @pytest.mark.asyncio
+    async def test_delete(self, repo, mock_collection):
+        mock_collection.delete_one.return_value = MagicMock(deleted_count=1)
+
+        assert await repo.delete("default_profile") is True
+        mock_collection.delete_one.assert_awaited_once_with({"_id": "default_profile"})
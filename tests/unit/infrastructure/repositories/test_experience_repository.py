@@ -1,6 +1,6 @@
 """Unit tests for WorkExperienceRepository (ordered repository pattern)."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
@@ -147,22 +147,21 @@ class TestWorkExperienceOrderedMethods:
             make_work_experience_doc(_id="e2", order_index=1),
         ]
         cursor = collection.find.return_value
-        cursor.to_list = AsyncMock(return_value=docs)
+        cursor.__aiter__.return_value = docs
 
         result = await repo.get_all_ordered("profile-123", ascending=True)
 
         collection.find.assert_called_with({"profile_id": "profile-123"})
-        cursor.sort.assert_called_once_with("order_index", 1)
+        cursor.sort.assert_called_once_with([("order_index", 1)])
         assert len(result) == 2
 
     @pytest.mark.asyncio
     async def test_get_all_ordered_descending(self, repo, collection):
         cursor = collection.find.return_value
-        cursor.to_list = AsyncMock(return_value=[])
 
         await repo.get_all_ordered("profile-123", ascending=False)
 
-        cursor.sort.assert_called_once_with("order_index", -1)
+        cursor.sort.assert_called_once_with([("order_index", -1)])
 
 
 class TestWorkExperienceReorder:
@@ -193,15 +192,13 @@ class TestWorkExperienceReorder:
 
         await repo.reorder("profile-123", "exp-1", 3)
 
-        collection.update_many.assert_called_once_with(
-            {
-                "profile_id": "profile-123",
-                "order_index": {"$gt": 1, "$lte": 3},
-            },
-            {"$inc": {"order_index": -1}},
-        )
-        collection.update_one.assert_called_once_with(
-            {"_id": "exp-1"}, {"$set": {"order_index": 3}}
+        shift = collection.update_many.call_args_list[0]
+        assert shift.args[0] == {
+            "profile_id": "profile-123",
+            "order_index": {"$gt": 1, "$lte": 3},
+        }
+        assert collection.update_one.call_args_list[-1] == call(
+            {"_id": "exp-1"}, {"$set": {"order_index": 3}}, session=None
         )
 
     @pytest.mark.asyncio
@@ -212,15 +209,13 @@ class TestWorkExperienceReorder:
 
         await repo.reorder("profile-123", "exp-1", 1)
 
-        collection.update_many.assert_called_once_with(
-            {
-                "profile_id": "profile-123",
-                "order_index": {"$gte": 1, "$lt": 3},
-            },
-            {"$inc": {"order_index": 1}},
-        )
-        collection.update_one.assert_called_once_with(
-            {"_id": "exp-1"}, {"$set": {"order_index": 1}}
+        shift = collection.update_many.call_args_list[0]
+        assert shift.args[0] == {
+            "profile_id": "profile-123",
+            "order_index": {"$gte": 1, "$lt": 3},
+        }
+        assert collection.update_one.call_args_list[-1] == call(
+            {"_id": "exp-1"}, {"$set": {"order_index": 1}}, session=None
         )
 
 
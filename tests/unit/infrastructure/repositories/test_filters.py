@@ -0,0 +1,126 @@
+"""Unit tests for FilterSpec translation and push-down to MongoDB."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.infrastructure.repositories.certification_repository import (
+    CertificationRepository,
+)
+from app.infrastructure.repositories.filters import to_query
+from app.infrastructure.repositories.skill_repository import SkillRepository
+from app.shared.interfaces import Contains, FilterSpec, In, Not, Prefix, Range
+
+from .conftest import make_skill_doc
+
+
+class TestFilterSpec:
+    def test_range_needs_a_bound(self):
+        with pytest.raises(ValueError):
+            Range()
+
+    def test_limit_must_be_positive(self):
+        with pytest.raises(ValueError):
+            FilterSpec(limit=0)
+
+    def test_and_where_adds_conditions(self):
+        spec = FilterSpec(where={"profile_id": "p1"}, limit=5)
+
+        merged = spec.and_where(level="expert")
+
+        assert merged.where == {"profile_id": "p1", "level": "expert"}
+        assert merged.limit == 5
+        assert spec.where == {"profile_id": "p1"}
+
+
+class TestToQuery:
+    def test_plain_values_are_equality(self):
+        assert to_query({"profile_id": "p1", "end_date": None}) == {
+            "profile_id": "p1",
+            "end_date": None,
+        }
+
+    def test_in_and_range(self):
+        now = datetime(2025, 1, 1)
+
+        query = to_query(
+            {"level": In(["expert", "advanced"]), "expiry_date": Range(gte=now)}
+        )
+
+        assert query == {
+            "level": {"$in": ["expert", "advanced"]},
+            "expiry_date": {"$gte": now},
+        }
+
+    def test_prefix_is_anchored_and_escaped(self):
+        assert to_query({"name": Prefix("C++")}) == {"name": {"$regex": "^C\\+\\+"}}
+
+    def test_contains_ignores_case_by_default(self):
+        assert to_query({"issuer": Contains("a.b")}) == {
+            "issuer": {"$regex": "a\\.b", "$options": "i"}
+        }
+
+    def test_not_wraps_the_condition(self):
+        now = datetime(2025, 1, 1)
+
+        assert to_query({"expiry_date": Not(Range(lt=now))}) == {
+            "expiry_date": {"$not": {"$lt": now}}
+        }
+
+
+class TestFindBySpec:
+    @pytest.mark.asyncio
+    async def test_conditions_sort_and_limit_reach_the_cursor(
+        self, mock_db, mock_collection
+    ):
+        repo = CertificationRepository(mock_db)
+        cursor = mock_collection.find.return_value
+        now = datetime(2025, 1, 1)
+
+        await repo.find_by(
+            FilterSpec(sort=(("order_index", 1),), limit=3),
+            profile_id="p1",
+            expiry_date=Range(lt=now),
+        )
+
+        mock_collection.find.assert_called_once_with(
+            {"profile_id": "p1", "expiry_date": {"$lt": now}}
+        )
+        cursor.sort.assert_called_once_with([("order_index", 1)])
+        cursor.limit.assert_called_once_with(3)
+
+    @pytest.mark.asyncio
+    async def test_keyword_filters_still_work(self, mock_db, mock_collection):
+        repo = SkillRepository(mock_db)
+        cursor = mock_collection.find.return_value
+        cursor.__aiter__.return_value = [make_skill_doc()]
+
+        result = await repo.find_by(profile_id="profile-123", level="expert")
+
+        mock_collection.find.assert_called_once_with(
+            {"profile_id": "profile-123", "level": "expert"}
+        )
+        cursor.limit.assert_not_called()
+        assert len(result) == 1
+
+    @pytest.mark.asyncio
+    async def test_rank_mode_filters_after_deriving_the_order(
+        self, mock_db, mock_collection
+    ):
+        repo = SkillRepository(mock_db, rank_ordering=True)
+        cursor = MagicMock()
+        cursor.__aiter__.return_value = []
+        mock_collection.aggregate = MagicMock(return_value=cursor)
+
+        await repo.find_by(
+            FilterSpec(sort=(("order_index", 1),), limit=2),
+            profile_id="p1",
+            level=In(["expert"]),
+        )
+
+        pipeline = mock_collection.aggregate.call_args[0][0]
+        assert pipeline[0] == {"$match": {"profile_id": "p1"}}
+        match = {"$match": {"profile_id": "p1", "level": {"$in": ["expert"]}}}
+        assert match in pipeline
+        assert pipeline[-2:] == [{"$sort": {"order_index": 1}}, {"$limit": 2}]
@@ -0,0 +1,107 @@
+"""Unit tests for grouping and counting through aggregation pipelines."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.infrastructure.repositories.grouping import count_pipeline, grouped_pipeline
+from app.infrastructure.repositories.skill_repository import SkillRepository
+from app.infrastructure.repositories.tool_repository import ToolRepository
+
+from .conftest import make_skill_doc
+
+
+def _set_aggregate_result(collection, docs):
+    cursor = MagicMock()
+    cursor.__aiter__.return_value = docs
+    cursor.to_list = AsyncMock(return_value=docs)
+    collection.aggregate = MagicMock(return_value=cursor)
+    return cursor
+
+
+class TestGroupedPipeline:
+    def test_groups_sorted_documents_and_projects_fields(self):
+        pipeline = grouped_pipeline({"profile_id": "p1"}, "category", ("name",))
+
+        assert pipeline[:2] == [
+            {"$match": {"profile_id": "p1"}},
+            {"$sort": {"order_index": 1}},
+        ]
+        group = pipeline[2]["$group"]
+        assert group["_id"] == "$category"
+        assert group["items"] == {"$push": {"_id": "$_id", "name": "$name"}}
+        # Los grupos siguen el orden de su primer elemento
+        assert pipeline[3] == {"$sort": {"first": 1}}
+
+    def test_rank_mode_groups_the_derived_order(self):
+        pipeline = grouped_pipeline(
+            {"profile_id": "p1"}, "category", ("name",), rank_ordering=True
+        )
+
+        assert any("$setWindowFields" in str(stage) for stage in pipeline)
+        assert "$group" in pipeline[-2]
+
+    def test_count_pipeline_uses_one_facet_per_field(self):
+        pipeline = count_pipeline({"profile_id": "p1"}, ("level", "category"))
+
+        facets = pipeline[1]["$facet"]
+        assert list(facets) == ["level", "category"]
+        assert facets["level"] == [{"$group": {"_id": "$level", "count": {"$sum": 1}}}]
+
+
+class TestGroupBy:
+    @pytest.mark.asyncio
+    async def test_maps_each_group_to_entities(self, mock_db, mock_collection):
+        repo = SkillRepository(mock_db)
+        _set_aggregate_result(
+            mock_collection,
+            [
+                {"_id": "backend", "first": 0, "items": [make_skill_doc(_id="s1")]},
+                {"_id": None, "first": 1, "items": [make_skill_doc(_id="s2")]},
+            ],
+        )
+
+        groups = await repo.group_by("profile-123", "category")
+
+        assert list(groups) == ["backend", None]
+        assert groups["backend"][0].id == "s1"
+        mock_collection.find.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_only_mapped_fields_are_pushed(self, mock_db, mock_collection):
+        repo = ToolRepository(mock_db)
+        _set_aggregate_result(mock_collection, [])
+
+        await repo.group_by("profile-123", "category")
+
+        pipeline = mock_collection.aggregate.call_args[0][0]
+        pushed = pipeline[-2]["$group"]["items"]["$push"]
+        assert set(pushed) == {"_id", *ToolRepository.group_projection}
+        assert "rank" not in pushed
+
+
+class TestCountBy:
+    @pytest.mark.asyncio
+    async def test_returns_counts_by_field(self, mock_db, mock_collection):
+        repo = SkillRepository(mock_db)
+        _set_aggregate_result(
+            mock_collection,
+            [
+                {
+                    "level": [{"_id": "expert", "count": 2}, {"_id": None, "count": 1}],
+                    "category": [{"_id": "backend", "count": 3}],
+                }
+            ],
+        )
+
+        counts = await repo.count_by("profile-123", ("level", "category"))
+
+        assert counts == {"level": {"expert": 2, None: 1}, "category": {"backend": 3}}
+        mock_collection.find.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_empty_collection_gives_empty_counts(self, mock_db, mock_collection):
+        repo = ToolRepository(mock_db)
+        _set_aggregate_result(mock_collection, [])
+
+        assert await repo.count_by("profile-123", ("category",)) == {"category": {}}
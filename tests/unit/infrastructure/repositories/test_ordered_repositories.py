@@ -4,7 +4,7 @@ These all share the same IOrderedRepository pattern, so we test them together
 using parametrize to avoid duplication.
 """
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
 
@@ -20,6 +20,8 @@ from app.infrastructure.repositories.programming_language_repository import (
     ProgrammingLanguageRepository,
 )
 from app.infrastructure.repositories.project_repository import ProjectRepository
+from app.infrastructure.repositories.ranking import rank_between, ranked_pipeline
+from app.shared.interfaces.repository import DEFAULT_BATCH_SIZE
 
 from .conftest import (
     make_additional_training_doc,
@@ -191,12 +193,12 @@ class TestOrderedRepositoryOrderMethods:
             doc_factory(_id="b", order_index=1),
         ]
         cursor = collection.find.return_value
-        cursor.to_list = AsyncMock(return_value=docs)
+        cursor.__aiter__.return_value = docs
 
         result = await repo.get_all_ordered("profile-123")
 
         collection.find.assert_called_with({"profile_id": "profile-123"})
-        cursor.sort.assert_called_once_with("order_index", 1)
+        cursor.sort.assert_called_once_with([("order_index", 1)])
         assert len(result) == 2
 
     @pytest.mark.asyncio
@@ -228,12 +230,13 @@ class TestOrderedRepositoryOrderMethods:
 
         await repo.reorder("profile-123", "item-1", 4)
 
-        collection.update_many.assert_called_once_with(
-            {"profile_id": "profile-123", "order_index": {"$gt": 1, "$lte": 4}},
-            {"$inc": {"order_index": -1}},
-        )
-        collection.update_one.assert_called_once_with(
-            {"_id": "item-1"}, {"$set": {"order_index": 4}}
+        shift = collection.update_many.call_args_list[0]
+        assert shift.args[0] == {
+            "profile_id": "profile-123",
+            "order_index": {"$gt": 1, "$lte": 4},
+        }
+        assert collection.update_one.call_args_list[-1] == call(
+            {"_id": "item-1"}, {"$set": {"order_index": 4}}, session=None
         )
 
     @pytest.mark.asyncio
@@ -244,14 +247,126 @@ class TestOrderedRepositoryOrderMethods:
 
         await repo.reorder("profile-123", "item-1", 1)
 
-        collection.update_many.assert_called_once_with(
-            {"profile_id": "profile-123", "order_index": {"$gte": 1, "$lt": 4}},
-            {"$inc": {"order_index": 1}},
+        shift = collection.update_many.call_args_list[0]
+        assert shift.args[0] == {
+            "profile_id": "profile-123",
+            "order_index": {"$gte": 1, "$lt": 4},
+        }
+        assert collection.update_one.call_args_list[-1] == call(
+            {"_id": "item-1"}, {"$set": {"order_index": 1}}, session=None
         )
-        collection.update_one.assert_called_once_with(
-            {"_id": "item-1"}, {"$set": {"order_index": 1}}
+
+    @pytest.mark.asyncio
+    async def test_bulk_reorder_uses_one_bulk_write(self, repo_setup):
+        repo, collection, _, _, _ = repo_setup
+        collection.bulk_write = AsyncMock(return_value=MagicMock(matched_count=4))
+
+        found = await repo.bulk_reorder("profile-123", {"a": 1, "b": 0})
+
+        collection.bulk_write.assert_awaited_once()
+        operations = collection.bulk_write.call_args.args[0]
+        assert len(operations) == 4
+        # Standalone deployments run without a session
+        assert collection.bulk_write.call_args.kwargs["session"] is None
+        assert found == 2
+
+
+@pytest.fixture(params=ORDERED_REPOS)
+def ranked_repo_setup(request, mock_db):
+    """Provides (repo, collection, doc_factory) for each ordered repo in rank mode."""
+    repo_class, doc_factory, _, _ = request.param
+    repo = repo_class(mock_db, rank_ordering=True)
+    return repo, repo._collection, doc_factory
+
+
+class TestOrderedRepositoryRankMode:
+    @pytest.mark.asyncio
+    async def test_reorder_rewrites_only_the_moved_document(self, ranked_repo_setup):
+        repo, collection, _ = ranked_repo_setup
+        collection.count_documents = AsyncMock(return_value=2)
+        collection.find.return_value.to_list = AsyncMock(
+            return_value=[{"rank": "a"}, {"rank": "c"}]
+        )
+        collection.update_one = AsyncMock(return_value=MagicMock(matched_count=1))
+
+        await repo.reorder("profile-123", "item-1", 2)
+
+        collection.update_many.assert_not_called()
+        collection.update_one.assert_awaited_once_with(
+            {"_id": "item-1", "profile_id": "profile-123"}, {"$set": {"rank": "b"}}
         )
 
+    @pytest.mark.asyncio
+    async def test_get_all_ordered_derives_order_from_rank(self, ranked_repo_setup):
+        repo, collection, doc_factory = ranked_repo_setup
+        cursor = MagicMock()
+        cursor.__aiter__.return_value = [doc_factory(order_index=0)]
+        collection.aggregate = MagicMock(return_value=cursor)
+
+        result = await repo.get_all_ordered("profile-123", ascending=False)
+
+        collection.aggregate.assert_called_once_with(
+            ranked_pipeline({"profile_id": "profile-123"}, [("order_index", -1)]),
+            batchSize=DEFAULT_BATCH_SIZE,
+        )
+        collection.find.assert_not_called()
+        assert len(result) == 1
+
+    @pytest.mark.asyncio
+    async def test_add_assigns_a_rank(self, ranked_repo_setup):
+        repo, collection, doc_factory = ranked_repo_setup
+        collection.count_documents = AsyncMock(return_value=0)
+        entity = repo._mapper.to_domain(doc_factory(order_index=0))
+
+        await repo.add(entity)
+
+        inserted = collection.insert_one.call_args.args[0]
+        assert inserted["rank"] == rank_between(None, None)
+
+    @pytest.mark.asyncio
+    async def test_update_keeps_rank_and_order(self, ranked_repo_setup):
+        repo, collection, doc_factory = ranked_repo_setup
+        entity = repo._mapper.to_domain(doc_factory())
+
+        await repo.update(entity)
+
+        collection.replace_one.assert_not_called()
+        update = collection.update_one.call_args.args[1]
+        assert "$replaceWith" in update[0]
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_returns_the_order_index_lists_show(
+        self, ranked_repo_setup
+    ):
+        repo, collection, doc_factory = ranked_repo_setup
+        stored = doc_factory(order_index=0)
+        collection.find_one = AsyncMock(return_value=stored)
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(return_value=[{**stored, "order_index": 3}])
+        collection.aggregate = MagicMock(return_value=cursor)
+
+        entity = await repo.get_by_id(stored["_id"])
+
+        collection.aggregate.assert_called_once_with(
+            ranked_pipeline({"profile_id": "profile-123", "_id": stored["_id"]})
+        )
+        assert entity.order_index == 3
+
+    @pytest.mark.asyncio
+    async def test_update_fields_returns_the_order_index_lists_show(
+        self, ranked_repo_setup
+    ):
+        repo, collection, doc_factory = ranked_repo_setup
+        stored = doc_factory(order_index=0)
+        collection.find_one_and_update = AsyncMock(return_value=stored)
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(return_value=[{**stored, "order_index": 3}])
+        collection.aggregate = MagicMock(return_value=cursor)
+
+        entity = await repo.update_fields(stored["_id"], {})
+
+        assert entity.order_index == 3
+
 
 class TestOrderedRepositoryCountExists:
     @pytest.mark.asyncio
@@ -290,7 +405,7 @@ class TestOrderedRepositoryCountExists:
         repo, collection, doc_factory, _, _ = repo_setup
         docs = [doc_factory()]
         cursor = collection.find.return_value
-        cursor.to_list = AsyncMock(return_value=docs)
+        cursor.__aiter__.return_value = docs
 
         result = await repo.find_by(profile_id="profile-123")
 
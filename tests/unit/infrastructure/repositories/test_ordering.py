@@ -0,0 +1,272 @@
+"""Unit tests for the ordering helpers against a unique (profile_id, order_index)."""
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+import pytest
+
+from app.infrastructure.repositories.ordering import (
+    bulk_write_orders,
+    move_order_index,
+    reorder_operations,
+    restore_order_indexes,
+)
+from app.shared.shared_exceptions import BusinessRuleViolationException
+
+
+class UniqueOrderCollection:
+    """
+    In-memory stand-in that, like MongoDB, checks the unique index after every
+    single document write (also inside update_many).
+    """
+
+    def __init__(self, indexes: list[int]):
+        self.docs = [
+            {"_id": f"item-{i}", "profile_id": "p", "order_index": i} for i in indexes
+        ]
+        self.sessions: list[Any] = []
+
+    def _check_unique(self) -> None:
+        seen = [doc["order_index"] for doc in self.docs]
+        if len(seen) != len(set(seen)):
+            raise AssertionError(f"duplicate order_index: {sorted(seen)}")
+
+    def _is_taken(self, doc: dict[str, Any], order_index: int) -> bool:
+        return any(
+            other is not doc and other["order_index"] == order_index
+            for other in self.docs
+        )
+
+    @staticmethod
+    def _matches(doc: dict[str, Any], query: dict[str, Any]) -> bool:
+        for key, cond in query.items():
+            value = doc[key]
+            if not isinstance(cond, dict):
+                if value != cond:
+                    return False
+                continue
+            if "$in" in cond:
+                if value not in cond["$in"]:
+                    return False
+                continue
+            ops = {
+                "$gt": value > cond.get("$gt", value - 1),
+                "$gte": value >= cond.get("$gte", value),
+                "$lt": value < cond.get("$lt", value + 1),
+                "$lte": value <= cond.get("$lte", value),
+            }
+            if not all(ops[op] for op in cond):
+                return False
+        return True
+
+    @classmethod
+    def _eval(cls, expr: Any, doc: dict[str, Any]) -> int:
+        if isinstance(expr, int):
+            return expr
+        if expr == "$order_index":
+            return doc["order_index"]
+        [(op, (left, right))] = expr.items()
+        a, b = cls._eval(left, doc), cls._eval(right, doc)
+        return a - b if op == "$subtract" else a + b
+
+    async def update_one(self, query, update, session=None):
+        self.sessions.append(session)
+        for doc in self.docs:
+            if self._matches(doc, query):
+                doc.update(update["$set"])
+                self._check_unique()
+                return
+
+    async def update_many(self, query, pipeline, session=None):
+        self.sessions.append(session)
+        expr = pipeline[0]["$set"]["order_index"]
+        # Descending order is the worst case for a naive "+1" shift
+        for doc in sorted(self.docs, key=lambda d: -d["order_index"]):
+            if self._matches(doc, query):
+                doc["order_index"] = self._eval(expr, doc)
+                self._check_unique()
+
+    def find(self, query, projection=None):
+        docs = [dict(doc) for doc in self.docs if self._matches(doc, query)]
+        return SimpleNamespace(to_list=AsyncMock(return_value=docs))
+
+    async def find_one(self, query, projection=None, sort=None):
+        docs = [doc for doc in self.docs if self._matches(doc, query)]
+        return min(docs, key=lambda d: d["order_index"], default=None)
+
+    async def bulk_write(self, operations, ordered=True, session=None):
+        self.sessions.append(session)
+        matched = 0
+        for op in operations:
+            for doc in self.docs:
+                if self._matches(doc, op._filter):
+                    # Like MongoDB: the write is rejected and the batch stops
+                    if self._is_taken(doc, op._doc["$set"]["order_index"]):
+                        raise BulkWriteError({"writeErrors": [{"code": 11000}]})
+                    doc.update(op._doc["$set"])
+                    matched += 1
+                    break
+        return SimpleNamespace(matched_count=matched)
+
+    def indexes(self) -> dict[str, int]:
+        return {d["_id"]: d["order_index"] for d in self.docs}
+
+    def order(self) -> list[str]:
+        return [d["_id"] for d in sorted(self.docs, key=lambda d: d["order_index"])]
+
+
+class TestMoveOrderIndex:
+    @pytest.mark.asyncio
+    async def test_move_down_never_duplicates(self):
+        collection = UniqueOrderCollection([0, 1, 2, 3, 4])
+
+        await move_order_index(collection, "p", "item-1", 1, 3)
+
+        assert collection.order() == ["item-0", "item-2", "item-3", "item-1", "item-4"]
+        assert sorted(d["order_index"] for d in collection.docs) == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_move_up_never_duplicates(self):
+        collection = UniqueOrderCollection([0, 1, 2, 3, 4])
+
+        await move_order_index(collection, "p", "item-4", 4, 0)
+
+        assert collection.order() == ["item-4", "item-0", "item-1", "item-2", "item-3"]
+        assert sorted(d["order_index"] for d in collection.docs) == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_keeps_gaps_outside_the_moved_range(self):
+        collection = UniqueOrderCollection([0, 2, 5, 9])
+
+        await move_order_index(collection, "p", "item-0", 0, 5)
+
+        assert {d["_id"]: d["order_index"] for d in collection.docs} == {
+            "item-0": 5,
+            "item-2": 1,
+            "item-5": 4,
+            "item-9": 9,
+        }
+
+    @pytest.mark.asyncio
+    async def test_runs_every_write_in_the_session(self):
+        collection = UniqueOrderCollection([0, 1, 2])
+        session = object()
+
+        await move_order_index(collection, "p", "item-0", 0, 2, session)
+
+        assert collection.sessions == [session] * 4
+        assert collection.order() == ["item-1", "item-2", "item-0"]
+
+    @pytest.mark.asyncio
+    async def test_failure_without_session_restores_the_order(self):
+        class FailingRestore(UniqueOrderCollection):
+            """Fails the write that brings the parked range back."""
+
+            async def update_many(self, query, pipeline, session=None):
+                if query["order_index"] == {"$lt": -1}:
+                    raise ConnectionError("connection lost")
+                await super().update_many(query, pipeline, session)
+
+        collection = FailingRestore([0, 1, 2, 3])
+
+        with pytest.raises(ConnectionError):
+            await move_order_index(collection, "p", "item-0", 0, 2)
+
+        assert collection.indexes() == {
+            "item-0": 0,
+            "item-1": 1,
+            "item-2": 2,
+            "item-3": 3,
+        }
+
+
+class TestRestoreOrderIndexes:
+    @pytest.mark.asyncio
+    async def test_brings_back_parked_items(self):
+        collection = UniqueOrderCollection([0, 1, 2])
+        # State of a move interrupted after parking the range
+        collection.docs[0]["order_index"] = -1
+        collection.docs[1]["order_index"] = -2
+        collection.docs[2]["order_index"] = -3
+
+        await restore_order_indexes(
+            collection, "p", {"item-0": 0, "item-1": 1, "item-2": 2}
+        )
+
+        assert collection.indexes() == {"item-0": 0, "item-1": 1, "item-2": 2}
+
+
+class TestReorderOperations:
+    def test_parks_every_item_before_placing_it(self):
+        ops = reorder_operations("p", {"a": 0, "b": 1})
+
+        assert ops == [
+            UpdateOne({"_id": "a", "profile_id": "p"}, {"$set": {"order_index": -2}}),
+            UpdateOne({"_id": "b", "profile_id": "p"}, {"$set": {"order_index": -3}}),
+            UpdateOne({"_id": "a", "profile_id": "p"}, {"$set": {"order_index": 0}}),
+            UpdateOne({"_id": "b", "profile_id": "p"}, {"$set": {"order_index": 1}}),
+        ]
+
+
+class TestBulkWriteOrders:
+    @pytest.mark.asyncio
+    async def test_reverses_order_never_duplicates(self):
+        collection = UniqueOrderCollection([0, 1, 2, 3])
+
+        found = await bulk_write_orders(
+            collection,
+            "p",
+            {"item-0": 3, "item-1": 2, "item-2": 1, "item-3": 0},
+        )
+
+        assert found == 4
+        assert collection.order() == ["item-3", "item-2", "item-1", "item-0"]
+        assert sorted(collection.indexes().values()) == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_counts_only_items_of_the_profile(self):
+        collection = UniqueOrderCollection([0])
+
+        found = await bulk_write_orders(collection, "p", {"item-0": 0, "other": 1})
+
+        assert found == 1
+
+    @pytest.mark.asyncio
+    async def test_passes_session(self):
+        collection = UniqueOrderCollection([0])
+        session = object()
+
+        await bulk_write_orders(collection, "p", {"item-0": 0}, session)
+
+        assert collection.sessions == [session]
+
+    @pytest.mark.asyncio
+    async def test_failure_without_session_restores_parked_items(self):
+        collection = UniqueOrderCollection([0, 1, 2])
+
+        # item-2 is not reordered and keeps index 2: placing item-0 there fails
+        with pytest.raises(BusinessRuleViolationException):
+            await bulk_write_orders(collection, "p", {"item-1": 0, "item-0": 2})
+
+        assert collection.indexes() == {"item-0": 0, "item-1": 1, "item-2": 2}
+
+    @pytest.mark.asyncio
+    async def test_duplicate_key_raises_business_rule(self):
+        class DuplicateCollection(UniqueOrderCollection):
+            async def bulk_write(self, operations, ordered=True, session=None):
+                raise BulkWriteError({"writeErrors": [{"code": 11000}]})
+
+        with pytest.raises(BusinessRuleViolationException):
+            await bulk_write_orders(DuplicateCollection([]), "p", {"a": 0})
+
+    @pytest.mark.asyncio
+    async def test_other_errors_propagate(self):
+        class FailingCollection(UniqueOrderCollection):
+            async def bulk_write(self, operations, ordered=True, session=None):
+                raise BulkWriteError({"writeErrors": [{"code": 2}]})
+
+        with pytest.raises(BulkWriteError):
+            await bulk_write_orders(FailingCollection([]), "p", {"a": 0})
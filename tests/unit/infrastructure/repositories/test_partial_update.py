@@ -0,0 +1,54 @@
+"""Unit tests for the single round trip partial update helpers."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from pymongo import ReturnDocument
+import pytest
+
+from app.infrastructure.repositories.partial_update import (
+    fields_update,
+    update_document_fields,
+)
+
+
+class TestFieldsUpdate:
+    def test_sets_changed_fields_and_updated_at(self):
+        update = fields_update({"name": "Go", "level": "advanced"})
+
+        assert update["$set"]["name"] == "Go"
+        assert update["$set"]["level"] == "advanced"
+        assert isinstance(update["$set"]["updated_at"], datetime)
+        assert "$unset" not in update
+
+    def test_none_values_are_unset(self):
+        update = fields_update({"name": "Go", "level": None})
+
+        assert "level" not in update["$set"]
+        assert update["$unset"] == {"level": ""}
+
+
+class TestUpdateDocumentFields:
+    @pytest.mark.asyncio
+    async def test_single_find_one_and_update_returning_the_new_document(self):
+        collection = MagicMock()
+        collection.find_one_and_update = AsyncMock(return_value={"_id": "s-1"})
+
+        doc = await update_document_fields(collection, "s-1", {"name": "Go"})
+
+        assert doc == {"_id": "s-1"}
+        collection.find_one_and_update.assert_awaited_once()
+        query, update = collection.find_one_and_update.call_args.args
+        assert query == {"_id": "s-1"}
+        assert update["$set"]["name"] == "Go"
+        assert (
+            collection.find_one_and_update.call_args.kwargs["return_document"]
+            == ReturnDocument.AFTER
+        )
+
+    @pytest.mark.asyncio
+    async def test_missing_document_returns_none(self):
+        collection = MagicMock()
+        collection.find_one_and_update = AsyncMock(return_value=None)
+
+        assert await update_document_fields(collection, "nope", {"name": "Go"}) is None
@@ -197,7 +197,7 @@ class TestProfileRepositoryFindBy:
     async def test_find_by_filters(self, repo, collection):
         docs = [make_profile_doc()]
         cursor = collection.find.return_value
-        cursor.to_list = AsyncMock(return_value=docs)
+        cursor.__aiter__.return_value = docs
 
         result = await repo.find_by(name="John Doe")
 
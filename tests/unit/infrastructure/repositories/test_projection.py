@@ -0,0 +1,149 @@
+"""Unit tests for sparse fieldsets (find_views) pushed down as projections."""
+
+from unittest.mock import MagicMock
+
+import bson
+from bson.raw_bson import RawBSONDocument
+import pytest
+
+from app.infrastructure.repositories.contact_message_repository import (
+    ContactMessageRepository,
+)
+from app.infrastructure.repositories.experience_repository import (
+    WorkExperienceRepository,
+)
+from app.infrastructure.repositories.projection import projection, raw_documents
+from app.infrastructure.repositories.skill_repository import SkillRepository
+from app.shared.interfaces import FilterSpec
+
+from .conftest import make_contact_message_doc
+
+
+class TestProjection:
+    def test_always_keeps_the_id(self):
+        assert projection(("name", "level")) == {"_id": 1, "name": 1, "level": 1}
+
+    def test_id_field_maps_to_mongo_id(self):
+        assert projection(("id", "name")) == {"_id": 1, "name": 1}
+
+
+class TestFindViews:
+    @pytest.mark.asyncio
+    async def test_projection_reaches_the_find_call(self, mock_db, mock_collection):
+        repo = SkillRepository(mock_db)
+        cursor = mock_collection.find.return_value
+        cursor.__aiter__.return_value = [{"_id": "s-1", "name": "Python"}]
+
+        views = await repo.find_views(
+            ("name",), FilterSpec(sort=(("order_index", 1),)), profile_id="p1"
+        )
+
+        mock_collection.find.assert_called_once_with(
+            {"profile_id": "p1"}, {"_id": 1, "name": 1}
+        )
+        cursor.sort.assert_called_once_with([("order_index", 1)])
+        assert views == [{"id": "s-1", "name": "Python"}]
+
+    @pytest.mark.asyncio
+    async def test_partial_documents_are_not_hydrated_as_entities(
+        self, mock_db, mock_collection
+    ):
+        repo = WorkExperienceRepository(mock_db)
+        cursor = mock_collection.find.return_value
+        # Sin start_date ni created_at: to_domain fallaría
+        cursor.__aiter__.return_value = [{"_id": "w-1", "role": "Dev"}]
+
+        views = await repo.find_views(("role", "responsibilities"), profile_id="p1")
+
+        assert views == [{"id": "w-1", "role": "Dev", "responsibilities": []}]
+
+    @pytest.mark.asyncio
+    async def test_rank_mode_projects_after_deriving_the_order(
+        self, mock_db, mock_collection
+    ):
+        repo = SkillRepository(mock_db, rank_ordering=True)
+        cursor = MagicMock()
+        cursor.__aiter__.return_value = []
+        mock_collection.aggregate = MagicMock(return_value=cursor)
+
+        await repo.find_views(
+            ("name",), FilterSpec(sort=(("order_index", 1),)), profile_id="p1"
+        )
+
+        pipeline = mock_collection.aggregate.call_args[0][0]
+        assert pipeline[-2:] == [
+            {"$sort": {"order_index": 1}},
+            {"$project": {"_id": 1, "name": 1}},
+        ]
+
+
+class TestStreamViews:
+    def test_raw_documents_keeps_the_other_codec_options(self, mock_collection):
+        raw = raw_documents(mock_collection)
+
+        mock_collection.codec_options.with_options.assert_called_once_with(
+            document_class=RawBSONDocument
+        )
+        mock_collection.with_options.assert_called_once_with(
+            codec_options=mock_collection.codec_options.with_options.return_value
+        )
+        assert raw is mock_collection.with_options.return_value
+
+    @pytest.mark.asyncio
+    async def test_reads_raw_documents_with_the_projection(
+        self, mock_db, mock_collection
+    ):
+        repo = SkillRepository(mock_db)
+        raw_collection = mock_collection.with_options.return_value
+        cursor = MagicMock()
+        cursor.batch_size = MagicMock(return_value=cursor)
+        cursor.sort = MagicMock(return_value=cursor)
+        cursor.__aiter__.return_value = [
+            RawBSONDocument(bson.encode({"_id": "s-1", "name": "Python"})),
+            RawBSONDocument(
+                bson.encode({"_id": "s-2", "name": "Go", "level": "basic"})
+            ),
+        ]
+        raw_collection.find = MagicMock(return_value=cursor)
+
+        views = [
+            view
+            async for view in repo.stream_views(
+                ("name", "level"),
+                FilterSpec(sort=(("order_index", 1),)),
+                batch_size=50,
+                profile_id="p1",
+            )
+        ]
+
+        raw_collection.find.assert_called_once_with(
+            {"profile_id": "p1"}, {"_id": 1, "name": 1, "level": 1}
+        )
+        cursor.batch_size.assert_called_once_with(50)
+        mock_collection.find.assert_not_called()
+        assert views == [
+            {"id": "s-1", "name": "Python", "level": None},
+            {"id": "s-2", "name": "Go", "level": "basic"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_default_streams_entities_without_the_list_cap(
+        self, mock_db, mock_collection
+    ):
+        repo = ContactMessageRepository(mock_db)
+        repo.max_results = 2
+        cursor = mock_collection.find.return_value
+        cursor.__aiter__.return_value = [
+            make_contact_message_doc(_id=f"m{i}") for i in range(5)
+        ]
+
+        views = [
+            view
+            async for view in repo.stream_views(
+                ("name",), batch_size=7, status="pending"
+            )
+        ]
+
+        mock_collection.find.assert_called_once_with({"status": "pending"})
+        cursor.batch_size.assert_called_once_with(7)
+        assert views == [{"id": f"m{i}", "name": "Jane Doe"} for i in range(5)]
@@ -0,0 +1,230 @@
+"""Unit tests for the rank-key (fractional) ordering helpers."""
+
+import random
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.infrastructure.repositories.ranking import (
+    keep_ordering,
+    move_rank,
+    needs_rebalance,
+    rank_between,
+    ranked_pipeline,
+    rebalance_ranks,
+    reorder_ranks,
+    spread_ranks,
+)
+
+
+class TestRankBetween:
+    def test_open_bounds(self):
+        first = rank_between(None, None)
+
+        assert rank_between(None, first) < first < rank_between(first, None)
+
+    def test_adjacent_keys_grow_a_digit(self):
+        rank = rank_between("a", "b")
+
+        assert "a" < rank < "b"
+        assert len(rank) == 2
+
+    def test_rejects_unordered_bounds(self):
+        with pytest.raises(ValueError):
+            rank_between("b", "a")
+
+    def test_repeated_inserts_stay_ordered(self):
+        generator = random.Random(7)
+        ranks = spread_ranks(3)
+        for _ in range(500):
+            i = generator.randint(0, len(ranks))
+            before = ranks[i - 1] if i > 0 else None
+            after = ranks[i] if i < len(ranks) else None
+            rank = rank_between(before, after)
+            assert not rank.endswith("0")
+            ranks.insert(i, rank)
+
+        assert ranks == sorted(ranks)
+        assert len(set(ranks)) == len(ranks)
+
+
+class TestSpreadRanks:
+    @pytest.mark.parametrize("count", [0, 1, 2, 35, 36, 1000])
+    def test_sorted_unique_and_short(self, count):
+        ranks = spread_ranks(count)
+
+        assert len(ranks) == count
+        assert ranks == sorted(ranks)
+        assert len(set(ranks)) == count
+        assert not any(rank.endswith("0") for rank in ranks)
+        assert not any(needs_rebalance(rank) for rank in ranks)
+
+
+class TestPipelines:
+    def test_filters_after_deriving_order_index(self):
+        pipeline = ranked_pipeline(
+            {"profile_id": "p", "category": "backend"}, [("order_index", -1)]
+        )
+
+        assert pipeline[0] == {"$match": {"profile_id": "p"}}
+        assert pipeline[-2] == {"$match": {"profile_id": "p", "category": "backend"}}
+        assert pipeline[-1] == {"$sort": {"order_index": -1}}
+
+    def test_update_keeps_rank_and_order_index(self):
+        [stage] = keep_ordering({"_id": "a", "title": "$100 budget"})
+
+        merged = stage["$replaceWith"]["$mergeObjects"]
+        # The new document is a literal: "$..." strings are not field paths
+        assert merged[0] == {"$literal": {"_id": "a", "title": "$100 budget"}}
+        assert merged[1] == {"rank": "$rank", "order_index": "$order_index"}
+
+
+class RankedCollection:
+    """In-memory stand-in with a unique (profile_id, order_index) index."""
+
+    def __init__(self, ranks: list[str | None]):
+        self.docs = [
+            {"_id": f"item-{i}", "profile_id": "p", "order_index": i, "rank": rank}
+            for i, rank in enumerate(ranks)
+        ]
+        self.writes = 0
+
+    def _check_unique(self) -> None:
+        seen = [doc["order_index"] for doc in self.docs]
+        if len(seen) != len(set(seen)):
+            raise AssertionError(f"duplicate order_index: {sorted(seen)}")
+
+    @staticmethod
+    def _matches(doc: dict[str, Any], query: dict[str, Any]) -> bool:
+        for key, cond in query.items():
+            if isinstance(cond, dict):
+                if "$lt" in cond and not doc[key] < cond["$lt"]:
+                    return False
+                if "$ne" in cond and doc[key] == cond["$ne"]:
+                    return False
+            elif doc[key] != cond:
+                return False
+        return True
+
+    async def count_documents(self, query):
+        return sum(1 for doc in self.docs if self._matches(doc, query))
+
+    def find(self, query, projection=None, session=None):
+        docs = [dict(doc) for doc in self.docs if self._matches(doc, query)]
+        cursor = SimpleNamespace()
+
+        def sort(key, direction):
+            docs.sort(key=lambda d: d[key] or "", reverse=direction < 0)
+            return cursor
+
+        def skip(n):
+            del docs[:n]
+            return cursor
+
+        def limit(n):
+            del docs[n:]
+            return cursor
+
+        async def to_list(length=None):
+            return docs
+
+        cursor.sort, cursor.skip, cursor.limit = sort, skip, limit
+        cursor.to_list = to_list
+        return cursor
+
+    async def update_one(self, query, update):
+        self.writes += 1
+        for doc in self.docs:
+            if self._matches(doc, query):
+                doc.update(update["$set"])
+                self._check_unique()
+                return SimpleNamespace(matched_count=1)
+        return SimpleNamespace(matched_count=0)
+
+    async def bulk_write(self, operations, ordered=True, session=None):
+        for op in operations:
+            await self.update_one(op._filter, op._doc)
+        return SimpleNamespace(matched_count=len(operations))
+
+    def visible(self) -> dict[str, int]:
+        """order_index as the reads derive it (rank_slot_stages)."""
+        by_rank = sorted(self.docs, key=lambda d: d["rank"] or "")
+        slots = sorted(doc["order_index"] for doc in self.docs)
+        return {doc["_id"]: slot for doc, slot in zip(by_rank, slots, strict=True)}
+
+    def order(self) -> list[str]:
+        return [d["_id"] for d in sorted(self.docs, key=lambda d: d["rank"] or "")]
+
+
+class TestMoveRank:
+    @pytest.mark.asyncio
+    async def test_move_down_writes_one_document(self):
+        collection = RankedCollection(spread_ranks(5))
+
+        rank = await move_rank(collection, "p", "item-1", 3)
+
+        assert rank is not None
+        assert collection.writes == 1
+        assert collection.order() == ["item-0", "item-2", "item-3", "item-1", "item-4"]
+        assert collection.visible()["item-1"] == 3
+
+    @pytest.mark.asyncio
+    async def test_move_up_writes_one_document(self):
+        collection = RankedCollection(spread_ranks(5))
+
+        await move_rank(collection, "p", "item-4", 0)
+
+        assert collection.writes == 1
+        assert collection.order() == ["item-4", "item-0", "item-1", "item-2", "item-3"]
+
+    @pytest.mark.asyncio
+    async def test_move_past_the_end(self):
+        collection = RankedCollection(spread_ranks(3))
+
+        await move_rank(collection, "p", "item-0", 99)
+
+        assert collection.order() == ["item-1", "item-2", "item-0"]
+
+    @pytest.mark.asyncio
+    async def test_missing_entity(self):
+        collection = RankedCollection(spread_ranks(2))
+
+        assert await move_rank(collection, "p", "missing", 0) is None
+
+
+class TestRebalanceRanks:
+    @pytest.mark.asyncio
+    async def test_materializes_order_and_shortens_keys(self):
+        collection = RankedCollection(spread_ranks(4))
+        for _ in range(30):
+            # Always in front of the first item: keys keep growing
+            await move_rank(collection, "p", "item-3", 0)
+            await move_rank(collection, "p", "item-2", 0)
+        expected = collection.visible()
+
+        await rebalance_ranks(collection, "p")
+
+        assert {d["_id"]: d["order_index"] for d in collection.docs} == expected
+        assert not any(needs_rebalance(d["rank"]) for d in collection.docs)
+        assert collection.visible() == expected
+
+    @pytest.mark.asyncio
+    async def test_seed_follows_order_index(self):
+        collection = RankedCollection([None, None, None])
+
+        await rebalance_ranks(collection, "p", seed=True)
+
+        assert collection.order() == ["item-0", "item-1", "item-2"]
+
+    @pytest.mark.asyncio
+    async def test_reorder_ranks_applies_new_indexes(self):
+        collection = RankedCollection(spread_ranks(3))
+
+        found = await reorder_ranks(
+            collection, "p", {"item-0": 2, "item-2": 0, "other": 5}
+        )
+
+        assert found == 2
+        assert collection.order() == ["item-2", "item-1", "item-0"]
+        assert collection.visible() == {"item-0": 2, "item-1": 1, "item-2": 0}
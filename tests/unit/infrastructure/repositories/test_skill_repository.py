@@ -1,10 +1,17 @@
 """Unit tests for SkillRepository (unique name + ordered repository)."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
+from pymongo.errors import DuplicateKeyError
 import pytest
 
+from app.infrastructure.database.indexes import CASE_INSENSITIVE
+from app.infrastructure.mappers import SkillMapper
 from app.infrastructure.repositories.skill_repository import SkillRepository
+from app.shared.shared_exceptions import (
+    BusinessRuleViolationException,
+    DuplicateException,
+)
 
 from .conftest import make_skill_doc
 
@@ -68,6 +75,36 @@ class TestSkillRepositoryCRUD:
 
         assert await repo.delete("nope") is False
 
+    @pytest.mark.asyncio
+    async def test_update_fields(self, repo, collection):
+        collection.find_one_and_update = AsyncMock(
+            return_value=make_skill_doc(name="Go")
+        )
+
+        result = await repo.update_fields("skill-123", {"name": "Go"})
+
+        assert result is not None
+        assert result.name == "Go"
+        collection.find_one.assert_not_called()
+        collection.replace_one.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_fields_not_found(self, repo, collection):
+        collection.find_one_and_update = AsyncMock(return_value=None)
+
+        assert await repo.update_fields("nope", {"name": "Go"}) is None
+
+    @pytest.mark.asyncio
+    async def test_update_fields_duplicate_name(self, repo, collection):
+        collection.find_one_and_update = AsyncMock(
+            side_effect=DuplicateKeyError(
+                "E11000", 11000, {"keyPattern": {"profile_id": 1, "name": 1}}
+            )
+        )
+
+        with pytest.raises(DuplicateException):
+            await repo.update_fields("skill-123", {"name": "Python"})
+
 
 class TestSkillRepositoryUniqueNameMethods:
     @pytest.mark.asyncio
@@ -77,7 +114,8 @@ class TestSkillRepositoryUniqueNameMethods:
         result = await repo.exists_by_name("profile-123", "Python")
 
         collection.count_documents.assert_called_once_with(
-            {"profile_id": "profile-123", "name": "Python"}
+            {"profile_id": "profile-123", "name": "Python"},
+            collation=CASE_INSENSITIVE,
         )
         assert result is True
 
@@ -97,7 +135,8 @@ class TestSkillRepositoryUniqueNameMethods:
         result = await repo.get_by_name("profile-123", "FastAPI")
 
         collection.find_one.assert_called_once_with(
-            {"profile_id": "profile-123", "name": "FastAPI"}
+            {"profile_id": "profile-123", "name": "FastAPI"},
+            collation=CASE_INSENSITIVE,
         )
         assert result is not None
         assert result.name == "FastAPI"
@@ -131,12 +170,12 @@ class TestSkillRepositoryOrderedMethods:
             make_skill_doc(_id="s2", order_index=1),
         ]
         cursor = collection.find.return_value
-        cursor.to_list = AsyncMock(return_value=docs)
+        cursor.__aiter__.return_value = docs
 
         result = await repo.get_all_ordered("profile-123")
 
         collection.find.assert_called_with({"profile_id": "profile-123"})
-        cursor.sort.assert_called_once_with("order_index", 1)
+        cursor.sort.assert_called_once_with([("order_index", 1)])
         assert len(result) == 2
 
     @pytest.mark.asyncio
@@ -146,9 +185,9 @@ class TestSkillRepositoryOrderedMethods:
 
         await repo.reorder("profile-123", "s-1", 2)
 
-        collection.update_many.assert_called_once()
-        collection.update_one.assert_called_once_with(
-            {"_id": "s-1"}, {"$set": {"order_index": 2}}
+        assert collection.update_many.call_count == 2
+        assert collection.update_one.call_args_list[-1] == call(
+            {"_id": "s-1"}, {"$set": {"order_index": 2}}, session=None
         )
 
     @pytest.mark.asyncio
@@ -162,6 +201,84 @@ class TestSkillRepositoryOrderedMethods:
         collection.update_one.assert_not_called()
 
 
+class TestSkillRepositoryUniqueness:
+    """Uniqueness is enforced by unique indexes, not by reading first."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_name_raises_duplicate_exception(self, repo, collection):
+        collection.insert_one = AsyncMock(
+            side_effect=DuplicateKeyError(
+                "E11000", 11000, {"keyPattern": {"profile_id": 1, "name": 1}}
+            )
+        )
+
+        with pytest.raises(DuplicateException) as exc_info:
+            await repo.add(SkillMapper().to_domain(make_skill_doc(name="Python")))
+
+        assert exc_info.value.details["field"] == "name"
+        assert exc_info.value.details["value"] == "Python"
+        collection.count_documents.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_order_index_raises_business_rule(self, repo, collection):
+        collection.replace_one = AsyncMock(
+            side_effect=DuplicateKeyError(
+                "E11000 duplicate key error collection: portfolio_db.skills "
+                "index: profile_id_1_order_index_1 dup key: { : 2 }",
+                11000,
+            )
+        )
+
+        with pytest.raises(BusinessRuleViolationException) as exc_info:
+            await repo.update(SkillMapper().to_domain(make_skill_doc(order_index=2)))
+
+        assert exc_info.value.details == {"orderIndex": 2}
+
+
+class TestSkillRepositoryContentVersion:
+    @pytest.fixture
+    def versions(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def versioned_repo(self, mock_db, versions):
+        return SkillRepository(mock_db, versions=versions)
+
+    @pytest.mark.asyncio
+    async def test_writes_bump_collection_version(self, versioned_repo, versions):
+        entity = MagicMock()
+        entity.id = "s-1"
+        versioned_repo._collection.delete_one = AsyncMock(
+            return_value=MagicMock(deleted_count=1)
+        )
+
+        await versioned_repo.add(entity)
+        await versioned_repo.update(entity)
+        await versioned_repo.delete("s-1")
+
+        assert versions.bump.await_count == 3
+        versions.bump.assert_awaited_with("skills")
+
+    @pytest.mark.asyncio
+    async def test_missed_delete_does_not_bump(self, versioned_repo, versions):
+        versioned_repo._collection.delete_one = AsyncMock(
+            return_value=MagicMock(deleted_count=0)
+        )
+
+        await versioned_repo.delete("missing")
+
+        versions.bump.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_reorder_bumps_version(self, versioned_repo, versions):
+        doc = make_skill_doc(_id="s-1", order_index=0)
+        versioned_repo._collection.find_one = AsyncMock(return_value=doc)
+
+        await versioned_repo.reorder("profile-123", "s-1", 2)
+
+        versions.bump.assert_awaited_once_with("skills")
+
+
 class TestSkillRepositoryMapperValidation:
     @pytest.mark.asyncio
     async def test_add_calls_mapper_to_persistence(self, repo, collection):
@@ -0,0 +1,82 @@
+"""Unit tests for streaming iteration and the explicit list maximum."""
+
+import logging
+
+import pytest
+
+from app.infrastructure.repositories.contact_message_repository import (
+    ContactMessageRepository,
+)
+from app.infrastructure.repositories.skill_repository import SkillRepository
+from app.infrastructure.repositories.streaming import collect
+
+from .conftest import make_contact_message_doc, make_skill_doc
+
+
+async def _numbers(count, pulled):
+    for i in range(count):
+        pulled.append(i)
+        yield i
+
+
+class TestCollect:
+    @pytest.mark.asyncio
+    async def test_returns_everything_under_the_maximum(self):
+        pulled = []
+
+        assert await collect(_numbers(3, pulled), 5, "items") == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_stops_reading_at_the_maximum_and_warns(self, caplog):
+        pulled = []
+
+        with caplog.at_level(logging.WARNING):
+            result = await collect(_numbers(10, pulled), 3, "items")
+
+        assert result == [0, 1, 2]
+        # Solo se lee un elemento de más para saber que había más
+        assert pulled == [0, 1, 2, 3]
+        assert "items" in caplog.text
+
+
+class TestStream:
+    @pytest.mark.asyncio
+    async def test_yields_entities_in_batches(self, mock_db, mock_collection):
+        repo = SkillRepository(mock_db)
+        cursor = mock_collection.find.return_value
+        cursor.__aiter__.return_value = [
+            make_skill_doc(_id="s1"),
+            make_skill_doc(_id="s2"),
+        ]
+
+        ids = [
+            skill.id
+            async for skill in repo.stream({"profile_id": "profile-123"}, batch_size=2)
+        ]
+
+        mock_collection.find.assert_called_once_with({"profile_id": "profile-123"})
+        cursor.batch_size.assert_called_once_with(2)
+        cursor.sort.assert_not_called()
+        assert ids == ["s1", "s2"]
+
+    @pytest.mark.asyncio
+    async def test_sort_pairs_are_passed_to_the_cursor(self, mock_db, mock_collection):
+        repo = ContactMessageRepository(mock_db)
+        cursor = mock_collection.find.return_value
+
+        [_ async for _ in repo.stream(sort=[("created_at", -1), ("_id", -1)])]
+
+        cursor.sort.assert_called_once_with([("created_at", -1), ("_id", -1)])
+
+    @pytest.mark.asyncio
+    async def test_list_methods_respect_max_results(self, mock_db, mock_collection):
+        repo = ContactMessageRepository(mock_db)
+        repo.max_results = 2
+        cursor = mock_collection.find.return_value
+        cursor.__aiter__.return_value = [
+            make_contact_message_doc(_id=f"m{i}") for i in range(5)
+        ]
+
+        result = await repo.find_by(status="pending")
+
+        assert [m.id for m in result] == ["m0", "m1"]
@@ -47,3 +47,19 @@ def test_settings_debug_by_environment(env, expected):
     """Test: DEBUG se configura según el entorno"""
     settings = Settings(ENVIRONMENT=env, DEBUG=expected)
     assert expected == settings.DEBUG
+
+
+def test_max_staleness_requires_secondary_reads():
+    """Test: maxStalenessSeconds no se aplica a lecturas del primario"""
+    with pytest.raises(ValueError, match="non-primary"):
+        Settings(MONGODB_MAX_STALENESS_SECONDS=90)
+
+
+def test_primary_pin_covers_max_staleness():
+    """Test: tras escribir, el cliente lee del primario mientras dure el retraso"""
+    with pytest.raises(ValueError, match="MONGODB_PRIMARY_PIN_SECONDS"):
+        Settings(
+            MONGODB_READ_PREFERENCE="secondaryPreferred",
+            MONGODB_MAX_STALENESS_SECONDS=120,
+            MONGODB_PRIMARY_PIN_SECONDS=60,
+        )